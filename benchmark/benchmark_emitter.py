@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_emitter.py
+our_version = 100
+'''
+********************************
+benchmark_emitter.py
+********************************
+
+Description
+-----------
+Compares playbook writing throughput of Emitter() against PyYAML, on a
+synthetic stream of --tasks tasks (default 1,000,000), --tasks-per-play
+tasks per play.  Each task resembles an nxos_interfaces task.  Each
+backend writes the whole stream to a file in --directory:
+
+    pyyaml          yaml.dump(), with yaml.Dumper
+    libyaml         yaml.dump(), with yaml.CDumper (if installed)
+    scriptkit       Emitter().write_yaml()
+    json            Emitter().dump_json()
+
+For each backend, the wall time, tasks per second, and megabytes per
+second are reported.  The pure-python backend is slow with the default
+--tasks; use e.g. --tasks 100000 for a quick comparison.  Both PyYAML
+backends build a node for every object in the stream before emitting
+anything, so with the default --tasks they may need several GB of
+memory.
+
+To compare before and after a change::
+
+    ./benchmark_emitter.py --save /tmp/before.json
+    # make the change
+    ./benchmark_emitter.py --baseline /tmp/before.json
+
+Usage
+-----
+./benchmark_emitter.py [--tasks N] [--tasks-per-play N] [--backends B [B ...]] [--directory DIR] [--save FILE] [--baseline FILE]
+
+'''
+import argparse
+import json
+import time
+import yaml
+from os import path, remove
+
+from ask.common.log import Log
+from ask.common.emitter import Emitter
+from ask.common.playbook import CDumper
+
+log = Log('benchmark_emitter', 'ERROR', 'ERROR')
+
+backends = ['pyyaml', 'libyaml', 'scriptkit', 'json']
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark Emitter() against PyYAML')
+    parser.add_argument('--tasks', type=int, default=1000000, help='total number of tasks')
+    parser.add_argument('--tasks-per-play', type=int, default=10, help='number of tasks per play')
+    parser.add_argument('--backends', nargs='+', default=backends, choices=backends, help='backends to benchmark')
+    parser.add_argument('--directory', default='/tmp', help='directory in which to write the playbooks')
+    parser.add_argument('--save', default=None, help='write results, as json, to this file')
+    parser.add_argument('--baseline', default=None, help='compare results against this previously-saved json file')
+    return parser
+
+def make_task(play, port):
+    task = dict()
+    task['name'] = '[nxos_interfaces : v.100], Ethernet1/{}'.format(port)
+    config = dict()
+    config['name'] = 'Ethernet1/{}'.format(port)
+    config['description'] = 'host-{} port {}'.format(play, port)
+    config['enabled'] = True
+    config['mode'] = 'layer3'
+    config['mtu'] = 9216
+    task['cisco.nxos.nxos_interfaces'] = dict()
+    task['cisco.nxos.nxos_interfaces']['config'] = [config]
+    task['cisco.nxos.nxos_interfaces']['state'] = 'merged'
+    return task
+
+def make_stream(cfg):
+    stream = list()
+    for play in range(cfg.tasks // cfg.tasks_per_play):
+        playbook = dict()
+        playbook['name'] = 'ansible_playbook'
+        playbook['gather_facts'] = False
+        playbook['hosts'] = 'host-{}'.format(play)
+        playbook['vars'] = {'ansible_connection': 'httpapi', 'ansible_network_os': 'nxos', 'ansible_httpapi_use_ssl': True}
+        playbook['tasks'] = [make_task(play, port) for port in range(1, cfg.tasks_per_play + 1)]
+        stream.append(playbook)
+    return stream
+
+def write(backend, stream, fh):
+    if backend == 'pyyaml':
+        yaml.dump(stream, fh, Dumper=yaml.Dumper, indent=4, allow_unicode=True, explicit_end=True, explicit_start=True, default_flow_style=False)
+    elif backend == 'libyaml':
+        yaml.dump(stream, fh, Dumper=CDumper, indent=4, allow_unicode=True, explicit_end=True, explicit_start=True, default_flow_style=False)
+    elif backend == 'scriptkit':
+        Emitter(log).write_yaml(stream, fh, explicit_start=True, explicit_end=True)
+    elif backend == 'json':
+        fh.write(Emitter(log).dump_json(stream))
+
+def run(cfg):
+    stream = make_stream(cfg)
+    tasks = len(stream) * cfg.tasks_per_play
+    results = dict()
+    for backend in cfg.backends:
+        if backend == 'libyaml' and CDumper == None:
+            print('skipping libyaml. PyYAML was built without libyaml')
+            continue
+        filename = path.join(cfg.directory, 'benchmark_emitter_{}'.format(backend))
+        start = time.perf_counter()
+        with open(filename, 'w') as fh:
+            write(backend, stream, fh)
+        seconds = time.perf_counter() - start
+        megabytes = path.getsize(filename) / 1e6
+        remove(filename)
+        results[backend] = dict()
+        results[backend]['seconds'] = seconds
+        results[backend]['tasks_per_second'] = tasks / seconds
+        results[backend]['mb_per_second'] = megabytes / seconds
+    return results
+
+def report(results, baseline):
+    print('{:<12} {:>10} {:>14} {:>10} {:>8}'.format('backend', 'seconds', 'tasks/sec', 'MB/sec', 'speedup'))
+    for backend in results:
+        result = results[backend]
+        if baseline != None and backend in baseline:
+            reference = baseline[backend]['seconds']
+        elif 'pyyaml' in results:
+            reference = results['pyyaml']['seconds']
+        else:
+            reference = None
+        if reference == None:
+            speedup = 'n/a'
+        else:
+            speedup = '{:.2f}x'.format(reference / result['seconds'])
+        print('{:<12} {:>10.2f} {:>14.0f} {:>10.2f} {:>8}'.format(
+            backend,
+            result['seconds'],
+            result['tasks_per_second'],
+            result['mb_per_second'],
+            speedup))
+    if baseline == None:
+        print('speedup is relative to pyyaml')
+    else:
+        print('speedup is relative to --baseline {}'.format(cfg.baseline))
+
+cfg = get_parser().parse_args()
+results = run(cfg)
+baseline = None
+if cfg.baseline != None:
+    with open(cfg.baseline, 'r') as fh:
+        baseline = json.load(fh)
+report(results, baseline)
+if cfg.save != None:
+    with open(cfg.save, 'w') as fh:
+        json.dump(results, fh, indent=4, sort_keys=True)
+    print('wrote {}'.format(cfg.save))
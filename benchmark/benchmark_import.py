@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_import.py
+our_version = 100
+'''
+********************************
+benchmark_import.py
+********************************
+
+Description
+-----------
+Measures ScriptKit startup cost.  Each case below is run in a new
+python interpreter (so nothing is already imported) --repeat times, and
+the median wall time, in milliseconds, is reported.  The interpreter's
+own startup time (case: python) is included for reference.
+
+    python          python -c pass
+    import_ask      import ask
+    facade_one      import ask; ask.NxosFeature
+    facade_all      import ask, then access every class in ask.__all__
+    direct_all      import every ScriptKit module directly
+
+To compare before and after a change::
+
+    ./benchmark_import.py --save /tmp/before.json
+    # make the change
+    ./benchmark_import.py --baseline /tmp/before.json
+
+To catch startup regressions e.g. in CI, --max-import-ask exits 1 if
+the import_ask case is slower than the given number of milliseconds
+over the python case.
+
+Usage
+-----
+./benchmark_import.py [--repeat N] [--save FILE] [--baseline FILE] [--max-import-ask MS]
+
+'''
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+cases = dict()
+cases['python'] = 'pass'
+cases['import_ask'] = 'import ask'
+cases['facade_one'] = 'import ask; ask.NxosFeature'
+cases['facade_all'] = 'import ask\nfor name in ask.__all__: getattr(ask, name)'
+cases['direct_all'] = 'import ask, importlib\nfor name in sorted(set(ask.class_module.values())): importlib.import_module(name)'
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark ScriptKit import time')
+    parser.add_argument('--repeat', type=int, default=10, help='number of timing runs per case')
+    parser.add_argument('--save', default=None, help='write results, as json, to this file')
+    parser.add_argument('--baseline', default=None, help='compare results against this previously-saved json file')
+    parser.add_argument('--max-import-ask', type=float, default=None, help='exit 1 if import_ask minus python exceeds this many milliseconds')
+    return parser
+
+def msec(code, repeat):
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+def run(cfg):
+    results = dict()
+    for name in cases:
+        results[name] = msec(cases[name], cfg.repeat)
+    return results
+
+def report(results, baseline):
+    if baseline == None:
+        print('{:<16} {:>12}'.format('case', 'msec'))
+        for name in results:
+            print('{:<16} {:>12.2f}'.format(name, results[name]))
+        return
+    print('{:<16} {:>12} {:>12} {:>8}'.format('case', 'before', 'after', 'speedup'))
+    for name in results:
+        if name not in baseline:
+            print('{:<16} {:>12} {:>12.2f} {:>8}'.format(name, 'n/a', results[name], 'n/a'))
+            continue
+        print('{:<16} {:>12.2f} {:>12.2f} {:>7.2f}x'.format(
+            name,
+            baseline[name],
+            results[name],
+            baseline[name] / results[name]))
+
+cfg = get_parser().parse_args()
+results = run(cfg)
+baseline = None
+if cfg.baseline != None:
+    with open(cfg.baseline, 'r') as fh:
+        baseline = json.load(fh)
+report(results, baseline)
+if cfg.save != None:
+    with open(cfg.save, 'w') as fh:
+        json.dump(results, fh, indent=4, sort_keys=True)
+    print('wrote {}'.format(cfg.save))
+if cfg.max_import_ask != None:
+    overhead = results['import_ask'] - results['python']
+    if overhead > cfg.max_import_ask:
+        print('FAIL: import ask took {:.2f} msec, over the {:.2f} msec limit'.format(overhead, cfg.max_import_ask))
+        exit(1)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_instantiation.py
+our_version = 101
+'''
+********************************
+benchmark_instantiation.py
+********************************
+
+Description
+-----------
+Measures the cost of instantiating every ScriptKit NX-OS and Spirent
+task class.  For each class, the median (over --repeat runs) time
+to create --number instances is reported in microseconds per instance.
+With --memory, the memory held by --number instances (tracemalloc) is
+reported instead, in bytes per instance.
+
+To compare before and after a change, save the results from the
+earlier tree, then compare against them from the later tree::
+
+    git stash                # or checkout the earlier commit
+    ./benchmark_instantiation.py --save /tmp/before.json
+    git stash pop
+    ./benchmark_instantiation.py --baseline /tmp/before.json
+
+Usage
+-----
+./benchmark_instantiation.py [--number N] [--repeat N] [--memory] [--save FILE] [--baseline FILE]
+
+'''
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import statistics
+import timeit
+import tracemalloc
+
+from ask.common.log import Log
+from ask.common.task import Task
+
+# ERROR, since some (deprecated) classes log warnings when instantiated
+log = Log('benchmark_instantiation', 'ERROR', 'ERROR')
+
+packages = ['ask.cisco.nxos', 'ask.spirent']
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark ScriptKit task instantiation cost')
+    parser.add_argument('--number', type=int, default=200, help='instances created per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timing runs per class')
+    parser.add_argument('--memory', action='store_true', default=False, help='report bytes per instance rather than time')
+    parser.add_argument('--save', default=None, help='write results, as json, to this file')
+    parser.add_argument('--baseline', default=None, help='compare results against this previously-saved json file')
+    return parser
+
+def task_classes():
+    '''
+    yield (name, class) for every Task() subclass defined in packages
+    '''
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for module_info in sorted(pkgutil.iter_modules(package.__path__), key=lambda x: x.name):
+            module = importlib.import_module('{}.{}'.format(package_name, module_info.name))
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__:
+                    continue
+                if not issubclass(cls, Task):
+                    continue
+                yield '{}.{}'.format(module_info.name, name), cls
+
+def usec_per_instance(cls, number, repeat):
+    timings = timeit.repeat(lambda: cls(log), number=number, repeat=repeat)
+    return statistics.median(timings) / number * 1000000
+
+def bytes_per_instance(cls, number):
+    cls(log) # build the class schema first.  See Task().load_schema()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls(log) for _ in range(number)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / number
+
+def run(cfg):
+    results = dict()
+    for name, cls in task_classes():
+        if cfg.memory:
+            results[name] = bytes_per_instance(cls, cfg.number)
+        else:
+            results[name] = usec_per_instance(cls, cfg.number, cfg.repeat)
+    return results
+
+def report(results, baseline, unit):
+    if baseline == None:
+        print('{:<64} {:>12}'.format('class', unit))
+        for name in sorted(results):
+            print('{:<64} {:>12.2f}'.format(name, results[name]))
+        print('{:<64} {:>12.2f}'.format('TOTAL', sum(results.values())))
+        return
+    # speedup: before / after, for time or memory
+    print('{:<64} {:>12} {:>12} {:>8}'.format('class', 'before', 'after', 'speedup'))
+    total_before = 0
+    total_after = 0
+    for name in sorted(results):
+        if name not in baseline:
+            print('{:<64} {:>12} {:>12.2f} {:>8}'.format(name, 'n/a', results[name], 'n/a'))
+            continue
+        total_before += baseline[name]
+        total_after += results[name]
+        print('{:<64} {:>12.2f} {:>12.2f} {:>7.2f}x'.format(
+            name,
+            baseline[name],
+            results[name],
+            baseline[name] / results[name]))
+    print('{:<64} {:>12.2f} {:>12.2f} {:>7.2f}x'.format(
+        'TOTAL',
+        total_before,
+        total_after,
+        total_before / total_after))
+
+cfg = get_parser().parse_args()
+results = run(cfg)
+baseline = None
+if cfg.baseline != None:
+    with open(cfg.baseline, 'r') as fh:
+        baseline = json.load(fh)
+report(results, baseline, 'bytes/inst' if cfg.memory else 'usec/inst')
+if cfg.save != None:
+    with open(cfg.save, 'w') as fh:
+        json.dump(results, fh, indent=4, sort_keys=True)
+    print('wrote {}'.format(cfg.save))
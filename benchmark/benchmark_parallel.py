@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_parallel.py
+our_version = 100
+'''
+********************************
+benchmark_parallel.py
+********************************
+
+Description
+-----------
+Measures how ParallelPlaybook() generation time scales with the number of
+worker processes, for a fabric of --hosts switches (default 2000).  Each
+switch's play enables two features and configures --ports interfaces
+(default 48).
+
+For each --workers value (default: 0, which is a sequential run in this
+process, then 1, 2, 4 ... up to os.cpu_count()), the time to build and
+write every switch's playbook is reported, along with the speedup over
+the sequential run.  --mode selects merged (one playbook file, in host
+order) or per-host (one file per switch) output.
+
+Usage
+-----
+./benchmark_parallel.py [--hosts N] [--ports N] [--workers N [N ...]] [--mode merged|per-host] [--directory DIR]
+
+'''
+import argparse
+import os
+import shutil
+import time
+
+from ask.common.log import Log
+from ask.common.parallel import ParallelPlaybook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('benchmark_parallel', 'ERROR', 'ERROR')
+
+def default_workers():
+    workers = [0, 1]
+    while workers[-1] * 2 <= os.cpu_count():
+        workers.append(workers[-1] * 2)
+    if workers[-1] != os.cpu_count():
+        workers.append(os.cpu_count())
+    return workers
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark ParallelPlaybook() scaling')
+    parser.add_argument('--hosts', type=int, default=2000, help='number of switches')
+    parser.add_argument('--ports', type=int, default=48, help='number of interfaces per switch')
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers(), help='worker counts to benchmark')
+    parser.add_argument('--mode', default='merged', choices=['merged', 'per-host'], help='write one playbook, or one per switch')
+    parser.add_argument('--directory', default='/tmp/benchmark_parallel', help='scratch directory for the playbooks')
+    return parser
+
+# set from --ports in main.  Workers forked afterwards inherit it.
+ports = 48
+
+def build(pb, host, log):
+    pb.profile_nxos()
+    for feature in ['bgp', 'interface-vlan']:
+        task = NxosFeature(log)
+        task.feature = feature
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+    task = NxosInterfaces(log)
+    for port in range(1, ports + 1):
+        task.name = 'Ethernet1/{}'.format(port)
+        task.description = '{} port {}'.format(host, port)
+        task.mode = 'layer3'
+        task.mtu = 9216
+        task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+
+def seconds(cfg, workers):
+    shutil.rmtree(cfg.directory, ignore_errors=True)
+    os.makedirs(cfg.directory)
+    ppb = ParallelPlaybook(log)
+    ppb.builder = build
+    ppb.hosts = ['switch-{}'.format(x) for x in range(cfg.hosts)]
+    ppb.workers = workers
+    if cfg.mode == 'merged':
+        ppb.file = os.path.join(cfg.directory, 'fabric.yaml')
+    else:
+        ppb.directory = cfg.directory
+    start = time.perf_counter()
+    ppb.run()
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    cfg = get_parser().parse_args()
+    ports = cfg.ports
+    print('{} switches, {} ports each, {} output, {} cpus'.format(cfg.hosts, cfg.ports, cfg.mode, os.cpu_count()))
+    print('{:<8} {:>10} {:>8}'.format('workers', 'seconds', 'speedup'))
+    sequential = None
+    for workers in cfg.workers:
+        result = seconds(cfg, workers)
+        if sequential == None:
+            sequential = result
+        print('{:<8} {:>10.2f} {:>7.2f}x'.format(workers, result, sequential / result))
+    shutil.rmtree(cfg.directory, ignore_errors=True)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_playbook_stream.py
+our_version = 101
+'''
+********************************
+benchmark_playbook_stream.py
+********************************
+
+Description
+-----------
+Compares peak memory (max RSS) and wall time of writing a playbook with
+one play per host, --hosts plays, each with --tasks NxosInterfaces()
+tasks, in two modes:
+
+    list      append_playbook() keeps every play in memory and
+              write_playbook() dumps them all at the end
+    stream    pb.open_stream() is called first, and append_playbook()
+              writes each play as it is appended
+
+Each mode runs in its own python process, so max RSS is not shared
+between modes.  The two playbook files are compared, and must be
+identical.
+
+stream mode is also run with a quarter of --hosts.  Its max RSS must
+not grow by more than --max-growth MB between the two, i.e. memory must
+not grow with the number of plays.
+
+Usage
+-----
+./benchmark_playbook_stream.py [--hosts N] [--tasks N] [--directory DIR] [--max-growth MB]
+
+'''
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from os import path, remove
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark Playbook() streaming mode')
+    parser.add_argument('--hosts', type=int, default=2000, help='number of plays (one per host)')
+    parser.add_argument('--tasks', type=int, default=10, help='number of tasks per play')
+    parser.add_argument('--directory', default='/tmp', help='directory in which to write the playbooks')
+    parser.add_argument('--max-growth', type=float, default=5.0, help='maximum growth, in MB, of stream max RSS from hosts / 4 to hosts')
+    parser.add_argument('--mode', default=None, choices=['list', 'stream'], help=argparse.SUPPRESS)
+    return parser
+
+def playbook_file(cfg, mode):
+    return path.join(cfg.directory, 'benchmark_playbook_{}.yaml'.format(mode))
+
+def child(cfg):
+    '''
+    Build and write the playbook in cfg.mode.  Print results as json.
+    '''
+    from ask.common.log import Log
+    from ask.common.playbook import Playbook
+    from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+    log = Log('benchmark_playbook_stream', 'ERROR', 'ERROR')
+    start = time.perf_counter()
+    pb = Playbook(log)
+    pb.profile_nxos()
+    pb.file = playbook_file(cfg, cfg.mode)
+    if cfg.mode == 'stream':
+        pb.open_stream()
+    for host in range(cfg.hosts):
+        for port in range(1, cfg.tasks + 1):
+            task = NxosInterfaces(log)
+            task.name = 'Ethernet1/{}'.format(port)
+            task.mode = 'layer3'
+            task.description = 'host-{} port {}'.format(host, port)
+            task.add_interface()
+            task.state = 'merged'
+            task.commit()
+            pb.add_task(task)
+        pb.add_host('host-{}'.format(host))
+        pb.append_playbook()
+    pb.write_playbook()
+    result = dict()
+    result['seconds'] = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    result['max_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(result))
+
+def run(cfg, mode, hosts):
+    filename = playbook_file(cfg, mode)
+    if path.exists(filename):
+        remove(filename)
+    command = [sys.executable, __file__, '--mode', mode, '--hosts', str(hosts), '--tasks', str(cfg.tasks), '--directory', cfg.directory]
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+def same_contents(file_a, file_b):
+    with open(file_a, 'rb') as fh_a, open(file_b, 'rb') as fh_b:
+        return fh_a.read() == fh_b.read()
+
+cfg = get_parser().parse_args()
+if cfg.mode != None:
+    child(cfg)
+    exit(0)
+small_hosts = max(1, cfg.hosts // 4)
+results = dict()
+results['stream {}'.format(small_hosts)] = run(cfg, 'stream', small_hosts)
+for mode in ['list', 'stream']:
+    results[mode] = run(cfg, mode, cfg.hosts)
+print('{} hosts, {} tasks per host'.format(cfg.hosts, cfg.tasks))
+print('{:<12} {:>12} {:>12}'.format('mode', 'seconds', 'max_rss_mb'))
+for mode in results:
+    print('{:<12} {:>12.2f} {:>12.1f}'.format(mode, results[mode]['seconds'], results[mode]['max_rss_mb']))
+if not same_contents(playbook_file(cfg, 'list'), playbook_file(cfg, 'stream')):
+    print('FAIL: list and stream playbooks differ')
+    exit(1)
+print('list and stream playbooks are identical')
+growth = results['stream']['max_rss_mb'] - results['stream {}'.format(small_hosts)]['max_rss_mb']
+if growth > cfg.max_growth:
+    print('FAIL: stream max RSS grew {:.1f} MB from {} to {} hosts.  Expected at most {:.1f} MB'.format(growth, small_hosts, cfg.hosts, cfg.max_growth))
+    exit(1)
+print('stream max RSS grew {:.1f} MB from {} to {} hosts'.format(growth, small_hosts, cfg.hosts))
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# benchmark/benchmark_snapshot.py
+our_version = 100
+'''
+********************************
+benchmark_snapshot.py
+********************************
+
+Description
+-----------
+Measures the time, and memory, to hand two large tasks to a playbook:
+
+    acl     NxosAcls() with one ACL of --aces ACEs (default 10000)
+    bgp     NxosBgpGlobal() with --neighbors neighbors (default 2000),
+            each with bfd, timers, and password settings
+
+Each task is built once, then committed and added to --hosts plays
+(default 4), as a script applying the same ACL or BGP config to several
+switches would.  This is done with pb.deepcopy_tasks False (snapshot,
+the default: tasks and plays are kept by reference, and identical
+subtrees are shared) and True (deepcopy: every play holds its own
+mutable copy).
+
+For each case, the median (over --repeat runs) time in milliseconds from
+commit() through the last append_playbook() is reported, along with the
+memory retained by the playbook (tracemalloc, in a separate run).
+
+To compare before and after a change::
+
+    ./benchmark_snapshot.py --save /tmp/before.json
+    # make the change
+    ./benchmark_snapshot.py --baseline /tmp/before.json
+
+Usage
+-----
+./benchmark_snapshot.py [--aces N] [--neighbors N] [--hosts N] [--repeat N] [--save FILE] [--baseline FILE]
+
+'''
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.snapshot import snapshots
+from ask.cisco.nxos.nxos_acls import NxosAcls
+from ask.cisco.nxos.nxos_bgp_global import NxosBgpGlobal
+
+log = Log('benchmark_snapshot', 'ERROR', 'ERROR')
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Benchmark Playbook() task snapshots against deep copies')
+    parser.add_argument('--aces', type=int, default=10000, help='number of ACEs in the acl task')
+    parser.add_argument('--neighbors', type=int, default=2000, help='number of neighbors in the bgp task')
+    parser.add_argument('--hosts', type=int, default=4, help='number of plays to which each task is added')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timing runs per case')
+    parser.add_argument('--save', default=None, help='write results, as json, to this file')
+    parser.add_argument('--baseline', default=None, help='compare results against this previously-saved json file')
+    return parser
+
+def acl_task(cfg):
+    task = NxosAcls(log)
+    for sequence in range(1, cfg.aces + 1):
+        task.afi = 'ipv4'
+        task.grant = 'permit'
+        task.protocol = 'ip'
+        task.sequence = sequence
+        task.destination_address = '10.{}.{}.0'.format(sequence // 256 % 256, sequence % 256)
+        task.destination_wildcard_bits = '0.0.0.255'
+        task.source_address = '192.168.0.0'
+        task.source_wildcard_bits = '0.0.255.255'
+        task.add_ace()
+    task.afi = 'ipv4'
+    task.name = 'BIG_ACL'
+    task.add_acl()
+    task.state = 'merged'
+    return task
+
+def bgp_task(cfg):
+    task = NxosBgpGlobal(log)
+    task.as_number = '65000'
+    for index in range(cfg.neighbors):
+        task.neighbor_address = '10.{}.{}.1'.format(index // 256 % 256, index % 256)
+        task.neighbor_remote_as = str(65001 + index)
+        task.neighbor_bfd_set = True
+        task.neighbor_bfd_singlehop = True
+        task.neighbor_password_encryption = 0
+        task.neighbor_password_key = 'wings'
+        task.neighbor_timers_holdtime = 20
+        task.neighbor_timers_keepalive = 5
+        task.neighbor_update_source = 'loopback0'
+        task.add_bgp_neighbor()
+    task.state = 'merged'
+    return task
+
+def hand_off(cfg, task, deepcopy_tasks):
+    '''
+    commit task, and add it to cfg.hosts plays.  return the playbook
+    '''
+    pb = Playbook(log)
+    pb.profile_nxos()
+    pb.deepcopy_tasks = deepcopy_tasks
+    task.commit()
+    for host in range(cfg.hosts):
+        pb.add_task(task)
+        pb.add_host('leaf-{}'.format(host))
+        pb.append_playbook()
+    return pb
+
+def msec(cfg, task, deepcopy_tasks):
+    timings = list()
+    for _ in range(cfg.repeat):
+        snapshots.clear()
+        start = time.perf_counter()
+        hand_off(cfg, task, deepcopy_tasks)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+def retained_mb(cfg, task, deepcopy_tasks):
+    '''
+    memory retained by the playbook (and the task's snapshot), in MB
+    '''
+    snapshots.clear()
+    gc.collect()
+    tracemalloc.start()
+    pb = hand_off(cfg, task, deepcopy_tasks)
+    snapshots.clear()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del pb
+    return current / 1e6
+
+def run(cfg):
+    tasks = dict()
+    tasks['acl'] = acl_task(cfg)
+    tasks['bgp'] = bgp_task(cfg)
+    results = dict()
+    for name in tasks:
+        for mode, deepcopy_tasks in [('snapshot', False), ('deepcopy', True)]:
+            case = '{}_{}'.format(name, mode)
+            results[case] = dict()
+            results[case]['msec'] = msec(cfg, tasks[name], deepcopy_tasks)
+            results[case]['mb'] = retained_mb(cfg, tasks[name], deepcopy_tasks)
+    return results
+
+def report(results, baseline):
+    if baseline == None:
+        print('{:<16} {:>10} {:>10}'.format('case', 'msec', 'MB'))
+        for case in results:
+            print('{:<16} {:>10.1f} {:>10.2f}'.format(case, results[case]['msec'], results[case]['mb']))
+        return
+    print('{:<16} {:>10} {:>10} {:>8} {:>10} {:>10}'.format('case', 'before', 'after', 'speedup', 'MB before', 'MB after'))
+    for case in results:
+        if case not in baseline:
+            print('{:<16} {:>10} {:>10.1f} {:>8} {:>10} {:>10.2f}'.format(case, 'n/a', results[case]['msec'], 'n/a', 'n/a', results[case]['mb']))
+            continue
+        print('{:<16} {:>10.1f} {:>10.1f} {:>7.2f}x {:>10.2f} {:>10.2f}'.format(
+            case,
+            baseline[case]['msec'],
+            results[case]['msec'],
+            baseline[case]['msec'] / results[case]['msec'],
+            baseline[case]['mb'],
+            results[case]['mb']))
+
+cfg = get_parser().parse_args()
+print('acl: {} aces, bgp: {} neighbors, each added to {} plays'.format(cfg.aces, cfg.neighbors, cfg.hosts))
+results = run(cfg)
+baseline = None
+if cfg.baseline != None:
+    with open(cfg.baseline, 'r') as fh:
+        baseline = json.load(fh)
+report(results, baseline)
+if cfg.save != None:
+    with open(cfg.save, 'w') as fh:
+        json.dump(results, fh, indent=4, sort_keys=True)
+    print('wrote {}'.format(cfg.save))
@@ -0,0 +1,172 @@
+# ask/__init__.py
+our_version = 107
+'''
+****************
+ask/__init__.py
+****************
+
+Description
+-----------
+
+Lazy-loading facade for all ScriptKit classes::
+
+    import ask
+    task = ask.NxosFeature(log)
+
+Every ScriptKit class (and the Log() factory) is available by name
+directly from ask.  The module that defines a class is imported only
+on first access to that class (PEP 562 module __getattr__), so
+``import ask`` itself costs almost nothing, and a script pays only for
+the modules it uses.
+
+The usual direct imports e.g. ``from ask.cisco.nxos.nxos_feature import
+NxosFeature`` are unchanged.
+
+ask/__init__.py extends __path__ with every other ask directory on
+sys.path (as pkgutil.extend_path() does, without the cost of importing
+pkgutil), so ask.spirent, which lives outside lib/ask, is still found.
+
+When adding a module, add its classes to class_module, below.
+unit_test/common/unit_test_ask_facade.py fails if a class is missing.
+
+See benchmark/benchmark_import.py to measure import time.
+
+'''
+import sys
+from importlib import import_module
+from os import path
+
+for entry in sys.path:
+    portion = path.join(entry, __name__)
+    if portion not in __path__ and path.isdir(portion):
+        __path__.append(portion)
+
+# key: class name, value: name of the module that defines it
+class_module = {
+    'Common':                      'ask.common.common',
+    'DeferredValidation':          'ask.common.task',
+    'Emitter':                     'ask.common.emitter',
+    'FrozenDict':                  'ask.common.snapshot',
+    'FrozenList':                  'ask.common.snapshot',
+    'InterfaceName':               'ask.common.common',
+    'Inventory':                   'ask.common.inventory',
+    'Log':                         'ask.common.log',
+    'NxosAaaServer':               'ask.cisco.nxos.nxos_aaa_server',
+    'NxosAaaServerHost':           'ask.cisco.nxos.nxos_aaa_server_host',
+    'NxosAclInterfaces':           'ask.cisco.nxos.nxos_acl_interfaces',
+    'NxosAcls':                    'ask.cisco.nxos.nxos_acls',
+    'NxosBanner':                  'ask.cisco.nxos.nxos_banner',
+    'NxosBfdGlobal':               'ask.cisco.nxos.nxos_bfd_global',
+    'NxosBfdInterfaces':           'ask.cisco.nxos.nxos_bfd_interfaces',
+    'NxosBgp':                     'ask.cisco.nxos.nxos_bgp',
+    'NxosBgpAddressFamily':        'ask.cisco.nxos.nxos_bgp_address_family',
+    'NxosBgpAf':                   'ask.cisco.nxos.nxos_bgp_af',
+    'NxosBgpGlobal':               'ask.cisco.nxos.nxos_bgp_global',
+    'NxosBgpNeighbor':             'ask.cisco.nxos.nxos_bgp_neighbor',
+    'NxosBgpNeighborAddressFamily':'ask.cisco.nxos.nxos_bgp_neighbor_address_family',
+    'NxosBgpNeighborAf':           'ask.cisco.nxos.nxos_bgp_neighbor_af',
+    'NxosCommand':                 'ask.cisco.nxos.nxos_command',
+    'NxosConfig':                  'ask.cisco.nxos.nxos_config',
+    'NxosEvpnGlobal':              'ask.cisco.nxos.nxos_evpn_global',
+    'NxosEvpnVni':                 'ask.cisco.nxos.nxos_evpn_vni',
+    'NxosFeature':                 'ask.cisco.nxos.nxos_feature',
+    'NxosGir':                     'ask.cisco.nxos.nxos_gir',
+    'NxosGirProfileManagement':    'ask.cisco.nxos.nxos_gir_profile_management',
+    'NxosHsrp':                    'ask.cisco.nxos.nxos_hsrp',
+    'NxosHsrpInterfaces':          'ask.cisco.nxos.nxos_hsrp_interfaces',
+    'NxosIgmp':                    'ask.cisco.nxos.nxos_igmp',
+    'NxosIgmpSnooping':            'ask.cisco.nxos.nxos_igmp_snooping',
+    'NxosInterface':               'ask.cisco.nxos.nxos_interface',
+    'NxosInterfaceOspf':           'ask.cisco.nxos.nxos_interface_ospf',
+    'NxosInterfaces':              'ask.cisco.nxos.nxos_interfaces',
+    'NxosL2Interface':             'ask.cisco.nxos.nxos_l2_interface',
+    'NxosL2Interfaces':            'ask.cisco.nxos.nxos_l2_interfaces',
+    'NxosL3Interface':             'ask.cisco.nxos.nxos_l3_interface',
+    'NxosL3Interfaces':            'ask.cisco.nxos.nxos_l3_interfaces',
+    'NxosLacpInterfaces':          'ask.cisco.nxos.nxos_lacp_interfaces',
+    'NxosLagInterfaces':           'ask.cisco.nxos.nxos_lag_interfaces',
+    'NxosLldpGlobal':              'ask.cisco.nxos.nxos_lldp_global',
+    'NxosLldpInterfaces':          'ask.cisco.nxos.nxos_lldp_interfaces',
+    'NxosLogging':                 'ask.cisco.nxos.nxos_logging',
+    'NxosNtp':                     'ask.cisco.nxos.nxos_ntp',
+    'NxosNtpAuth':                 'ask.cisco.nxos.nxos_ntp_auth',
+    'NxosNtpOptions':              'ask.cisco.nxos.nxos_ntp_options',
+    'NxosNxapi':                   'ask.cisco.nxos.nxos_nxapi',
+    'NxosOspf':                    'ask.cisco.nxos.nxos_ospf',
+    'NxosOspfInterfaces':          'ask.cisco.nxos.nxos_ospf_interfaces',
+    'NxosOspfV2':                  'ask.cisco.nxos.nxos_ospfv2',
+    'NxosOverlayGlobal':           'ask.cisco.nxos.nxos_overlay_global',
+    'NxosPim':                     'ask.cisco.nxos.nxos_pim',
+    'NxosPimInterface':            'ask.cisco.nxos.nxos_pim_interface',
+    'NxosPimRpAddress':            'ask.cisco.nxos.nxos_pim_rp_address',
+    'NxosPrefixLists':             'ask.cisco.nxos.nxos_prefix_lists',
+    'NxosReboot':                  'ask.cisco.nxos.nxos_reboot',
+    'NxosSnmpCommunity':           'ask.cisco.nxos.nxos_snmp_community',
+    'NxosSnmpContact':             'ask.cisco.nxos.nxos_snmp_contact',
+    'NxosSnmpHost':                'ask.cisco.nxos.nxos_snmp_host',
+    'NxosSnmpLocation':            'ask.cisco.nxos.nxos_snmp_location',
+    'NxosStaticRoutes':            'ask.cisco.nxos.nxos_static_routes',
+    'NxosSystem':                  'ask.cisco.nxos.nxos_system',
+    'NxosVlan':                    'ask.cisco.nxos.nxos_vlan',
+    'NxosVlans':                   'ask.cisco.nxos.nxos_vlans',
+    'NxosVpc':                     'ask.cisco.nxos.nxos_vpc',
+    'NxosVpcInterface':            'ask.cisco.nxos.nxos_vpc_interface',
+    'NxosVrf':                     'ask.cisco.nxos.nxos_vrf',
+    'NxosVrfAf':                   'ask.cisco.nxos.nxos_vrf_af',
+    'NxosVrfInterface':            'ask.cisco.nxos.nxos_vrf_interface',
+    'NxosVtpDomain':               'ask.cisco.nxos.nxos_vtp_domain',
+    'NxosVtpPassword':             'ask.cisco.nxos.nxos_vtp_password',
+    'NxosVtpVersion':              'ask.cisco.nxos.nxos_vtp_version',
+    'NxosVxlanVtep':               'ask.cisco.nxos.nxos_vxlan_vtep',
+    'NxosVxlanVtepVni':            'ask.cisco.nxos.nxos_vxlan_vtep_vni',
+    'ParallelPlaybook':            'ask.common.parallel',
+    'Pause':                       'ask.ansible.pause',
+    'Playbook':                    'ask.common.playbook',
+    'PlaybookCache':               'ask.common.cache',
+    'RegisterSave':                'ask.ansible.register_save',
+    'ShardWriter':                 'ask.common.shard',
+    'Snapshots':                   'ask.common.snapshot',
+    'StcBgpDevice':                'ask.spirent.stc_bgp_device',
+    'StcDevice':                   'ask.spirent.stc_device',
+    'StcDeviceConfig':             'ask.spirent.stc_device_config',
+    'StcDeviceConfigIpv4':         'ask.spirent.stc_device_config',
+    'StcDeviceConfigIpv6':         'ask.spirent.stc_device_config',
+    'StcDeviceConfigIpv6LinkLocal':'ask.spirent.stc_device_config_ipv6_link_local',
+    'StcDeviceControl':            'ask.spirent.stc_device_control',
+    'StcDeviceIpv4':               'ask.spirent.stc_device',
+    'StcDeviceIpv6':               'ask.spirent.stc_device',
+    'StcDeviceMac':                'ask.spirent.stc_device',
+    'StcDrvClear':                 'ask.spirent.stc_drv_clear',
+    'StcDrvCreate':                'ask.spirent.stc_drv_create',
+    'StcDrvDelete':                'ask.spirent.stc_drv_delete',
+    'StcDrvFetch':                 'ask.spirent.stc_drv_fetch',
+    'StcDrvSave':                  'ask.spirent.stc_drv_save',
+    'StcDrvSubscribe':             'ask.spirent.stc_drv_subscribe',
+    'StcDrvUnsubscribe':           'ask.spirent.stc_drv_unsubscribe',
+    'StcPortControl':              'ask.spirent.stc_port_control',
+    'StcPorts':                    'ask.spirent.stc_ports',
+    'StcSession':                  'ask.spirent.stc_session',
+    'StcStreamblock':              'ask.spirent.stc_streamblock',
+    'StcTrafficControl':           'ask.spirent.stc_traffic_control',
+    'Task':                        'ask.common.task',
+    'TaskProperty':                'ask.common.task',
+    'TrustedSource':               'ask.common.task',
+    'ValidationCollector':         'ask.common.common',
+    'ValidationError':             'ask.common.common',
+    'ValidationReport':            'ask.common.common',
+    'ValidatorCache':              'ask.common.common',
+    'VarsWriter':                  'ask.common.hoist'
+}
+
+__all__ = sorted(class_module)
+
+def __getattr__(name):
+    if name not in class_module:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+    value = getattr(import_module(class_module[name]), name)
+    # cache, so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
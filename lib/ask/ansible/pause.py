@@ -1,7 +1,7 @@
 # Pause() - python/lib3/ask_task_pause.py
 our_version = 104
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ==================
 Pause() - pause.py
@@ -37,6 +37,9 @@ class Pause(Task):
         self.lib_version = our_version
         self._classname = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('seconds')
 
@@ -45,18 +48,13 @@ class Pause(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.seconds == None:
-            self.task_log.error('exiting. call instance.seconds before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.seconds before calling instance.update()')
 
     def update(self):
         '''
@@ -82,13 +80,4 @@ class Pause(Task):
         expectation = 'int()'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def seconds(self):
-        return self.properties['seconds']
-    @seconds.setter
-    def seconds(self, x):
-        parameter = 'seconds'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ansible_pause_seconds(x, parameter)
-        self.properties[parameter] = x
+    seconds = TaskProperty('verify_ansible_pause_seconds')
@@ -1,6 +1,6 @@
 # RegisterSave() - ansible/register_save.py
 our_version = 105
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 Name: register_save.py
 
@@ -21,6 +21,9 @@ class RegisterSave(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('filename')
         self.properties_set.add('var')
@@ -30,21 +33,15 @@ class RegisterSave(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['name'] = None
 
     def final_verification(self):
         if self.var == None:
-            self.task_log.error('exiting. call instance.var before calling update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.var before calling update()')
         if self.filename == None:
-            self.task_log.error('exiting. call instance.filename before calling update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.filename before calling update()')
 
     def commit(self):
         self.update()
@@ -60,22 +57,6 @@ class RegisterSave(Task):
         save_results = 'copy content="{' + '{ ' + self.var + ' }' + '}"' + ' dest="' + self.filename + '"'
         self.ansible_task[self.ansible_module] = save_results
 
-    @property
-    def filename(self):
-        return self.properties['filename']
-    @filename.setter
-    def filename(self, x):
-        parameter = 'filename'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    filename = TaskProperty()
 
-    @property
-    def var(self):
-        return self.properties['var']
-    @var.setter
-    def var(self, x):
-        parameter = 'var'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    var = TaskProperty()
@@ -1,7 +1,7 @@
 # NxosAaaServer() - cisco/nxos/nxos_aaa_server.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosAaaServer() 
@@ -144,6 +144,9 @@ class NxosAaaServer(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_aaa_server_deadtime_min = 1
         self.nxos_aaa_server_deadtime_max = 1440
 
@@ -183,18 +186,13 @@ class NxosAaaServer(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.server_type == None:
-            self.task_log.error('exiting. Set instance.server_type before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.server_type before calling instance.commit()')
         if self.task_name == None:
             self.task_name = 'nxos_aaa_server: server_type {}'.format(self.server_type)
 
@@ -267,79 +265,17 @@ class NxosAaaServer(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def deadtime(self):
-        return self.properties['deadtime']
-    @deadtime.setter
-    def deadtime(self, x):
-        parameter = 'deadtime'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_deadtime(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def directed_request(self):
-        return self.properties['directed_request']
-    @directed_request.setter
-    def directed_request(self, x):
-        parameter = 'directed_request'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_directed_request(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def encrypt_type(self):
-        return self.properties['encrypt_type']
-    @encrypt_type.setter
-    def encrypt_type(self, x):
-        parameter = 'encrypt_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_encrypt_type(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def global_key(self):
-        return self.properties['global_key']
-    @global_key.setter
-    def global_key(self, x):
-        parameter = 'global_key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def server_timeout(self):
-        return self.properties['server_timeout']
-    @server_timeout.setter
-    def server_timeout(self, x):
-        parameter = 'server_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_server_timeout(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def server_type(self):
-        return self.properties['server_type']
-    @server_type.setter
-    def server_type(self, x):
-        parameter = 'server_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_server_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_state(x, parameter)
-        self.properties[parameter] = x
+    deadtime = TaskProperty('verify_nxos_aaa_server_deadtime', to_str=True)
+
+    directed_request = TaskProperty('verify_nxos_aaa_server_directed_request')
+
+    encrypt_type = TaskProperty('verify_nxos_aaa_server_encrypt_type', to_str=True)
+
+    global_key = TaskProperty()
+
+    server_timeout = TaskProperty('verify_nxos_aaa_server_server_timeout', to_str=True)
+
+    server_type = TaskProperty('verify_nxos_aaa_server_server_type')
+
+    state = TaskProperty('verify_nxos_aaa_server_state')
 
@@ -1,7 +1,7 @@
 # NxosAaaServerHost() - cisco/nxos/nxos_aaa_server_host.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosAaaServerHost() 
@@ -162,6 +162,9 @@ class NxosAaaServerHost(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_aaa_server_host_acct_port_min = 1
         self.nxos_aaa_server_host_acct_port_max = 65535
 
@@ -198,7 +201,6 @@ class NxosAaaServerHost(Task):
         self.properties_set.add('server_type')
         self.properties_set.add('state')
         self.properties_set.add('tacacs_port')
-        self.init_properties()
 
         # scriptkit_properties can be used by scripts when
         # setting task_name. See Task().append_to_task_name()
@@ -206,18 +208,14 @@ class NxosAaaServerHost(Task):
         self.scriptkit_properties.update(self.properties_set)
 
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.address == None:
-            self.task_log.error('exiting. Set instance.address before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.address before calling instance.commit()')
         if self.server_type == None:
-            self.task_log.error('exiting. Set instance.server_type before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.server_type before calling instance.commit()')
         if self.task_name == None:
             self.task_name = 'nxos_aaa_server_host: address {}, server_type {}'.format(self.address, self.server_type)
 
@@ -306,100 +304,20 @@ class NxosAaaServerHost(Task):
         range_max = self.nxos_aaa_server_host_tacacs_port_max
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def acct_port(self):
-        return self.properties['acct_port']
-    @acct_port.setter
-    def acct_port(self, x):
-        parameter = 'acct_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_acct_port(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def address(self):
-        return self.properties['address']
-    @address.setter
-    def address(self, x):
-        parameter = 'address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_address(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def auth_port(self):
-        return self.properties['auth_port']
-    @auth_port.setter
-    def auth_port(self, x):
-        parameter = 'auth_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_auth_port(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def encrypt_type(self):
-        return self.properties['encrypt_type']
-    @encrypt_type.setter
-    def encrypt_type(self, x):
-        parameter = 'encrypt_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_encrypt_type(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def host_timeout(self):
-        return self.properties['host_timeout']
-    @host_timeout.setter
-    def host_timeout(self, x):
-        parameter = 'host_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_host_timeout(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def key(self):
-        return self.properties['key']
-    @key.setter
-    def key(self, x):
-        parameter = 'key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def server_type(self):
-        return self.properties['server_type']
-    @server_type.setter
-    def server_type(self, x):
-        parameter = 'server_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_server_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def tacacs_port(self):
-        return self.properties['tacacs_port']
-    @tacacs_port.setter
-    def tacacs_port(self, x):
-        parameter = 'tacacs_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_aaa_server_host_tacacs_port(x, parameter)
-        self.properties[parameter] = str(x)
+    acct_port = TaskProperty('verify_nxos_aaa_server_host_acct_port', to_str=True)
+
+    address = TaskProperty('verify_nxos_aaa_server_host_address')
+
+    auth_port = TaskProperty('verify_nxos_aaa_server_host_auth_port', to_str=True)
+
+    encrypt_type = TaskProperty('verify_nxos_aaa_server_host_encrypt_type', to_str=True)
+
+    host_timeout = TaskProperty('verify_nxos_aaa_server_host_host_timeout', to_str=True)
+
+    key = TaskProperty()
+
+    server_type = TaskProperty('verify_nxos_aaa_server_host_server_type')
+
+    state = TaskProperty('verify_nxos_aaa_server_host_state')
+
+    tacacs_port = TaskProperty('verify_nxos_aaa_server_host_tacacs_port', to_str=True)
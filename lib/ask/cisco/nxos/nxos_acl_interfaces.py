@@ -1,7 +1,7 @@
 # NxosAclInterfaces() - cisco/nxos/nxos_acl_interfaces.py
-our_version = 107
+our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosAclInterfaces()
@@ -220,6 +220,9 @@ class NxosAclInterfaces(Task):
         self.access_group_list = list()
         self.interface_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_acl_interfaces_valid_afi = set()
         self.nxos_acl_interfaces_valid_afi.add('ipv4')
         self.nxos_acl_interfaces_valid_afi.add('ipv6')
@@ -268,21 +271,15 @@ class NxosAclInterfaces(Task):
         self.property_map['afi'] = 'afi'
         self.property_map['name'] = 'name'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if len(self.interface_list) == 0:
-            self.task_log.error('exiting. call instance.add_interface() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_interface() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -301,16 +298,13 @@ class NxosAclInterfaces(Task):
         self.ansible_task[self.ansible_module]['state'] = self.state
 
     def init_interface(self):
-        for p in self.interface_properties:
-            self.properties[p] = None
+        self.reset(self.interface_properties)
         self.access_group_list = list()
     def verify_interface(self):
         if self.name == None:
-            self.task_log.error('exiting. Set instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.name before calling instance.add_interface()')
         if len(self.access_group_list) == 0:
-            self.task_log.error('exiting. Call instance.add_access_group() at least once before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. Call instance.add_access_group() at least once before calling instance.add_interface()')
     def add_interface(self):
         self.verify_interface()
         d = dict()
@@ -320,16 +314,13 @@ class NxosAclInterfaces(Task):
         self.init_interface()
 
     def init_access_group(self):
-        for p in self.access_group_properties:
-            self.properties[p] = None
+        self.reset(self.access_group_properties)
         self.acl_list = list()
     def verify_access_group(self):
         if self.afi == None:
-            self.task_log.error('exiting. Set instance.afi before calling instance.add_access_group()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.afi before calling instance.add_access_group()')
         if len(self.acl_list) == 0:
-            self.task_log.error('exiting. Call instance.add_acl() at least once before calling instance.add_access_group()')
-            exit(1)
+            self.fail_msg('exiting. Call instance.add_acl() at least once before calling instance.add_access_group()')
     def add_access_group(self):
         self.verify_access_group()
         d = dict()
@@ -339,15 +330,12 @@ class NxosAclInterfaces(Task):
         self.init_access_group()
 
     def init_acl(self):
-        for p in self.acl_properties:
-            self.properties[p] = None
+        self.reset(self.acl_properties)
     def verify_acl(self):
         if self.acl_name == None:
-            self.task_log.error('exiting. Set instance.acl_name before calling instance.add_acl()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.acl_name before calling instance.add_acl()')
         if self.acl_direction == None:
-            self.task_log.error('exiting. call instance.acl_direction before calling instance.add_acl()')
-            exit(1)
+            self.fail_msg('exiting. call instance.acl_direction before calling instance.add_acl()')
     def add_acl(self):
         self.verify_acl()
         d = dict()
@@ -385,48 +373,13 @@ class NxosAclInterfaces(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_acl_interfaces_verify_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('nxos_acl_interfaces_verify_afi')
 
-    @property
-    def acl_direction(self):
-        return self.properties['acl_direction']
-    @acl_direction.setter
-    def acl_direction(self, x):
-        parameter = 'acl_direction'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_acl_interfaces_verify_direction(x, parameter)
-        self.properties[parameter] = x
+    acl_direction = TaskProperty('nxos_acl_interfaces_verify_direction')
 
-    @property
-    def acl_name(self):
-        return self.properties['acl_name']
-    @acl_name.setter
-    def acl_name(self, x):
-        parameter = 'acl_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    acl_name = TaskProperty()
 
-    @property
-    def acl_port(self):
-        return self.properties['acl_port']
-    @acl_port.setter
-    def acl_port(self, x):
-        parameter = 'acl_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    acl_port = TaskProperty('verify_boolean')
 
     @property
     def name(self):
@@ -439,13 +392,4 @@ class NxosAclInterfaces(Task):
         self.verify_ip_interface(x, parameter) # in AnsCommon()
         self.properties[parameter] = x
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_acl_interfaces_verify_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('nxos_acl_interfaces_verify_state')
@@ -1,8 +1,8 @@
 # NxosAcls() - cisco/nxos/nxos_acls.py
-our_version = 113
+our_version = 114
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosAcls()
@@ -935,6 +935,9 @@ class NxosAcls(Task):
         self.ansible_task[self.ansible_module]['state'] = None
         self.ansible_task[self.ansible_module]['config'] = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_ace = set()
         self.properties_ace.add('dscp')
         self.properties_ace.add('fragments')
@@ -1148,8 +1151,6 @@ class NxosAcls(Task):
         self.port_min = 1
         self.port_max = 65535
 
-        self.init_properties()
-
     def get_mapped_property(self, x):
         '''
         return either a mapped property, if one exists, or x
@@ -1267,7 +1268,7 @@ class NxosAcls(Task):
             self.properties[p] = None
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.acls_ipv4 = list()
         self.acls_ipv6 = list()
         self.init_properties_acl()
@@ -1335,33 +1336,26 @@ class NxosAcls(Task):
             if self.properties[p] != None:
                 s.add(p)
         if self.destination_any != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.destination_any is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.destination_any is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_destination_address(self):
         s = set()
         for p in ['destination_host', 'destination_prefix']:
             if self.properties[p] != None:
                 s.add(p)
         if self.destination_address != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.destination_address is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.destination_address is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if self.destination_address != None and self.destination_wildcard_bits == None:
-            self.task_log.error('exiting. if instance.destination_address is set instance.destination_wildcard_bits must also be set.')
-            exit(1)
+            self.fail_msg('exiting. if instance.destination_address is set instance.destination_wildcard_bits must also be set.')
     def verify_ace_destination_prefix(self):
         s = set()
         for p in ['destination_any', 'destination_host', 'destination_wildcard_bits']:
             if self.properties[p] != None:
                 s.add(p)
         if self.destination_prefix != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.destination_prefix is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.destination_prefix is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_destination_port_range(self):
         s = set()
         for p in ['destination_port_range_end', 'destination_port_range_start']:
@@ -1369,33 +1363,24 @@ class NxosAcls(Task):
                 s.add(p)
         if len(s) == 2:
             if self.properties['destination_port_range_start'] > self.properties['destination_port_range_end']:
-                self.task_log.error('exiting. range_start must be less than range_end.')
-                for p in s:
-                    self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-                exit(1)
+                self.fail_msg('exiting. range_start must be less than range_end.',
+                    ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if len(s) in [0,2]:
             return s
-        self.task_log.error('exiting. Both destination_port_range_start and destination_port_range_end must be set or unset.')
-        for p in s:
-            self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-        exit(1)
+        self.fail_msg('exiting. Both destination_port_range_start and destination_port_range_end must be set or unset.',
+            ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_destination_port(self, s_pr):
         s = set()
         for p in ['destination_port_eq', 'destination_port_gt', 'destination_port_lt', 'destination_port_neq']:
             if self.properties[p] != None:
                 s.add(p)
         if len(s) > 1:
-            self.task_log.error('exiting. Only one destination_port property can be set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. Only one destination_port property can be set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if len(s) != 0 and len(s_pr) != 0:
-            self.task_log.error('exiting. Only one destination_port property can be set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            for p in ['destination_port_range_end', 'destination_port_range_start']:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            properties = sorted(s) + ['destination_port_range_end', 'destination_port_range_start']
+            self.fail_msg('exiting. Only one destination_port property can be set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in properties])
 
     def verify_ace_source_any(self):
         s = set()
@@ -1403,33 +1388,26 @@ class NxosAcls(Task):
             if self.properties[p] != None:
                 s.add(p)
         if self.source_any != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.source_any is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.source_any is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_source_address(self):
         s = set()
         for p in ['source_host', 'source_prefix']:
             if self.properties[p] != None:
                 s.add(p)
         if self.source_address != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.source_address is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.source_address is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if self.source_address != None and self.source_wildcard_bits == None:
-            self.task_log.error('exiting. if instance.source_address is set instance.source_wildcard_bits must also be set.')
-            exit(1)
+            self.fail_msg('exiting. if instance.source_address is set instance.source_wildcard_bits must also be set.')
     def verify_ace_source_prefix(self):
         s = set()
         for p in ['source_any', 'source_host', 'source_wildcard_bits']:
             if self.properties[p] != None:
                 s.add(p)
         if self.source_prefix != None and len(s) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.source_prefix is set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.source_prefix is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_source_port_range(self):
         s = set()
         for p in ['source_port_range_end', 'source_port_range_start']:
@@ -1437,38 +1415,28 @@ class NxosAcls(Task):
                 s.add(p)
         if len(s) == 2:
             if self.properties['source_port_range_start'] > self.properties['source_port_range_end']:
-                self.task_log.error('exiting. range_start must be less than range_end.')
-                for p in s:
-                    self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-                exit(1)
+                self.fail_msg('exiting. range_start must be less than range_end.',
+                    ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if len(s) in [0,2]:
             return s
-        self.task_log.error('exiting. Both source_port_range_start and source_port_range_end must be set or unset.')
-        for p in s:
-            self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-        exit(1)
+        self.fail_msg('exiting. Both source_port_range_start and source_port_range_end must be set or unset.',
+            ['property {}: {}'.format(p, self.properties[p]) for p in s])
     def verify_ace_source_port(self, s_pr):
         s = set()
         for p in ['source_port_eq', 'source_port_gt', 'source_port_lt', 'source_port_neq']:
             if self.properties[p] != None:
                 s.add(p)
         if len(s) > 1:
-            self.task_log.error('exiting. Only one source_port property can be set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. Only one source_port property can be set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in s])
         if len(s) != 0 and len(s_pr) != 0:
-            self.task_log.error('exiting. Only one source_port property can be set.')
-            for p in s:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            for p in ['source_port_range_end', 'source_port_range_start']:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            properties = sorted(s) + ['source_port_range_end', 'source_port_range_start']
+            self.fail_msg('exiting. Only one source_port property can be set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in properties])
 
     def verify_ace_afi(self):
         if self.afi == None:
-            self.task_log.error('exiting. instance.afi must be set prior to calling instance.add_ace()')
-            exit(1)
+            self.fail_msg('exiting. instance.afi must be set prior to calling instance.add_ace()')
     def verify_ace_destination(self):
         self.verify_ace_destination_any()
         self.verify_ace_destination_address()
@@ -1485,14 +1453,12 @@ class NxosAcls(Task):
         if self.remark != None:
             return
         if self.grant == None:
-            self.task_log.error('exiting. instance.grant must be set if instance.remark is not set.')
-            exit(1)
+            self.fail_msg('exiting. instance.grant must be set if instance.remark is not set.')
     def verify_ace_remark(self):
         if self.remark == None:
             return
         if self.sequence == None:
-            self.task_log.error('exiting. instance.sequence must be set if instance.remark is set.')
-            exit(1)
+            self.fail_msg('exiting. instance.sequence must be set if instance.remark is set.')
         verify_set = set()
         verify_set.update(self.ace_set_for_remark())
         verify_set.update(self.destination_set())
@@ -1501,14 +1467,11 @@ class NxosAcls(Task):
         verify_set.update(self.source_set())
         verify_set.update(self.tcp_set())
         if len(verify_set) != 0:
-            self.task_log.error('exiting. The following should not be set if instance.remark is set.')
-            for p in verify_set:
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. The following should not be set if instance.remark is set.',
+                ['property {}: {}'.format(p, self.properties[p]) for p in verify_set])
     def verify_ace_sequence(self):
         if self.sequence == None:
-            self.task_log.error('exiting. instance.sequence must be set before calling instance.add_ace()')
-            exit(1)
+            self.fail_msg('exiting. instance.sequence must be set before calling instance.add_ace()')
 
     def verify_ace_protocol_options(self):
         '''
@@ -1518,8 +1481,7 @@ class NxosAcls(Task):
         '''
         if len(self.igmp_set()) > 1:
             self.task_log.error('exiting. igmp options are mututually-exclusive. Only one should be set, per ACE.')
-            self.task_log.error('Got igmp options: {}'.format(sorted(self.igmp_set())))
-            exit(1)
+            self.fail_msg('Got igmp options: {}'.format(sorted(self.igmp_set())))
 
         verified = True
         all_protocol_options = set()
@@ -1533,11 +1495,8 @@ class NxosAcls(Task):
         if len(self.tcp_set()) != 0 and len(self.tcp_set()) != len(all_protocol_options):
             verified = False
         if verified == False:
-            self.task_log.error('exiting. options for only one of icmp, igmp, tcp should be set.')
-            self.task_log.error('The following options were set:')
-            for p in sorted(all_protocol_options):
-                self.task_log.error('   property {}: {}'.format(p, self.properties[p]))
-            exit(1)
+            self.fail_msg('exiting. options for only one of icmp, igmp, tcp should be set. The following options were set:',
+                ['property {}: {}'.format(p, self.properties[p]) for p in sorted(all_protocol_options)])
         if len(self.icmp_set()) != 0 and self.protocol != 'icmp':
             self.task_log.warning('setting instance.protocol = icmp due to icmp options are set')
             self.protocol = 'icmp'
@@ -1550,13 +1509,11 @@ class NxosAcls(Task):
 
     def verify_ace_icmp_echo(self):
         if self.afi == 'ipv6' and self.icmp_echo != None:
-            self.task_log.error('exiting. icmp_echo is not valid when afi is set to ipv6.  Use icmp_echo_request instead.')
-            exit(1)
+            self.fail_msg('exiting. icmp_echo is not valid when afi is set to ipv6.  Use icmp_echo_request instead.')
 
     def verify_ace(self):
         if self.protocol == None:
-            self.task_log.error('exiting. instance.protocol must be set before calling intance.add_ace()')
-            exit(1)
+            self.fail_msg('exiting. instance.protocol must be set before calling intance.add_ace()')
         self.verify_ace_afi()
         self.verify_ace_remark()
         self.verify_ace_grant()
@@ -1630,11 +1587,9 @@ class NxosAcls(Task):
                 mapped_p = self.get_mapped_property(p)
                 d[mapped_p] = self.properties[p]
         if len(source) == 0:
-            self.task_log.error('exiting. No source information was set')
-            exit(1)
+            self.fail_msg('exiting. No source information was set')
         if len(destination) == 0:
-            self.task_log.error('exiting. No destination information was set')
-            exit(1)
+            self.fail_msg('exiting. No destination information was set')
         if len(icmp) != 0:
             d['protocol_options'] = dict()
             d['protocol_options']['icmp'] = icmp
@@ -1652,11 +1607,9 @@ class NxosAcls(Task):
 
     def verify_acl(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_acl()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_acl()')
         if self.afi == None:
-            self.task_log.error('exiting. call instance.afi before calling instance.add_acl()')
-            exit(1)
+            self.fail_msg('exiting. call instance.afi before calling instance.add_acl()')
 
     def add_acl(self):
         self.verify_acl()
@@ -1665,15 +1618,14 @@ class NxosAcls(Task):
         if len(self.aces) != 0:
             d['aces'] = self.aces.copy()
         if self.afi == 'ipv4':
-            self.acls_ipv4.append(deepcopy(d))
+            self.acls_ipv4.append(d)
         if self.afi == 'ipv6':
-            self.acls_ipv6.append(deepcopy(d))
+            self.acls_ipv6.append(d)
         self.init_properties_acl()
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -1690,12 +1642,12 @@ class NxosAcls(Task):
             d = dict()
             d['afi'] = 'ipv4'
             d['acls'] = self.acls_ipv4.copy()
-            config.append(deepcopy(d))
+            config.append(d)
         if len(self.acls_ipv6) != 0:
             d = dict()
             d['afi'] = 'ipv6'
             d['acls'] = self.acls_ipv6.copy()
-            config.append(deepcopy(d))
+            config.append(d)
         self.ansible_task[self.ansible_module]['config'] = config.copy()
         if self.task_name != None:
             self.ansible_task['name'] = self.task_name
@@ -1740,128 +1692,29 @@ class NxosAcls(Task):
 
 
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_acls_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_acls_afi')
 
-    @property
-    def destination_address(self):
-        return self.properties['destination_address']
-    @destination_address.setter
-    def destination_address(self, x):
-        parameter = 'destination_address'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_address = TaskProperty()
 
-    @property
-    def destination_any(self):
-        return self.properties['destination_any']
-    @destination_any.setter
-    def destination_any(self, x):
-        parameter = 'destination_any'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    destination_any = TaskProperty('verify_boolean')
 
-    @property
-    def destination_host(self):
-        return self.properties['destination_host']
-    @destination_host.setter
-    def destination_host(self, x):
-        parameter = 'destination_host'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_host = TaskProperty()
 
-    @property
-    def destination_port_eq(self):
-        return self.properties['destination_port_eq']
-    @destination_port_eq.setter
-    def destination_port_eq(self, x):
-        parameter = 'destination_port_eq'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_eq = TaskProperty()
 
-    @property
-    def destination_port_gt(self):
-        return self.properties['destination_port_gt']
-    @destination_port_gt.setter
-    def destination_port_gt(self, x):
-        parameter = 'destination_port_gt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_gt = TaskProperty()
 
-    @property
-    def destination_port_lt(self):
-        return self.properties['destination_port_lt']
-    @destination_port_lt.setter
-    def destination_port_lt(self, x):
-        parameter = 'destination_port_lt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_lt = TaskProperty()
 
-    @property
-    def destination_port_neq(self):
-        return self.properties['destination_port_neq']
-    @destination_port_neq.setter
-    def destination_port_neq(self, x):
-        parameter = 'destination_port_neq'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_neq = TaskProperty()
 
-    @property
-    def destination_port_range_end(self):
-        return self.properties['destination_port_range_end']
-    @destination_port_range_end.setter
-    def destination_port_range_end(self, x):
-        parameter = 'destination_port_range_end'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_range_end = TaskProperty()
 
-    @property
-    def destination_port_range_start(self):
-        return self.properties['destination_port_range_start']
-    @destination_port_range_start.setter
-    def destination_port_range_start(self, x):
-        parameter = 'destination_port_range_start'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_port_range_start = TaskProperty()
 
-    @property
-    def destination_prefix(self):
-        return self.properties['destination_prefix']
-    @destination_prefix.setter
-    def destination_prefix(self, x):
-        parameter = 'destination_prefix'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_acls_prefix(x, parameter)
-        self.properties[parameter] = x
+    destination_prefix = TaskProperty('verify_nxos_acls_prefix')
 
-    @property
-    def destination_wildcard_bits(self):
-        return self.properties['destination_wildcard_bits']
-    @destination_wildcard_bits.setter
-    def destination_wildcard_bits(self, x):
-        parameter = 'destination_wildcard_bits'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    destination_wildcard_bits = TaskProperty()
 
     @property
     def dscp(self):
@@ -1875,823 +1728,154 @@ class NxosAcls(Task):
         self.verify_nxos_acls_dscp(x, parameter)
         self.properties[parameter] = x
 
-    @property
-    def fragments(self):
-        return self.properties['fragments']
-    @fragments.setter
-    def fragments(self, x):
-        parameter = 'fragments'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    fragments = TaskProperty('verify_boolean')
 
-    @property
-    def grant(self):
-        return self.properties['grant']
-    @grant.setter
-    def grant(self, x):
-        parameter = 'grant'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    grant = TaskProperty()
 
-    @property
-    def icmp_administratively_prohibited(self):
-        return self.properties['icmp_administratively_prohibited']
-    @icmp_administratively_prohibited.setter
-    def icmp_administratively_prohibited(self, x):
-        parameter = 'icmp_administratively_prohibited'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_administratively_prohibited = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_alternate_address(self):
-        return self.properties['icmp_alternate_address']
-    @icmp_alternate_address.setter
-    def icmp_alternate_address(self, x):
-        parameter = 'icmp_alternate_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_alternate_address = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_conversion_error(self):
-        return self.properties['icmp_conversion_error']
-    @icmp_conversion_error.setter
-    def icmp_conversion_error(self, x):
-        parameter = 'icmp_conversion_error'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_conversion_error = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_dod_net_prohibited(self):
-        return self.properties['icmp_dod_net_prohibited']
-    @icmp_dod_net_prohibited.setter
-    def icmp_dod_net_prohibited(self, x):
-        parameter = 'icmp_dod_net_prohibited'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_dod_net_prohibited = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_echo_request(self):
-        return self.properties['icmp_echo_request']
-    @icmp_echo_request.setter
-    def icmp_echo_request(self, x):
-        parameter = 'icmp_echo_request'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_echo_request = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_echo(self):
-        return self.properties['icmp_echo']
-    @icmp_echo.setter
-    def icmp_echo(self, x):
-        parameter = 'icmp_echo'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_echo = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_echo_reply(self):
-        return self.properties['icmp_echo_reply']
-    @icmp_echo_reply.setter
-    def icmp_echo_reply(self, x):
-        parameter = 'icmp_echo_reply'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_echo_reply = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_general_parameter_problem(self):
-        return self.properties['icmp_general_parameter_problem']
-    @icmp_general_parameter_problem.setter
-    def icmp_general_parameter_problem(self, x):
-        parameter = 'icmp_general_parameter_problem'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_general_parameter_problem = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_isolated(self):
-        return self.properties['icmp_host_isolated']
-    @icmp_host_isolated.setter
-    def icmp_host_isolated(self, x):
-        parameter = 'icmp_host_isolated'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_isolated = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_precedence_unreachable(self):
-        return self.properties['icmp_host_precedence_unreachable']
-    @icmp_host_precedence_unreachable.setter
-    def icmp_host_precedence_unreachable(self, x):
-        parameter = 'icmp_host_precedence_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_precedence_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_redirect(self):
-        return self.properties['icmp_host_redirect']
-    @icmp_host_redirect.setter
-    def icmp_host_redirect(self, x):
-        parameter = 'icmp_host_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_tos_redirect(self):
-        return self.properties['icmp_host_tos_redirect']
-    @icmp_host_tos_redirect.setter
-    def icmp_host_tos_redirect(self, x):
-        parameter = 'icmp_host_tos_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_tos_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_tos_unreachable(self):
-        return self.properties['icmp_host_tos_unreachable']
-    @icmp_host_tos_unreachable.setter
-    def icmp_host_tos_unreachable(self, x):
-        parameter = 'icmp_host_tos_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_tos_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_unknown(self):
-        return self.properties['icmp_host_unknown']
-    @icmp_host_unknown.setter
-    def icmp_host_unknown(self, x):
-        parameter = 'icmp_host_unknown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_unknown = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_host_unreachable(self):
-        return self.properties['icmp_host_unreachable']
-    @icmp_host_unreachable.setter
-    def icmp_host_unreachable(self, x):
-        parameter = 'icmp_host_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_host_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_information_reply(self):
-        return self.properties['icmp_information_reply']
-    @icmp_information_reply.setter
-    def icmp_information_reply(self, x):
-        parameter = 'icmp_information_reply'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_information_reply = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_information_request(self):
-        return self.properties['icmp_information_request']
-    @icmp_information_request.setter
-    def icmp_information_request(self, x):
-        parameter = 'icmp_information_request'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_information_request = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_mask_reply(self):
-        return self.properties['icmp_mask_reply']
-    @icmp_mask_reply.setter
-    def icmp_mask_reply(self, x):
-        parameter = 'icmp_mask_reply'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_mask_reply = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_mask_request(self):
-        return self.properties['icmp_mask_request']
-    @icmp_mask_request.setter
-    def icmp_mask_request(self, x):
-        parameter = 'icmp_mask_request'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_mask_request = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_message_code(self):
-        return self.properties['icmp_message_code']
-    @icmp_message_code.setter
-    def icmp_message_code(self, x):
-        parameter = 'icmp_message_code'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_message_code = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_message_type(self):
-        return self.properties['icmp_message_type']
-    @icmp_message_type.setter
-    def icmp_message_type(self, x):
-        parameter = 'icmp_message_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_message_type = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_mobile_redirect(self):
-        return self.properties['icmp_mobile_redirect']
-    @icmp_mobile_redirect.setter
-    def icmp_mobile_redirect(self, x):
-        parameter = 'icmp_mobile_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_mobile_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_net_redirect(self):
-        return self.properties['icmp_net_redirect']
-    @icmp_net_redirect.setter
-    def icmp_net_redirect(self, x):
-        parameter = 'icmp_net_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_net_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_net_tos_redirect(self):
-        return self.properties['icmp_net_tos_redirect']
-    @icmp_net_tos_redirect.setter
-    def icmp_net_tos_redirect(self, x):
-        parameter = 'icmp_net_tos_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_net_tos_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_net_tos_unreachable(self):
-        return self.properties['icmp_net_tos_unreachable']
-    @icmp_net_tos_unreachable.setter
-    def icmp_net_tos_unreachable(self, x):
-        parameter = 'icmp_net_tos_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_net_tos_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_net_unreachable(self):
-        return self.properties['icmp_net_unreachable']
-    @icmp_net_unreachable.setter
-    def icmp_net_unreachable(self, x):
-        parameter = 'icmp_net_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_net_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_network_unknown(self):
-        return self.properties['icmp_network_unknown']
-    @icmp_network_unknown.setter
-    def icmp_network_unknown(self, x):
-        parameter = 'icmp_network_unknown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_network_unknown = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_no_room_for_option(self):
-        return self.properties['icmp_no_room_for_option']
-    @icmp_no_room_for_option.setter
-    def icmp_no_room_for_option(self, x):
-        parameter = 'icmp_no_room_for_option'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_no_room_for_option = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_option_missing(self):
-        return self.properties['icmp_option_missing']
-    @icmp_option_missing.setter
-    def icmp_option_missing(self, x):
-        parameter = 'icmp_option_missing'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_option_missing = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_packet_too_big(self):
-        return self.properties['icmp_packet_too_big']
-    @icmp_packet_too_big.setter
-    def icmp_packet_too_big(self, x):
-        parameter = 'icmp_packet_too_big'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_packet_too_big = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_parameter_problem(self):
-        return self.properties['icmp_parameter_problem']
-    @icmp_parameter_problem.setter
-    def icmp_parameter_problem(self, x):
-        parameter = 'icmp_parameter_problem'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_parameter_problem = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_port_unreachable(self):
-        return self.properties['icmp_port_unreachable']
-    @icmp_port_unreachable.setter
-    def icmp_port_unreachable(self, x):
-        parameter = 'icmp_port_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_port_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_precedence_unreachable(self):
-        return self.properties['icmp_precedence_unreachable']
-    @icmp_precedence_unreachable.setter
-    def icmp_precedence_unreachable(self, x):
-        parameter = 'icmp_precedence_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_precedence_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_protocol_unreachable(self):
-        return self.properties['icmp_protocol_unreachable']
-    @icmp_protocol_unreachable.setter
-    def icmp_protocol_unreachable(self, x):
-        parameter = 'icmp_protocol_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_protocol_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_reassembly_timeout(self):
-        return self.properties['icmp_reassembly_timeout']
-    @icmp_reassembly_timeout.setter
-    def icmp_reassembly_timeout(self, x):
-        parameter = 'icmp_reassembly_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_reassembly_timeout = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_redirect(self):
-        return self.properties['icmp_redirect']
-    @icmp_redirect.setter
-    def icmp_redirect(self, x):
-        parameter = 'icmp_redirect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_redirect = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_router_advertisement(self):
-        return self.properties['icmp_router_advertisement']
-    @icmp_router_advertisement.setter
-    def icmp_router_advertisement(self, x):
-        parameter = 'icmp_router_advertisement'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_router_advertisement = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_router_solicitation(self):
-        return self.properties['icmp_router_solicitation']
-    @icmp_router_solicitation.setter
-    def icmp_router_solicitation(self, x):
-        parameter = 'icmp_router_solicitation'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_router_solicitation = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_source_quench(self):
-        return self.properties['icmp_source_quench']
-    @icmp_source_quench.setter
-    def icmp_source_quench(self, x):
-        parameter = 'icmp_source_quench'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_source_quench = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_source_route_failed(self):
-        return self.properties['icmp_source_route_failed']
-    @icmp_source_route_failed.setter
-    def icmp_source_route_failed(self, x):
-        parameter = 'icmp_source_route_failed'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_source_route_failed = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_time_exceeded(self):
-        return self.properties['icmp_time_exceeded']
-    @icmp_time_exceeded.setter
-    def icmp_time_exceeded(self, x):
-        parameter = 'icmp_time_exceeded'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_time_exceeded = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_timestamp_reply(self):
-        return self.properties['icmp_timestamp_reply']
-    @icmp_timestamp_reply.setter
-    def icmp_timestamp_reply(self, x):
-        parameter = 'icmp_timestamp_reply'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_timestamp_reply = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_timestamp_request(self):
-        return self.properties['icmp_timestamp_request']
-    @icmp_timestamp_request.setter
-    def icmp_timestamp_request(self, x):
-        parameter = 'icmp_timestamp_request'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_timestamp_request = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_traceroute(self):
-        return self.properties['icmp_traceroute']
-    @icmp_traceroute.setter
-    def icmp_traceroute(self, x):
-        parameter = 'icmp_traceroute'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_traceroute = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_ttl_exceeded(self):
-        return self.properties['icmp_ttl_exceeded']
-    @icmp_ttl_exceeded.setter
-    def icmp_ttl_exceeded(self, x):
-        parameter = 'icmp_ttl_exceeded'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_ttl_exceeded = TaskProperty('verify_boolean')
 
-    @property
-    def icmp_unreachable(self):
-        return self.properties['icmp_unreachable']
-    @icmp_unreachable.setter
-    def icmp_unreachable(self, x):
-        parameter = 'icmp_unreachable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    icmp_unreachable = TaskProperty('verify_boolean')
 
-    @property
-    def igmp_dvmrp(self):
-        return self.properties['igmp_dvmrp']
-    @igmp_dvmrp.setter
-    def igmp_dvmrp(self, x):
-        parameter = 'igmp_dvmrp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    igmp_dvmrp = TaskProperty('verify_boolean')
 
-    @property
-    def igmp_host_query(self):
-        return self.properties['igmp_host_query']
-    @igmp_host_query.setter
-    def igmp_host_query(self, x):
-        parameter = 'igmp_host_query'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    igmp_host_query = TaskProperty('verify_boolean')
 
-    @property
-    def igmp_host_report(self):
-        return self.properties['igmp_host_report']
-    @igmp_host_report.setter
-    def igmp_host_report(self, x):
-        parameter = 'igmp_host_report'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    igmp_host_report = TaskProperty('verify_boolean')
 
-    @property
-    def log(self):
-        return self.properties['log']
-    @log.setter
-    def log(self, x):
-        parameter = 'log'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    log = TaskProperty('verify_boolean')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    name = TaskProperty()
 
-    @property
-    def precedence(self):
-        return self.properties['precedence']
-    @precedence.setter
-    def precedence(self, x):
-        parameter = 'precedence'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    precedence = TaskProperty()
 
-    @property
-    def protocol(self):
-        return self.properties['protocol']
-    @protocol.setter
-    def protocol(self, x):
-        parameter = 'protocol'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    protocol = TaskProperty()
 
-    @property
-    def remark(self):
-        return self.properties['remark']
-    @remark.setter
-    def remark(self, x):
-        parameter = 'remark'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    remark = TaskProperty()
 
-    @property
-    def sequence(self):
-        return self.properties['sequence']
-    @sequence.setter
-    def sequence(self, x):
-        parameter = 'sequence'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    sequence = TaskProperty()
 
-    @property
-    def source_address(self):
-        return self.properties['source_address']
-    @source_address.setter
-    def source_address(self, x):
-        parameter = 'source_address'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_address = TaskProperty()
 
-    @property
-    def source_any(self):
-        return self.properties['source_any']
-    @source_any.setter
-    def source_any(self, x):
-        parameter = 'source_any'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    source_any = TaskProperty('verify_boolean')
 
-    @property
-    def source_host(self):
-        return self.properties['source_host']
-    @source_host.setter
-    def source_host(self, x):
-        parameter = 'source_host'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_host = TaskProperty()
 
-    @property
-    def source_port_eq(self):
-        return self.properties['source_port_eq']
-    @source_port_eq.setter
-    def source_port_eq(self, x):
-        parameter = 'source_port_eq'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_eq = TaskProperty()
 
-    @property
-    def source_port_gt(self):
-        return self.properties['source_port_gt']
-    @source_port_gt.setter
-    def source_port_gt(self, x):
-        parameter = 'source_port_gt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_gt = TaskProperty()
 
-    @property
-    def source_port_lt(self):
-        return self.properties['source_port_lt']
-    @source_port_lt.setter
-    def source_port_lt(self, x):
-        parameter = 'source_port_lt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_lt = TaskProperty()
 
-    @property
-    def source_port_neq(self):
-        return self.properties['source_port_neq']
-    @source_port_neq.setter
-    def source_port_neq(self, x):
-        parameter = 'source_port_neq'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_neq = TaskProperty()
 
-    @property
-    def source_port_range_end(self):
-        return self.properties['source_port_range_end']
-    @source_port_range_end.setter
-    def source_port_range_end(self, x):
-        parameter = 'source_port_range_end'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_range_end = TaskProperty()
 
-    @property
-    def source_port_range_start(self):
-        return self.properties['source_port_range_start']
-    @source_port_range_start.setter
-    def source_port_range_start(self, x):
-        parameter = 'source_port_range_start'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_port_range_start = TaskProperty()
 
-    @property
-    def source_prefix(self):
-        return self.properties['source_prefix']
-    @source_prefix.setter
-    def source_prefix(self, x):
-        parameter = 'source_prefix'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_acls_prefix(x, parameter)
-        self.properties[parameter] = x
+    source_prefix = TaskProperty('verify_nxos_acls_prefix')
 
-    @property
-    def source_wildcard_bits(self):
-        return self.properties['source_wildcard_bits']
-    @source_wildcard_bits.setter
-    def source_wildcard_bits(self, x):
-        parameter = 'source_wildcard_bits'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    source_wildcard_bits = TaskProperty()
 
-    @property
-    def tcp_ack(self):
-        return self.properties['tcp_ack']
-    @tcp_ack.setter
-    def tcp_ack(self, x):
-        parameter = 'tcp_ack'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_ack = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_established(self):
-        return self.properties['tcp_established']
-    @tcp_established.setter
-    def tcp_established(self, x):
-        parameter = 'tcp_established'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_established = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_fin(self):
-        return self.properties['tcp_fin']
-    @tcp_fin.setter
-    def tcp_fin(self, x):
-        parameter = 'tcp_fin'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_fin = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_psh(self):
-        return self.properties['tcp_psh']
-    @tcp_psh.setter
-    def tcp_psh(self, x):
-        parameter = 'tcp_psh'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_psh = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_rst(self):
-        return self.properties['tcp_rst']
-    @tcp_rst.setter
-    def tcp_rst(self, x):
-        parameter = 'tcp_rst'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_rst = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_syn(self):
-        return self.properties['tcp_syn']
-    @tcp_syn.setter
-    def tcp_syn(self, x):
-        parameter = 'tcp_syn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_syn = TaskProperty('verify_boolean')
 
-    @property
-    def tcp_urg(self):
-        return self.properties['tcp_urg']
-    @tcp_urg.setter
-    def tcp_urg(self, x):
-        parameter = 'tcp_urg'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tcp_urg = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_acls_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_acls_state')
@@ -1,7 +1,7 @@
 # NxosBanner() - cisco/nxos/nxos_banner.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBanner()
@@ -116,6 +116,9 @@ class NxosBanner(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_banner_valid_banner = set()
         self.nxos_banner_valid_banner.add('exec')
         self.nxos_banner_valid_banner.add('motd')
@@ -134,27 +137,19 @@ class NxosBanner(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.banner == None:
-            self.task_log.error('exiting. call instance.banner before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.banner before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.state == 'absent' and self.text != None:
-            self.task_log.error('exiting. instance.text must not be set if instance.state == absent.')
-            exit(1)
+            self.fail_msg('exiting. instance.text must not be set if instance.state == absent.')
         if self.state == 'present' and self.text == None:
-            self.task_log.error('exiting. instance.text must be set if instance.state == present.')
-            exit(1)
+            self.fail_msg('exiting. instance.text must be set if instance.state == present.')
 
     def commit(self):
         self.update()
@@ -192,34 +187,8 @@ class NxosBanner(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def banner(self):
-        return self.properties['banner']
-    @banner.setter
-    def banner(self, x):
-        parameter = 'banner'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_banner_verify_banner(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def text(self):
-        return self.properties['text']
-    @text.setter
-    def text(self, x):
-        parameter = 'text'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_banner_verify_state(x, parameter)
-        self.properties[parameter] = x
+    banner = TaskProperty('nxos_banner_verify_banner')
+
+    text = TaskProperty()
+
+    state = TaskProperty('nxos_banner_verify_state')
@@ -1,7 +1,7 @@
 # NxosBfdGlobal() - cisco/nxos/nxos_bfd_global.py
 our_version = 114
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************
 NxosBfdGlobal()
@@ -272,7 +272,9 @@ class NxosBfdGlobal(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
 
+    def init_schema(self):
         # interval_properties_set is used to disambiguate properties
         # which have the same name, but are not ambiguous in the
         # Ansible module since they appear as keys in different
@@ -348,7 +350,6 @@ class NxosBfdGlobal(Task):
         self.ipv6_slow_timer_min = 1000
         self.ipv6_slow_timer_max = 30000
 
-
         # guessing fabricpath timers are the same as ipv4
         # fabricpath isn't available on n9k so cannot verify
         self.bfd_fabricpath_interval_min = 50
@@ -395,12 +396,8 @@ class NxosBfdGlobal(Task):
         self.startup_timer_min = 0
         self.startup_timer_max = 30
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
@@ -473,12 +470,10 @@ class NxosBfdGlobal(Task):
     def verify_bfd_sets(self, interval, min_rx, multiplier, feature=None):
         valid_bfd_features = ['bfd', 'bfd_ipv4', 'bfd_ipv6', 'bfd_fabricpath']
         if feature not in valid_bfd_features:
-            self.task_log.error('exiting. feature must be one of {}'.format(','.join(valid_bfd_features)))
-            exit(1)
+            self.fail_msg('exiting. feature must be one of {}'.format(','.join(valid_bfd_features)))
         bfd_set = set([interval, min_rx, multiplier])
         if None in bfd_set and len(bfd_set) != 1:
-            self.task_log.error('exiting. if any of {0}_interval, {0}_min_rx, {0}_multiplier are None, they all must be None'.format(feature))
-            exit(1)
+            self.fail_msg('exiting. if any of {0}_interval, {0}_min_rx, {0}_multiplier are None, they all must be None'.format(feature))
 
     def verify_nxos_bfd_global_echo_interface(self, x, parameter='echo_interface'):
         if x == 'deleted':
@@ -630,16 +625,7 @@ class NxosBfdGlobal(Task):
         source_method = 'verify_nxos_bfd_global_bfd_ipv6_slow_timer'
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def echo_interface(self):
-        return self.properties['echo_interface']
-    @echo_interface.setter
-    def echo_interface(self, x):
-        parameter = 'echo_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bfd_global_echo_interface(x, parameter)
-        self.properties[parameter] = x
+    echo_interface = TaskProperty('verify_nxos_bfd_global_echo_interface')
 
     @property
     def echo_rx_interval(self):
@@ -705,16 +691,7 @@ class NxosBfdGlobal(Task):
         self.verify_nxos_bfd_global_fabricpath_multiplier(x)
         self.properties['bfd_fabricpath_multiplier'] = x
 
-    @property
-    def fabricpath_vlan(self):
-        return self.properties['fabricpath_vlan']
-    @fabricpath_vlan.setter
-    def fabricpath_vlan(self, x):
-        parameter = 'fabricpath_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
+    fabricpath_vlan = TaskProperty('verify_digits')
 
 
     #---------------------------
@@ -1,8 +1,8 @@
 # NxosBfdInterfaces() - cisco/nxos/nxos_bfd_interfaces.py
-our_version = 105
+our_version = 106
 
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBfdInterfaces()
@@ -134,6 +134,9 @@ class NxosBfdInterfaces(Task):
         # updated in add_interface()
         self.interface_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('bfd')
         self.properties_set.add('echo')
@@ -191,15 +194,11 @@ class NxosBfdInterfaces(Task):
         self.nxos_bfd_interfaces_valid_state.add('rendered')
         self.nxos_bfd_interfaces_valid_state.add('replaced')
 
-        self.init_properties()
-
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if len(self.interface_list) == 0 and self.state != 'deleted':
-            self.task_log.error('exiting. call instance.add_interface() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_interface() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -219,12 +218,10 @@ class NxosBfdInterfaces(Task):
             self.ansible_task['name'] = self.task_name
 
     def init_interface_properties(self):
-        for p in self.interface_properties_set:
-            self.properties[p] = None
+        self.reset(self.interface_properties_set)
     def interface_verification(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
     def add_interface(self):
         self.interface_verification()
         d = dict()
@@ -237,9 +234,7 @@ class NxosBfdInterfaces(Task):
         self.init_interface_properties()
 
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
 
     def verify_nxos_bfd_interfaces_bfd(self, x, parameter='bfd'):
@@ -280,46 +275,10 @@ class NxosBfdInterfaces(Task):
         expectation = ','.join(self.nxos_bfd_interfaces_valid_state)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bfd_interfaces_bfd(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def echo(self):
-        return self.properties['echo']
-    @echo.setter
-    def echo(self, x):
-        parameter = 'echo'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bfd_interfaces_echo(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bfd_interfaces_name(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bfd_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_nxos_bfd_interfaces_bfd')
+
+    echo = TaskProperty('verify_nxos_bfd_interfaces_echo')
+
+    name = TaskProperty('verify_nxos_bfd_interfaces_name')
+
+    state = TaskProperty('verify_nxos_bfd_interfaces_state')
@@ -1,7 +1,7 @@
 # NxosBgp() - cisco/nxos/nxos_bgp.py
 our_version = 119
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgp()
@@ -572,6 +572,9 @@ class NxosBgp(Task):
         self.task_log.warning('Use NxosBgpGlobal() (nxos_bgp_global) instead.')
         self.task_log.warning('*******************************************************************************************')
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_bgp_valid_event_history = set()
         self.nxos_bgp_valid_event_history.add('size_small')
         self.nxos_bgp_valid_event_history.add('size_medium')
@@ -639,21 +642,15 @@ class NxosBgp(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.asn == None:
-            self.task_log.error('exiting. call instance.asn before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.asn before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -746,104 +743,23 @@ class NxosBgp(Task):
         self.verify_bgp_asn(x, parameter) # inherited from AnsCommon
         self.properties[parameter] = x
 
-    @property
-    def bestpath_always_compare_med(self):
-        return self.properties['bestpath_always_compare_med']
-    @bestpath_always_compare_med.setter
-    def bestpath_always_compare_med(self, x):
-        parameter = 'bestpath_always_compare_med'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_always_compare_med = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_aspath_multipath_relax(self):
-        return self.properties['bestpath_aspath_multipath_relax']
-    @bestpath_aspath_multipath_relax.setter
-    def bestpath_aspath_multipath_relax(self, x):
-        parameter = 'bestpath_aspath_multipath_relax'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_aspath_multipath_relax = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_compare_neighborid(self):
-        return self.properties['bestpath_compare_neighborid']
-    @bestpath_compare_neighborid.setter
-    def bestpath_compare_neighborid(self, x):
-        parameter = 'bestpath_compare_neighborid'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_compare_neighborid = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_compare_routerid(self):
-        return self.properties['bestpath_compare_routerid']
-    @bestpath_compare_routerid.setter
-    def bestpath_compare_routerid(self, x):
-        parameter = 'bestpath_compare_routerid'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_compare_routerid = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_cost_community_ignore(self):
-        return self.properties['bestpath_cost_community_ignore']
-    @bestpath_cost_community_ignore.setter
-    def bestpath_cost_community_ignore(self, x):
-        parameter = 'bestpath_cost_community_ignore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_cost_community_ignore = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_med_confed(self):
-        return self.properties['bestpath_med_confed']
-    @bestpath_med_confed.setter
-    def bestpath_med_confed(self, x):
-        parameter = 'bestpath_med_confed'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_confed = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_med_missing_as_worst(self):
-        return self.properties['bestpath_med_missing_as_worst']
-    @bestpath_med_missing_as_worst.setter
-    def bestpath_med_missing_as_worst(self, x):
-        parameter = 'bestpath_med_missing_as_worst'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_missing_as_worst = TaskProperty('verify_toggle')
 
-    @property
-    def bestpath_med_non_deterministic(self):
-        return self.properties['bestpath_med_non_deterministic']
-    @bestpath_med_non_deterministic.setter
-    def bestpath_med_non_deterministic(self, x):
-        parameter = 'bestpath_med_non_deterministic'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_non_deterministic = TaskProperty('verify_toggle')
 
-    @property
-    def cluster_id(self):
-        return self.properties['cluster_id']
-    @cluster_id.setter
-    def cluster_id(self, x):
-        parameter = 'cluster_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_cluster_id(x, parameter)
-        self.properties[parameter] = x
+    cluster_id = TaskProperty('verify_nxos_bgp_cluster_id')
 
     @property
     def confederation_id(self):
@@ -867,135 +783,29 @@ class NxosBgp(Task):
         self.verify_nxos_bgp_confederation_peers(x, parameter)
         self.properties[parameter] = ' '.join(x)
 
-    @property
-    def disable_policy_batching(self):
-        return self.properties['disable_policy_batching']
-    @disable_policy_batching.setter
-    def disable_policy_batching(self, x):
-        parameter = 'disable_policy_batching'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    disable_policy_batching = TaskProperty('verify_toggle')
 
-    @property
-    def disable_policy_batching_ipv4_prefix_list(self):
-        return self.properties['disable_policy_batching_ipv4_prefix_list']
-    @disable_policy_batching_ipv4_prefix_list.setter
-    def disable_policy_batching_ipv4_prefix_list(self, x):
-        parameter = 'disable_policy_batching_ipv4_prefix_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    disable_policy_batching_ipv4_prefix_list = TaskProperty()
 
-    @property
-    def disable_policy_batching_ipv6_prefix_list(self):
-        return self.properties['disable_policy_batching_ipv6_prefix_list']
-    @disable_policy_batching_ipv6_prefix_list.setter
-    def disable_policy_batching_ipv6_prefix_list(self, x):
-        parameter = 'disable_policy_batching_ipv6_prefix_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    disable_policy_batching_ipv6_prefix_list = TaskProperty()
 
-    @property
-    def enforce_first_as(self):
-        return self.properties['enforce_first_as']
-    @enforce_first_as.setter
-    def enforce_first_as(self, x):
-        parameter = 'enforce_first_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    enforce_first_as = TaskProperty('verify_toggle')
 
-    @property
-    def event_history_cli(self):
-        return self.properties['event_history_cli']
-    @event_history_cli.setter
-    def event_history_cli(self, x):
-        parameter = 'event_history_cli'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_event_history(x, parameter)
-        self.properties[parameter] = x
+    event_history_cli = TaskProperty('verify_nxos_bgp_event_history')
 
-    @property
-    def event_history_detail(self):
-        return self.properties['event_history_detail']
-    @event_history_detail.setter
-    def event_history_detail(self, x):
-        parameter = 'event_history_detail'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_event_history(x, parameter)
-        self.properties[parameter] = x
+    event_history_detail = TaskProperty('verify_nxos_bgp_event_history')
 
-    @property
-    def event_history_events(self):
-        return self.properties['event_history_events']
-    @event_history_events.setter
-    def event_history_events(self, x):
-        parameter = 'event_history_events'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_event_history(x, parameter)
-        self.properties[parameter] = x
+    event_history_events = TaskProperty('verify_nxos_bgp_event_history')
 
-    @property
-    def event_history_periodic(self):
-        return self.properties['event_history_periodic']
-    @event_history_periodic.setter
-    def event_history_periodic(self, x):
-        parameter = 'event_history_periodic'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_event_history(x, parameter)
-        self.properties[parameter] = x
+    event_history_periodic = TaskProperty('verify_nxos_bgp_event_history')
 
-    @property
-    def fast_external_fallover(self):
-        return self.properties['fast_external_fallover']
-    @fast_external_fallover.setter
-    def fast_external_fallover(self, x):
-        parameter = 'fast_external_fallover'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    fast_external_fallover = TaskProperty('verify_toggle')
 
-    @property
-    def flush_routes(self):
-        return self.properties['flush_routes']
-    @flush_routes.setter
-    def flush_routes(self, x):
-        parameter = 'flush_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    flush_routes = TaskProperty('verify_toggle')
 
-    @property
-    def graceful_restart(self):
-        return self.properties['graceful_restart']
-    @graceful_restart.setter
-    def graceful_restart(self, x):
-        parameter = 'graceful_restart'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart = TaskProperty('verify_toggle')
 
-    @property
-    def graceful_restart_helper(self):
-        return self.properties['graceful_restart_helper']
-    @graceful_restart_helper.setter
-    def graceful_restart_helper(self, x):
-        parameter = 'graceful_restart_helper'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart_helper = TaskProperty('verify_toggle')
 
     @property
     def graceful_restart_timers_restart(self):
@@ -1019,16 +829,7 @@ class NxosBgp(Task):
         self.verify_integer_range(x, 1, 3600, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def isolate(self):
-        return self.properties['isolate']
-    @isolate.setter
-    def isolate(self, x):
-        parameter = 'isolate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    isolate = TaskProperty('verify_toggle')
 
     @property
     def local_as(self):
@@ -1065,16 +866,7 @@ class NxosBgp(Task):
         self.verify_integer_range(x, 1, 512, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def neighbor_down_fib_accelerate(self):
-        return self.properties['neighbor_down_fib_accelerate']
-    @neighbor_down_fib_accelerate.setter
-    def neighbor_down_fib_accelerate(self, x):
-        parameter = 'neighbor_down_fib_accelerate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    neighbor_down_fib_accelerate = TaskProperty('verify_toggle')
 
     @property
     def reconnect_interval(self):
@@ -1087,49 +879,13 @@ class NxosBgp(Task):
         self.verify_integer_range(x, 1, 60, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def router_id(self):
-        return self.properties['router_id']
-    @router_id.setter
-    def router_id(self, x):
-        parameter = 'router_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_router_id(x, parameter)
-        self.properties[parameter] = x
+    router_id = TaskProperty('verify_nxos_bgp_router_id')
 
-    @property
-    def shutdown(self):
-        return self.properties['shutdown']
-    @shutdown.setter
-    def shutdown(self, x):
-        parameter = 'shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties['shutdown'] = x
+    shutdown = TaskProperty('verify_toggle')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_bgp_state')
 
-    @property
-    def suppress_fib_pending(self):
-        return self.properties['suppress_fib_pending']
-    @suppress_fib_pending.setter
-    def suppress_fib_pending(self, x):
-        parameter = 'suppress_fib_pending'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    suppress_fib_pending = TaskProperty('verify_toggle')
 
     @property
     def timer_bestpath_limit(self):
@@ -1142,24 +898,6 @@ class NxosBgp(Task):
         self.verify_integer_range(x, 1, 3600, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def timer_bgp_hold(self):
-        return self.properties['timer_bgp_hold']
-    @timer_bgp_hold.setter
-    def timer_bgp_hold(self, x):
-        parameter = 'timer_bgp_hold'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_timer_bgp_hold(x, parameter)
-        self.properties[parameter] = x
+    timer_bgp_hold = TaskProperty('verify_nxos_bgp_timer_bgp_hold')
 
-    @property
-    def timer_bgp_keepalive(self):
-        return self.properties['timer_bgp_keepalive']
-    @timer_bgp_keepalive.setter
-    def timer_bgp_keepalive(self, x):
-        parameter = 'timer_bgp_keepalive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_timer_bgp_keepalive(x, parameter)
-        self.properties[parameter] = x
+    timer_bgp_keepalive = TaskProperty('verify_nxos_bgp_timer_bgp_keepalive')
@@ -1,7 +1,7 @@
 # NxosBgpAddressFamily() - cisco/nxos/nxos_bgp_address_family.py
-our_version = 106
+our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgpAddressFamily()
@@ -797,6 +797,9 @@ class NxosBgpAddressFamily(Task):
         self.networks_list = list()
         self.redistribute_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         # The set of ansible module properties that should be written
         # when the user calls instance.commit().
         self.ansible_module_set = set()
@@ -1144,34 +1147,25 @@ class NxosBgpAddressFamily(Task):
         self.address_family_property_groups.add('distance')
         self.address_family_property_groups.add('table_map')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def init_address_family(self):
         self.address_family_dict = dict()
-        for p in self.address_family_set:
-            self.properties[p] = None
+        self.reset(self.address_family_set)
 
     def init_aggregate_address(self):
-        for p in self.aggregate_address_set:
-            self.properties[p] = None
+        self.reset(self.aggregate_address_set)
 
     def init_inject_map(self):
-        for p in self.inject_map_set:
-            self.properties[p] = None
+        self.reset(self.inject_map_set)
 
     def init_networks(self):
-        for p in self.networks_set:
-            self.properties[p] = None
+        self.reset(self.networks_set)
 
     def init_redistribute(self):
-        for p in self.redistribute_set:
-            self.properties[p] = None
+        self.reset(self.redistribute_set)
 
     def verify_all_or_none(self, verify_set):
         '''
@@ -1181,17 +1175,15 @@ class NxosBgpAddressFamily(Task):
         current_set = set()
         for p in verify_set:
             if p not in self.properties:
-                self.task_log.error('exiting. Unknown property {}'.format(p))
-                exit(1)
+                self.fail_msg('exiting. Unknown property {}'.format(p))
             if self.properties[p] != None:
                 current_set.add(p)
         if len(current_set) == 0:
             return
         if len(current_set) == len(verify_set):
             return
-        self.task_log.error('exiting.  If one of the following is set, all must be set: {}'.format(
+        self.fail_msg('exiting.  If one of the following is set, all must be set: {}'.format(
             sorted(verify_set)))
-        exit(1)
 
     def verify_dampening(self):
         self.verify_all_or_none(self.verify_dampening_set)
@@ -1200,11 +1192,9 @@ class NxosBgpAddressFamily(Task):
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.as_number == None:
-            self.task_log.error('exiting. call instance.as_number before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.as_number before calling instance.commit()')
 
     def update_config_atomic(self):
         '''
@@ -1342,14 +1332,11 @@ class NxosBgpAddressFamily(Task):
 
     def verify_address_family(self):
         if self.afi == None:
-            self.task_log.error('exiting. afi is a mandatory property but is not set.')
-            exit(1)
+            self.fail_msg('exiting. afi is a mandatory property but is not set.')
         if self.safi == None:
-            self.task_log.error('exiting. safi is a mandatory property but is not set.')
-            exit(1)
+            self.fail_msg('exiting. safi is a mandatory property but is not set.')
         if self.vrf == None and self.maximum_paths_eibgp_parallel_paths != None:
-            self.task_log.error('exiting. eibgp option available only if instance.vrf is set.')
-            exit(1)
+            self.fail_msg('exiting. eibgp option available only if instance.vrf is set.')
         self.verify_dampening()
         self.verify_distance()
 
@@ -1389,15 +1376,13 @@ class NxosBgpAddressFamily(Task):
             self.address_family_dict['redistribute'] = deepcopy(self.redistribute_list)
 
         if len(self.address_family_dict) == 0:
-            self.task_log.error('exiting. One or more address-family properties must be set before calling add_address_family()')
-            exit(1)
+            self.fail_msg('exiting. One or more address-family properties must be set before calling add_address_family()')
         self.address_family_list.append(deepcopy(self.address_family_dict))
         self.init_address_family()
 
     def verify_aggregate_address(self):
         if self.aggregate_address_prefix == None:
-            self.task_log.error('exiting. Set instance.aggregate_address_prefix before calling instance.add_aggregate_address()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.aggregate_address_prefix before calling instance.add_aggregate_address()')
     def add_aggregate_address(self):
         '''
         Add an aggregate address to self.aggregate_address_list
@@ -1413,11 +1398,9 @@ class NxosBgpAddressFamily(Task):
 
     def verify_inject_map(self):
         if self.inject_map_route_map == None:
-            self.task_log.error('exiting. Set instance.inject_map_route_map before calling instance.add_inject_map()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.inject_map_route_map before calling instance.add_inject_map()')
         if self.inject_map_exist_map == None:
-            self.task_log.error('exiting. Set instance.inject_map_exist_map before calling instance.add_inject_map()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.inject_map_exist_map before calling instance.add_inject_map()')
     def add_inject_map(self):
         '''
         Add an inject-map to self.inject_map_list
@@ -1433,8 +1416,7 @@ class NxosBgpAddressFamily(Task):
 
     def verify_network(self):
         if self.networks_prefix == None:
-            self.task_log.error('exiting. Set instance.networks_prefix before calling instance.add_network()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.networks_prefix before calling instance.add_network()')
     def add_network(self):
         '''
         Add a network prefix to self.networks_list
@@ -1450,26 +1432,22 @@ class NxosBgpAddressFamily(Task):
 
     def verify_redistribute(self):
         if self.redistribute_protocol == None:
-            self.task_log.error('exiting. Set instance.redistribute_protocol before calling instance.add_redistribute()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.redistribute_protocol before calling instance.add_redistribute()')
         if self.redistribute_id == None:
             if self.redistribute_protocol not in self.redistribute_id_required_set:
                 return
             else:
-                self.task_log.error('exiting. instance.redistribute_id must be set for instance.redistribute_protocol [{}]'.format(
+                self.fail_msg('exiting. instance.redistribute_id must be set for instance.redistribute_protocol [{}]'.format(
                     self.redistribute_protocol))
-                exit(1)
         if self.redistribute_id != None:
             if self.redistribute_protocol in self.redistribute_id_required_set:
                 return
             else:
-                self.task_log.error('exiting. instance.redistribute_id [{}] cannot be set for instance.redistribute_protocol [{}]'.format(
+                self.fail_msg('exiting. instance.redistribute_id [{}] cannot be set for instance.redistribute_protocol [{}]'.format(
                     self.redistribute_id,
                     self.redistribute_protocol))
-                exit(1)
         if self.redistribute_route_map == None:
-            self.task_log.error('exiting. Set instance.redistribute_route_map before calling instance.add_redistribute()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.redistribute_route_map before calling instance.add_redistribute()')
     def add_redistribute(self):
         '''
         Add a redistribution to self.redistribute_list
@@ -1658,620 +1636,118 @@ class NxosBgpAddressFamily(Task):
     def verify_vrf(self, x, paramter='vrf'):
         if x != 'default':
             return
-        self.task_log.error('exiting. To add configuration under the default vrf, leave instance.vrf unset.')
-        exit(1)
-
-    @property
-    def additional_paths_install_backup(self):
-        return self.properties['additional_paths_install_backup']
-    @additional_paths_install_backup.setter
-    def additional_paths_install_backup(self, x):
-        parameter = 'additional_paths_install_backup'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def additional_paths_receive(self):
-        return self.properties['additional_paths_receive']
-    @additional_paths_receive.setter
-    def additional_paths_receive(self, x):
-        parameter = 'additional_paths_receive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def additional_paths_selection_route_map(self):
-        return self.properties['additional_paths_selection_route_map']
-    @additional_paths_selection_route_map.setter
-    def additional_paths_selection_route_map(self, x):
-        parameter = 'additional_paths_selection_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def additional_paths_send(self):
-        return self.properties['additional_paths_send']
-    @additional_paths_send.setter
-    def additional_paths_send(self, x):
-        parameter = 'additional_paths_send'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def advertise_l2vpn_evpn(self):
-        return self.properties['advertise_l2vpn_evpn']
-    @advertise_l2vpn_evpn.setter
-    def advertise_l2vpn_evpn(self, x):
-        parameter = 'advertise_l2vpn_evpn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def advertise_pip(self):
-        return self.properties['advertise_pip']
-    @advertise_pip.setter
-    def advertise_pip(self, x):
-        parameter = 'advertise_pip'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def advertise_system_mac(self):
-        return self.properties['advertise_system_mac']
-    @advertise_system_mac.setter
-    def advertise_system_mac(self, x):
-        parameter = 'advertise_system_mac'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_afi(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_advertise_map(self):
-        return self.properties['aggregate_address_advertise_map']
-    @aggregate_address_advertise_map.setter
-    def aggregate_address_advertise_map(self, x):
-        parameter = 'aggregate_address_advertise_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_as_set(self):
-        return self.properties['aggregate_address_as_set']
-    @aggregate_address_as_set.setter
-    def aggregate_address_as_set(self, x):
-        parameter = 'aggregate_address_as_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_attribute_map(self):
-        return self.properties['aggregate_address_attribute_map']
-    @aggregate_address_attribute_map.setter
-    def aggregate_address_attribute_map(self, x):
-        parameter = 'aggregate_address_attribute_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_prefix(self):
-        return self.properties['aggregate_address_prefix']
-    @aggregate_address_prefix.setter
-    def aggregate_address_prefix(self, x):
-        parameter = 'aggregate_address_prefix'
-        if self.set_none(x, parameter):
-            return
-        self.verify_aggregate_address_prefix(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_summary_only(self):
-        return self.properties['aggregate_address_summary_only']
-    @aggregate_address_summary_only.setter
-    def aggregate_address_summary_only(self, x):
-        parameter = 'aggregate_address_summary_only'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def aggregate_address_suppress_map(self):
-        return self.properties['aggregate_address_suppress_map']
-    @aggregate_address_suppress_map.setter
-    def aggregate_address_suppress_map(self, x):
-        parameter = 'aggregate_address_suppress_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def allow_vni_in_ethertag(self):
-        return self.properties['allow_vni_in_ethertag']
-    @allow_vni_in_ethertag.setter
-    def allow_vni_in_ethertag(self, x):
-        parameter = 'allow_vni_in_ethertag'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def as_number(self):
-        return self.properties['as_number']
-    @as_number.setter
-    def as_number(self, x):
-        parameter = 'as_number'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def client_to_client_no_reflection(self):
-        return self.properties['client_to_client_no_reflection']
-    @client_to_client_no_reflection.setter
-    def client_to_client_no_reflection(self, x):
-        parameter = 'client_to_client_no_reflection'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampen_igp_metric(self):
-        return self.properties['dampen_igp_metric']
-    @dampen_igp_metric.setter
-    def dampen_igp_metric(self, x):
-        parameter = 'dampen_igp_metric'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dampen_igp_metric(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_decay_half_life(self):
-        return self.properties['dampening_decay_half_life']
-    @dampening_decay_half_life.setter
-    def dampening_decay_half_life(self, x):
-        parameter = 'dampening_decay_half_life'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dampening_decay_half_life(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_max_suppress_time(self):
-        return self.properties['dampening_max_suppress_time']
-    @dampening_max_suppress_time.setter
-    def dampening_max_suppress_time(self, x):
-        parameter = 'dampening_max_suppress_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dampening_max_suppress_time(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_route_map(self):
-        return self.properties['dampening_route_map']
-    @dampening_route_map.setter
-    def dampening_route_map(self, x):
-        parameter = 'dampening_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.dampening_route_map(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_set(self):
-        return self.properties['dampening_set']
-    @dampening_set.setter
-    def dampening_set(self, x):
-        parameter = 'dampening_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_start_reuse_route(self):
-        return self.properties['dampening_start_reuse_route']
-    @dampening_start_reuse_route.setter
-    def dampening_start_reuse_route(self, x):
-        parameter = 'dampening_start_reuse_route'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dampening_start_reuse_route(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dampening_start_suppress_route(self):
-        return self.properties['dampening_start_suppress_route']
-    @dampening_start_suppress_route.setter
-    def dampening_start_suppress_route(self, x):
-        parameter = 'dampening_start_suppress_route'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dampening_start_suppress_route(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def default_information_originate(self):
-        return self.properties['default_information_originate']
-    @default_information_originate.setter
-    def default_information_originate(self, x):
-        parameter = 'default_information_originate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def default_metric(self):
-        return self.properties['default_metric']
-    @default_metric.setter
-    def default_metric(self, x):
-        parameter = 'default_metric'
-        if self.set_none(x, parameter):
-            return
-        self.verify_default_metric(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def distance_ebgp_routes(self):
-        return self.properties['distance_ebgp_routes']
-    @distance_ebgp_routes.setter
-    def distance_ebgp_routes(self, x):
-        parameter = 'distance_ebgp_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_distance_ebgp_routes(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def distance_ibgp_routes(self):
-        return self.properties['distance_ibgp_routes']
-    @distance_ibgp_routes.setter
-    def distance_ibgp_routes(self, x):
-        parameter = 'distance_ibgp_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_distance_ibgp_routes(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def distance_local_routes(self):
-        return self.properties['distance_local_routes']
-    @distance_local_routes.setter
-    def distance_local_routes(self, x):
-        parameter = 'distance_local_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_distance_local_routes(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def export_gateway_ip(self):
-        return self.properties['export_gateway_ip']
-    @export_gateway_ip.setter
-    def export_gateway_ip(self, x):
-        parameter = 'export_gateway_ip'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def inject_map_copy_attributes(self):
-        return self.properties['inject_map_copy_attributes']
-    @inject_map_copy_attributes.setter
-    def inject_map_copy_attributes(self, x):
-        parameter = 'inject_map_copy_attributes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def inject_map_exist_map(self):
-        return self.properties['inject_map_exist_map']
-    @inject_map_exist_map.setter
-    def inject_map_exist_map(self, x):
-        parameter = 'inject_map_exist_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def inject_map_route_map(self):
-        return self.properties['inject_map_route_map']
-    @inject_map_route_map.setter
-    def inject_map_route_map(self, x):
-        parameter = 'inject_map_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def maximum_paths_eibgp_parallel_paths(self):
-        return self.properties['maximum_paths_eibgp_parallel_paths']
-    @maximum_paths_eibgp_parallel_paths.setter
-    def maximum_paths_eibgp_parallel_paths(self, x):
-        parameter = 'maximum_paths_eibgp_parallel_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_paths_eibgp_parallel_paths(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_paths_ibgp_parallel_paths(self):
-        return self.properties['maximum_paths_ibgp_parallel_paths']
-    @maximum_paths_ibgp_parallel_paths.setter
-    def maximum_paths_ibgp_parallel_paths(self, x):
-        parameter = 'maximum_paths_ibgp_parallel_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_paths_ibgp_parallel_paths(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_paths_local_parallel_paths(self):
-        return self.properties['maximum_paths_local_parallel_paths']
-    @maximum_paths_local_parallel_paths.setter
-    def maximum_paths_local_parallel_paths(self, x):
-        parameter = 'maximum_paths_local_parallel_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_paths_local_parallel_paths(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_paths_mixed_parallel_paths(self):
-        return self.properties['maximum_paths_mixed_parallel_paths']
-    @maximum_paths_mixed_parallel_paths.setter
-    def maximum_paths_mixed_parallel_paths(self, x):
-        parameter = 'maximum_paths_mixed_parallel_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_paths_mixed_parallel_paths(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_paths_parallel_paths(self):
-        return self.properties['maximum_paths_parallel_paths']
-    @maximum_paths_parallel_paths.setter
-    def maximum_paths_parallel_paths(self, x):
-        parameter = 'maximum_paths_parallel_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_paths_parallel_paths(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def networks_prefix(self):
-        return self.properties['networks_prefix']
-    @networks_prefix.setter
-    def networks_prefix(self, x):
-        parameter = 'networks_prefix'
-        if self.set_none(x, parameter):
-            return
-        self.verify_networks_prefix(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def networks_route_map(self):
-        return self.properties['networks_route_map']
-    @networks_route_map.setter
-    def networks_route_map(self, x):
-        parameter = 'networks_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def nexthop_route_map(self):
-        return self.properties['nexthop_route_map']
-    @nexthop_route_map.setter
-    def nexthop_route_map(self, x):
-        parameter = 'nexthop_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def nexthop_trigger_delay_critical_delay(self):
-        return self.properties['nexthop_trigger_delay_critical_delay']
-    @nexthop_trigger_delay_critical_delay.setter
-    def nexthop_trigger_delay_critical_delay(self, x):
-        parameter = 'nexthop_trigger_delay_critical_delay'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nexthop_trigger_delay_critical_delay(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def nexthop_trigger_delay_non_critical_delay(self):
-        return self.properties['nexthop_trigger_delay_non_critical_delay']
-    @nexthop_trigger_delay_non_critical_delay.setter
-    def nexthop_trigger_delay_non_critical_delay(self, x):
-        parameter = 'nexthop_trigger_delay_non_critical_delay'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nexthop_trigger_delay_non_critical_delay(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def redistribute_id(self):
-        return self.properties['redistribute_id']
-    @redistribute_id.setter
-    def redistribute_id(self, x):
-        parameter = 'redistribute_id'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def redistribute_protocol(self):
-        return self.properties['redistribute_protocol']
-    @redistribute_protocol.setter
-    def redistribute_protocol(self, x):
-        parameter = 'redistribute_protocol'
-        if self.set_none(x, parameter):
-            return
-        self.verify_redistribute_protocol(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def redistribute_route_map(self):
-        return self.properties['redistribute_route_map']
-    @redistribute_route_map.setter
-    def redistribute_route_map(self, x):
-        parameter = 'redistribute_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def retain_route_target_retain_all(self):
-        return self.properties['retain_route_target_retain_all']
-    @retain_route_target_retain_all.setter
-    def retain_route_target_retain_all(self, x):
-        parameter = 'retain_route_target_retain_all'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def retain_route_target_route_map(self):
-        return self.properties['retain_route_target_route_map']
-    @retain_route_target_route_map.setter
-    def retain_route_target_route_map(self, x):
-        parameter = 'retain_route_target_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def safi(self):
-        return self.properties['safi']
-    @safi.setter
-    def safi(self, x):
-        parameter = 'safi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_safi(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def suppress_inactive(self):
-        return self.properties['suppress_inactive']
-    @suppress_inactive.setter
-    def suppress_inactive(self, x):
-        parameter = 'suppress_inactive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def table_map_filter(self):
-        return self.properties['table_map_filter']
-    @table_map_filter.setter
-    def table_map_filter(self, x):
-        parameter = 'table_map_filter'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def table_map_name(self):
-        return self.properties['table_map_name']
-    @table_map_name.setter
-    def table_map_name(self, x):
-        parameter = 'table_map_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def timers_bestpath_defer_defer_time(self):
-        return self.properties['timers_bestpath_defer_defer_time']
-    @timers_bestpath_defer_defer_time.setter
-    def timers_bestpath_defer_defer_time(self, x):
-        parameter = 'timers_bestpath_defer_defer_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_timers_bestpath_defer_defer_time(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def timers_bestpath_defer_maximum_defer_time(self):
-        return self.properties['timers_bestpath_defer_maximum_defer_time']
-    @timers_bestpath_defer_maximum_defer_time.setter
-    def timers_bestpath_defer_maximum_defer_time(self, x):
-        parameter = 'timers_bestpath_defer_maximum_defer_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_timers_bestpath_defer_maximum_defer_time(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.verify_vrf(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def wait_igp_convergence(self):
-        return self.properties['wait_igp_convergence']
-    @wait_igp_convergence.setter
-    def wait_igp_convergence(self, x):
-        parameter = 'wait_igp_convergence'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+        self.fail_msg('exiting. To add configuration under the default vrf, leave instance.vrf unset.')
+
+    additional_paths_install_backup = TaskProperty('verify_boolean')
+
+    additional_paths_receive = TaskProperty('verify_boolean')
+
+    additional_paths_selection_route_map = TaskProperty()
+
+    additional_paths_send = TaskProperty('verify_boolean')
+
+    advertise_l2vpn_evpn = TaskProperty('verify_boolean')
+
+    advertise_pip = TaskProperty('verify_boolean')
+
+    advertise_system_mac = TaskProperty('verify_boolean')
+
+    afi = TaskProperty('verify_afi')
+
+    aggregate_address_advertise_map = TaskProperty()
+
+    aggregate_address_as_set = TaskProperty('verify_boolean')
+
+    aggregate_address_attribute_map = TaskProperty()
+
+    aggregate_address_prefix = TaskProperty('verify_aggregate_address_prefix')
+
+    aggregate_address_summary_only = TaskProperty('verify_boolean')
+
+    aggregate_address_suppress_map = TaskProperty()
+
+    allow_vni_in_ethertag = TaskProperty('verify_boolean')
+
+    as_number = TaskProperty('verify_bgp_asn')
+
+    client_to_client_no_reflection = TaskProperty('verify_boolean')
+
+    dampen_igp_metric = TaskProperty('verify_dampen_igp_metric')
+
+    dampening_decay_half_life = TaskProperty('verify_dampening_decay_half_life')
+
+    dampening_max_suppress_time = TaskProperty('verify_dampening_max_suppress_time')
+
+    dampening_route_map = TaskProperty('dampening_route_map')
+
+    dampening_set = TaskProperty('verify_boolean')
+
+    dampening_start_reuse_route = TaskProperty('verify_dampening_start_reuse_route')
+
+    dampening_start_suppress_route = TaskProperty('verify_dampening_start_suppress_route')
+
+    default_information_originate = TaskProperty('verify_boolean')
+
+    default_metric = TaskProperty('verify_default_metric')
+
+    distance_ebgp_routes = TaskProperty('verify_distance_ebgp_routes')
+
+    distance_ibgp_routes = TaskProperty('verify_distance_ibgp_routes')
+
+    distance_local_routes = TaskProperty('verify_distance_local_routes')
+
+    export_gateway_ip = TaskProperty('verify_boolean')
+
+    inject_map_copy_attributes = TaskProperty('verify_boolean')
+
+    inject_map_exist_map = TaskProperty()
+
+    inject_map_route_map = TaskProperty()
+
+    maximum_paths_eibgp_parallel_paths = TaskProperty('verify_maximum_paths_eibgp_parallel_paths')
+
+    maximum_paths_ibgp_parallel_paths = TaskProperty('verify_maximum_paths_ibgp_parallel_paths')
+
+    maximum_paths_local_parallel_paths = TaskProperty('verify_maximum_paths_local_parallel_paths')
+
+    maximum_paths_mixed_parallel_paths = TaskProperty('verify_maximum_paths_mixed_parallel_paths')
+
+    maximum_paths_parallel_paths = TaskProperty('verify_maximum_paths_parallel_paths')
+
+    networks_prefix = TaskProperty('verify_networks_prefix')
+
+    networks_route_map = TaskProperty()
+
+    nexthop_route_map = TaskProperty()
+
+    nexthop_trigger_delay_critical_delay = TaskProperty('verify_nexthop_trigger_delay_critical_delay')
+
+    nexthop_trigger_delay_non_critical_delay = TaskProperty('verify_nexthop_trigger_delay_non_critical_delay')
+
+    redistribute_id = TaskProperty()
+
+    redistribute_protocol = TaskProperty('verify_redistribute_protocol')
+
+    redistribute_route_map = TaskProperty()
+
+    retain_route_target_retain_all = TaskProperty('verify_boolean')
+
+    retain_route_target_route_map = TaskProperty()
+
+    safi = TaskProperty('verify_safi')
+
+    state = TaskProperty('verify_state')
+
+    suppress_inactive = TaskProperty('verify_boolean')
+
+    table_map_filter = TaskProperty('verify_boolean')
+
+    table_map_name = TaskProperty()
+
+    timers_bestpath_defer_defer_time = TaskProperty('verify_timers_bestpath_defer_defer_time')
+
+    timers_bestpath_defer_maximum_defer_time = TaskProperty('verify_timers_bestpath_defer_maximum_defer_time')
+
+    vrf = TaskProperty('verify_vrf')
+
+    wait_igp_convergence = TaskProperty('verify_boolean')
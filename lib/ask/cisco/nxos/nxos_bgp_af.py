@@ -3,7 +3,7 @@ our_version = 117
 
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgpAf()
@@ -435,6 +435,9 @@ class NxosBgpAf(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_bgp_af_valid_additional_paths_receive = set()
         self.nxos_bgp_af_valid_additional_paths_receive.add('no')
         self.nxos_bgp_af_valid_additional_paths_receive.add('yes')
@@ -508,12 +511,8 @@ class NxosBgpAf(Task):
         self.nxos_bgp_af_maximum_paths_ibgp_min = 1
         self.nxos_bgp_af_maximum_paths_ibgp_max = 64
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification_dampening_reuse_vs_suppress(self):
@@ -523,11 +522,10 @@ class NxosBgpAf(Task):
         greater_str = 'dampening_suppress_time'
         if self.is_digits(lesser) and self.is_digits(greater):
             if int(lesser) >= int(greater):
-                self.task_log.error('exiting. {} must be less than {}'.format(
+                self.fail_msg('exiting. {} must be less than {}'.format(
                     lesser_str,
                     greater_str)
                 )
-                exit(1)
 
     def final_verification_dampening_state(self):
         '''
@@ -551,19 +549,15 @@ class NxosBgpAf(Task):
                     p)
                 )
         if test == True:
-            self.task_log.error('exiting')
-            exit(1)
+            self.fail_msg('exiting')
 
     def final_verification(self):
         if self.asn == None:
-            self.task_log.error('exiting. call instance.asn before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.asn before calling instance.commit()')
         if self.afi == None:
-            self.task_log.error('exiting. call instance.afi before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.afi before calling instance.commit()')
         if self.safi == None:
-            self.task_log.error('exiting. call instance.safi before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.safi before calling instance.commit()')
         self.final_verification_dampening_state()
         self.final_verification_dampening_reuse_vs_suppress()
 
@@ -641,277 +635,55 @@ class NxosBgpAf(Task):
         self.fail(source_class, source_method, x, parameter, expectation)
 
 
-    @property
-    def additional_paths_install(self):
-        return self.properties['additional_paths_install']
-    @additional_paths_install.setter
-    def additional_paths_install(self, x):
-        parameter = 'additional_paths_install'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_install = TaskProperty('verify_boolean')
 
-    @property
-    def additional_paths_receive(self):
-        return self.properties['additional_paths_receive']
-    @additional_paths_receive.setter
-    def additional_paths_receive(self, x):
-        parameter = 'additional_paths_receive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_additional_paths_receive(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_receive = TaskProperty('verify_nxos_bgp_af_additional_paths_receive')
 
-    @property
-    def additional_paths_selection(self):
-        return self.properties['additional_paths_selection']
-    @additional_paths_selection.setter
-    def additional_paths_selection(self, x):
-        parameter = 'additional_paths_selection'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    additional_paths_selection = TaskProperty()
 
-    @property
-    def additional_paths_send(self):
-        return self.properties['additional_paths_send']
-    @additional_paths_send.setter
-    def additional_paths_send(self, x):
-        parameter = 'additional_paths_send'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_send = TaskProperty('verify_boolean')
 
-    @property
-    def advertise_l2vpn_evpn(self):
-        return self.properties['advertise_l2vpn_evpn']
-    @advertise_l2vpn_evpn.setter
-    def advertise_l2vpn_evpn(self, x):
-        parameter = 'advertise_l2vpn_evpn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    advertise_l2vpn_evpn = TaskProperty('verify_boolean')
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_bgp_af_afi')
 
-    @property
-    def asn(self):
-        return self.properties['asn']
-    @asn.setter
-    def asn(self, x):
-        parameter = 'asn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_asn(x, parameter)
-        self.properties[parameter] = str(x)
+    asn = TaskProperty('verify_nxos_bgp_af_asn', to_str=True)
 
-    @property
-    def client_to_client(self):
-        return self.properties['client_to_client']
-    @client_to_client.setter
-    def client_to_client(self, x):
-        parameter = 'client_to_client'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    client_to_client = TaskProperty('verify_boolean')
 
-    @property
-    def dampen_igp_metric(self):
-        return self.properties['dampen_igp_metric']
-    @dampen_igp_metric.setter
-    def dampen_igp_metric(self, x):
-        parameter = 'dampen_igp_metric'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = str(x)
+    dampen_igp_metric = TaskProperty('verify_digits_or_default', to_str=True)
 
-    @property
-    def dampening_half_time(self):
-        return self.properties['dampening_half_time']
-    @dampening_half_time.setter
-    def dampening_half_time(self, x):
-        parameter = 'dampening_half_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = str(x)
+    dampening_half_time = TaskProperty('verify_digits_or_default', to_str=True)
 
-    @property
-    def dampening_max_suppress_time(self):
-        return self.properties['dampening_max_suppress_time']
-    @dampening_max_suppress_time.setter
-    def dampening_max_suppress_time(self, x):
-        parameter = 'dampening_max_suppress_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = str(x)
+    dampening_max_suppress_time = TaskProperty('verify_digits_or_default', to_str=True)
 
-    @property
-    def dampening_reuse_time(self):
-        return self.properties['dampening_reuse_time']
-    @dampening_reuse_time.setter
-    def dampening_reuse_time(self, x):
-        parameter = 'dampening_reuse_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = str(x)
+    dampening_reuse_time = TaskProperty('verify_digits_or_default', to_str=True)
 
-    @property
-    def dampening_routemap(self):
-        return self.properties['dampening_routemap']
-    @dampening_routemap.setter
-    def dampening_routemap(self, x):
-        parameter = 'dampening_routemap'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    dampening_routemap = TaskProperty()
 
-    @property
-    def dampening_state(self):
-        return self.properties['dampening_state']
-    @dampening_state.setter
-    def dampening_state(self, x):
-        parameter = 'dampening_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    dampening_state = TaskProperty('verify_boolean')
 
-    @property
-    def dampening_suppress_time(self):
-        return self.properties['dampening_suppress_time']
-    @dampening_suppress_time.setter
-    def dampening_suppress_time(self, x):
-        parameter = 'dampening_suppress_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = str(x)
+    dampening_suppress_time = TaskProperty('verify_digits_or_default', to_str=True)
 
-    @property
-    def default_information_originate(self):
-        return self.properties['default_information_originate']
-    @default_information_originate.setter
-    def default_information_originate(self, x):
-        parameter = 'default_information_originate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    default_information_originate = TaskProperty('verify_boolean')
 
-    @property
-    def default_metric(self):
-        return self.properties['default_metric']
-    @default_metric.setter
-    def default_metric(self, x):
-        parameter = 'default_metric'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    default_metric = TaskProperty('verify_digits_or_default')
 
-    @property
-    def distance_ebgp(self):
-        return self.properties['distance_ebgp']
-    @distance_ebgp.setter
-    def distance_ebgp(self, x):
-        parameter = 'distance_ebgp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    distance_ebgp = TaskProperty('verify_digits_or_default')
 
-    @property
-    def distance_ibgp(self):
-        return self.properties['distance_ibgp']
-    @distance_ibgp.setter
-    def distance_ibgp(self, x):
-        parameter = 'distance_ibgp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    distance_ibgp = TaskProperty('verify_digits_or_default')
 
-    @property
-    def distance_local(self):
-        return self.properties['distance_local']
-    @distance_local.setter
-    def distance_local(self, x):
-        parameter = 'distance_local'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    distance_local = TaskProperty('verify_digits_or_default')
 
-    @property
-    def inject_map(self):
-        return self.properties['inject_map']
-    @inject_map.setter
-    def inject_map(self, x):
-        parameter = 'inject_map'
-        if self.set_none(x, parameter):
-            return
-        self.verify_list_of_list(x, parameter)
-        self.properties[parameter] = x
+    inject_map = TaskProperty('verify_list_of_list')
 
-    @property
-    def maximum_paths(self):
-        return self.properties['maximum_paths']
-    @maximum_paths.setter
-    def maximum_paths(self, x):
-        parameter = 'maximum_paths'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_maximum_paths(x, parameter)
-        self.properties[parameter] = str(x)
+    maximum_paths = TaskProperty('verify_nxos_bgp_af_maximum_paths', to_str=True)
 
-    @property
-    def maximum_paths_ibgp(self):
-        return self.properties['maximum_paths_ibgp']
-    @maximum_paths_ibgp.setter
-    def maximum_paths_ibgp(self, x):
-        parameter = 'maximum_paths_ibgp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_maximum_paths_ibgp(x, parameter)
-        self.properties[parameter] = str(x)
+    maximum_paths_ibgp = TaskProperty('verify_nxos_bgp_af_maximum_paths_ibgp', to_str=True)
 
-    @property
-    def networks(self):
-        return self.properties['networks']
-    @networks.setter
-    def networks(self, x):
-        parameter = 'networks'
-        if self.set_none(x, parameter):
-            return
-        self.verify_list_of_list(x, parameter)
-        self.properties[parameter] = x
+    networks = TaskProperty('verify_list_of_list')
 
-    @property
-    def next_hop_route_map(self):
-        return self.properties['next_hop_route_map']
-    @next_hop_route_map.setter
-    def next_hop_route_map(self, x):
-        parameter = 'next_hop_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    next_hop_route_map = TaskProperty()
 
     @property
     def redistribute(self):
@@ -932,76 +704,16 @@ class NxosBgpAf(Task):
         self.verify_list_of_list(x, parameter)
         self.properties[parameter] = x
 
-    @property
-    def retain_route_target(self):
-        return self.properties['retain_route_target']
-    @retain_route_target.setter
-    def retain_route_target(self, x):
-        parameter = 'retain_route_target'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    retain_route_target = TaskProperty()
 
-    @property
-    def safi(self):
-        return self.properties['safi']
-    @safi.setter
-    def safi(self, x):
-        parameter = 'safi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_safi(x, parameter)
-        self.properties[parameter] = x
+    safi = TaskProperty('verify_nxos_bgp_af_safi')
 
-    @property
-    def suppress_inactive(self):
-        return self.properties['suppress_inactive']
-    @suppress_inactive.setter
-    def suppress_inactive(self, x):
-        parameter = 'suppress_inactive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    suppress_inactive = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_af_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_bgp_af_state')
 
-    @property
-    def table_map(self):
-        return self.properties['table_map']
-    @table_map.setter
-    def table_map(self, x):
-        parameter = 'table_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    table_map = TaskProperty()
 
-    @property
-    def table_map_filter(self):
-        return self.properties['table_map_filter']
-    @table_map_filter.setter
-    def table_map_filter(self, x):
-        parameter = 'table_map_filter'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    table_map_filter = TaskProperty('verify_boolean')
 
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    vrf = TaskProperty()
@@ -1,8 +1,8 @@
 # NxosBgpGlobal() - cisco/nxos/nxos_bgp_global.py
-our_version = 110
+our_version = 112
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgpGlobal()
@@ -1334,6 +1334,15 @@ class NxosBgpGlobal(Task):
         self.bgp_neighbors_list_vrf = list()
         self.vrf_list = list()
 
+        # Keyed on feature, value is a pointer to the verification
+        # method for the feature
+        # Used in self.update_property_group()
+        self.verification_dispatch_table = dict()
+        self.verification_dispatch_table['rd'] = self.verify_rd
+
+        self.init_properties()
+
+    def init_schema(self):
         # The set of ansible module properties that should be written
         # when the user calls instance.commit().
         # TODO: VERIFY these are written to the ansible_task
@@ -1830,12 +1839,6 @@ class NxosBgpGlobal(Task):
         self.nxos_bgp_global_valid_neighbor_peer_type.add('fabric-border-leaf')
         self.nxos_bgp_global_valid_neighbor_peer_type.add('fabric-external')
 
-        # Keyed on feature, value is a pointer to the verification
-        # method for the feature
-        # Used in self.update_property_group()
-        self.verification_dispatch_table = dict()
-        self.verification_dispatch_table['rd'] = self.verify_rd
-
         # used in self.update_property_group()
         # These are groups of properties that are structured
         # into simple single-level dict() with the Ansible
@@ -1877,18 +1880,14 @@ class NxosBgpGlobal(Task):
         self.property_group_map['neighbor_remove_private_as'] = 'remove_private_as'
         self.property_group_map['neighbor_timers'] = 'timers'
         self.property_group_map['neighbor_ttl_security'] = 'ttl_security'
-        self.init_properties()
 
 
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def init_bgp_neighbor_path_attribute(self):
-        for p in self.neighbor_path_attribute_set:
-            self.properties[p] = None
+        self.reset(self.neighbor_path_attribute_set)
     def init_bgp_neighbor(self):
         self.bgp_neighbor_path_attribute_list = list()
         for p in self.bgp_neighbor_set:
@@ -1902,25 +1901,21 @@ class NxosBgpGlobal(Task):
         current_set = set()
         for p in verify_set:
             if p not in self.properties:
-                self.task_log.error('exiting. Unknown property {}'.format(p))
-                exit(1)
+                self.fail_msg('exiting. Unknown property {}'.format(p))
             if self.properties[p] != None:
                 current_set.add(p)
         if len(current_set) == 0:
             return
         if len(current_set) == len(verify_set):
             return
-        self.task_log.error('exiting.  If one of the following is set, all must be set: {}'.format(
+        self.fail_msg('exiting.  If one of the following is set, all must be set: {}'.format(
             sorted(verify_set)))
-        exit(1)
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.as_number == None:
-            self.task_log.error('exiting. call instance.as_number before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.as_number before calling instance.commit()')
 
     def update_bestpath(self):
         d = dict()
@@ -1990,8 +1985,7 @@ class NxosBgpGlobal(Task):
 
     def verify_rd(self):
         if self.rd_id != None and self.rd_dual == None:
-            self.task_log.error('exiting. if rd_id is set, rd_dual must also be set')
-            exit(1)
+            self.fail_msg('exiting. if rd_id is set, rd_dual must also be set')
 
     def update_timers(self):
         d = dict()
@@ -2055,8 +2049,7 @@ class NxosBgpGlobal(Task):
                     mapped_pg = pg
                 self.bgp_neighbor_dict[mapped_pg] = deepcopy(d)
             else:
-                self.task_log.error('exiting. Unknown property group: {}'.format(pg))
-                exit(1)
+                self.fail_msg('exiting. Unknown property group: {}'.format(pg))
 
     def commit(self):
         self.update()
@@ -2074,28 +2067,27 @@ class NxosBgpGlobal(Task):
         self.update_graceful_shutdown()
         self.update_timers()
         self.update_bgp_global_atomic()
+        # no deepcopy() needed.  commit() freezes ansible_task into a
+        # snapshot (a copy) on return.  See common/snapshot.py
         if len(self.bgp_neighbors_list) != 0:
-            self.config['neighbors'] = deepcopy(self.bgp_neighbors_list)
+            self.config['neighbors'] = self.bgp_neighbors_list.copy()
         if len(self.vrf_list) != 0:
-            self.config['vrfs'] = deepcopy(self.vrf_list)
+            self.config['vrfs'] = self.vrf_list.copy()
         self.ansible_task = dict()
         if self.task_name != None:
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = dict()
-        self.ansible_task[self.ansible_module]['config'] = deepcopy(self.config)
+        self.ansible_task[self.ansible_module]['config'] = self.config
         self.ansible_task[self.ansible_module]['state'] = self.state
 
     def verify_bgp_neighbor_path_attribute(self):
         if self.properties['neighbor_path_attribute_action'] == None:
-            self.task_log.error('exiting. neighbor_path_attribute_action must be set before calling add_bgp_neighbor_path_attribute()')
-            exit(1)
+            self.fail_msg('exiting. neighbor_path_attribute_action must be set before calling add_bgp_neighbor_path_attribute()')
         if self.properties['neighbor_path_attribute_type'] != None:
             if self.properties['neighbor_path_attribute_range_start'] != None:
-                self.task_log.error('exiting. neighbor_path_attribute_type is mutually-exclusive with neighbor_path_attribute_range_start')
-                exit(1)
+                self.fail_msg('exiting. neighbor_path_attribute_type is mutually-exclusive with neighbor_path_attribute_range_start')
             if self.properties['neighbor_path_attribute_range_end'] != None:
-                self.task_log.error('exiting. neighbor_path_attribute_type is mutually-exclusive with neighbor_path_attribute_range_end')
-                exit(1)
+                self.fail_msg('exiting. neighbor_path_attribute_type is mutually-exclusive with neighbor_path_attribute_range_end')
         self.verify_all_or_none(self.verify_path_attribute_range_set)
 
     def add_bgp_neighbor_path_attribute(self):
@@ -2123,15 +2115,13 @@ class NxosBgpGlobal(Task):
                 mapped_p = self.property_map[p]
                 d[mapped_p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. One or more path attribute properties must be set before calling add_bgp_neighbor_path_attribute()')
-            exit(1)
+            self.fail_msg('exiting. One or more path attribute properties must be set before calling add_bgp_neighbor_path_attribute()')
         self.bgp_neighbor_path_attribute_list.append(deepcopy(d))
         self.init_bgp_neighbor_path_attribute()
 
     def verify_bgp_neighbor(self):
         if self.properties['neighbor_address'] == None:
-            self.task_log.error('exiting. Set neighbor_address before calling instance.add_bgp_neighbor()')
-            exit(1)
+            self.fail_msg('exiting. Set neighbor_address before calling instance.add_bgp_neighbor()')
 
     def verify_bgp_neighbor_bfd(self):
         interval_set = set()
@@ -2142,8 +2132,7 @@ class NxosBgpGlobal(Task):
             self.task_log.error('exiting. neighbor bfd multihop interval requires all multihop interval properties to be set.')
             self.task_log.error('min_rx_interval {}'.format(self.neighbor_bfd_multihop_interval_min_rx_interval))
             self.task_log.error('multiplier {}'.format(self.neighbor_bfd_multihop_interval_multiplier))
-            self.task_log.error('tx_interval {}'.format(self.neighbor_bfd_multihop_interval_tx_interval))
-            exit(1)
+            self.fail_msg('tx_interval {}'.format(self.neighbor_bfd_multihop_interval_tx_interval))
 
     def update_bgp_neighbor_atomic_properties(self):
         for p in self.bgp_neighbor_atomic_properties:
@@ -2232,8 +2221,7 @@ class NxosBgpGlobal(Task):
         if len(self.bgp_neighbor_path_attribute_list) != 0:
             self.bgp_neighbor_dict['path_attribute'] = deepcopy(self.bgp_neighbor_path_attribute_list)
         if len(self.bgp_neighbor_dict) == 0:
-            self.task_log.error('exiting. One or more bgp neighbor properties must be set before calling add_bgp_neighbor()')
-            exit(1)
+            self.fail_msg('exiting. One or more bgp neighbor properties must be set before calling add_bgp_neighbor()')
         self.bgp_neighbors_list.append(deepcopy(self.bgp_neighbor_dict))
         self.init_bgp_neighbor()
 
@@ -2262,8 +2250,7 @@ class NxosBgpGlobal(Task):
         if len(self.bgp_neighbor_path_attribute_list) != 0:
             self.bgp_neighbor_dict['path_attribute'] = deepcopy(self.bgp_neighbor_path_attribute_list)
         if len(self.bgp_neighbor_dict) == 0:
-            self.task_log.error('exiting. One or more bgp neighbor properties must be set before calling add_vrf_bgp_neighbor()')
-            exit(1)
+            self.fail_msg('exiting. One or more bgp neighbor properties must be set before calling add_vrf_bgp_neighbor()')
         self.bgp_neighbors_list_vrf.append(deepcopy(self.bgp_neighbor_dict))
         self.init_bgp_neighbor()
 
@@ -2284,8 +2271,7 @@ class NxosBgpGlobal(Task):
             self.properties[p] = None
     def final_verification_vrf(self):
         if self.vrf == None:
-            self.task_log.error('exiting. instance.vrf must be set before calling instance.add_vrf()')
-            exit(1)
+            self.fail_msg('exiting. instance.vrf must be set before calling instance.add_vrf()')
     def add_vrf(self):
         '''
         add all configured properties to self.vrf_list
@@ -2536,289 +2522,57 @@ class NxosBgpGlobal(Task):
         expectation = 'An interface, limited to type: Ethernet, loopback, port-channel, Vlan'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def affinity_group_group_id(self):
-        return self.properties['affinity_group_group_id']
-    @affinity_group_group_id.setter
-    def affinity_group_group_id(self, x):
-        parameter = 'affinity_group_group_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_affinity_group_group_id(x, parameter)
-        self.properties[parameter] = x
+    affinity_group_group_id = TaskProperty('verify_nxos_bgp_global_affinity_group_group_id')
 
-    @property
-    def as_number(self):
-        return self.properties['as_number']
-    @as_number.setter
-    def as_number(self, x):
-        parameter = 'as_number'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    as_number = TaskProperty('verify_bgp_asn')
 
-    @property
-    def bestpath_always_compare_med(self):
-        return self.properties['bestpath_always_compare_med']
-    @bestpath_always_compare_med.setter
-    def bestpath_always_compare_med(self, x):
-        parameter = 'bestpath_always_compare_med'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_always_compare_med = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_as_path_ignore(self):
-        return self.properties['bestpath_as_path_ignore']
-    @bestpath_as_path_ignore.setter
-    def bestpath_as_path_ignore(self, x):
-        parameter = 'bestpath_as_path_ignore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_as_path_ignore = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_as_path_multipath_relax(self):
-        return self.properties['bestpath_as_path_multipath_relax']
-    @bestpath_as_path_multipath_relax.setter
-    def bestpath_as_path_multipath_relax(self, x):
-        parameter = 'bestpath_as_path_multipath_relax'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_as_path_multipath_relax = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_compare_neighborid(self):
-        return self.properties['bestpath_compare_neighborid']
-    @bestpath_compare_neighborid.setter
-    def bestpath_compare_neighborid(self, x):
-        parameter = 'bestpath_compare_neighborid'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_compare_neighborid = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_compare_routerid(self):
-        return self.properties['bestpath_compare_routerid']
-    @bestpath_compare_routerid.setter
-    def bestpath_compare_routerid(self, x):
-        parameter = 'bestpath_compare_routerid'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_compare_routerid = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_cost_community_ignore(self):
-        return self.properties['bestpath_cost_community_ignore']
-    @bestpath_cost_community_ignore.setter
-    def bestpath_cost_community_ignore(self, x):
-        parameter = 'bestpath_cost_community_ignore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_cost_community_ignore = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_igp_metric_ignore(self):
-        return self.properties['bestpath_igp_metric_ignore']
-    @bestpath_igp_metric_ignore.setter
-    def bestpath_igp_metric_ignore(self, x):
-        parameter = 'bestpath_igp_metric_ignore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_igp_metric_ignore = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_med_confed(self):
-        return self.properties['bestpath_med_confed']
-    @bestpath_med_confed.setter
-    def bestpath_med_confed(self, x):
-        parameter = 'bestpath_med_confed'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_confed = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_med_missing_as_worst(self):
-        return self.properties['bestpath_med_missing_as_worst']
-    @bestpath_med_missing_as_worst.setter
-    def bestpath_med_missing_as_worst(self, x):
-        parameter = 'bestpath_med_missing_as_worst'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_missing_as_worst = TaskProperty('verify_boolean')
 
-    @property
-    def bestpath_med_non_deterministic(self):
-        return self.properties['bestpath_med_non_deterministic']
-    @bestpath_med_non_deterministic.setter
-    def bestpath_med_non_deterministic(self, x):
-        parameter = 'bestpath_med_non_deterministic'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bestpath_med_non_deterministic = TaskProperty('verify_boolean')
 
-    @property
-    def cluster_id(self):
-        return self.properties['cluster_id']
-    @cluster_id.setter
-    def cluster_id(self, x):
-        parameter = 'cluster_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_cluster_id(x, parameter)
-        self.properties[parameter] = x
+    cluster_id = TaskProperty('verify_nxos_bgp_global_cluster_id')
 
-    @property
-    def confederation_identifier(self):
-        return self.properties['confederation_identifier']
-    @confederation_identifier.setter
-    def confederation_identifier(self, x):
-        parameter = 'confederation_identifier'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    confederation_identifier = TaskProperty('verify_bgp_asn')
 
-    @property
-    def confederation_peers(self):
-        return self.properties['confederation_peers']
-    @confederation_peers.setter
-    def confederation_peers(self, x):
-        parameter = 'confederation_peers'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_confederation_peers(x, parameter)
-        self.properties[parameter] = x
+    confederation_peers = TaskProperty('verify_nxos_bgp_global_confederation_peers')
 
-    @property
-    def disable_policy_batching_set(self):
-        return self.properties['disable_policy_batching_set']
-    @disable_policy_batching_set.setter
-    def disable_policy_batching_set(self, x):
-        parameter = 'disable_policy_batching_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    disable_policy_batching_set = TaskProperty('verify_boolean')
 
-    @property
-    def disable_policy_batching_ipv4_prefix_list(self):
-        return self.properties['disable_policy_batching_ipv4_prefix_list']
-    @disable_policy_batching_ipv4_prefix_list.setter
-    def disable_policy_batching_ipv4_prefix_list(self, x):
-        parameter = 'disable_policy_batching_ipv4_prefix_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    disable_policy_batching_ipv4_prefix_list = TaskProperty()
 
-    @property
-    def disable_policy_batching_ipv6_prefix_list(self):
-        return self.properties['disable_policy_batching_ipv6_prefix_list']
-    @disable_policy_batching_ipv6_prefix_list.setter
-    def disable_policy_batching_ipv6_prefix_list(self, x):
-        parameter = 'disable_policy_batching_ipv6_prefix_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    disable_policy_batching_ipv6_prefix_list = TaskProperty()
 
-    @property
-    def disable_policy_batching_nexthop(self):
-        return self.properties['disable_policy_batching_nexthop']
-    @disable_policy_batching_nexthop.setter
-    def disable_policy_batching_nexthop(self, x):
-        parameter = 'disable_policy_batching_nexthop'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    disable_policy_batching_nexthop = TaskProperty('verify_boolean')
 
-    @property
-    def dynamic_med_interval(self):
-        return self.properties['dynamic_med_interval']
-    @dynamic_med_interval.setter
-    def dynamic_med_interval(self, x):
-        parameter = 'dynamic_med_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_dynamic_med_interval(x, parameter)
-        self.properties[parameter] = x
+    dynamic_med_interval = TaskProperty('verify_nxos_bgp_global_dynamic_med_interval')
 
-    @property
-    def enforce_first_as(self):
-        return self.properties['enforce_first_as']
-    @enforce_first_as.setter
-    def enforce_first_as(self, x):
-        parameter = 'enforce_first_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    enforce_first_as = TaskProperty('verify_boolean')
 
-    @property
-    def enhanced_error(self):
-        return self.properties['enhanced_error']
-    @enhanced_error.setter
-    def enhanced_error(self, x):
-        parameter = 'enhanced_error'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    enhanced_error = TaskProperty('verify_boolean')
 
-    @property
-    def fabric_soo(self):
-        return self.properties['fabric_soo']
-    @fabric_soo.setter
-    def fabric_soo(self, x):
-        parameter = 'fabric_soo'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    fabric_soo = TaskProperty('verify_bgp_asn')
 
-    @property
-    def fast_external_fallover(self):
-        return self.properties['fast_external_fallover']
-    @fast_external_fallover.setter
-    def fast_external_fallover(self, x):
-        parameter = 'fast_external_fallover'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    fast_external_fallover = TaskProperty('verify_boolean')
 
-    @property
-    def flush_routes(self):
-        return self.properties['flush_routes']
-    @flush_routes.setter
-    def flush_routes(self, x):
-        parameter = 'flush_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    flush_routes = TaskProperty('verify_boolean')
 
-    @property
-    def graceful_restart_helper(self):
-        return self.properties['graceful_restart_helper']
-    @graceful_restart_helper.setter
-    def graceful_restart_helper(self, x):
-        parameter = 'graceful_restart_helper'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart_helper = TaskProperty('verify_boolean')
 
     @property
     def graceful_restart_restart_time(self):
@@ -2831,16 +2585,7 @@ class NxosBgpGlobal(Task):
         self.verify_integer_range(x, 1, 3600, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def graceful_restart_set(self):
-        return self.properties['graceful_restart_set']
-    @graceful_restart_set.setter
-    def graceful_restart_set(self, x):
-        parameter = 'graceful_restart_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart_set = TaskProperty('verify_boolean')
 
     @property
     def graceful_restart_stalepath_time(self):
@@ -2853,81 +2598,19 @@ class NxosBgpGlobal(Task):
         self.verify_integer_range(x, 1, 3600, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def graceful_shutdown_activate_route_map(self):
-        return self.properties['graceful_shutdown_activate_route_map']
-    @graceful_shutdown_activate_route_map.setter
-    def graceful_shutdown_activate_route_map(self, x):
-        parameter = 'graceful_shutdown_activate_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    graceful_shutdown_activate_route_map = TaskProperty()
 
-    @property
-    def graceful_shutdown_activate_set(self):
-        return self.properties['graceful_shutdown_activate_set']
-    @graceful_shutdown_activate_set.setter
-    def graceful_shutdown_activate_set(self, x):
-        parameter = 'graceful_shutdown_activate_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_shutdown_activate_set = TaskProperty('verify_boolean')
 
-    @property
-    def graceful_shutdown_aware(self):
-        return self.properties['graceful_shutdown_aware']
-    @graceful_shutdown_aware.setter
-    def graceful_shutdown_aware(self, x):
-        parameter = 'graceful_shutdown_aware'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_shutdown_aware = TaskProperty('verify_boolean')
 
-    @property
-    def isolate_include_local(self):
-        return self.properties['isolate_include_local']
-    @isolate_include_local.setter
-    def isolate_include_local(self, x):
-        parameter = 'isolate_include_local'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    isolate_include_local = TaskProperty('verify_boolean')
 
-    @property
-    def isolate_set(self):
-        return self.properties['isolate_set']
-    @isolate_set.setter
-    def isolate_set(self, x):
-        parameter = 'isolate_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    isolate_set = TaskProperty('verify_boolean')
 
-    @property
-    def local_as(self):
-        return self.properties['local_as']
-    @local_as.setter
-    def local_as(self, x):
-        parameter = 'local_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    local_as = TaskProperty('verify_bgp_asn')
 
-    @property
-    def log_neighbor_changes(self):
-        return self.properties['log_neighbor_changes']
-    @log_neighbor_changes.setter
-    def log_neighbor_changes(self, x):
-        parameter = 'log_neighbor_changes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    log_neighbor_changes = TaskProperty('verify_boolean')
 
     @property
     def maxas_limit(self):
@@ -2940,495 +2623,95 @@ class NxosBgpGlobal(Task):
         self.verify_integer_range(x, 1, 512, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def neighbor_address(self):
-        return self.properties['neighbor_address']
-    @neighbor_address.setter
-    def neighbor_address(self, x):
-        parameter = 'neighbor_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_global_neighbor_address(x, parameter)
-        self.properties[parameter] = x
+    neighbor_address = TaskProperty('verify_bgp_global_neighbor_address')
 
-    @property
-    def neighbor_affinity_group_group_id(self):
-        return self.properties['neighbor_affinity_group_group_id']
-    @neighbor_affinity_group_group_id.setter
-    def neighbor_affinity_group_group_id(self, x):
-        parameter = 'neighbor_affinity_group_group_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_global_neighbor_affinity_group_group_id(x, parameter)
-        self.properties[parameter] = x
+    neighbor_affinity_group_group_id = TaskProperty('verify_bgp_global_neighbor_affinity_group_group_id')
 
-    @property
-    def neighbor_bfd_multihop_interval_min_rx_interval(self):
-        return self.properties['neighbor_bfd_multihop_interval_min_rx_interval']
-    @neighbor_bfd_multihop_interval_min_rx_interval.setter
-    def neighbor_bfd_multihop_interval_min_rx_interval(self, x):
-        parameter = 'neighbor_bfd_multihop_interval_min_rx_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_bfd_multihop_interval_min_rx_interval(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_multihop_interval_min_rx_interval = TaskProperty('verify_nxos_bgp_global_neighbor_bfd_multihop_interval_min_rx_interval')
 
-    @property
-    def neighbor_bfd_multihop_interval_multiplier(self):
-        return self.properties['neighbor_bfd_multihop_interval_multiplier']
-    @neighbor_bfd_multihop_interval_multiplier.setter
-    def neighbor_bfd_multihop_interval_multiplier(self, x):
-        parameter = 'neighbor_bfd_multihop_interval_multiplier'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_bfd_multihop_interval_multiplier(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_multihop_interval_multiplier = TaskProperty('verify_nxos_bgp_global_neighbor_bfd_multihop_interval_multiplier')
 
-    @property
-    def neighbor_bfd_multihop_interval_tx_interval(self):
-        return self.properties['neighbor_bfd_multihop_interval_tx_interval']
-    @neighbor_bfd_multihop_interval_tx_interval.setter
-    def neighbor_bfd_multihop_interval_tx_interval(self, x):
-        parameter = 'neighbor_bfd_multihop_interval_tx_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_bfd_multihop_interval_tx_interval(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_multihop_interval_tx_interval = TaskProperty('verify_nxos_bgp_global_neighbor_bfd_multihop_interval_tx_interval')
 
-    @property
-    def neighbor_bfd_multihop_set(self):
-        return self.properties['neighbor_bfd_multihop_set']
-    @neighbor_bfd_multihop_set.setter
-    def neighbor_bfd_multihop_set(self, x):
-        parameter = 'neighbor_bfd_multihop_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_multihop_set = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_bfd_set(self):
-        return self.properties['neighbor_bfd_set']
-    @neighbor_bfd_set.setter
-    def neighbor_bfd_set(self, x):
-        parameter = 'neighbor_bfd_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_set = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_bfd_singlehop(self):
-        return self.properties['neighbor_bfd_singlehop']
-    @neighbor_bfd_singlehop.setter
-    def neighbor_bfd_singlehop(self, x):
-        parameter = 'neighbor_bfd_singlehop'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bfd_singlehop = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_bmp_activate_server(self):
-        return self.properties['neighbor_bmp_activate_server']
-    @neighbor_bmp_activate_server.setter
-    def neighbor_bmp_activate_server(self, x):
-        parameter = 'neighbor_bmp_activate_server'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_global_neighbor_bmp_activate_server(x, parameter)
-        self.properties[parameter] = x
+    neighbor_bmp_activate_server = TaskProperty('verify_bgp_global_neighbor_bmp_activate_server')
 
-    @property
-    def neighbor_capability_suppress_4_byte_as(self):
-        return self.properties['neighbor_capability_suppress_4_byte_as']
-    @neighbor_capability_suppress_4_byte_as.setter
-    def neighbor_capability_suppress_4_byte_as(self, x):
-        parameter = 'neighbor_capability_suppress_4_byte_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_capability_suppress_4_byte_as = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_description(self):
-        return self.properties['neighbor_description']
-    @neighbor_description.setter
-    def neighbor_description(self, x):
-        parameter = 'neighbor_description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_description = TaskProperty()
 
-    @property
-    def neighbor_disable_connected_check(self):
-        return self.properties['neighbor_disable_connected_check']
-    @neighbor_disable_connected_check.setter
-    def neighbor_disable_connected_check(self, x):
-        parameter = 'neighbor_disable_connected_check'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_disable_connected_check = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_dont_capability_negotiate(self):
-        return self.properties['neighbor_dont_capability_negotiate']
-    @neighbor_dont_capability_negotiate.setter
-    def neighbor_dont_capability_negotiate(self, x):
-        parameter = 'neighbor_dont_capability_negotiate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_dont_capability_negotiate = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_down_fib_accelerate(self):
-        return self.properties['neighbor_down_fib_accelerate']
-    @neighbor_down_fib_accelerate.setter
-    def neighbor_down_fib_accelerate(self, x):
-        parameter = 'neighbor_down_fib_accelerate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_down_fib_accelerate = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_dscp(self):
-        return self.properties['neighbor_dscp']
-    @neighbor_dscp.setter
-    def neighbor_dscp(self, x):
-        parameter = 'neighbor_dscp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_dscp(x, parameter)
-        self.properties[parameter] = x
+    neighbor_dscp = TaskProperty('verify_nxos_bgp_global_neighbor_dscp')
 
-    @property
-    def neighbor_dynamic_capability(self):
-        return self.properties['neighbor_dynamic_capability']
-    @neighbor_dynamic_capability.setter
-    def neighbor_dynamic_capability(self, x):
-        parameter = 'neighbor_dynamic_capability'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_dynamic_capability = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_ebgp_multihop(self):
-        return self.properties['neighbor_ebgp_multihop']
-    @neighbor_ebgp_multihop.setter
-    def neighbor_ebgp_multihop(self, x):
-        parameter = 'neighbor_ebgp_multihop'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_ebgp_multihop(x, parameter)
-        self.properties[parameter] = x
+    neighbor_ebgp_multihop = TaskProperty('verify_nxos_bgp_global_neighbor_ebgp_multihop')
 
-    @property
-    def neighbor_graceful_shutdown_activate_route_map(self):
-        return self.properties['neighbor_graceful_shutdown_activate_route_map']
-    @neighbor_graceful_shutdown_activate_route_map.setter
-    def neighbor_graceful_shutdown_activate_route_map(self, x):
-        parameter = 'neighbor_graceful_shutdown_activate_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_graceful_shutdown_activate_route_map = TaskProperty()
 
-    @property
-    def neighbor_graceful_shutdown_activate_set(self):
-        return self.properties['neighbor_graceful_shutdown_activate_set']
-    @neighbor_graceful_shutdown_activate_set.setter
-    def neighbor_graceful_shutdown_activate_set(self, x):
-        parameter = 'neighbor_graceful_shutdown_activate_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_graceful_shutdown_activate_set = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_inherit_peer(self):
-        return self.properties['neighbor_inherit_peer']
-    @neighbor_inherit_peer.setter
-    def neighbor_inherit_peer(self, x):
-        parameter = 'neighbor_inherit_peer'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_inherit_peer = TaskProperty()
 
-    @property
-    def neighbor_inherit_peer_session(self):
-        return self.properties['neighbor_inherit_peer_session']
-    @neighbor_inherit_peer_session.setter
-    def neighbor_inherit_peer_session(self, x):
-        parameter = 'neighbor_inherit_peer_session'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_inherit_peer_session = TaskProperty()
 
-    @property
-    def neighbor_local_as(self):
-        return self.properties['neighbor_local_as']
-    @neighbor_local_as.setter
-    def neighbor_local_as(self, x):
-        parameter = 'neighbor_local_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    neighbor_local_as = TaskProperty('verify_bgp_asn')
 
-    @property
-    def neighbor_log_neighbor_changes_disable(self):
-        return self.properties['neighbor_log_neighbor_changes_disable']
-    @neighbor_log_neighbor_changes_disable.setter
-    def neighbor_log_neighbor_changes_disable(self, x):
-        parameter = 'neighbor_log_neighbor_changes_disable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_log_neighbor_changes_disable = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_log_neighbor_changes_set(self):
-        return self.properties['neighbor_log_neighbor_changes_set']
-    @neighbor_log_neighbor_changes_set.setter
-    def neighbor_log_neighbor_changes_set(self, x):
-        parameter = 'neighbor_log_neighbor_changes_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_log_neighbor_changes_set = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_low_memory_exempt(self):
-        return self.properties['neighbor_low_memory_exempt']
-    @neighbor_low_memory_exempt.setter
-    def neighbor_low_memory_exempt(self, x):
-        parameter = 'neighbor_low_memory_exempt'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_low_memory_exempt = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_password_encryption(self):
-        return self.properties['neighbor_password_encryption']
-    @neighbor_password_encryption.setter
-    def neighbor_password_encryption(self, x):
-        parameter = 'neighbor_password_encryption'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_password_encryption(x, parameter)
-        self.properties[parameter] = x
+    neighbor_password_encryption = TaskProperty('verify_nxos_bgp_global_neighbor_password_encryption')
 
-    @property
-    def neighbor_password_key(self):
-        return self.properties['neighbor_password_key']
-    @neighbor_password_key.setter
-    def neighbor_password_key(self, x):
-        parameter = 'neighbor_password_key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_password_key = TaskProperty()
 
-    @property
-    def neighbor_path_attribute_action(self):
-        return self.properties['neighbor_path_attribute_action']
-    @neighbor_path_attribute_action.setter
-    def neighbor_path_attribute_action(self, x):
-        parameter = 'neighbor_path_attribute_action'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_path_attribute_action(x, parameter)
-        self.properties[parameter] = x
+    neighbor_path_attribute_action = TaskProperty('verify_nxos_bgp_global_neighbor_path_attribute_action')
 
-    @property
-    def neighbor_path_attribute_range_start(self):
-        return self.properties['neighbor_path_attribute_range_start']
-    @neighbor_path_attribute_range_start.setter
-    def neighbor_path_attribute_range_start(self, x):
-        parameter = 'neighbor_path_attribute_range_start'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_path_attribute_range_start(x, parameter)
-        self.properties[parameter] = x
+    neighbor_path_attribute_range_start = TaskProperty('verify_nxos_bgp_global_neighbor_path_attribute_range_start')
 
-    @property
-    def neighbor_path_attribute_range_end(self):
-        return self.properties['neighbor_path_attribute_range_end']
-    @neighbor_path_attribute_range_end.setter
-    def neighbor_path_attribute_range_end(self, x):
-        parameter = 'neighbor_path_attribute_range_end'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_path_attribute_range_end(x, parameter)
-        self.properties[parameter] = x
+    neighbor_path_attribute_range_end = TaskProperty('verify_nxos_bgp_global_neighbor_path_attribute_range_end')
 
-    @property
-    def neighbor_path_attribute_type(self):
-        return self.properties['neighbor_path_attribute_type']
-    @neighbor_path_attribute_type.setter
-    def neighbor_path_attribute_type(self, x):
-        parameter = 'neighbor_path_attribute_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_path_attribute_type(x, parameter)
-        self.properties[parameter] = x
+    neighbor_path_attribute_type = TaskProperty('verify_nxos_bgp_global_neighbor_path_attribute_type')
 
-    @property
-    def neighbor_peer_type(self):
-        return self.properties['neighbor_peer_type']
-    @neighbor_peer_type.setter
-    def neighbor_peer_type(self, x):
-        parameter = 'neighbor_peer_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_peer_type(x, parameter)
-        self.properties[parameter] = x
+    neighbor_peer_type = TaskProperty('verify_nxos_bgp_global_neighbor_peer_type')
 
-    @property
-    def neighbor_remote_as(self):
-        return self.properties['neighbor_remote_as']
-    @neighbor_remote_as.setter
-    def neighbor_remote_as(self, x):
-        parameter = 'neighbor_remote_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    neighbor_remote_as = TaskProperty('verify_bgp_asn')
 
-    @property
-    def neighbor_remove_private_as_all(self):
-        return self.properties['neighbor_remove_private_as_all']
-    @neighbor_remove_private_as_all.setter
-    def neighbor_remove_private_as_all(self, x):
-        parameter = 'neighbor_remove_private_as_all'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_remove_private_as_all = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_remove_private_as_replace_as(self):
-        return self.properties['neighbor_remove_private_as_replace_as']
-    @neighbor_remove_private_as_replace_as.setter
-    def neighbor_remove_private_as_replace_as(self, x):
-        parameter = 'neighbor_remove_private_as_replace_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_remove_private_as_replace_as = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_remove_private_as_set(self):
-        return self.properties['neighbor_remove_private_as_set']
-    @neighbor_remove_private_as_set.setter
-    def neighbor_remove_private_as_set(self, x):
-        parameter = 'neighbor_remove_private_as_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_remove_private_as_set = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_shutdown(self):
-        return self.properties['neighbor_shutdown']
-    @neighbor_shutdown.setter
-    def neighbor_shutdown(self, x):
-        parameter = 'neighbor_shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_shutdown = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_timers_holdtime(self):
-        return self.properties['neighbor_timers_holdtime']
-    @neighbor_timers_holdtime.setter
-    def neighbor_timers_holdtime(self, x):
-        parameter = 'neighbor_timers_holdtime'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_timers_holdtime(x, parameter)
-        self.properties[parameter] = x
+    neighbor_timers_holdtime = TaskProperty('verify_nxos_bgp_global_neighbor_timers_holdtime')
 
-    @property
-    def neighbor_timers_keepalive(self):
-        return self.properties['neighbor_timers_keepalive']
-    @neighbor_timers_keepalive.setter
-    def neighbor_timers_keepalive(self, x):
-        parameter = 'neighbor_timers_keepalive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_timers_keepalive(x, parameter)
-        self.properties[parameter] = x
+    neighbor_timers_keepalive = TaskProperty('verify_nxos_bgp_global_neighbor_timers_keepalive')
 
-    @property
-    def neighbor_transport_connection_mode_passive(self):
-        return self.properties['neighbor_transport_connection_mode_passive']
-    @neighbor_transport_connection_mode_passive.setter
-    def neighbor_transport_connection_mode_passive(self, x):
-        parameter = 'neighbor_transport_connection_mode_passive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    neighbor_transport_connection_mode_passive = TaskProperty('verify_boolean')
 
-    @property
-    def neighbor_ttl_security_hops(self):
-        return self.properties['neighbor_ttl_security_hops']
-    @neighbor_ttl_security_hops.setter
-    def neighbor_ttl_security_hops(self, x):
-        parameter = 'neighbor_ttl_security_hops'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_ttl_security_hops(x, parameter)
-        self.properties[parameter] = x
+    neighbor_ttl_security_hops = TaskProperty('verify_nxos_bgp_global_neighbor_ttl_security_hops')
 
-    @property
-    def neighbor_update_source(self):
-        return self.properties['neighbor_update_source']
-    @neighbor_update_source.setter
-    def neighbor_update_source(self, x):
-        parameter = 'neighbor_update_source'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_neighbor_update_source(x, parameter)
-        self.properties[parameter] = x
+    neighbor_update_source = TaskProperty('verify_nxos_bgp_global_neighbor_update_source')
 
-    @property
-    def nexthop_suppress_default_resolution(self):
-        return self.properties['nexthop_suppress_default_resolution']
-    @nexthop_suppress_default_resolution.setter
-    def nexthop_suppress_default_resolution(self, x):
-        parameter = 'nexthop_suppress_default_resolution'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties['nexthop_suppress_default_resolution'] = x
+    nexthop_suppress_default_resolution = TaskProperty('verify_boolean')
 
-    @property
-    def rd_dual(self):
-        return self.properties['rd_dual']
-    @rd_dual.setter
-    def rd_dual(self, x):
-        parameter = 'rd_dual'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties['rd_dual'] = x
+    rd_dual = TaskProperty('verify_boolean')
 
-    @property
-    def rd_id(self):
-        return self.properties['rd_id']
-    @rd_id.setter
-    def rd_id(self, x):
-        parameter = 'rd_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_rd_id(x, parameter)
-        self.properties['rd_id'] = x
+    rd_id = TaskProperty('verify_nxos_bgp_global_rd_id')
 
     @property
     def reconnect_interval(self):
@@ -3441,112 +2724,22 @@ class NxosBgpGlobal(Task):
         self.verify_integer_range(x, 1, 60, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def router_id(self):
-        return self.properties['router_id']
-    @router_id.setter
-    def router_id(self, x):
-        parameter = 'router_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_router_id(x, parameter)
-        self.properties[parameter] = x
+    router_id = TaskProperty('verify_nxos_bgp_global_router_id')
 
-    @property
-    def shutdown(self):
-        return self.properties['shutdown']
-    @shutdown.setter
-    def shutdown(self, x):
-        parameter = 'shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties['shutdown'] = x
+    shutdown = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_bgp_global_state')
 
-    @property
-    def suppress_fib_pending(self):
-        return self.properties['suppress_fib_pending']
-    @suppress_fib_pending.setter
-    def suppress_fib_pending(self, x):
-        parameter = 'suppress_fib_pending'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    suppress_fib_pending = TaskProperty('verify_boolean')
 
-    @property
-    def timers_bestpath_limit_always(self):
-        return self.properties['timers_bestpath_limit_always']
-    @timers_bestpath_limit_always.setter
-    def timers_bestpath_limit_always(self, x):
-        parameter = 'timers_bestpath_limit_always'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    timers_bestpath_limit_always = TaskProperty('verify_boolean')
 
-    @property
-    def timers_bestpath_limit_timeout(self):
-        return self.properties['timers_bestpath_limit_timeout']
-    @timers_bestpath_limit_timeout.setter
-    def timers_bestpath_limit_timeout(self, x):
-        parameter = 'timers_bestpath_limit_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_timers_bestpath_limit_timeout(x, parameter)
-        self.properties[parameter] = x
+    timers_bestpath_limit_timeout = TaskProperty('verify_nxos_bgp_global_timers_bestpath_limit_timeout')
 
-    @property
-    def timers_bgp_holdtime(self):
-        return self.properties['timers_bgp_holdtime']
-    @timers_bgp_holdtime.setter
-    def timers_bgp_holdtime(self, x):
-        parameter = 'timers_bgp_holdtime'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_timers_bgp_holdtime(x, parameter)
-        self.properties[parameter] = x
+    timers_bgp_holdtime = TaskProperty('verify_nxos_bgp_global_timers_bgp_holdtime')
 
-    @property
-    def timers_bgp_keepalive(self):
-        return self.properties['timers_bgp_keepalive']
-    @timers_bgp_keepalive.setter
-    def timers_bgp_keepalive(self, x):
-        parameter = 'timers_bgp_keepalive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_timers_bgp_keepalive(x, parameter)
-        self.properties[parameter] = x
+    timers_bgp_keepalive = TaskProperty('verify_nxos_bgp_global_timers_bgp_keepalive')
 
-    @property
-    def timers_prefix_peer_timeout(self):
-        return self.properties['timers_prefix_peer_timeout']
-    @timers_prefix_peer_timeout.setter
-    def timers_prefix_peer_timeout(self, x):
-        parameter = 'timers_prefix_peer_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_timers_prefix_peer_timeout(x, parameter)
-        self.properties[parameter] = x
+    timers_prefix_peer_timeout = TaskProperty('verify_nxos_bgp_global_timers_prefix_peer_timeout')
 
-    @property
-    def timers_prefix_peer_wait(self):
-        return self.properties['timers_prefix_peer_wait']
-    @timers_prefix_peer_wait.setter
-    def timers_prefix_peer_wait(self, x):
-        parameter = 'timers_prefix_peer_wait'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_global_timers_prefix_peer_wait(x, parameter)
-        self.properties[parameter] = x
+    timers_prefix_peer_wait = TaskProperty('verify_nxos_bgp_global_timers_prefix_peer_wait')
@@ -7,7 +7,7 @@ our_version = 114
 #
 import re
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgpNeighbor()
@@ -408,6 +408,9 @@ class NxosBgpNeighbor(Task):
         self.task_log.warning('*******************************************************************************************')
         self.init_properties()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_bgp_neighbor_valid_log_neighbor_changes = set()
         self.nxos_bgp_neighbor_valid_log_neighbor_changes.add('enable')
         self.nxos_bgp_neighbor_valid_log_neighbor_changes.add('disable')
@@ -467,12 +470,8 @@ class NxosBgpNeighbor(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification_nxos_bgp_neighbor_maximum_peers(self):
@@ -488,19 +487,15 @@ class NxosBgpNeighbor(Task):
         self.task_log.error('exiting. maximum_peers is used only when neighbor is a prefix-peer')
         self.task_log.error('maximum_peers: {}'.format(self.maximum_peers))
         self.task_log.error('neighbor: {}'.format(self.neighbor))
-        self.task_log.error('Either specify neighbor as a prefix-peer e.g. 10.1.1.0/24, 2001:aaaa::/120, or unset maximum_peers')
-        exit(1)
+        self.fail_msg('Either specify neighbor as a prefix-peer e.g. 10.1.1.0/24, 2001:aaaa::/120, or unset maximum_peers')
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.asn == None:
-            self.task_log.error('exiting. call instance.asn before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.asn before calling instance.commit()')
         if self.neighbor == None:
-            self.task_log.error('exiting. call instance.neighbor before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.neighbor before calling instance.commit()')
         self.final_verification_nxos_bgp_neighbor_maximum_peers()
 
     def commit(self):
@@ -617,92 +612,21 @@ class NxosBgpNeighbor(Task):
         expectation = '[2-255, "default"]'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def asn(self):
-        return self.properties['asn']
-    @asn.setter
-    def asn(self, x):
-        parameter = 'asn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_asn(x, parameter)
-        self.properties[parameter] = x
+    asn = TaskProperty('verify_nxos_bgp_neighbor_asn')
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_enable_disable(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_enable_disable')
 
-    @property
-    def capability_negotiation(self):
-        return self.properties['capability_negotiation']
-    @capability_negotiation.setter
-    def capability_negotiation(self, x):
-        parameter = 'capability_negotiation'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    capability_negotiation = TaskProperty('verify_toggle')
 
-    @property
-    def connected_check(self):
-        return self.properties['connected_check']
-    @connected_check.setter
-    def connected_check(self, x):
-        parameter = 'connected_check'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    connected_check = TaskProperty('verify_toggle')
 
-    @property
-    def description(self):
-        return self.properties['description']
-    @description.setter
-    def description(self, x):
-        parameter = 'description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    description = TaskProperty()
 
-    @property
-    def dynamic_capability(self):
-        return self.properties['dynamic_capability']
-    @dynamic_capability.setter
-    def dynamic_capability(self, x):
-        parameter = 'dynamic_capability'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    dynamic_capability = TaskProperty('verify_toggle')
 
-    @property
-    def ebgp_multihop(self):
-        return self.properties['ebgp_multihop']
-    @ebgp_multihop.setter
-    def ebgp_multihop(self, x):
-        parameter = 'ebgp_multihop'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_ebgp_multihop(x, parameter)
-        self.properties[parameter] = x
+    ebgp_multihop = TaskProperty('verify_nxos_bgp_neighbor_ebgp_multihop')
 
-    @property
-    def local_as(self):
-        return self.properties['local_as']
-    @local_as.setter
-    def local_as(self, x):
-        parameter = 'local_as'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_local_as(x, parameter)
-        self.properties[parameter] = x
+    local_as = TaskProperty('verify_nxos_bgp_neighbor_local_as')
 
     @property
     def log_neighbor_changes(self):
@@ -717,27 +641,9 @@ class NxosBgpNeighbor(Task):
             self.fail(self.class_name, parameter, x, parameter, expectation)
         self.properties[parameter] = x
 
-    @property
-    def low_memory_exempt(self):
-        return self.properties['low_memory_exempt']
-    @low_memory_exempt.setter
-    def low_memory_exempt(self, x):
-        parameter = 'low_memory_exempt'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    low_memory_exempt = TaskProperty('verify_toggle')
 
-    @property
-    def maximum_peers(self):
-        return self.properties['maximum_peers']
-    @maximum_peers.setter
-    def maximum_peers(self, x):
-        parameter = 'maximum_peers'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_maximum_peers(x, parameter)
-        self.properties[parameter] = x
+    maximum_peers = TaskProperty('verify_nxos_bgp_neighbor_maximum_peers')
 
     @property
     def neighbor(self):
@@ -750,26 +656,9 @@ class NxosBgpNeighbor(Task):
         self.verify_nxos_bgp_neighbor_neighbor(x)
         self.properties[parameter] = x
 
-    @property
-    def peer_type(self):
-        return self.properties['peer_type']
-    @peer_type.setter
-    def peer_type(self, x):
-        parameter = 'peer_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_peer_type(x, parameter)
-        self.properties[parameter] = x
+    peer_type = TaskProperty('verify_nxos_bgp_neighbor_peer_type')
 
-    @property
-    def pwd(self):
-        return self.properties['pwd']
-    @pwd.setter
-    def pwd(self, x):
-        parameter = 'pwd'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    pwd = TaskProperty()
 
     @property
     def pwd_type(self):
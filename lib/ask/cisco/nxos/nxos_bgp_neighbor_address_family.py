@@ -1,8 +1,8 @@
 # NxosBgpNeighborAddressFamily() - cisco/nxos/nxos_bgp_neighbor_address_family.py
-our_version = 103
+our_version = 105
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosBgpNeighborAddressFamily()
@@ -645,6 +645,14 @@ class NxosBgpNeighborAddressFamily(Task):
         self.bgp_neighbors_list_vrf = list()
         self.vrf_list = list()
 
+        # Keyed on feature, value is a pointer to the verification
+        # method for the feature
+        self.verification_dispatch_table = dict()
+        self.verification_dispatch_table['maximum_prefix'] = self.verify_maximum_prefix
+
+        self.init_properties()
+
+    def init_schema(self):
         # The set of ansible module properties that should be written
         # when the user calls instance.commit().
         self.ansible_module_set = set()
@@ -860,11 +868,6 @@ class NxosBgpNeighborAddressFamily(Task):
         self.weight_min = 1
         self.weight_max = 65535
 
-        # Keyed on feature, value is a pointer to the verification
-        # method for the feature
-        self.verification_dispatch_table = dict()
-        self.verification_dispatch_table['maximum_prefix'] = self.verify_maximum_prefix
-
         self.address_family_property_groups = set()
         self.address_family_property_groups.add('advertise_map')
         self.address_family_property_groups.add('allowas_in')
@@ -878,10 +881,8 @@ class NxosBgpNeighborAddressFamily(Task):
         self.address_family_property_groups.add('send_community')
         self.address_family_property_groups.add('soft_reconfiguration_inbound')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.address_family = dict()
         for p in self.properties_set:
             self.properties[p] = None
@@ -889,21 +890,17 @@ class NxosBgpNeighborAddressFamily(Task):
 
     def init_address_family(self):
         self.address_family = dict()
-        for p in self.address_family_set:
-            self.properties[p] = None
+        self.reset(self.address_family_set)
 
     def init_bgp_neighbor(self):
         self.address_family_list = list()
-        for p in self.bgp_neighbor_set:
-            self.properties[p] = None
+        self.reset(self.bgp_neighbor_set)
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.as_number == None:
-            self.task_log.error('exiting. call instance.as_number before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.as_number before calling instance.commit()')
 
     def update_config_atomic(self):
         '''
@@ -964,14 +961,11 @@ class NxosBgpNeighborAddressFamily(Task):
     def verify_maximum_prefix(self):
         if self.maximum_prefix_max_prefix_limit == None:
             if self.maximum_prefix_generate_warning_threshold != None:
-                self.task_log.error('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_generate_warning_threshold is set.')
-                exit(1)
+                self.fail_msg('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_generate_warning_threshold is set.')
             if self.maximum_prefix_restart_interval != None:
-                self.task_log.error('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_restart_interval is set.')
-                exit(1)
+                self.fail_msg('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_restart_interval is set.')
             if self.maximum_prefix_warning_only != None:
-                self.task_log.error('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_warning_only is set.')
-                exit(1)
+                self.fail_msg('exiting. maximum_prefix_max_prefix_limit must be set if maximum_prefix_warning_only is set.')
 
     def update_property_group(self, pg):
         '''
@@ -992,14 +986,11 @@ class NxosBgpNeighborAddressFamily(Task):
 
     def verify_address_family(self):
         if self.afi == None:
-            self.task_log.error('exiting. afi is a mandatory property but is not set.')
-            exit(1)
+            self.fail_msg('exiting. afi is a mandatory property but is not set.')
         if self.safi == None:
-            self.task_log.error('exiting. safi is a mandatory property but is not set.')
-            exit(1)
+            self.fail_msg('exiting. safi is a mandatory property but is not set.')
         if self.send_community_set == True and self.send_community_standard == True:
-            self.task_log.error('exiting send_community_set and send_community_standard are mutually-exclusive.')
-            exit(1)
+            self.fail_msg('exiting send_community_set and send_community_standard are mutually-exclusive.')
     def add_address_family(self):
         '''
         Add an address-family to self.address_family_list
@@ -1028,18 +1019,15 @@ class NxosBgpNeighborAddressFamily(Task):
         for pg in self.address_family_property_groups:
             self.update_property_group(pg)
         if len(self.address_family_dict) == 0:
-            self.task_log.error('exiting. One or more address-family properties must be set before calling add_address_family()')
-            exit(1)
+            self.fail_msg('exiting. One or more address-family properties must be set before calling add_address_family()')
         self.address_family_list.append(deepcopy(self.address_family_dict))
         self.init_address_family()
 
     def verify_bgp_neighbor(self):
         if self.properties['neighbor_address'] == None:
-            self.task_log.error('exiting. Set neighbor_address before calling instance.add_bgp_neighbor()')
-            exit(1)
+            self.fail_msg('exiting. Set neighbor_address before calling instance.add_bgp_neighbor()')
         if len(self.address_family_list) == 0:
-            self.task_log.error('exiting. call instance.add_address_family() at least once before calling instance.add_bgp_neighbor()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_address_family() at least once before calling instance.add_bgp_neighbor()')
 
     def add_bgp_neighbor(self):
         '''
@@ -1079,15 +1067,12 @@ class NxosBgpNeighborAddressFamily(Task):
         self.init_bgp_neighbor()
 
     def init_properties_vrf(self):
-        for p in self.vrf_set:
-            self.properties[p] = None
+        self.reset(self.vrf_set)
     def final_verification_vrf(self):
         if self.vrf == None:
-            self.task_log.error('exiting. instance.vrf must be set before calling instance.add_vrf()')
-            exit(1)
+            self.fail_msg('exiting. instance.vrf must be set before calling instance.add_vrf()')
         if len(self.bgp_neighbors_list_vrf) == 0:
-            self.task_log.error('exiting. call instance.add_vrf_bgp_neighbor() at least once before calling instance.add_vrf()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_vrf_bgp_neighbor() at least once before calling instance.add_vrf()')
     def add_vrf(self):
         '''
         add all configured properties to self.vrf_list
@@ -1140,7 +1125,7 @@ class NxosBgpNeighborAddressFamily(Task):
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_inherit_sequence(self, x, parameter):
-        if self.isdigits(x):
+        if self.is_digits(x):
             return
         source_class = self.class_name
         source_method = 'verify_inherit_sequence'
@@ -1203,474 +1188,90 @@ class NxosBgpNeighborAddressFamily(Task):
         range_max = self.weight_max
         self.verify_integer_range(x, range_min, range_max, self.class_name, parameter)
 
-    @property
-    def advertise_map_exist_map(self):
-        return self.properties['advertise_map_exist_map']
-    @advertise_map_exist_map.setter
-    def advertise_map_exist_map(self, x):
-        parameter = 'advertise_map_exist_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def advertise_map_non_exist_map(self):
-        return self.properties['advertise_map_non_exist_map']
-    @advertise_map_non_exist_map.setter
-    def advertise_map_non_exist_map(self, x):
-        parameter = 'advertise_map_non_exist_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def advertise_map_route_map(self):
-        return self.properties['advertise_map_route_map']
-    @advertise_map_route_map.setter
-    def advertise_map_route_map(self, x):
-        parameter = 'advertise_map_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def advertisement_interval(self):
-        return self.properties['advertisement_interval']
-    @advertisement_interval.setter
-    def advertisement_interval(self, x):
-        parameter = 'advertisement_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_advertisement_interval(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_afi(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def allowas_in_max_occurences(self):
-        return self.properties['allowas_in_max_occurences']
-    @allowas_in_max_occurences.setter
-    def allowas_in_max_occurences(self, x):
-        parameter = 'allowas_in_max_occurences'
-        if self.set_none(x, parameter):
-            return
-        self.verify_allowas_in_max_occurences(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def allowas_in_set(self):
-        return self.properties['allowas_in_set']
-    @allowas_in_set.setter
-    def allowas_in_set(self, x):
-        parameter = 'allowas_in_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def as_override(self):
-        return self.properties['as_override']
-    @as_override.setter
-    def as_override(self, x):
-        parameter = 'as_override'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def as_number(self):
-        return self.properties['as_number']
-    @as_number.setter
-    def as_number(self, x):
-        parameter = 'as_number'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def capability_additional_paths_receive(self):
-        return self.properties['capability_additional_paths_receive']
-    @capability_additional_paths_receive.setter
-    def capability_additional_paths_receive(self, x):
-        parameter = 'capability_additional_paths_receive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_capability_additional_paths_receive(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def capability_additional_paths_send(self):
-        return self.properties['capability_additional_paths_send']
-    @capability_additional_paths_send.setter
-    def capability_additional_paths_send(self, x):
-        parameter = 'capability_additional_paths_send'
-        if self.set_none(x, parameter):
-            return
-        self.verify_capability_additional_paths_send(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def default_originate_route_map(self):
-        return self.properties['default_originate_route_map']
-    @default_originate_route_map.setter
-    def default_originate_route_map(self, x):
-        parameter = 'default_originate_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def default_originate_set(self):
-        return self.properties['default_originate_set']
-    @default_originate_set.setter
-    def default_originate_set(self, x):
-        parameter = 'default_originate_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def disable_peer_as_check(self):
-        return self.properties['disable_peer_as_check']
-    @disable_peer_as_check.setter
-    def disable_peer_as_check(self, x):
-        parameter = 'disable_peer_as_check'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def filter_list_inbound(self):
-        return self.properties['filter_list_inbound']
-    @filter_list_inbound.setter
-    def filter_list_inbound(self, x):
-        parameter = 'filter_list_inbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def filter_list_outbound(self):
-        return self.properties['filter_list_outbound']
-    @filter_list_outbound.setter
-    def filter_list_outbound(self, x):
-        parameter = 'filter_list_outbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def inherit_sequence(self):
-        return self.properties['inherit_sequence']
-    @inherit_sequence.setter
-    def inherit_sequence(self, x):
-        parameter = 'inherit_sequence'
-        if self.set_none(x, parameter):
-            return
-        self.verify_inherit_sequence(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def inherit_template(self):
-        return self.properties['inherit_template']
-    @inherit_template.setter
-    def inherit_template(self, x):
-        parameter = 'inherit_template'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def maximum_prefix_generate_warning_threshold(self):
-        return self.properties['maximum_prefix_generate_warning_threshold']
-    @maximum_prefix_generate_warning_threshold.setter
-    def maximum_prefix_generate_warning_threshold(self, x):
-        parameter = 'maximum_prefix_generate_warning_threshold'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_prefix_generate_warning_threshold(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_prefix_max_prefix_limit(self):
-        return self.properties['maximum_prefix_max_prefix_limit']
-    @maximum_prefix_max_prefix_limit.setter
-    def maximum_prefix_max_prefix_limit(self, x):
-        parameter = 'maximum_prefix_max_prefix_limit'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_prefix_max_prefix_limit(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_prefix_restart_interval(self):
-        return self.properties['maximum_prefix_restart_interval']
-    @maximum_prefix_restart_interval.setter
-    def maximum_prefix_restart_interval(self, x):
-        parameter = 'maximum_prefix_restart_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_maximum_prefix_restart_interval(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def maximum_prefix_warning_only(self):
-        return self.properties['maximum_prefix_warning_only']
-    @maximum_prefix_warning_only.setter
-    def maximum_prefix_warning_only(self, x):
-        parameter = 'maximum_prefix_warning_only'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def neighbor_address(self):
-        return self.properties['neighbor_address']
-    @neighbor_address.setter
-    def neighbor_address(self, x):
-        parameter = 'neighbor_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_neighbor_address(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def next_hop_self_all_routes(self):
-        return self.properties['next_hop_self_all_routes']
-    @next_hop_self_all_routes.setter
-    def next_hop_self_all_routes(self, x):
-        parameter = 'next_hop_self_all_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def next_hop_self_set(self):
-        return self.properties['next_hop_self_set']
-    @next_hop_self_set.setter
-    def next_hop_self_set(self, x):
-        parameter = 'next_hop_self_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def next_hop_third_party(self):
-        return self.properties['next_hop_third_party']
-    @next_hop_third_party.setter
-    def next_hop_third_party(self, x):
-        parameter = 'next_hop_third_party'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def prefix_list_inbound(self):
-        return self.properties['prefix_list_inbound']
-    @prefix_list_inbound.setter
-    def prefix_list_inbound(self, x):
-        parameter = 'prefix_list_inbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def prefix_list_outbound(self):
-        return self.properties['prefix_list_outbound']
-    @prefix_list_outbound.setter
-    def prefix_list_outbound(self, x):
-        parameter = 'prefix_list_outbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def rewrite_evpn_rt_asn(self):
-        return self.properties['rewrite_evpn_rt_asn']
-    @rewrite_evpn_rt_asn.setter
-    def rewrite_evpn_rt_asn(self, x):
-        parameter = 'rewrite_evpn_rt_asn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def route_map_inbound(self):
-        return self.properties['route_map_inbound']
-    @route_map_inbound.setter
-    def route_map_inbound(self, x):
-        parameter = 'route_map_inbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def route_map_outbound(self):
-        return self.properties['route_map_outbound']
-    @route_map_outbound.setter
-    def route_map_outbound(self, x):
-        parameter = 'route_map_outbound'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def route_reflector_client(self):
-        return self.properties['route_reflector_client']
-    @route_reflector_client.setter
-    def route_reflector_client(self, x):
-        parameter = 'route_reflector_client'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def safi(self):
-        return self.properties['safi']
-    @safi.setter
-    def safi(self, x):
-        parameter = 'safi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_safi(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def send_community_both(self):
-        return self.properties['send_community_both']
-    @send_community_both.setter
-    def send_community_both(self, x):
-        parameter = 'send_community_both'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def send_community_extended(self):
-        return self.properties['send_community_extended']
-    @send_community_extended.setter
-    def send_community_extended(self, x):
-        parameter = 'send_community_extended'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def send_community_set(self):
-        return self.properties['send_community_set']
-    @send_community_set.setter
-    def send_community_set(self, x):
-        parameter = 'send_community_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def send_community_standard(self):
-        return self.properties['send_community_standard']
-    @send_community_standard.setter
-    def send_community_standard(self, x):
-        parameter = 'send_community_standard'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def soft_reconfiguration_inbound_always(self):
-        return self.properties['soft_reconfiguration_inbound_always']
-    @soft_reconfiguration_inbound_always.setter
-    def soft_reconfiguration_inbound_always(self, x):
-        parameter = 'soft_reconfiguration_inbound_always'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def soft_reconfiguration_inbound_set(self):
-        return self.properties['soft_reconfiguration_inbound_set']
-    @soft_reconfiguration_inbound_set.setter
-    def soft_reconfiguration_inbound_set(self, x):
-        parameter = 'soft_reconfiguration_inbound_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def soo(self):
-        return self.properties['soo']
-    @soo.setter
-    def soo(self, x):
-        parameter = 'soo'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bgp_asn(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def suppress_inactive(self):
-        return self.properties['suppress_inactive']
-    @suppress_inactive.setter
-    def suppress_inactive(self, x):
-        parameter = 'suppress_inactive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def unsuppress_map(self):
-        return self.properties['unsuppress_map']
-    @unsuppress_map.setter
-    def unsuppress_map(self, x):
-        parameter = 'unsuppress_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def weight(self):
-        return self.properties['weight']
-    @weight.setter
-    def weight(self, x):
-        parameter = 'weight'
-        if self.set_none(x, parameter):
-            return
-        self.verify_weight(x, parameter)
-        self.properties[parameter] = x
+    advertise_map_exist_map = TaskProperty()
+
+    advertise_map_non_exist_map = TaskProperty()
+
+    advertise_map_route_map = TaskProperty()
+
+    advertisement_interval = TaskProperty('verify_advertisement_interval')
+
+    afi = TaskProperty('verify_afi')
+
+    allowas_in_max_occurences = TaskProperty('verify_allowas_in_max_occurences')
+
+    allowas_in_set = TaskProperty('verify_boolean')
+
+    as_override = TaskProperty('verify_boolean')
+
+    as_number = TaskProperty('verify_bgp_asn')
+
+    capability_additional_paths_receive = TaskProperty('verify_capability_additional_paths_receive')
+
+    capability_additional_paths_send = TaskProperty('verify_capability_additional_paths_send')
+
+    default_originate_route_map = TaskProperty()
+
+    default_originate_set = TaskProperty('verify_boolean')
+
+    disable_peer_as_check = TaskProperty('verify_boolean')
+
+    filter_list_inbound = TaskProperty()
+
+    filter_list_outbound = TaskProperty()
+
+    inherit_sequence = TaskProperty('verify_inherit_sequence')
+
+    inherit_template = TaskProperty()
+
+    maximum_prefix_generate_warning_threshold = TaskProperty('verify_maximum_prefix_generate_warning_threshold')
+
+    maximum_prefix_max_prefix_limit = TaskProperty('verify_maximum_prefix_max_prefix_limit')
+
+    maximum_prefix_restart_interval = TaskProperty('verify_maximum_prefix_restart_interval')
+
+    maximum_prefix_warning_only = TaskProperty('verify_boolean')
+
+    neighbor_address = TaskProperty('verify_neighbor_address')
+
+    next_hop_self_all_routes = TaskProperty('verify_boolean')
+
+    next_hop_self_set = TaskProperty('verify_boolean')
+
+    next_hop_third_party = TaskProperty('verify_boolean')
+
+    prefix_list_inbound = TaskProperty()
+
+    prefix_list_outbound = TaskProperty()
+
+    rewrite_evpn_rt_asn = TaskProperty('verify_boolean')
+
+    route_map_inbound = TaskProperty()
+
+    route_map_outbound = TaskProperty()
+
+    route_reflector_client = TaskProperty('verify_boolean')
+
+    safi = TaskProperty('verify_safi')
+
+    send_community_both = TaskProperty('verify_boolean')
+
+    send_community_extended = TaskProperty('verify_boolean')
+
+    send_community_set = TaskProperty('verify_boolean')
+
+    send_community_standard = TaskProperty('verify_boolean')
+
+    soft_reconfiguration_inbound_always = TaskProperty('verify_boolean')
+
+    soft_reconfiguration_inbound_set = TaskProperty('verify_boolean')
+
+    soo = TaskProperty('verify_bgp_asn')
+
+    state = TaskProperty('verify_state')
+
+    suppress_inactive = TaskProperty('verify_boolean')
+
+    unsuppress_map = TaskProperty()
+
+    weight = TaskProperty('verify_weight')
@@ -3,7 +3,7 @@ our_version = 115
 
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 
 '''
 **************************************
@@ -533,6 +533,13 @@ class NxosBgpNeighborAf(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.nxos_bgp_neighbor_af_valid_state = set('')
+        self.nxos_bgp_neighbor_af_valid_state.add('present')
+        self.nxos_bgp_neighbor_af_valid_state.add('absent')
+
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('additional_paths_receive')
         self.properties_set.add('additional_paths_send')
@@ -603,34 +610,22 @@ class NxosBgpNeighborAf(Task):
         self.nxos_bgp_neighbor_af_valid_soft_reconfiguration_in.add('always')
         self.nxos_bgp_neighbor_af_valid_soft_reconfiguration_in.add('inherit')
 
-        self.nxos_bgp_neighbor_af_valid_state = set('')
-        self.nxos_bgp_neighbor_af_valid_state.add('present')
-        self.nxos_bgp_neighbor_af_valid_state.add('absent')
-
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.afi == None:
-            self.task_log.error('exiting. call instance.afi before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.afi before calling instance.commit()')
         if self.safi == None:
-            self.task_log.error('exiting. call instance.safi before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.safi before calling instance.commit()')
         if self.allowas_in != None and self.allowas_in_max != None:
-            self.task_log.error('exiting. allowas_in is mutually-exclusive with allowas_in_max')
-            exit(1)
+            self.fail_msg('exiting. allowas_in is mutually-exclusive with allowas_in_max')
         if self.any_defined([self.max_prefix_warning, self.max_prefix_limit]):
             if not self.all_defined([self.max_prefix_warning, self.max_prefix_limit]):
                 self.task_log.error('exiting. either define both max_prefix_warning and max_prefix_limit, or neither.')
                 self.task_log.error('max_prefix_warning {}'.format(self.max_prefix_warning))
-                self.task_log.error('max_prefix_limit {}'.format(self.max_prefix_limit))
-                exit(1)
+                self.fail_msg('max_prefix_limit {}'.format(self.max_prefix_limit))
 
     def commit(self):
         self.update()
@@ -718,167 +713,35 @@ class NxosBgpNeighborAf(Task):
         expectation = self.nxos_bgp_neighbor_af_valid_soft_reconfiguration_in
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def additional_paths_receive(self):
-        return self.properties['additional_paths_receive']
-    @additional_paths_receive.setter
-    def additional_paths_receive(self, x):
-        parameter = 'additional_paths_receive'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_additional_paths_receive(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_receive = TaskProperty('nxos_bgp_neighbor_af_verify_additional_paths_receive')
 
-    @property
-    def additional_paths_install(self):
-        return self.properties['additional_paths_install']
-    @additional_paths_install.setter
-    def additional_paths_install(self, x):
-        parameter = 'additional_paths_install'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_install = TaskProperty('verify_boolean')
 
-    @property
-    def additional_paths_send(self):
-        return self.properties['additional_paths_send']
-    @additional_paths_send.setter
-    def additional_paths_send(self, x):
-        parameter = 'additional_paths_send'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    additional_paths_send = TaskProperty('verify_boolean')
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('nxos_bgp_neighbor_af_verify_afi')
 
-    @property
-    def asn(self):
-        return self.properties['asn']
-    @asn.setter
-    def asn(self, x):
-        parameter = 'asn'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_asn(x, parameter)
-        self.properties[parameter] = x
+    asn = TaskProperty('nxos_bgp_neighbor_af_verify_asn')
 
-    @property
-    def advertise_map_exist(self):
-        return self.properties['advertise_map_exist']
-    @advertise_map_exist.setter
-    def advertise_map_exist(self, x):
-        parameter = 'advertise_map_exist'
-        if self.set_none(x, parameter):
-            return
-        self.verify_list_or_default(x, parameter)
-        self.properties[parameter] = x
+    advertise_map_exist = TaskProperty('verify_list_or_default')
 
-    @property
-    def advertise_map_non_exist(self):
-        return self.properties['advertise_map_non_exist']
-    @advertise_map_non_exist.setter
-    def advertise_map_non_exist(self, x):
-        parameter = 'advertise_map_non_exist'
-        if self.set_none(x, parameter):
-            return
-        self.verify_list_or_default(x, parameter)
-        self.properties[parameter] = x
+    advertise_map_non_exist = TaskProperty('verify_list_or_default')
 
-    @property
-    def allowas_in(self):
-        return self.properties['allowas_in']
-    @allowas_in.setter
-    def allowas_in(self, x):
-        parameter = 'allowas_in'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    allowas_in = TaskProperty('verify_boolean')
 
-    @property
-    def allowas_in_max(self):
-        return self.properties['allowas_in_max']
-    @allowas_in_max.setter
-    def allowas_in_max(self, x):
-        parameter = 'allowas_in_max'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    allowas_in_max = TaskProperty('verify_digits_or_default')
 
-    @property
-    def as_override(self):
-        return self.properties['as_override']
-    @as_override.setter
-    def as_override(self, x):
-        parameter = 'as_override'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    as_override = TaskProperty('verify_boolean')
 
-    @property
-    def default_originate(self):
-        return self.properties['default_originate']
-    @default_originate.setter
-    def default_originate(self, x):
-        parameter = 'default_originate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    default_originate = TaskProperty('verify_boolean')
 
-    @property
-    def default_originate_route_map(self):
-        return self.properties['default_originate_route_map']
-    @default_originate_route_map.setter
-    def default_originate_route_map(self, x):
-        parameter = 'default_originate_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    default_originate_route_map = TaskProperty()
 
-    @property
-    def disable_peer_as_check(self):
-        return self.properties['disable_peer_as_check']
-    @disable_peer_as_check.setter
-    def disable_peer_as_check(self, x):
-        parameter = 'disable_peer_as_check'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    disable_peer_as_check = TaskProperty('verify_boolean')
 
-    @property
-    def filter_list_in(self):
-        return self.properties['filter_list_in']
-    @filter_list_in.setter
-    def filter_list_in(self, x):
-        parameter = 'filter_list_in'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    filter_list_in = TaskProperty()
 
-    @property
-    def filter_list_out(self):
-        return self.properties['filter_list_out']
-    @filter_list_out.setter
-    def filter_list_out(self, x):
-        parameter = 'filter_list_out'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    filter_list_out = TaskProperty()
 
     @property
     def max_prefix_interval(self):
@@ -889,43 +752,15 @@ class NxosBgpNeighborAf(Task):
         if self.set_none(x, parameter):
             return
         if self.max_prefix_warning != None:
-            self.task_log.error('exiting. {} is mutually-exclusive with max_prefix_warning.'.format(parameter))
-            exit(1)
+            self.fail_msg('exiting. {} is mutually-exclusive with max_prefix_warning.'.format(parameter))
         self.verify_digits(x, parameter)
         self.properties[parameter] = x
 
-    @property
-    def max_prefix_limit(self):
-        return self.properties['max_prefix_limit']
-    @max_prefix_limit.setter
-    def max_prefix_limit(self, x):
-        parameter = 'max_prefix_limit'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    max_prefix_limit = TaskProperty('verify_digits_or_default')
 
-    @property
-    def max_prefix_threshold(self):
-        return self.properties['max_prefix_threshold']
-    @max_prefix_threshold.setter
-    def max_prefix_threshold(self, x):
-        parameter = 'max_prefix_threshold'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
+    max_prefix_threshold = TaskProperty('verify_digits')
 
-    @property
-    def max_prefix_warning(self):
-        return self.properties['max_prefix_warning']
-    @max_prefix_warning.setter
-    def max_prefix_warning(self, x):
-        parameter = 'max_prefix_warning'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_prefix_warning = TaskProperty('verify_boolean')
 
     @property
     def neighbor(self):
@@ -938,161 +773,32 @@ class NxosBgpNeighborAf(Task):
         self.nxos_bgp_neighbor_af_verify_neighbor(x)
         self.properties[parameter] = x
 
-    @property
-    def next_hop_self(self):
-        return self.properties['next_hop_self']
-    @next_hop_self.setter
-    def next_hop_self(self, x):
-        parameter = 'next_hop_self'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    next_hop_self = TaskProperty('verify_boolean')
 
-    @property
-    def next_hop_third_party(self):
-        return self.properties['next_hop_third_party']
-    @next_hop_third_party.setter
-    def next_hop_third_party(self, x):
-        parameter = 'next_hop_third_party'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    next_hop_third_party = TaskProperty('verify_boolean')
 
-    @property
-    def prefix_list_in(self):
-        return self.properties['prefix_list_in']
-    @prefix_list_in.setter
-    def prefix_list_in(self, x):
-        parameter = 'prefix_list_in'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    prefix_list_in = TaskProperty()
 
-    @property
-    def prefix_list_out(self):
-        return self.properties['prefix_list_out']
-    @prefix_list_out.setter
-    def prefix_list_out(self, x):
-        parameter = 'prefix_list_out'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    prefix_list_out = TaskProperty()
 
-    @property
-    def route_map_in(self):
-        return self.properties['route_map_in']
-    @route_map_in.setter
-    def route_map_in(self, x):
-        parameter = 'route_map_in'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    route_map_in = TaskProperty()
 
-    @property
-    def route_map_out(self):
-        return self.properties['route_map_out']
-    @route_map_out.setter
-    def route_map_out(self, x):
-        parameter = 'route_map_out'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    route_map_out = TaskProperty()
 
-    @property
-    def route_reflector_client(self):
-        return self.properties['route_reflector_client']
-    @route_reflector_client.setter
-    def route_reflector_client(self, x):
-        parameter = 'route_reflector_client'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    route_reflector_client = TaskProperty('verify_boolean')
 
-    @property
-    def safi(self):
-        return self.properties['safi']
-    @safi.setter
-    def safi(self, x):
-        parameter = 'safi'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_safi(x, parameter)
-        self.properties[parameter] = x
+    safi = TaskProperty('nxos_bgp_neighbor_af_verify_safi')
 
-    @property
-    def send_community(self):
-        return self.properties['send_community']
-    @send_community.setter
-    def send_community(self, x):
-        parameter = 'send_community'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_send_community(x, parameter)
-        self.properties[parameter] = x
+    send_community = TaskProperty('nxos_bgp_neighbor_af_verify_send_community')
 
-    @property
-    def soft_reconfiguration_in(self):
-        return self.properties['soft_reconfiguration_in']
-    @soft_reconfiguration_in.setter
-    def soft_reconfiguration_in(self, x):
-        parameter = 'soft_reconfiguration_in'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_bgp_neighbor_af_verify_soft_reconfiguration_in(x, parameter)
-        self.properties[parameter] = x
+    soft_reconfiguration_in = TaskProperty('nxos_bgp_neighbor_af_verify_soft_reconfiguration_in')
 
-    @property
-    def soo(self):
-        return self.properties['soo']
-    @soo.setter
-    def soo(self, x):
-        parameter = 'soo'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    soo = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_bgp_neighbor_af_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_bgp_neighbor_af_state')
 
-    @property
-    def suppress_inactive(self):
-        return self.properties['suppress_inactive']
-    @suppress_inactive.setter
-    def suppress_inactive(self, x):
-        parameter = 'suppress_inactive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    suppress_inactive = TaskProperty('verify_boolean')
 
-    @property
-    def unsuppress_map(self):
-        return self.properties['unsuppress_map']
-    @unsuppress_map.setter
-    def unsuppress_map(self, x):
-        parameter = 'unsuppress_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    unsuppress_map = TaskProperty()
 
-    @property
-    def weight(self):
-        return self.properties['weight']
-    @weight.setter
-    def weight(self, x):
-        parameter = 'weight'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    weight = TaskProperty('verify_digits_or_default')
@@ -2,7 +2,7 @@
 our_version = 106
 
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 
 '''
 ***************
@@ -238,6 +238,9 @@ class NxosCommand(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('answer')
         self.properties_set.add('command')
@@ -259,29 +262,21 @@ class NxosCommand(Task):
         self.nxos_command_valid_output.add('text')
         self.nxos_command_valid_output.add('json')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.commands == None and self.command == None:
-            self.task_log.error('exiting. instance.commands or instance.command must be set before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.commands or instance.command must be set before calling instance.commit()')
         if self.commands != None and self.command != None:
-            self.task_log.error('exiting. instance.commands and instance.command cannot both be set')
-            exit(1)
+            self.fail_msg('exiting. instance.commands and instance.command cannot both be set')
         if self.command == None and self.output != None:
-            self.task_log.error('exiting. instance.command must be set if instance.output ({}) is set'.format(self.output))
-            exit(1)
+            self.fail_msg('exiting. instance.command must be set if instance.output ({}) is set'.format(self.output))
         if self.command != None and self.output == None:
             self.output = 'text'
         if self.register == None:
-            self.task_log.error('exiting. instance.register must be set before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.register must be set before calling instance.commit()')
         if self.interval == None:
             self.interval = 1
         if self.match == None:
@@ -338,105 +333,22 @@ class NxosCommand(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def answer(self):
-        return self.properties['answer']
-    @answer.setter
-    def answer(self, x):
-        parameter = 'answer'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def commands(self):
-        return self.properties['commands']
-    @commands.setter
-    def commands(self, x):
-        parameter = 'commands'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def interval(self):
-        return self.properties['interval']
-    @interval.setter
-    def interval(self, x):
-        parameter = 'interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def match(self):
-        return self.properties['match']
-    @match.setter
-    def match(self, x):
-        parameter = 'match'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def output(self):
-        return self.properties['output']
-    @output.setter
-    def output(self, x):
-        parameter = 'output'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_command_output(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def prompt(self):
-        return self.properties['prompt']
-    @prompt.setter
-    def prompt(self, x):
-        parameter = 'prompt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def retries(self):
-        return self.properties['retries']
-    @retries.setter
-    def retries(self, x):
-        parameter = 'retries'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def wait_for(self):
-        return self.properties['wait_for']
-    @wait_for.setter
-    def wait_for(self, x):
-        parameter = 'wait_for'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    answer = TaskProperty()
+
+    command = TaskProperty()
+
+    commands = TaskProperty()
+
+    interval = TaskProperty('verify_digits')
+
+    match = TaskProperty()
+
+    output = TaskProperty('verify_nxos_command_output')
+
+    prompt = TaskProperty()
+
+    register = TaskProperty()
+
+    retries = TaskProperty('verify_digits')
+
+    wait_for = TaskProperty()
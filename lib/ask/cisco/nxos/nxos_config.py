@@ -2,7 +2,7 @@
 our_version = 116
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 
 '''
 **************************************
@@ -394,6 +394,17 @@ class NxosConfig(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        # the following are used in converting an NXOS config snippet
+        # into a format that is expected by the Ansible nxos_config module
+        self.last = dict() # see self.push_line() and self.get_stanza()
+        for level in list(range(0,31)): # support up to 32 levels of indentation
+            self.last[level] = None
+        self.re_blank_line = re.compile('^\s*$')
+        self.re_leading_spaces = re.compile('^(\s*).*')
+
+        self.init_properties()
+
+    def init_schema(self):
         self.backup_options_set = set()
         self.backup_options_set.add('dir_path')
         self.backup_options_set.add('filename')
@@ -447,35 +458,19 @@ class NxosConfig(Task):
         self.backup_options_set.add('dir_path')
         self.backup_options_set.add('filename')
 
-        # the following are used in converting an NXOS config snippet
-        # into a format that is expected by the Ansible nxos_config module
-        self.last = dict() # see self.push_line() and self.get_stanza()
-        for level in list(range(0,31)): # support up to 32 levels of indentation
-            self.last[level] = None
-        self.re_blank_line = re.compile('^\s*$')
-        self.re_leading_spaces = re.compile('^(\s*).*')
-
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.replace_src != None and self.src != None:
-            self.task_log.error('exiting. replace_src is mutually-exclusive with src.  Unset one or the other.')
-            exit(1)
+            self.fail_msg('exiting. replace_src is mutually-exclusive with src.  Unset one or the other.')
         if self.replace_src != None and self.lines != None:
-            self.task_log.error('exiting. replace_src is mutually-exclusive with lines.  Unset one or the other.')
-            exit(1)
+            self.fail_msg('exiting. replace_src is mutually-exclusive with lines.  Unset one or the other.')
         if self.src != None and self.lines != None:
-            self.task_log.error('exiting. src is mutually-exclusive with lines.  Unset one or the other.')
-            exit(1)
+            self.fail_msg('exiting. src is mutually-exclusive with lines.  Unset one or the other.')
         if self.src != None and self.parents != None:
-            self.task_log.error('exiting. src is mutually-exclusive with parents.  Unset one or the other.')
-            exit(1)
+            self.fail_msg('exiting. src is mutually-exclusive with parents.  Unset one or the other.')
 
     def are_all_backup_options_set(self):
         result = True
@@ -611,35 +606,11 @@ class NxosConfig(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def dir_path(self):
-        return self.properties['dir_path']
-    @dir_path.setter
-    def dir_path(self, x):
-        parameter = 'dir_path'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    dir_path = TaskProperty()
 
-    @property
-    def filename(self):
-        return self.properties['filename']
-    @filename.setter
-    def filename(self, x):
-        parameter = 'filename'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    filename = TaskProperty()
 
-    @property
-    def after(self):
-        return self.properties['after']
-    @after.setter
-    def after(self, x):
-        parameter = 'after'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    after = TaskProperty()
 
     @property
     def backup(self):
@@ -652,15 +623,7 @@ class NxosConfig(Task):
         self.verify_boolean(x)
         self.properties[parameter] = x
 
-    @property
-    def before(self):
-        return self.properties['before']
-    @before.setter
-    def before(self, x):
-        parameter = 'before'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    before = TaskProperty()
 
     @property
     def defaults(self):
@@ -673,36 +636,11 @@ class NxosConfig(Task):
         self.verify_boolean(x)
         self.properties[parameter] = x
 
-    @property
-    def diff_against(self):
-        return self.properties['diff_against']
-    @diff_against.setter
-    def diff_against(self, x):
-        parameter = 'diff_against'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_config_diff_against(x, parameter)
-        self.properties[parameter] = x
+    diff_against = TaskProperty('verify_nxos_config_diff_against')
 
-    @property
-    def diff_ignore_lines(self):
-        return self.properties['diff_ignore_lines']
-    @diff_ignore_lines.setter
-    def diff_ignore_lines(self, x):
-        parameter = 'diff_ignore_lines'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    diff_ignore_lines = TaskProperty()
 
-    @property
-    def intended_config(self):
-        return self.properties['intended_config']
-    @intended_config.setter
-    def intended_config(self, x):
-        parameter = 'intended_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    intended_config = TaskProperty()
 
     @property
     def lines(self):
@@ -714,75 +652,16 @@ class NxosConfig(Task):
             return
         self.properties[parameter] = self.gen_lines(x)
 
-    @property
-    def match(self):
-        return self.properties['match']
-    @match.setter
-    def match(self, x):
-        parameter = 'match'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_config_match(x, parameter)
-        self.properties[parameter] = x
+    match = TaskProperty('verify_nxos_config_match')
 
-    @property
-    def parents(self):
-        return self.properties['parents']
-    @parents.setter
-    def parents(self, x):
-        parameter = 'parents'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    parents = TaskProperty()
 
-    @property
-    def replace(self):
-        return self.properties['replace']
-    @replace.setter
-    def replace(self, x):
-        parameter = 'replace'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_config_replace(x, parameter)
-        self.properties[parameter] = x
+    replace = TaskProperty('verify_nxos_config_replace')
 
-    @property
-    def replace_src(self):
-        return self.properties['replace_src']
-    @replace_src.setter
-    def replace_src(self, x):
-        parameter = 'replace_src'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    replace_src = TaskProperty()
 
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    running_config = TaskProperty()
 
-    @property
-    def save_when(self):
-        return self.properties['save_when']
-    @save_when.setter
-    def save_when(self, x):
-        parameter = 'save_when'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_config_save_when(x, parameter)
-        self.properties[parameter] = x
+    save_when = TaskProperty('verify_nxos_config_save_when')
 
-    @property
-    def src(self):
-        return self.properties['src']
-    @src.setter
-    def src(self, x):
-        parameter = 'src'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    src = TaskProperty()
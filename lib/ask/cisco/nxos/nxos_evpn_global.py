@@ -1,7 +1,7 @@
 # NxosEvpnGlobal() - cisco/nxos/nxos_evpn_global.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosEvpnGlobal()
@@ -127,6 +127,9 @@ class NxosEvpnGlobal(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('nv_overlay_evpn')
 
@@ -135,18 +138,13 @@ class NxosEvpnGlobal(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.nv_overlay_evpn == None:
-            self.task_log.error('exiting. instance.nv_overlay_evpn must be set before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.nv_overlay_evpn must be set before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -165,14 +163,5 @@ class NxosEvpnGlobal(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def nv_overlay_evpn(self):
-        return self.properties['nv_overlay_evpn']
-    @nv_overlay_evpn.setter
-    def nv_overlay_evpn(self, x):
-        parameter = 'nv_overlay_evpn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nv_overlay_evpn = TaskProperty('verify_boolean')
 
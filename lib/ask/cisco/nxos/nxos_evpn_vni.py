@@ -1,7 +1,7 @@
 # NxosEvpnVni() - cisco/nxos/nxos_evpn_vni.py
 our_version = 104
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosEvpnVni()
@@ -241,6 +241,9 @@ class NxosEvpnVni(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('route_distinguisher')  
         self.properties_set.add('route_target_both')
@@ -258,17 +261,12 @@ class NxosEvpnVni(Task):
         self.nxos_evpn_vni_valid_state.add('absent')
         self.nxos_evpn_vni_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.vni == None:
-            self.task_log.error('exiting. instance.vni must be set before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.vni must be set before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -341,16 +339,7 @@ class NxosEvpnVni(Task):
         self.verify_rt(x, parameter) # inherited from Common() via Task()
         self.properties[parameter] = x
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_evpn_vni_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_evpn_vni_state')
 
     @property
     def vni(self):
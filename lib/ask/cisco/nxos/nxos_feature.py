@@ -1,7 +1,7 @@
 # NxosFeature() - cisco/nxos/nxos_feature.py
 our_version = 109
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosFeature()
@@ -131,6 +131,9 @@ class NxosFeature(Task):
         self._version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('feature')
         self.properties_set.add('state')
@@ -144,21 +147,15 @@ class NxosFeature(Task):
         self.nxos_feature_valid_state.add('enabled')
         self.nxos_feature_valid_state.add('disabled')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.feature == None:
-            self.task_log.error('exiting. call instance.feature before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.feature before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -186,23 +183,6 @@ class NxosFeature(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def feature(self):
-        return self.properties['feature']
-    @feature.setter
-    def feature(self, x):
-        parameter = 'feature'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_feature_verify_state(x, parameter)
-        self.properties[parameter] = x
+    feature = TaskProperty()
+
+    state = TaskProperty('nxos_feature_verify_state')
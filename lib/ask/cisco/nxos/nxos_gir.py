@@ -1,7 +1,7 @@
 # NxosGir() - cisco/nxos/nxos_gir.py
 our_version = 100
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosGir()
@@ -219,14 +219,6 @@ class NxosGir(Task):
         self._version = our_version
         self.class_name = __class__.__name__
 
-        self.properties_set = set()
-        self.properties_set.add('state')
-        self.properties_set.add('system_mode_maintenance')
-        self.properties_set.add('system_mode_maintenance_dont_generate_profile')
-        self.properties_set.add('system_mode_maintenance_on_reload_reset_reason')
-        self.properties_set.add('system_mode_maintenance_shutdown')
-        self.properties_set.add('system_mode_maintenance_timeout')
-
         self.mutex = dict()
         self.mutex['system_mode_maintenance'] = set()
         self.mutex['system_mode_maintenance'].add('system_mode_maintenance_dont_generate_profile')
@@ -240,6 +232,17 @@ class NxosGir(Task):
         self.mutex['system_mode_maintenance_shutdown'].add('system_mode_maintenance')
         self.mutex['system_mode_maintenance_shutdown'].add('system_mode_maintenance_dont_generate_profile')
 
+        self.init_properties()
+
+    def init_schema(self):
+        self.properties_set = set()
+        self.properties_set.add('state')
+        self.properties_set.add('system_mode_maintenance')
+        self.properties_set.add('system_mode_maintenance_dont_generate_profile')
+        self.properties_set.add('system_mode_maintenance_on_reload_reset_reason')
+        self.properties_set.add('system_mode_maintenance_shutdown')
+        self.properties_set.add('system_mode_maintenance_timeout')
+
         # scriptkit_properties can be used by scripts when
         # setting task_name. See Task().append_to_task_name()
         self.scriptkit_properties = set()
@@ -264,23 +267,17 @@ class NxosGir(Task):
         self.system_mode_maintenance_timeout_min = 5
         self.system_mode_maintenance_timeout_max = 65535
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         for p in self.mutex:
             for mp in self.mutex[p]:
                 if self.properties[p] != None and self.properties[mp] != None:
-                    self.task_log.error('exiting. {} is mutually-exclusive with {}'.format(p, mp))
-                    exit(1)
+                    self.fail_msg('exiting. {} is mutually-exclusive with {}'.format(p, mp))
 
     def commit(self):
         self.update()
@@ -323,68 +320,14 @@ class NxosGir(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def system_mode_maintenance(self):
-        return self.properties['system_mode_maintenance']
-    @system_mode_maintenance.setter
-    def system_mode_maintenance(self, x):
-        parameter = 'system_mode_maintenance'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_mode_maintenance_dont_generate_profile(self):
-        return self.properties['system_mode_maintenance_dont_generate_profile']
-    @system_mode_maintenance_dont_generate_profile.setter
-    def system_mode_maintenance_dont_generate_profile(self, x):
-        parameter = 'system_mode_maintenance_dont_generate_profile'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_mode_maintenance_on_reload_reset_reason(self):
-        return self.properties['system_mode_maintenance_on_reload_reset_reason']
-    @system_mode_maintenance_on_reload_reset_reason.setter
-    def system_mode_maintenance_on_reload_reset_reason(self, x):
-        parameter = 'system_mode_maintenance_on_reload_reset_reason'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_gir_verify_system_mode_maintenance_on_reload_reset_reason(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_mode_maintenance_shutdown(self):
-        return self.properties['system_mode_maintenance_shutdown']
-    @system_mode_maintenance_shutdown.setter
-    def system_mode_maintenance_shutdown(self, x):
-        parameter = 'system_mode_maintenance_shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_mode_maintenance_timeout(self):
-        return self.properties['system_mode_maintenance_timeout']
-    @system_mode_maintenance_timeout.setter
-    def system_mode_maintenance_timeout(self, x):
-        parameter = 'system_mode_maintenance_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_gir_verify_system_mode_maintenance_timeout(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_gir_verify_state(x, parameter)
-        self.properties[parameter] = x
+    system_mode_maintenance = TaskProperty('verify_boolean')
+
+    system_mode_maintenance_dont_generate_profile = TaskProperty('verify_boolean')
+
+    system_mode_maintenance_on_reload_reset_reason = TaskProperty('nxos_gir_verify_system_mode_maintenance_on_reload_reset_reason')
+
+    system_mode_maintenance_shutdown = TaskProperty('verify_boolean')
+
+    system_mode_maintenance_timeout = TaskProperty('nxos_gir_verify_system_mode_maintenance_timeout')
+
+    state = TaskProperty('nxos_gir_verify_state')
@@ -1,7 +1,7 @@
 # NxosGirProfileManagement() - cisco/nxos/nxos_gir_profile_management.py
 our_version = 101
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosGirProfileManagement()
@@ -158,6 +158,9 @@ class NxosGirProfileManagement(Task):
         self._version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('commands')
         self.properties_set.add('mode')
@@ -176,21 +179,15 @@ class NxosGirProfileManagement(Task):
         self.nxos_gir_profile_management_valid_state.add('absent')
         self.nxos_gir_profile_management_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.mode == None:
-            self.task_log.error('exiting. call instance.mode before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.mode before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -227,34 +224,8 @@ class NxosGirProfileManagement(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def commands(self):
-        return self.properties['commands']
-    @commands.setter
-    def commands(self, x):
-        parameter = 'commands'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_gir_profile_management_verify_mode(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_gir_profile_management_verify_state(x, parameter)
-        self.properties[parameter] = x
+    commands = TaskProperty()
+
+    mode = TaskProperty('nxos_gir_profile_management_verify_mode')
+
+    state = TaskProperty('nxos_gir_profile_management_verify_state')
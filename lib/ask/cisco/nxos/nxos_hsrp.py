@@ -1,7 +1,7 @@
 # NxosHsrp() - cisco/nxos/nxos_hsrp.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosHsrp()
@@ -150,6 +150,9 @@ class NxosHsrp(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('auth_string')
         self.properties_set.add('auth_type')
@@ -190,12 +193,8 @@ class NxosHsrp(Task):
         self.nxos_hsrp_valid_interface_examples.add('port-channelX')
         self.nxos_hsrp_valid_interface_examples.add('VlanX')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
@@ -203,14 +202,11 @@ class NxosHsrp(Task):
         final verification across the properties that the user has or hasn't set
         '''
         if self.group == None:
-            self.task_log.error('exiting. call instance.group before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.group before calling instance.commit()')
         if self.interface == None:
-            self.task_log.error('exiting. call instance.interface before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.interface before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         self.verify_nxos_hsrp_group(self.group, 'group')
 
 
@@ -249,8 +245,7 @@ class NxosHsrp(Task):
         elif int(self.version) == 2:
             self.verify_integer_range(x, 0, 4095, self.class_name, parameter)
         else:
-            self.task_log.error('exiting. unknown hsrp version {}'.format(self.version))
-            exit(1)
+            self.fail_msg('exiting. unknown hsrp version {}'.format(self.version))
 
     def nxos_hsrp_verify_interface(self, x, parameter='interface'):
         if self.is_ethernet_interface(x):
@@ -279,8 +274,7 @@ class NxosHsrp(Task):
         if self.is_default(x):
             return
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, or keyword: default. Got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, or keyword: default. Got {}'.format(x))
         self.verify_integer_range(x, 0, 255, self.class_name, parameter)
 
     def verify_nxos_hsrp_state(self, x, parameter='state'):
@@ -311,70 +305,18 @@ class NxosHsrp(Task):
         expectation = 'ipv4 address with prefixlen e.g. 10.0.0.1/24, or keyword: default'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def auth_string(self):
-        return self.properties['auth_string']
-    @auth_string.setter
-    def auth_string(self, x):
-        parameter = 'auth_string'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    auth_string = TaskProperty()
 
-    @property
-    def auth_type(self):
-        return self.properties['auth_type']
-    @auth_type.setter
-    def auth_type(self, x):
-        parameter = 'auth_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_auth_type(x, parameter)
-        self.properties[parameter] = x
+    auth_type = TaskProperty('verify_nxos_hsrp_auth_type')
 
-    @property
-    def group(self):
-        return self.properties['group']
-    @group.setter
-    def group(self, x):
-        parameter = 'group'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    group = TaskProperty()
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_hsrp_verify_interface(x, parameter)
-        self.properties[parameter] = x
+    interface = TaskProperty('nxos_hsrp_verify_interface')
 
-    @property
-    def preempt(self):
-        return self.properties['preempt']
-    @preempt.setter
-    def preempt(self, x):
-        parameter = 'preempt'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_preempt(x, parameter)
-        self.properties[parameter] = x
+    preempt = TaskProperty('verify_nxos_hsrp_preempt')
 
 
-    @property
-    def priority(self):
-        return self.properties['priority']
-    @priority.setter
-    def priority(self, x):
-        parameter = 'priority'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_priority(x, parameter)
-        self.properties[parameter] = x
+    priority = TaskProperty('verify_nxos_hsrp_priority')
 
     @property
     def state(self):
@@ -1,7 +1,7 @@
 # NxosHsrpInterfaces() - cisco/nxos/nxos_hsrp_interfaces.py
-our_version = 106
+our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosHsrpInterfaces()
@@ -129,6 +129,9 @@ class NxosHsrpInterfaces(Task):
 
         self.interface_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.interface_properties = set()
         self.interface_properties.add('name')
         self.interface_properties.add('bfd')
@@ -163,18 +166,13 @@ class NxosHsrpInterfaces(Task):
         self.nxos_hsrp_interfaces_valid_interface_examples.add('port-channelX')
         self.nxos_hsrp_interfaces_valid_interface_examples.add('VlanX')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
     def commit(self):
         self.update()
     def update(self):
@@ -191,12 +189,10 @@ class NxosHsrpInterfaces(Task):
             self.ansible_task['name'] = self.task_name
 
     def init_interface_properties(self):
-        for p in self.interface_properties:
-            self.properties[p] = None
+        self.reset(self.interface_properties)
     def verify_interface_properties(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
     def add_interface(self):
         self.verify_interface_properties()
         d = dict()
@@ -204,8 +200,7 @@ class NxosHsrpInterfaces(Task):
             if self.properties[p] != None:
                 d[p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. Set at least one interface property before calling instance.interface()')
-            exit(1)
+            self.fail_msg('exiting. Set at least one interface property before calling instance.interface()')
         self.interface_list.append(deepcopy(d))
         self.init_interface_properties()
 
@@ -241,36 +236,9 @@ class NxosHsrpInterfaces(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_interfaces_bfd(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_interfaces_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_hsrp_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_nxos_hsrp_interfaces_bfd')
+
+    name = TaskProperty('verify_nxos_hsrp_interfaces_interface')
+
+    state = TaskProperty('verify_nxos_hsrp_interfaces_state')
 
@@ -1,7 +1,7 @@
 # NxosIgmp() - cisco/nxos/nxos_igmp.py
 our_version = 102
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosIgmp()
@@ -97,6 +97,9 @@ class NxosIgmp(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('enforce_rtr_alert')
         self.properties_set.add('flush_routes')
@@ -112,12 +115,8 @@ class NxosIgmp(Task):
         self.nxos_igmp_valid_state.add('absent')
         self.nxos_igmp_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for item in self.properties_set:
-            self.properties[item] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.state == None:
@@ -150,46 +149,10 @@ class NxosIgmp(Task):
         expectation = ','.join(self.verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def enforce_rtr_alert(self):
-        return self.properties['enforce_rtr_alert']
-    @enforce_rtr_alert.setter
-    def enforce_rtr_alert(self, x):
-        parameter = 'enforce_rtr_alert'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def flush_routes(self):
-        return self.properties['flush_routes']
-    @flush_routes.setter
-    def flush_routes(self, x):
-        parameter = 'flush_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def restart(self):
-        return self.properties['restart']
-    @enforce_rtr_alert.setter
-    def restart(self, x):
-        parameter = 'restart'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_igmp_verify_state(x, parameter)
-        self.properties[parameter] = x
+    enforce_rtr_alert = TaskProperty('verify_boolean')
+
+    flush_routes = TaskProperty('verify_boolean')
+
+    restart = TaskProperty('verify_boolean')
+
+    state = TaskProperty('nxos_igmp_verify_state')
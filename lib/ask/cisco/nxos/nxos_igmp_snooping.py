@@ -1,7 +1,7 @@
 # NxosIgmpSnooping() - cisco/nxos/nxos_igmp_snooping.py
 our_version = 104
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosIgmpSnooping()
@@ -107,6 +107,9 @@ class NxosIgmpSnooping(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('group_timeout')
         self.properties_set.add('link_local_grp_supp')
@@ -130,17 +133,12 @@ class NxosIgmpSnooping(Task):
         self.nxos_igmp_snooping_min_group_timeout = 1
         self.nxos_igmp_snooping_max_group_timeout = 10080
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for item in self.properties_set:
-            self.properties[item] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.snooping == 'no' and self.group_timeout != None:
-            self.task_log.error('exiting. instance.group_timeout cannot be set if self.snooping == no')
-            exit(1)
+            self.fail_msg('exiting. instance.group_timeout cannot be set if self.snooping == no')
         if self.state == None:
             self.state = 'present'
 
@@ -188,57 +186,12 @@ class NxosIgmpSnooping(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def group_timeout(self):
-        return self.properties['group_timeout']
-    @group_timeout.setter
-    def group_timeout(self, x):
-        parameter = 'group_timeout'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_igmp_snooping_verify_group_timeout(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def link_local_grp_supp(self):
-        return self.properties['link_local_grp_supp']
-    @link_local_grp_supp.setter
-    def link_local_grp_supp(self, x):
-        parameter = 'link_local_grp_supp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def report_supp(self):
-        return self.properties['report_supp']
-    @report_supp.setter
-    def report_supp(self, x):
-        parameter = 'report_supp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_igmp_snooping_verify_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def v3_report_supp(self):
-        return self.properties['v3_report_supp']
-    @v3_report_supp.setter
-    def v3_report_supp(self, x):
-        parameter = 'v3_report_supp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    group_timeout = TaskProperty('nxos_igmp_snooping_verify_group_timeout')
+
+    link_local_grp_supp = TaskProperty('verify_boolean')
+
+    report_supp = TaskProperty('verify_boolean')
+
+    state = TaskProperty('nxos_igmp_snooping_verify_state')
+
+    v3_report_supp = TaskProperty('verify_boolean')
@@ -1,7 +1,7 @@
 # NxosInterface() - cisco/nxos/nxos_interface.py
 our_version = 116
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosInterface()
@@ -237,6 +237,9 @@ class NxosInterface(Task):
         self.task_log.warning('Use NxosInterfaces() (cisco/nxos/nxos_interfaces.py) instead.')
         self.task_log.warning('*******************************************************************************************')
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_interface_valid_admin_state = set()
         self.nxos_interface_valid_admin_state.add('up')
         self.nxos_interface_valid_admin_state.add('down')
@@ -291,12 +294,8 @@ class NxosInterface(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['neighbors']    = list()
         self.properties['task_name']    = None
         self.properties['neighbor_port'] = None
@@ -308,11 +307,9 @@ class NxosInterface(Task):
         It performs a final verification across the properties that the user has or hasn't set
         '''
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
         if self.mode == 'layer2' and self.ip_forward == 'enable':
-            self.task_log.error('exiting. mode is layer2 and ip_forward is enable.  Either set mode to layer3 or set ip_forward to either None or disable')
-            exit(1)
+            self.fail_msg('exiting. mode is layer2 and ip_forward is enable.  Either set mode to layer3 or set ip_forward to either None or disable')
         if 'loopback' in self.name.lower() and self.mtu != None:
             self.task_log.info('mtu not valid for {}. Changing mtu to None.'.format(self.name))
             self.properties['mtu'] = None
@@ -420,16 +417,7 @@ class NxosInterface(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def admin_state(self):
-        return self.properties['admin_state']
-    @admin_state.setter
-    def admin_state(self, x):
-        parameter = 'admin_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_admin_state(x, parameter)
-        self.properties[parameter] = x
+    admin_state = TaskProperty('verify_nxos_interface_admin_state')
 
     @property
     def delay(self):
@@ -442,113 +430,25 @@ class NxosInterface(Task):
         self.verify_integer_range(x, self.nxos_interface_min_delay, self.nxos_interface_max_delay, self.class_name, parameter)
         self.properties[parameter] = x
 
-    @property
-    def description(self):
-        return self.properties['description']
-    @description.setter
-    def description(self, x):
-        parameter = 'description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    description = TaskProperty()
 
-    @property
-    def duplex(self):
-        return self.properties['duplex']
-    @duplex.setter
-    def duplex(self, x):
-        parameter = 'duplex'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_duplex(x, parameter)
-        self.properties[parameter] = x
+    duplex = TaskProperty('verify_nxos_interface_duplex')
 
-    @property
-    def fabric_forwarding_anycast_gateway(self):
-        return self.properties['fabric_forwarding_anycast_gateway']
-    @fabric_forwarding_anycast_gateway.setter
-    def fabric_forwarding_anycast_gateway(self, x):
-        parameter = 'fabric_forwarding_anycast_gateway'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    fabric_forwarding_anycast_gateway = TaskProperty('verify_boolean')
 
-    @property
-    def interface_type(self):
-        return self.properties['interface_type']
-    @interface_type.setter
-    def interface_type(self, x):
-        parameter = 'interface_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_interface_type(x, parameter)
-        self.properties[parameter] = x
+    interface_type = TaskProperty('verify_nxos_interface_interface_type')
 
-    @property
-    def ip_forward(self):
-        return self.properties['ip_forward']
-    @ip_forward.setter
-    def ip_forward(self, x):
-        parameter = 'ip_forward'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_ip_forward(x, parameter)
-        self.properties[parameter] = x
+    ip_forward = TaskProperty('verify_nxos_interface_ip_forward')
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_nxos_interface_mode')
 
-    @property
-    def mtu(self):
-        return self.properties['mtu']
-    @mtu.setter
-    def mtu(self, x):
-        parameter = 'mtu'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_interface_verify_mtu(x, parameter)
-        self.properties[parameter] = str(x)
+    mtu = TaskProperty('nxos_interface_verify_mtu', to_str=True)
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty('verify_interface')
 
-    @property
-    def neighbor_host(self):
-        return self.properties['neighbor_host']
-    @neighbor_host.setter
-    def neighbor_host(self, x):
-        parameter = 'neighbor_host'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_host = TaskProperty()
 
-    @property
-    def neighbor_port(self):
-        return self.properties['neighbor_port']
-    @neighbor_port.setter
-    def neighbor_port(self, x):
-        parameter = 'neighbor_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
+    neighbor_port = TaskProperty('verify_interface')
 
     @property
     def rx_rate(self):
@@ -559,31 +459,12 @@ class NxosInterface(Task):
         if self.set_none(x, parameter):
             return
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits. Got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits. Got {}'.format(x))
         self.properties[parameter] = x
 
-    @property
-    def speed(self):
-        return self.properties['speed']
-    @speed.setter
-    def speed(self, x):
-        parameter = 'speed'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_speed(x, parameter)
-        self.properties[parameter] = x
+    speed = TaskProperty('verify_nxos_interface_speed')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_interface_state')
 
     @property
     def tx_rate(self):
@@ -594,6 +475,5 @@ class NxosInterface(Task):
         if self.set_none(x, parameter):
             return
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits. Got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits. Got {}'.format(x))
         self.properties[parameter] = x
@@ -1,7 +1,7 @@
 # NxosInterfaceOspf() - cisco/nxos/nxos_interface_ospf.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 Name: nxos_interface_ospf.py
 
@@ -61,6 +61,9 @@ class NxosInterfaceOspf(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.valid_message_digest_algorithm_type = set()
         self.valid_message_digest_algorithm_type.add('md5')
         self.valid_message_digest_algorithm_type.add('default')
@@ -104,30 +107,21 @@ class NxosInterfaceOspf(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.ospf == None:
-            self.task_log.error('exiting. self.ospf is is mandatory, but is not set.')
-            exit(1)
+            self.fail_msg('exiting. self.ospf is is mandatory, but is not set.')
         if self.interface == None:
-            self.task_log.error('exiting. self.interface is is mandatory, but is not set.')
-            exit(1)
+            self.fail_msg('exiting. self.interface is is mandatory, but is not set.')
         if self.message_digest_key_id != None:
             if self.message_digest_algorithm_type == None:
-                self.task_log.error('exiting. message_digest_algorithm_type is mandatory, but is not set.')
-                exit(1)
+                self.fail_msg('exiting. message_digest_algorithm_type is mandatory, but is not set.')
             if self.message_digest_encryption_type == None:
-                self.task_log.error('exiting. message_digest_encryption_type is mandatory, but is not set.')
-                exit(1)
+                self.fail_msg('exiting. message_digest_encryption_type is mandatory, but is not set.')
             if self.message_digest_password == None:
-                self.task_log.error('exiting. message_digest_password is mandatory, but is not set.')
-                exit(1)
+                self.fail_msg('exiting. message_digest_password is mandatory, but is not set.')
 
     def commit(self):
         self.update()
@@ -199,7 +193,7 @@ class NxosInterfaceOspf(Task):
                 return
         source_class = self.class_name
         source_method = 'verify_interface'
-        expectation = "OSPF Interface type: {}".format(self.valid_ospf_interface)
+        expectation = "OSPF Interface type: {}".format(','.join(sorted(self.valid_ospf_interface)))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_message_digest(self, x, parameter='message_digest'):
@@ -210,7 +204,7 @@ class NxosInterfaceOspf(Task):
             return
         source_class = self.class_name
         source_method = 'verify_message_digest_algorithm_type'
-        expectation = "{}".format(self.valid_message_digest_algorithm_type)
+        expectation = "{}".format(','.join(sorted(self.valid_message_digest_algorithm_type)))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_message_digest_encryption_type(self, x, parameter='message_digest_encryption_type'):
@@ -218,7 +212,7 @@ class NxosInterfaceOspf(Task):
             return
         source_class = self.class_name
         source_method = 'verify_message_digest_encryption_type'
-        expectation = "{}".format(self.valid_message_digest_encryption_type)
+        expectation = "{}".format(','.join(sorted(self.valid_message_digest_encryption_type)))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_message_digest_key_id(self, x, parameter='message_digest_key_id'):
@@ -236,7 +230,7 @@ class NxosInterfaceOspf(Task):
             return
         source_class = self.class_name
         source_method = 'verify_network'
-        expectation = "{}".format(self.valid_network)
+        expectation = "{}".format(','.join(sorted(self.valid_network)))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_nxos_interface_ospf_passive_interface(self, x, parameter='force'):
@@ -256,165 +250,32 @@ class NxosInterfaceOspf(Task):
         expectation = ','.join(self.nxos_interface_ospf_valid_state)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def area(self):
-        return self.properties['area']
-    @area.setter
-    def area(self, x):
-        parameter = 'area'
-        if self.set_none(x, parameter):
-            return
-        self.verify_area(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_bfd(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def cost(self):
-        return self.properties['cost']
-    @cost.setter
-    def cost(self, x):
-        parameter = 'cost'
-        if self.set_none(x, parameter):
-            return
-        self.verify_cost(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def dead_interval(self):
-        return self.properties['dead_interval']
-    @dead_interval.setter
-    def dead_interval(self, x):
-        parameter = 'dead_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_dead_interval(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def hello_interval(self):
-        return self.properties['hello_interval']
-    @hello_interval.setter
-    def hello_interval(self, x):
-        parameter = 'hello_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_hello_interval(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def message_digest(self):
-        return self.properties['message_digest']
-    @message_digest.setter
-    def message_digest(self, x):
-        parameter = 'message_digest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_message_digest(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def message_digest_algorithm_type(self):
-        return self.properties['message_digest_algorithm_type']
-    @message_digest_algorithm_type.setter
-    def message_digest_algorithm_type(self, x):
-        parameter = 'message_digest_algorithm_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_message_digest_algorithm_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def message_digest_encryption_type(self):
-        return self.properties['message_digest_encryption_type']
-    @message_digest_encryption_type.setter
-    def message_digest_encryption_type(self, x):
-        parameter = 'message_digest_encryption_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_message_digest_encryption_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def message_digest_key_id(self):
-        return self.properties['message_digest_key_id']
-    @message_digest_key_id.setter
-    def message_digest_key_id(self, x):
-        parameter = 'message_digest_key_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_message_digest_key_id(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def message_digest_password(self):
-        return self.properties['message_digest_password']
-    @message_digest_key_id.setter
-    def message_digest_password(self, x):
-        parameter = 'message_digest_password'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def network(self):
-        return self.properties['network']
-    @network.setter
-    def network(self, x):
-        parameter = 'network'
-        if self.set_none(x, parameter):
-            return
-        self.verify_network(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def ospf(self):
-        return self.properties['ospf']
-    @ospf.setter
-    def ospf(self, x):
-        parameter = 'ospf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def passive_interface(self):
-        return self.properties['passive_interface']
-    @passive_interface.setter
-    def passive_interface(self, x):
-        parameter = 'passive_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_ospf_passive_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interface_ospf_state(x, parameter)
-        self.properties[parameter] = x
+    area = TaskProperty('verify_area')
+
+    bfd = TaskProperty('verify_bfd')
+
+    cost = TaskProperty('verify_cost')
+
+    dead_interval = TaskProperty('verify_dead_interval')
+
+    hello_interval = TaskProperty('verify_hello_interval')
+
+    interface = TaskProperty('verify_interface')
+
+    message_digest = TaskProperty('verify_message_digest')
+
+    message_digest_algorithm_type = TaskProperty('verify_message_digest_algorithm_type')
+
+    message_digest_encryption_type = TaskProperty('verify_message_digest_encryption_type')
+
+    message_digest_key_id = TaskProperty('verify_message_digest_key_id')
+
+    message_digest_password = TaskProperty()
+
+    network = TaskProperty('verify_network')
+
+    ospf = TaskProperty()
+
+    passive_interface = TaskProperty('verify_nxos_interface_ospf_passive_interface')
+
+    state = TaskProperty('verify_nxos_interface_ospf_state')
@@ -1,7 +1,7 @@
 # NxosInterfaces() - cisco/nxos/nxos_interfaces.py
-our_version = 125
+our_version = 126
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosInterfaces()
@@ -223,6 +223,9 @@ class NxosInterfaces(Task):
 
         self.interface_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.interface_properties = set()
         self.interface_properties.add('description')
         self.interface_properties.add('duplex')
@@ -268,12 +271,8 @@ class NxosInterfaces(Task):
         self.nxos_interfaces_svi_mtu_min = 68
         self.nxos_interfaces_svi_mtu_max = 9216
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification_mtu(self):
         if self.mtu == None:
@@ -293,11 +292,9 @@ class NxosInterfaces(Task):
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if len(self.interface_list) == 0:
-            self.task_log.error('exiting. call instance.add_interface() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_interface() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -317,25 +314,19 @@ class NxosInterfaces(Task):
 
     def verify_interface_properties(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
         if self.mode == 'layer2' and self.ip_forward == 'enable':
-            self.task_log.error('exiting. mode is layer2 and ip_forward is enabled.  Either set mode to layer3 or set ip_forward to either None or no')
-            exit(1)
+            self.fail_msg('exiting. mode is layer2 and ip_forward is enabled.  Either set mode to layer3 or set ip_forward to either None or no')
         if self.duplex != None and self.speed == None:
-            self.task_log.error('exiting. If duplex is set, speed must also be set.')
-            exit(1)
+            self.fail_msg('exiting. If duplex is set, speed must also be set.')
         if self.fabric_forwarding_anycast_gateway != None and not self.is_vlan_interface(self.name):
-            self.task_log.error('exiting. If fabric_forwarding_anycast_gateway is set, name must be an SVI.')
-            exit(1)
+            self.fail_msg('exiting. If fabric_forwarding_anycast_gateway is set, name must be an SVI.')
         self.final_verification_mtu()
         if self.speed != None and not self.is_ethernet_interface(self.name):
-            self.task_log.error('exiting. If instance.speed is set, instance.name must be an ethernet interface.')
-            exit(1)
+            self.fail_msg('exiting. If instance.speed is set, instance.name must be an ethernet interface.')
 
     def init_interface_properties(self):
-        for p in self.interface_properties:
-            self.properties[p] = None
+        self.reset(self.interface_properties)
     def add_interface(self):
         self.verify_interface_properties()
         d = dict()
@@ -343,8 +334,7 @@ class NxosInterfaces(Task):
             if self.properties[p] != None:
                 d[p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. Set at least instance.name before calling task.add_interface().')
-            exit(1)
+            self.fail_msg('exiting. Set at least instance.name before calling task.add_interface().')
         self.interface_list.append(deepcopy(d))
         self.init_interface_properties()
 
@@ -385,70 +375,17 @@ class NxosInterfaces(Task):
         range_max = self.nxos_interfaces_svi_mtu_max
         self.verify_integer_range(x, range_min, range_max, self.class_name, parameter)
 
-    @property
-    def description(self):
-        return self.properties['description']
-    @description.setter
-    def description(self, x):
-        parameter = 'description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    description = TaskProperty()
 
-    @property
-    def duplex(self):
-        return self.properties['duplex']
-    @duplex.setter
-    def duplex(self, x):
-        parameter = 'duplex'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interfaces_duplex(x, parameter)
-        self.properties[parameter] = x
+    duplex = TaskProperty('verify_nxos_interfaces_duplex')
 
-    @property
-    def enabled(self):
-        return self.properties['enabled']
-    @enabled.setter
-    def enabled(self, x):
-        parameter = 'enabled'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    enabled = TaskProperty('verify_boolean')
 
-    @property
-    def fabric_forwarding_anycast_gateway(self):
-        return self.properties['fabric_forwarding_anycast_gateway']
-    @fabric_forwarding_anycast_gateway.setter
-    def fabric_forwarding_anycast_gateway(self, x):
-        parameter = 'fabric_forwarding_anycast_gateway'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    fabric_forwarding_anycast_gateway = TaskProperty('verify_boolean')
 
-    @property
-    def ip_forward(self):
-        return self.properties['ip_forward']
-    @ip_forward.setter
-    def ip_forward(self, x):
-        parameter = 'ip_forward'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    ip_forward = TaskProperty('verify_boolean')
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interfaces_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_nxos_interfaces_mode')
 
     @property
     def mtu(self):
@@ -463,35 +400,8 @@ class NxosInterfaces(Task):
         self.verify_digits(x, parameter)
         self.properties[parameter] = str(x)
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty('verify_interface')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_interfaces_state')
 
-    @property
-    def speed(self):
-        return self.properties['speed']
-    @speed.setter
-    def speed(self, x):
-        parameter = 'speed'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
+    speed = TaskProperty('verify_digits', to_str=True)
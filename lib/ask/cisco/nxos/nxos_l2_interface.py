@@ -1,7 +1,7 @@
 # NxosL2Interface() - cisco/nxos/nxos_l2_interface.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 Name: ask_task_nxos_l2_interface.py
 
@@ -43,6 +43,9 @@ class NxosL2Interface(Task):
         self.task_log.warning('Use NxosL2Interfaces() (cisco/nxos/nxos_l2_interfaces.py) instead.')
         self.task_log.warning('*******************************************************************************************')
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_l2_interface_valid_state = set()
         self.nxos_l2_interface_valid_state.add('present')
         self.nxos_l2_interface_valid_state.add('absent')
@@ -73,17 +76,12 @@ class NxosL2Interface(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -134,60 +132,15 @@ class NxosL2Interface(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def access_vlan(self):
-        return self.properties['access_vlan']
-    @access_vlan.setter
-    def access_vlan(self, x):
-        parameter = 'access_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interface_access_vlan(x, parameter)
-        self.properties[parameter] = x
+    access_vlan = TaskProperty('verify_nxos_l2_interface_access_vlan')
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interface_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_nxos_l2_interface_mode')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty('verify_interface')
 
-    @property
-    def native_vlan(self):
-        return self.properties['native_vlan']
-    @native_vlan.setter
-    def native_vlan(self, x):
-        parameter = 'native_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interface_native_vlan(x, parameter)
-        self.properties[parameter] = x
+    native_vlan = TaskProperty('verify_nxos_l2_interface_native_vlan')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interface_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_l2_interface_state')
 
     @property
     def trunk_allowed_vlans(self):
@@ -202,13 +155,4 @@ class NxosL2Interface(Task):
         self.verify_vlan_list(str(x), parameter)
         self.properties[parameter] = x
 
-    @property
-    def trunk_vlans(self):
-        return self.properties['trunk_vlans']
-    @trunk_vlans.setter
-    def trunk_vlans(self, x):
-        parameter = 'trunk_vlans'
-        if self.set_none(x, parameter):
-            return
-        self.verify_vlan_list(x, parameter)
-        self.properties[parameter] = x
+    trunk_vlans = TaskProperty('verify_vlan_list')
@@ -1,7 +1,7 @@
 # NxosL2Interfaces() - cisco/nxos/nxos_l2_interfaces.py
-our_version = 111
+our_version = 112
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosL2Interfaces()
@@ -170,6 +170,9 @@ class NxosL2Interfaces(Task):
 
         self.interface_list = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.interface_properties = set()
         self.interface_properties.add('allowed_vlans')
         self.interface_properties.add('mode')
@@ -209,24 +212,17 @@ class NxosL2Interfaces(Task):
         self.nxos_l2_interfaces_vlan_min = 1
         self.nxos_l2_interfaces_vlan_max = 3967
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None and self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
         if len(self.interface_list) == 0 and self.running_config == None:
-            self.task_log.error('exiting. call instance.add_interface() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_interface() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -254,11 +250,9 @@ class NxosL2Interfaces(Task):
 
     def verify_interface_properties(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
     def init_interface_properties(self):
-        for p in self.interface_properties:
-            self.properties[p] = None
+        self.reset(self.interface_properties)
     def add_interface(self):
         self.verify_interface_properties()
         d = dict()
@@ -272,8 +266,7 @@ class NxosL2Interfaces(Task):
         if trunk != False:
             d['trunk'] = trunk
         if len(d) == 0:
-            self.task_log.error('exiting. Set at least instance.name before calling task.add_interface().')
-            exit(1)
+            self.fail_msg('exiting. Set at least instance.name before calling task.add_interface().')
         self.interface_list.append(deepcopy(d))
         self.init_interface_properties()
 
@@ -337,77 +330,16 @@ class NxosL2Interfaces(Task):
         self.verify_vlan_list(x)
         self.properties[parameter] = x
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interfaces_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_nxos_l2_interfaces_mode')
 
-    @property
-    def native_vlan(self):
-        return self.properties['native_vlan']
-    @native_vlan.setter
-    def native_vlan(self, x):
-        parameter = 'native_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interfaces_native_vlan(x, parameter)
-        self.properties[parameter] = x
+    native_vlan = TaskProperty('verify_nxos_l2_interfaces_native_vlan')
 
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    register = TaskProperty()
 
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    running_config = TaskProperty()
 
-    @property
-    def vlan(self):
-        return self.properties['vlan']
-    @vlan.setter
-    def vlan(self, x):
-        parameter = 'vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interfaces_vlan(x, parameter)
-        self.properties[parameter] = x
+    vlan = TaskProperty('verify_nxos_l2_interfaces_vlan')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty('verify_interface')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l2_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_l2_interfaces_state')
@@ -1,7 +1,7 @@
 # NxosL3Interface() - cisco/nxos/nxos_l3_interface.py
 our_version = 109
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 Name: nxos_l3_interface.py
 
@@ -31,6 +31,9 @@ class NxosL3Interface(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_l3_interface_valid_state = set()
         self.nxos_l3_interface_valid_state.add('absent')
         self.nxos_l3_interface_valid_state.add('present')
@@ -46,24 +49,17 @@ class NxosL3Interface(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.ipv4 == None and self.ipv6 == None:
-            self.task_log.error('exiting. at least one of [ipv4, ipv6] must be set.')
-            exit(1)
+            self.fail_msg('exiting. at least one of [ipv4, ipv6] must be set.')
 
     def commit(self):
         self.update()
@@ -91,46 +87,10 @@ class NxosL3Interface(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def ipv4(self):
-        return self.properties['ipv4']
-    @ipv4.setter
-    def ipv4(self, x):
-        parameter = 'ipv4'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_address_with_prefix(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def ipv6(self):
-        return self.properties['ipv6']
-    @ipv6.setter
-    def ipv6(self, x):
-        parameter = 'ipv6'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv6_address_with_prefix(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ip_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l3_interface_state(x, parameter)
-        self.properties[parameter] = x
+    ipv4 = TaskProperty('verify_ipv4_address_with_prefix')
+
+    ipv6 = TaskProperty('verify_ipv6_address_with_prefix')
+
+    name = TaskProperty('verify_ip_interface')
+
+    state = TaskProperty('verify_nxos_l3_interface_state')
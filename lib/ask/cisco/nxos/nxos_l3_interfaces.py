@@ -1,7 +1,7 @@
 # NxosL3Interfaces() - cisco/nxos/nxos_l3_interfaces.py
-our_version = 112
+our_version = 113
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosL3Interfaces()
@@ -294,6 +294,9 @@ class NxosL3Interfaces(Task):
         self.ipv4 = list() # list() of dict()
         self.ipv6 = list() # list() of dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_l3_interfaces_valid_state = set()
         self.nxos_l3_interfaces_valid_state.add('deleted')
         self.nxos_l3_interfaces_valid_state.add('gathered')
@@ -349,22 +352,16 @@ class NxosL3Interfaces(Task):
         self.scriptkit_properties.update(self.ipv4_set)
         self.scriptkit_properties.update(self.ipv6_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification_running_config(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.final_verification_running_config()
         else:
@@ -403,8 +400,7 @@ class NxosL3Interfaces(Task):
 
     def verify_interface_properties(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
         ipv4_without_secondary = 0
         for d in self.ipv4:
             if 'secondary' in d:
@@ -414,12 +410,10 @@ class NxosL3Interfaces(Task):
                 ipv4_without_secondary += 1
         if ipv4_without_secondary > 1:
             self.task_log.error('exiting. {} multiple ipv4_address without ipv4_secondary detected.'.format(self.name))
-            self.task_log.error('We counted {} ipv4_address without secondary.'.format(ipv4_without_secondary))
-            exit(1)
+            self.fail_msg('We counted {} ipv4_address without secondary.'.format(ipv4_without_secondary))
 
     def init_interface_properties(self):
-        for p in self.interface_properties:
-            self.properties[p] = None
+        self.reset(self.interface_properties)
         self.ipv4 = list()
         self.ipv6 = list()
     def add_interface(self):
@@ -439,8 +433,7 @@ class NxosL3Interfaces(Task):
         if self.unreachables != None:
             d['unreachables'] = self.unreachables
         if len(d) == 0:
-            self.task_log.error('exiting. Set at least instance.name before calling task.add_interface().')
-            exit(1)
+            self.fail_msg('exiting. Set at least instance.name before calling task.add_interface().')
         self.interface_list.append(deepcopy(d))
         self.init_interface_properties()
 
@@ -464,21 +457,17 @@ class NxosL3Interfaces(Task):
 
     def verify_ipv4_attributes(self):
         if self.ipv4_address == None:
-            self.task_log.error('exiting. Call intance.ipv4_address before calling instance.add_ipv4')
-            exit(1)
+            self.fail_msg('exiting. Call intance.ipv4_address before calling instance.add_ipv4')
 
     def verify_ipv6_attributes(self):
         if self.ipv6_address == None:
-            self.task_log.error('exiting. Call intance.ipv6_address before calling instance.add_ipv6')
-            exit(1)
+            self.fail_msg('exiting. Call intance.ipv6_address before calling instance.add_ipv6')
 
     def init_ipv4_properties(self):
-        for p in self.ipv4_set:
-            self.properties[p] = None
+        self.reset(self.ipv4_set)
 
     def init_ipv6_properties(self):
-        for p in self.ipv6_set:
-            self.properties[p] = None
+        self.reset(self.ipv6_set)
 
     def add_ipv4(self):
         self.verify_ipv4_attributes()
@@ -512,71 +501,17 @@ class NxosL3Interfaces(Task):
         self.verify_vlan(x, expectation, parameter)
         self.properties[parameter] = x
 
-    @property
-    def evpn_multisite_tracking(self):
-        return self.properties['evpn_multisite_tracking']
-    @evpn_multisite_tracking.setter
-    def evpn_multisite_tracking(self, x):
-        parameter = 'evpn_multisite_tracking'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l3_interfaces_evpn_multisite_tracking(x, parameter)
-        self.properties[parameter] = x
+    evpn_multisite_tracking = TaskProperty('verify_nxos_l3_interfaces_evpn_multisite_tracking')
 
-    @property
-    def ipv4_address(self):
-        return self.properties['ipv4_address']
-    @ipv4_address.setter
-    def ipv4_address(self, x):
-        parameter = 'ipv4_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_address_with_prefix(x, parameter)
-        self.properties[parameter] = x
+    ipv4_address = TaskProperty('verify_ipv4_address_with_prefix')
 
-    @property
-    def ipv4_secondary(self):
-        return self.properties['ipv4_secondary']
-    @ipv4_secondary.setter
-    def ipv4_secondary(self, x):
-        parameter = 'ipv4_secondary'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    ipv4_secondary = TaskProperty('verify_boolean')
 
-    @property
-    def ipv4_tag(self):
-        return self.properties['ipv4_tag']
-    @ipv4_tag.setter
-    def ipv4_tag(self, x):
-        parameter = 'ipv4_tag'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
+    ipv4_tag = TaskProperty('verify_digits')
 
-    @property
-    def ipv6_address(self):
-        return self.properties['ipv6_address']
-    @ipv6_address.setter
-    def ipv6_address(self, x):
-        parameter = 'ipv6_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv6_address_with_prefix(x, parameter)
-        self.properties[parameter] = x
+    ipv6_address = TaskProperty('verify_ipv6_address_with_prefix')
 
-    @property
-    def ipv6_tag(self):
-        return self.properties['ipv6_tag']
-    @ipv6_tag.setter
-    def ipv6_tag(self, x):
-        parameter = 'ipv6_tag'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
+    ipv6_tag = TaskProperty('verify_digits')
 
     @property
     def name(self):
@@ -589,55 +524,12 @@ class NxosL3Interfaces(Task):
         self.verify_ip_interface(x, parameter) # in AnsCommon()
         self.properties[parameter] = x
 
-    @property
-    def redirects(self):
-        return self.properties['redirects']
-    @redirects.setter
-    def redirects(self, x):
-        parameter = 'redirects'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    redirects = TaskProperty('verify_boolean')
 
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    register = TaskProperty()
 
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    running_config = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_l3_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_l3_interfaces_state')
 
-    @property
-    def unreachables(self):
-        return self.properties['unreachables']
-    @unreachables.setter
-    def unreachables(self, x):
-        parameter = 'unreachables'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    unreachables = TaskProperty('verify_boolean')
@@ -1,8 +1,7 @@
 # NxosLacpInterfaces() - cisco/nxos/nxos_lacp_interfaces.py
-our_version = 106
-import re
+our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosLacpInterfaces()
@@ -230,9 +229,11 @@ class NxosLacpInterfaces(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
-        self.re_lacp_interface = re.compile('^port-channel\d+$')
-
         self.config = list()
+
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_lacp_interfaces_valid_state = set()
         self.nxos_lacp_interfaces_valid_state.add('deleted')
         self.nxos_lacp_interfaces_valid_state.add('gathered')
@@ -279,60 +280,44 @@ class NxosLacpInterfaces(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def running_config_verification(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
         if len(self.config) != 0:
             self.task_log.error('exiting. Cannot mix running_config with interface configuration.')
-            self.task_log.error('Instantiate a separate NxosLacpInterfaces() instance and configure it solely for running_config.')
-            exit(1)
+            self.fail_msg('Instantiate a separate NxosLacpInterfaces() instance and configure it solely for running_config.')
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.running_config_verification()
         if self.running_config == None:
             if len(self.config) == 0:
-                self.task_log.error('exiting. call instance.add_interface() at least once before calling self.update()')
-                exit(1)
+                self.fail_msg('exiting. call instance.add_interface() at least once before calling self.update()')
 
     def interface_verification(self):
         if self.running_config != None:
             self.task_log.error('exiting. Cannot mix running_config with interface configuration.')
-            self.task_log.error('Instantiate a separate NxosLacpInterfaces() instance and configure it solely for running_config.')
-            exit(1)
+            self.fail_msg('Instantiate a separate NxosLacpInterfaces() instance and configure it solely for running_config.')
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
         if self.graceful != None and self.is_ethernet_interface(self.name):
-            self.task_log.error('exiting. instance.graceful is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
-            exit(1) 
+            self.fail_msg('exiting. instance.graceful is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
         if self.vpc != None and self.is_ethernet_interface(self.name):
-            self.task_log.error('exiting. instance.vpc is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
-            exit(1)
+            self.fail_msg('exiting. instance.vpc is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
         if self.mode != None and self.is_ethernet_interface(self.name):
-            self.task_log.error('exiting. instance.mode is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
-            exit(1)
+            self.fail_msg('exiting. instance.mode is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
         if self.rate != None and self.is_port_channel_interface(self.name):
-            self.task_log.error('exiting. instance.rate is not applicable when instance.name is port-channel. Got instance.name: {}'.format(self.name))
-            exit(1)
+            self.fail_msg('exiting. instance.rate is not applicable when instance.name is port-channel. Got instance.name: {}'.format(self.name))
         if self.port_priority != None and self.is_port_channel_interface(self.name):
-            self.task_log.error('exiting. instance.port_priority is not applicable when instance.name is port-channel. Got instance.name: {}'.format(self.name))
-            exit(1)
+            self.fail_msg('exiting. instance.port_priority is not applicable when instance.name is port-channel. Got instance.name: {}'.format(self.name))
         if self.suspend_individual != None and self.is_ethernet_interface(self.name):
-            self.task_log.error('exiting. instance.suspend_individual is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
-            exit(1)
+            self.fail_msg('exiting. instance.suspend_individual is not applicable when instance.name is ethernet. Got instance.name: {}'.format(self.name))
 
     def add_interface(self):
         self.interface_verification()
@@ -445,133 +430,27 @@ class NxosLacpInterfaces(Task):
         expectation = ','.join(sorted(verify_set))
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def graceful(self):
-        return self.properties['graceful']
-    @graceful.setter
-    def graceful(self, x):
-        parameter = 'graceful'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def max(self):
-        return self.properties['max']
-    @max.setter
-    def max(self, x):
-        parameter = 'max'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_max_bundle(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def min(self):
-        return self.properties['min']
-    @min.setter
-    def min(self, x):
-        parameter = 'min'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_min_links(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_mode(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_name(x, parameter)
-        self.properties['name'] = x
-
-    @property
-    def port_priority(self):
-        return self.properties['port_priority']
-    @port_priority.setter
-    def port_priority(self, x):
-        parameter = 'port_priority'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_port_priority(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def rate(self):
-        return self.properties['rate']
-    @rate.setter
-    def rate(self, x):
-        parameter = 'rate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_rate(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lacp_interfaces_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def suspend_individual(self):
-        return self.properties['suspend_individual']
-    @suspend_individual.setter
-    def suspend_individual(self, x):
-        parameter = 'suspend_individual'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vpc(self):
-        return self.properties['vpc']
-    @vpc.setter
-    def vpc(self, x):
-        parameter = 'vpc'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful = TaskProperty('verify_boolean')
+
+    max = TaskProperty('verify_nxos_lacp_interfaces_max_bundle')
+
+    min = TaskProperty('verify_nxos_lacp_interfaces_min_links')
+
+    mode = TaskProperty('verify_nxos_lacp_interfaces_mode')
+
+    name = TaskProperty('verify_nxos_lacp_interfaces_name')
+
+    port_priority = TaskProperty('verify_nxos_lacp_interfaces_port_priority')
+
+    rate = TaskProperty('verify_nxos_lacp_interfaces_rate')
+
+    register = TaskProperty()
+
+    running_config = TaskProperty()
+
+    state = TaskProperty('verify_nxos_lacp_interfaces_state')
+
+    suspend_individual = TaskProperty('verify_boolean')
+
+    vpc = TaskProperty('verify_boolean')
 
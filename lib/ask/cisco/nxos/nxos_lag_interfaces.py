@@ -1,8 +1,8 @@
 # NxosLagInterfaces() - cisco/nxos/nxos_lag_interfaces.py
-our_version = 107
+our_version = 108
 
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosLagInterfaces()
@@ -164,6 +164,9 @@ class NxosLagInterfaces(Task):
         self.lag = list()
         self.lag_members = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_lag_interfaces_valid_state = set()
         self.nxos_lag_interfaces_valid_state.add('deleted')
         self.nxos_lag_interfaces_valid_state.add('gathered')
@@ -202,33 +205,25 @@ class NxosLagInterfaces(Task):
         self.scriptkit_properties.update(self.properties_lag)
         self.scriptkit_properties.update(self.properties_member)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def running_config_verification(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
         if len(self.config) != 0:
             self.task_log.error('exiting. Cannot mix running_config with interface configuration.')
-            self.task_log.error('Instantiate a separate NxosLagInterfaces() instance and configure it solely for running_config.')
-            exit(1)
+            self.fail_msg('Instantiate a separate NxosLagInterfaces() instance and configure it solely for running_config.')
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.running_config_verification()
         if self.running_config == None:
             if len(self.config) == 0:
-                self.task_log.error('exiting. call instance.add_lag() at least once before calling self.update()')
-                exit(1)
+                self.fail_msg('exiting. call instance.add_lag() at least once before calling self.update()')
 
     def commit(self):
         self.update()
@@ -257,11 +252,9 @@ class NxosLagInterfaces(Task):
 
     def verify_lag(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling add_lag()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling add_lag()')
     def init_lag(self):
-        for p in self.properties_lag:
-            self.properties[p] = None
+        self.reset(self.properties_lag)
         self.lag_members = list()
     def add_lag(self):
         self.verify_lag()
@@ -274,11 +267,9 @@ class NxosLagInterfaces(Task):
 
     def verify_member(self):
          if self.member == None:
-            self.task_log.error('exiting. set instance.member to a valid ethernet interface name before calling add_member()')
-            exit(1)
+            self.fail_msg('exiting. set instance.member to a valid ethernet interface name before calling add_member()')
     def init_member(self):
-        for p in self.properties_member:
-            self.properties[p] = None
+        self.reset(self.properties_member)
     def add_member(self):
         d = dict()
         d['member'] = self.member
@@ -323,87 +314,18 @@ class NxosLagInterfaces(Task):
         expectation = ','.join(sorted(verify_set))
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def force(self):
-        return self.properties['force']
-    @force.setter
-    def force(self, x):
-        parameter = 'force'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def member(self):
-        return self.properties['member']
-    @member.setter
-    def member(self, x):
-        parameter = 'member'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lag_interfaces_member(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lag_interfaces_mode(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lag_interfaces_name(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lag_interfaces_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def task_name(self):
-        return self.properties['task_name']
-    @task_name.setter
-    def task_name(self, x):
-        parameter = 'task_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    force = TaskProperty('verify_boolean')
+
+    member = TaskProperty('verify_nxos_lag_interfaces_member')
+
+    mode = TaskProperty('verify_nxos_lag_interfaces_mode')
+
+    name = TaskProperty('verify_nxos_lag_interfaces_name')
+
+    register = TaskProperty()
+
+    running_config = TaskProperty()
+
+    state = TaskProperty('verify_nxos_lag_interfaces_state')
+
+    task_name = TaskProperty()
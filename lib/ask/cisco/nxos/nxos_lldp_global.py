@@ -2,7 +2,7 @@
 our_version = 104
 import re
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosLldpGlobal()
@@ -199,6 +199,36 @@ class NxosLldpGlobal(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        # property_map is used to:
+        #    1. Map between disambiguated property names and the ambiguous Ansible
+        #       property names used in the Ansible playbook
+        #    2. Map between property names that we have chosen to make clearer
+        #       and the corresponding properties names used in the Ansible playbook
+        # For example, in the case of #1, the property names for port and system tlv_select
+        # descriptioni are ambiguous (they are both 'description').  We disambiguate these
+        # by providing properties for system_description and port_description.
+        # Later, we use property_map to apply the correct property name/values when populating
+        # the playbook.
+        #     system_description -> description
+        #     port_description   -> description
+        #
+        # In the case of #2, property names of 'v4' and 'v6' would not be descriptive enough
+        # (v4 for what?) so we change these to management_address_v4 and management_address_v6.
+        # It's also feasible that, in the future, we may gain a TLV for some other object that
+        # has values for v4 and v6, hence, a bit of future-proofing.
+        self.property_map = dict()
+        for p in self.properties_tlv_select_management_address:
+            mapped_p = re.sub('management_address_', '', p)
+            self.property_map[p] = mapped_p
+        for p in self.properties_tlv_select_port:
+            mapped_p = re.sub('port_', '', p)
+            self.property_map[p] = mapped_p
+        for p in self.properties_tlv_select_system:
+            self.property_map[p] = re.sub('system_', '', p)
+
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_global = set()
         self.properties_global.add('holdtime')
         self.properties_global.add('port_id')
@@ -238,33 +268,6 @@ class NxosLldpGlobal(Task):
         self.scriptkit_properties.add('running_config')
         self.scriptkit_properties.add('state')
 
-        # property_map is used to:
-        #    1. Map between disambiguated property names and the ambiguous Ansible
-        #       property names used in the Ansible playbook
-        #    2. Map between property names that we have chosen to make clearer
-        #       and the corresponding properties names used in the Ansible playbook
-        # For example, in the case of #1, the property names for port and system tlv_select
-        # descriptioni are ambiguous (they are both 'description').  We disambiguate these
-        # by providing properties for system_description and port_description.
-        # Later, we use property_map to apply the correct property name/values when populating
-        # the playbook.
-        #     system_description -> description
-        #     port_description   -> description
-        #
-        # In the case of #2, property names of 'v4' and 'v6' would not be descriptive enough
-        # (v4 for what?) so we change these to management_address_v4 and management_address_v6.
-        # It's also feasible that, in the future, we may gain a TLV for some other object that
-        # has values for v4 and v6, hence, a bit of future-proofing.
-        self.property_map = dict()
-        for p in self.properties_tlv_select_management_address:
-            mapped_p = re.sub('management_address_', '', p)
-            self.property_map[p] = mapped_p
-        for p in self.properties_tlv_select_port:
-            mapped_p = re.sub('port_', '', p)
-            self.property_map[p] = mapped_p
-        for p in self.properties_tlv_select_system:
-            self.property_map[p] = re.sub('system_', '', p)
-
         self.nxos_lldp_global_valid_state = set()
         self.nxos_lldp_global_valid_state.add('merged')
         self.nxos_lldp_global_valid_state.add('replaced')
@@ -286,8 +289,6 @@ class NxosLldpGlobal(Task):
         self.lldp_timer_min = 1
         self.lldp_timer_max = 254
 
-        self.init_properties()
-
     def get_mapped_property(self, x):
         '''
         return either a mapped property, if one exists, or x
@@ -316,7 +317,7 @@ class NxosLldpGlobal(Task):
         self.init_properties_tlv_select_system()
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         for p in self.properties_global:
             self.properties[p] = None
         self.init_properties_tlv_select()
@@ -326,18 +327,15 @@ class NxosLldpGlobal(Task):
 
     def running_config_verification(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
         for p in self.properties_set:
             if self.properties[p] != None:
                 self.task_log.error('exiting. Cannot mix running_config with lldp global configuration.')
-                self.task_log.error('Instantiate a separate NxosLldpGlobal() instance and configure it solely for running_config.')
-                exit(1)
+                self.fail_msg('Instantiate a separate NxosLldpGlobal() instance and configure it solely for running_config.')
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.running_config_verification()
 
@@ -422,177 +420,35 @@ class NxosLldpGlobal(Task):
     def verify_nxos_lldp_global_timer(self, x, source_method='verify_nxos_lldp_global_timer'):
         self.verify_integer_range(x, self.lldp_timer_min, self.lldp_timer_max, self.class_name, source_method)
 
-    @property
-    def dcbxp(self):
-        return self.properties['dcbxp']
-    @dcbxp.setter
-    def dcbxp(self, x):
-        parameter = 'dcbxp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def holdtime(self):
-        return self.properties['holdtime']
-    @holdtime.setter
-    def holdtime(self, x):
-        parameter = 'holdtime'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_global_holdtime(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def management_address_v4(self):
-        return self.properties['management_address_v4']
-    @management_address_v4.setter
-    def management_address_v4(self, x):
-        parameter = 'management_address_v4'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def management_address_v6(self):
-        return self.properties['management_address_v6']
-    @management_address_v6.setter
-    def management_address_v6(self, x):
-        parameter = 'management_address_v6'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def port_description(self):
-        return self.properties['port_description']
-    @port_description.setter
-    def port_description(self, x):
-        parameter = 'port_description'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def port_id(self):
-        return self.properties['port_id']
-    @port_id.setter
-    def port_id(self, x):
-        parameter = 'port_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_global_port_id(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def port_vlan(self):
-        return self.properties['port_vlan']
-    @port_vlan.setter
-    def port_vlan(self, x):
-        parameter = 'port_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def power_management(self):
-        return self.properties['power_management']
-    @power_management.setter
-    def power_management(self, x):
-        parameter = 'power_management'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def reinit(self):
-        return self.properties['reinit']
-    @reinit.setter
-    def reinit(self, x):
-        parameter = 'reinit'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_global_reinit(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def system_capabilities(self):
-        return self.properties['system_capabilities']
-    @system_capabilities.setter
-    def system_capabilities(self, x):
-        parameter = 'system_capabilities'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_description(self):
-        return self.properties['system_description']
-    @system_description.setter
-    def system_description(self, x):
-        parameter = 'system_description'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_name(self):
-        return self.properties['system_name']
-    @system_name.setter
-    def system_name(self, x):
-        parameter = 'system_name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_global_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def timer(self):
-        return self.properties['timer']
-    @timer.setter
-    def timer(self, x):
-        parameter = 'timer'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_global_timer(x, parameter)
-        self.properties[parameter] = x
+    dcbxp = TaskProperty('verify_boolean')
+
+    holdtime = TaskProperty('verify_nxos_lldp_global_holdtime')
+
+    management_address_v4 = TaskProperty('verify_boolean')
+
+    management_address_v6 = TaskProperty('verify_boolean')
+
+    port_description = TaskProperty('verify_boolean')
+
+    port_id = TaskProperty('verify_nxos_lldp_global_port_id')
+
+    port_vlan = TaskProperty('verify_boolean')
+
+    power_management = TaskProperty('verify_boolean')
+
+    register = TaskProperty()
+
+    reinit = TaskProperty('verify_nxos_lldp_global_reinit')
+
+    running_config = TaskProperty()
+
+    system_capabilities = TaskProperty('verify_boolean')
+
+    system_description = TaskProperty('verify_boolean')
+
+    system_name = TaskProperty('verify_boolean')
+
+    state = TaskProperty('verify_nxos_lldp_global_state')
+
+    timer = TaskProperty('verify_nxos_lldp_global_timer')
 
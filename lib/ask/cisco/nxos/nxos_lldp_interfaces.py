@@ -1,8 +1,8 @@
 # NxosLldpInterfaces() - cisco/nxos/nxos_lldp_interfaces.py
-our_version = 106
+our_version = 107
 
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosLldpInterfaces()
@@ -147,6 +147,9 @@ class NxosLldpInterfaces(Task):
         self.class_name = __class__.__name__
         self.config = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_lldp_interfaces_valid_state = set()
         self.nxos_lldp_interfaces_valid_state.add('deleted')
         self.nxos_lldp_interfaces_valid_state.add('gathered')
@@ -183,22 +186,16 @@ class NxosLldpInterfaces(Task):
         self.scriptkit_properties.update(self.config_properties_set)
         self.scriptkit_properties.add('state')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def init_config_properties(self):
-        for p in self.config_properties_set:
-            self.properties[p] = None
+        self.reset(self.config_properties_set)
 
     def interface_verification(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_iterface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_iterface()')
 
     def add_interface(self):
         self.interface_verification()
@@ -220,18 +217,15 @@ class NxosLldpInterfaces(Task):
 
     def final_verification_running_config(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.final_verification_running_config()
         else:
             if len(self.config) == 0 and self.state != 'deleted':
-                self.task_log.error('exiting. call intance.add_interface() at least once before calling instance.commit().')
-                exit(1)
+                self.fail_msg('exiting. call intance.add_interface() at least once before calling instance.commit().')
 
     def commit(self):
         self.update()
@@ -298,98 +292,20 @@ class NxosLldpInterfaces(Task):
         source_method = 'verify_nxos_lldp_interfaces_tlv_set_vlan'
         self.verify_integer_range(x, self.min_vlan, self.max_vlan, source_class, source_method)
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def receive(self):
-        return self.properties['receive']
-    @receive.setter
-    def receive(self, x):
-        parameter = 'receive'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_interfaces_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def task_name(self):
-        return self.properties['task_name']
-    @task_name.setter
-    def task_name(self, x):
-        parameter = 'task_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def tlv_set_management_address(self):
-        return self.properties['tlv_set_management_address']
-    @tlv_set_management_address.setter
-    def tlv_set_management_address(self, x):
-        parameter = 'tlv_set_management_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_interfaces_tlv_set_management_address(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def tlv_set_vlan(self):
-        return self.properties['tlv_set_vlan']
-    @tlv_set_vlan.setter
-    def tlv_set_vlan(self, x):
-        parameter = 'tlv_set_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_lldp_interfaces_tlv_set_vlan(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def transmit(self):
-        return self.properties['transmit']
-    @transmit.setter
-    def transmit(self, x):
-        parameter = 'transmit'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty('verify_interface')
+
+    receive = TaskProperty('verify_boolean')
+
+    register = TaskProperty()
+
+    running_config = TaskProperty()
+
+    state = TaskProperty('verify_nxos_lldp_interfaces_state')
+
+    task_name = TaskProperty()
+
+    tlv_set_management_address = TaskProperty('verify_nxos_lldp_interfaces_tlv_set_management_address')
+
+    tlv_set_vlan = TaskProperty('verify_nxos_lldp_interfaces_tlv_set_vlan')
+
+    transmit = TaskProperty('verify_boolean')
@@ -1,7 +1,7 @@
 # NxosLogging() - cisco/nxos/nxos_logging.py
 our_version = 102
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosLogging()
@@ -197,6 +197,9 @@ class NxosLogging(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('dest')
         self.properties_set.add('dest_level')
@@ -259,39 +262,27 @@ class NxosLogging(Task):
         self.nxos_logging_facility_level_min = 0
         self.nxos_logging_facility_level_max = 7
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name']    = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.dest == 'server' and self.remote_server == None:
-            self.task_log.error('exiting. instance.dest == server, but instance.remote_server is not set')
-            exit(1)
+            self.fail_msg('exiting. instance.dest == server, but instance.remote_server is not set')
         if self.dest != 'server' and self.remote_server != None:
-            self.task_log.error('exiting. instance.dest != server, but instance.remote_server is set')
-            exit(1)
+            self.fail_msg('exiting. instance.dest != server, but instance.remote_server is set')
         if self.dest == 'logfile' and self.name == None:
-            self.task_log.error('exiting. instance.dest == logfile, but instance.name is not set')
-            exit(1)
+            self.fail_msg('exiting. instance.dest == logfile, but instance.name is not set')
         if self.dest != 'logfile' and self.name != None:
-            self.task_log.error('exiting. instance.dest != logfile, but instance.name is set')
-            exit(1)
+            self.fail_msg('exiting. instance.dest != logfile, but instance.name is set')
         if self.file_size != None and self.name == None:
-            self.task_log.error('exiting. instance.file_size is set, but instance.name is not set')
-            exit(1)
+            self.fail_msg('exiting. instance.file_size is set, but instance.name is not set')
         if self.facility != None and self.facility_level == None and self.facility_link_status == None and self.remote_server == None:
-            self.task_log.error('exiting. instance.facility is set, but one of instance.facility_level or instance.facility_link_status or instance.remote_server is not set')
-            exit(1)
+            self.fail_msg('exiting. instance.facility is set, but one of instance.facility_level or instance.facility_link_status or instance.remote_server is not set')
         if self.facility_level != None and (self.facility == None and self.facility_link_status == None and self.remote_server == None):
-            self.task_log.error('exiting. instance.facility_level is set, but one of instance.facility or instance.facility_link_status or instance.remote_server is not set')
-            exit(1)
+            self.fail_msg('exiting. instance.facility_level is set, but one of instance.facility or instance.facility_link_status or instance.remote_server is not set')
 
     def commit(self):
         self.update()
@@ -401,16 +392,7 @@ class NxosLogging(Task):
         source_method='verify_nxos_logging_facility_level'
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def dest(self):
-        return self.properties['dest']
-    @dest.setter
-    def dest(self, x):
-        parameter = 'dest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_dest(x, parameter)
-        self.properties[parameter] = x
+    dest = TaskProperty('verify_nxos_logging_dest')
 
     @property
     def dest_level(self):
@@ -423,26 +405,9 @@ class NxosLogging(Task):
         self.verify_nxos_logging_level(x)
         self.properties[parameter] = x
 
-    @property
-    def event(self):
-        return self.properties['event']
-    @event.setter
-    def event(self, x):
-        parameter = 'event'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_event(x, parameter)
-        self.properties[parameter] = x
+    event = TaskProperty('verify_nxos_logging_event')
 
-    @property
-    def facility(self):
-        return self.properties['facility']
-    @facility.setter
-    def facility(self, x):
-        parameter = 'facility'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    facility = TaskProperty()
 
     @property
     def facility_level(self):
@@ -455,16 +420,7 @@ class NxosLogging(Task):
         self.verify_nxos_logging_facility_level(x)
         self.properties[parameter] = x
 
-    @property
-    def facility_link_status(self):
-        return self.properties['facility_link_status']
-    @facility_link_status.setter
-    def facility_link_status(self, x):
-        parameter = 'facility_link_status'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_facility_link_status(x, parameter)
-        self.properties[parameter] = x
+    facility_link_status = TaskProperty('verify_nxos_logging_facility_link_status')
 
     @property
     def file_size(self):
@@ -477,88 +433,19 @@ class NxosLogging(Task):
         self.verify_nxos_logging_file_size(x)
         self.properties[parameter] = x
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_interface(x, parameter)
-        self.properties[parameter] = x
+    interface = TaskProperty('verify_nxos_logging_interface')
 
-    @property
-    def interface_message(self):
-        return self.properties['interface_message']
-    @interface_message.setter
-    def interface_message(self, x):
-        parameter = 'interface_message'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_interface_message(x, parameter)
-        self.properties[parameter] = x
+    interface_message = TaskProperty('verify_nxos_logging_interface_message')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    name = TaskProperty()
 
-    @property
-    def purge(self):
-        return self.properties['purge']
-    @purge.setter
-    def purge(self, x):
-        parameter = 'purge'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    purge = TaskProperty('verify_boolean')
 
-    @property
-    def remote_server(self):
-        return self.properties['remote_server']
-    @remote_server.setter
-    def remote_server(self, x):
-        parameter = 'remote_server'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    remote_server = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_logging_state')
 
-    @property
-    def timestamp(self):
-        return self.properties['timestamp']
-    @timestamp.setter
-    def timestamp(self, x):
-        parameter = 'timestamp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_logging_timestamp(x, parameter)
-        self.properties[parameter] = x
+    timestamp = TaskProperty('verify_nxos_logging_timestamp')
 
-    @property
-    def use_vrf(self):
-        return self.properties['use_vrf']
-    @use_vrf.setter
-    def use_vrf(self, x):
-        parameter = 'use_vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    use_vrf = TaskProperty()
 
@@ -1,7 +1,7 @@
 # NxosNtp() - cisco/nxos/nxos_ntp.py
 our_version = 111
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosNtp()
@@ -153,6 +153,9 @@ class NxosNtp(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_ntp_valid_state = set()
         self.nxos_ntp_valid_state.add('absent')
         self.nxos_ntp_valid_state.add('present')
@@ -172,12 +175,8 @@ class NxosNtp(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
@@ -210,82 +209,19 @@ class NxosNtp(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def key_id(self):
-        return self.properties['key_id']
-    @key_id.setter
-    def key_id(self, x):
-        parameter = 'key_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits_or_default(x, parameter)
-        self.properties[parameter] = x
+    key_id = TaskProperty('verify_digits_or_default')
 
-    @property
-    def peer(self):
-        return self.properties['peer']
-    @peer.setter
-    def peer(self, x):
-        parameter = 'peer'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_ipv6_or_default(x, parameter)
-        self.properties[parameter] = x
+    peer = TaskProperty('verify_ipv4_ipv6_or_default')
 
-    @property
-    def prefer(self):
-        return self.properties['prefer']
-    @prefer.setter
-    def prefer(self, x):
-        parameter = 'prefer'
-        if self.set_none(x, parameter):
-            return
-        self.verify_enabled_disabled(x, parameter)
-        self.properties[parameter] = x
+    prefer = TaskProperty('verify_enabled_disabled')
 
-    @property
-    def server(self):
-        return self.properties['server']
-    @server.setter
-    def server(self, x):
-        parameter = 'server'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_ipv6_or_default(x, parameter)
-        self.properties[parameter] = x
+    server = TaskProperty('verify_ipv4_ipv6_or_default')
 
-    @property
-    def source_addr(self):
-        return self.properties['source_addr']
-    @source_addr.setter
-    def source_addr(self, x):
-        parameter = 'source_addr'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_ipv6(x, parameter)
-        self.properties[parameter] = x
+    source_addr = TaskProperty('verify_ipv4_ipv6')
 
-    @property
-    def source_int(self):
-        return self.properties['source_int']
-    @source_int.setter
-    def source_int(self, x):
-        parameter = 'source_int'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interface_or_default(x, parameter)
-        self.properties[parameter] = x
+    source_int = TaskProperty('verify_interface_or_default')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ntp_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_ntp_state')
 
     @property
     def vrf_name(self):
@@ -1,7 +1,7 @@
 # NxosNtpAuth() - cisco/nxos/nxos_ntp_auth.py
 our_version = 102
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosNtpAuth()
@@ -110,6 +110,9 @@ class NxosNtpAuth(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('auth_type')
         self.properties_set.add('authentication')
@@ -135,18 +138,13 @@ class NxosNtpAuth(Task):
         self.nxos_ntp_auth_valid_state.add('absent')
         self.nxos_ntp_auth_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name']    = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -193,67 +191,14 @@ class NxosNtpAuth(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def auth_type(self):
-        return self.properties['auth_type']
-    @auth_type.setter
-    def auth_type(self, x):
-        parameter = 'auth_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ntp_auth_auth_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def authentication(self):
-        return self.properties['authentication']
-    @authentication.setter
-    def authentication(self, x):
-        parameter = 'authentication'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ntp_auth_authentication(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def key_id(self):
-        return self.properties['key_id']
-    @key_id.setter
-    def key_id(self, x):
-        parameter = 'key_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def md5string(self):
-        return self.properties['md5string']
-    @md5string.setter
-    def md5string(self, x):
-        parameter = 'md5string'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ntp_auth_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def trusted_key(self):
-        return self.properties['trusted_key']
-    @trusted_key.setter
-    def trusted_key(self, x):
-        parameter = 'trusted_key'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    auth_type = TaskProperty('verify_nxos_ntp_auth_auth_type')
+
+    authentication = TaskProperty('verify_nxos_ntp_auth_authentication')
+
+    key_id = TaskProperty('verify_digits')
+
+    md5string = TaskProperty()
+
+    state = TaskProperty('verify_nxos_ntp_auth_state')
+
+    trusted_key = TaskProperty('verify_boolean')
@@ -1,7 +1,7 @@
 # NxosNtpOptions() - cisco/nxos/nxos_ntp_options.py
 our_version = 102
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosNtpOptions()
@@ -96,6 +96,9 @@ class NxosNtpOptions(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('logging')
         self.properties_set.add('master')
@@ -114,21 +117,15 @@ class NxosNtpOptions(Task):
         self.nxos_ntp_options_stratum_min = 1
         self.nxos_ntp_options_stratum_max = 15
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name']    = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.stratum != None and self.master != True:
-            self.task_log.error('exiting. If instance.stratum is set, instance.master must be set to True')
-            exit(1)
+            self.fail_msg('exiting. If instance.stratum is set, instance.master must be set to True')
 
     def commit(self):
         self.update()
@@ -163,38 +160,11 @@ class NxosNtpOptions(Task):
         range_max = self.nxos_ntp_options_stratum_max
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def logging(self):
-        return self.properties['logging']
-    @logging.setter
-    def logging(self, x):
-        parameter = 'logging'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    logging = TaskProperty('verify_boolean')
 
-    @property
-    def master(self):
-        return self.properties['master']
-    @master.setter
-    def master(self, x):
-        parameter = 'master'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    master = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ntp_options_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_ntp_options_state')
 
     @property
     def stratum(self):
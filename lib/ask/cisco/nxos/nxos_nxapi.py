@@ -1,7 +1,7 @@
 # NxosNxapi() - cisco/nxos/nxos_nxapi.py
 our_version = 103
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************
 NxosNxapi() - cisco.nxos.nxos_nxapi
@@ -121,6 +121,9 @@ class NxosNxapi(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('http')
         self.properties_set.add('http_port')
@@ -148,18 +151,13 @@ class NxosNxapi(Task):
         self.https_port_min = 1
         self.https_port_max = 65535
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -197,16 +195,7 @@ class NxosNxapi(Task):
         source_method = 'verify_nxos_nxapi_https_port'
         self.verify_integer_range(x, self.https_port_min, self.https_port_max, self.class_name, source_method)
 
-    @property
-    def http(self):
-        return self.properties['http']
-    @http.setter
-    def http(self, x):
-        parameter = 'http'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    http = TaskProperty('verify_boolean')
 
     @property
     def http_port(self):
@@ -219,16 +208,7 @@ class NxosNxapi(Task):
         self.verify_nxos_nxapi_http_port(x)
         self.properties[parameter] = x
 
-    @property
-    def https(self):
-        return self.properties['https']
-    @https.setter
-    def https(self, x):
-        parameter = 'https'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    https = TaskProperty('verify_boolean')
 
     @property
     def https_port(self):
@@ -241,69 +221,15 @@ class NxosNxapi(Task):
         self.verify_nxos_nxapi_https_port(x)
         self.properties[parameter] = x
 
-    @property
-    def sandbox(self):
-        return self.properties['sandbox']
-    @sandbox.setter
-    def sandbox(self, x):
-        parameter = 'sandbox'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    sandbox = TaskProperty('verify_boolean')
 
-    @property
-    def ssl_strong_ciphers(self):
-        return self.properties['ssl_strong_ciphers']
-    @ssl_strong_ciphers.setter
-    def ssl_strong_ciphers(self, x):
-        parameter = 'ssl_strong_ciphers'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    ssl_strong_ciphers = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_nxapi_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_nxapi_state')
 
-    @property
-    def tlsv1_0(self):
-        return self.properties['tlsv1_0']
-    @tlsv1_0.setter
-    def tlsv1_0(self, x):
-        parameter = 'tlsv1_0'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tlsv1_0 = TaskProperty('verify_boolean')
 
-    @property
-    def tlsv1_1(self):
-        return self.properties['tlsv1_1']
-    @tlsv1_1.setter
-    def tlsv1_1(self, x):
-        parameter = 'tlsv1_1'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tlsv1_1 = TaskProperty('verify_boolean')
 
-    @property
-    def tlsv1_2(self):
-        return self.properties['tlsv1_2']
-    @tlsv1_2.setter
-    def tlsv1_2(self, x):
-        parameter = 'tlsv1_2'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    tlsv1_2 = TaskProperty('verify_boolean')
 
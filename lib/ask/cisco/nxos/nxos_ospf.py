@@ -1,7 +1,7 @@
 # NxosOspf() - cisco/nxos/nxos_ospf.py
 our_version = 112
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 Name: nxos_ospf.py
 
@@ -29,6 +29,9 @@ class NxosOspf(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('ospf')
         self.properties_set.add('state')
@@ -42,21 +45,15 @@ class NxosOspf(Task):
         self.nxos_ospf_valid_state.add('absent')
         self.nxos_ospf_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.ospf == None:
-            self.task_log.error('exiting. call instance.ospf before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.ospf before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -83,23 +80,6 @@ class NxosOspf(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def ospf(self):
-        return self.properties['ospf']
-    @ospf.setter
-    def ospf(self, x):
-        parameter = 'ospf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    ospf = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_ospf_state')
@@ -1,7 +1,7 @@
 # NxosOspfInterfaces() - cisco/nxos/nxos_ospf_interfaces.py
 our_version = 110
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************
 NxosOspfInterfaces()
@@ -538,6 +538,9 @@ class NxosOspfInterfaces(Task):
         self.ansible_task[self.ansible_module]['state'] = None
         self.ansible_task[self.ansible_module]['config'] = list()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_authentication = set()
         self.properties_authentication.add('authentication_enable')
         self.properties_authentication.add('authentication_key_chain')
@@ -656,8 +659,6 @@ class NxosOspfInterfaces(Task):
         self.nxos_ospf_interfaces_process_id_min = 1
         self.nxos_ospf_interfaces_process_id_max = 65535
 
-        self.init_properties()
-
     def init_properties_authentication(self):
         for p in self.properties_authentication:
             self.properties[p] = None
@@ -683,7 +684,7 @@ class NxosOspfInterfaces(Task):
             self.properties[p] = None
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.address_family = list()
         self.init_properties_address_family()
         self.init_properties_process()
@@ -692,21 +693,17 @@ class NxosOspfInterfaces(Task):
 
     def verify_area(self):
         if self.process_area_id == None:
-            self.task_log.error('exiting. instance.process_area_id must be set prior to adding area info to an ospf process')
-            exit(1)
+            self.fail_msg('exiting. instance.process_area_id must be set prior to adding area info to an ospf process')
 
     def verify_address_family(self):
         if self.afi == None:
-            self.task_log.error('exiting. instance.afi must be set prior to calling instance.add_address_family()')
-            exit(1)
+            self.fail_msg('exiting. instance.afi must be set prior to calling instance.add_address_family()')
         if self.passive_interface != None and self.default_passive_interface != None:
-            self.task_log.error('exiting. instance.passive_interface is mutually-exclusive with instance.default_passive_interface.  Unset one or the other.')
-            exit(1)
+            self.fail_msg('exiting. instance.passive_interface is mutually-exclusive with instance.default_passive_interface.  Unset one or the other.')
 
     def verify_process(self):
         if self.process_id == None:
-            self.task_log.error('exiting. instance.process_id must be set prior to calling instance.add_process()')
-            exit(1)
+            self.fail_msg('exiting. instance.process_id must be set prior to calling instance.add_process()')
     def add_process(self):
         self.verify_process()
         process = dict()
@@ -778,8 +775,7 @@ class NxosOspfInterfaces(Task):
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -800,8 +796,7 @@ class NxosOspfInterfaces(Task):
             self.properties[p] = None
     def verify_interface_properties(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.add_interface()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.add_interface()')
     def add_interface(self):
         self.verify_interface_properties()
         d = dict()
@@ -810,8 +805,7 @@ class NxosOspfInterfaces(Task):
             if self.properties[p] != None:
                 d[p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. Set at least one interface property before calling instance.interface()')
-            exit(1)
+            self.fail_msg('exiting. Set at least one interface property before calling instance.interface()')
         self.interface_list.append(deepcopy(d))
         self.address_family = list()
         self.init_properties_address_family()
@@ -962,155 +956,33 @@ class NxosOspfInterfaces(Task):
         range_max = self.nxos_ospf_interfaces_transmit_delay_max
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_ospf_interfaces_afi')
 
-    @property
-    def authentication_enable(self):
-        return self.properties['authentication_enable']
-    @authentication_enable.setter
-    def authentication_enable(self, x):
-        parameter = 'authentication_enable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    authentication_enable = TaskProperty('verify_boolean')
 
-    @property
-    def authentication_key_chain(self):
-        return self.properties['authentication_key_chain']
-    @authentication_key_chain.setter
-    def authentication_key_chain(self, x):
-        parameter = 'authentication_key_chain'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    authentication_key_chain = TaskProperty()
 
-    @property
-    def authentication_message_digest(self):
-        return self.properties['authentication_message_digest']
-    @authentication_message_digest.setter
-    def authentication_message_digest(self, x):
-        parameter = 'authentication_message_digest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    authentication_message_digest = TaskProperty('verify_boolean')
 
-    @property
-    def authentication_null_auth(self):
-        return self.properties['authentication_null_auth']
-    @authentication_null_auth.setter
-    def authentication_null_auth(self, x):
-        parameter = 'authentication_null_auth'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    authentication_null_auth = TaskProperty('verify_boolean')
 
-    @property
-    def authentication_key_encryption(self):
-        return self.properties['authentication_key_encryption']
-    @authentication_key_encryption.setter
-    def authentication_key_encryption(self, x):
-        parameter = 'authentication_key_encryption'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_authentication_key_encryption(x, parameter)
-        self.properties[parameter] = x
+    authentication_key_encryption = TaskProperty('verify_nxos_ospf_interfaces_authentication_key_encryption')
 
-    @property
-    def authentication_key(self):
-        return self.properties['authentication_key']
-    @authentication_key.setter
-    def authentication_key(self, x):
-        parameter = 'authentication_key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    authentication_key = TaskProperty()
 
-    @property
-    def cost(self):
-        return self.properties['cost']
-    @cost.setter
-    def cost(self, x):
-        parameter = 'cost'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_cost(x, parameter)
-        self.properties[parameter] = x
+    cost = TaskProperty('verify_nxos_ospf_interfaces_cost')
 
-    @property
-    def dead_interval(self):
-        return self.properties['dead_interval']
-    @dead_interval.setter
-    def dead_interval(self, x):
-        parameter = 'dead_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_dead_interval(x, parameter)
-        self.properties[parameter] = x
+    dead_interval = TaskProperty('verify_nxos_ospf_interfaces_dead_interval')
 
-    @property
-    def default_passive_interface(self):
-        return self.properties['default_passive_interface']
-    @default_passive_interface.setter
-    def default_passive_interface(self, x):
-        parameter = 'default_passive_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    default_passive_interface = TaskProperty('verify_boolean')
 
-    @property
-    def hello_interval(self):
-        return self.properties['hello_interval']
-    @hello_interval.setter
-    def hello_interval(self, x):
-        parameter = 'hello_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_hello_interval(x, parameter)
-        self.properties[parameter] = x
+    hello_interval = TaskProperty('verify_nxos_ospf_interfaces_hello_interval')
 
-    @property
-    def instance(self):
-        return self.properties['instance']
-    @instance.setter
-    def instance(self, x):
-        parameter = 'instance'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    instance = TaskProperty()
 
-    @property
-    def message_digest_key_encryption(self):
-        return self.properties['message_digest_key_encryption']
-    @message_digest_key_encryption.setter
-    def message_digest_key_encryption(self, x):
-        parameter = 'message_digest_key_encryption'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_message_digest_key_encryption(x, parameter)
-        self.properties[parameter] = x
+    message_digest_key_encryption = TaskProperty('verify_nxos_ospf_interfaces_message_digest_key_encryption')
 
-    @property
-    def message_digest_key(self):
-        return self.properties['message_digest_key']
-    @message_digest_key.setter
-    def message_digest_key(self, x):
-        parameter = 'message_digest_key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    message_digest_key = TaskProperty()
 
     @property
     def message_digest_key_id(self):
@@ -1123,27 +995,9 @@ class NxosOspfInterfaces(Task):
         self.verify_nxos_ospf_interfaces_message_digest_key_id(x, parameter)
         self.properties[parameter] = int(x)
 
-    @property
-    def mtu_ignore(self):
-        return self.properties['mtu_ignore']
-    @mtu_ignore.setter
-    def mtu_ignore(self, x):
-        parameter = 'mtu_ignore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    mtu_ignore = TaskProperty('verify_boolean')
 
-    @property
-    def multi_areas(self):
-        return self.properties['multi_areas']
-    @multi_areas.setter
-    def multi_areas(self, x):
-        parameter = 'multi_areas'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_multi_areas(x, parameter)
-        self.properties[parameter] = x
+    multi_areas = TaskProperty('verify_nxos_ospf_interfaces_multi_areas')
 
     @property
     def name(self):
@@ -1156,93 +1010,21 @@ class NxosOspfInterfaces(Task):
         self.verify_interface(x, parameter) # inherited from AnsCommon()
         self.properties[parameter] = x
 
-    @property
-    def network(self):
-        return self.properties['network']
-    @network.setter
-    def network(self, x):
-        parameter = 'network'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_network(x, parameter)
-        self.properties[parameter] = x
+    network = TaskProperty('verify_nxos_ospf_interfaces_network')
 
-    @property
-    def passive_interface(self):
-        return self.properties['passive_interface']
-    @passive_interface.setter
-    def passive_interface(self, x):
-        parameter = 'passive_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    passive_interface = TaskProperty('verify_boolean')
 
-    @property
-    def priority(self):
-        return self.properties['priority']
-    @priority.setter
-    def priority(self, x):
-        parameter = 'priority'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_priority(x, parameter)
-        self.properties[parameter] = x
+    priority = TaskProperty('verify_nxos_ospf_interfaces_priority')
 
-    @property
-    def process_area_id(self):
-        return self.properties['process_area_id']
-    @process_area_id.setter
-    def process_area_id(self, x):
-        parameter = 'process_area_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_process_area_id(x, parameter)
-        self.properties[parameter] = x
+    process_area_id = TaskProperty('verify_nxos_ospf_interfaces_process_area_id')
 
-    @property
-    def process_area_secondaries(self):
-        return self.properties['process_area_secondaries']
-    @process_area_secondaries.setter
-    def process_area_secondaries(self, x):
-        parameter = 'process_area_secondaries'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    process_area_secondaries = TaskProperty('verify_boolean')
 
-    @property
-    def process_multi_areas(self):
-        return self.properties['process_multi_areas']
-    @process_multi_areas.setter
-    def process_multi_areas(self, x):
-        parameter = 'process_multi_areas'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_process_multi_areas(x, parameter)
-        self.properties[parameter] = x
+    process_multi_areas = TaskProperty('verify_nxos_ospf_interfaces_process_multi_areas')
 
-    @property
-    def process_id(self):
-        return self.properties['process_id']
-    @process_id.setter
-    def process_id(self, x):
-        parameter = 'process_id'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_process_id(x, parameter)
-        self.properties[parameter] = str(x)
+    process_id = TaskProperty('verify_nxos_ospf_interfaces_process_id', to_str=True)
 
-    @property
-    def retransmit_interval(self):
-        return self.properties['retransmit_interval']
-    @retransmit_interval.setter
-    def retransmit_interval(self, x):
-        parameter = 'retransmit_interval'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_retransmit_interval(x, parameter)
-        self.properties[parameter] = x
+    retransmit_interval = TaskProperty('verify_nxos_ospf_interfaces_retransmit_interval')
 
     @property
     def shutdown(self):
@@ -1256,24 +1038,6 @@ class NxosOspfInterfaces(Task):
         self.verify_boolean(x, parameter)
         self.properties[parameter] = x
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_ospf_interfaces_state')
 
-    @property
-    def transmit_delay(self):
-        return self.properties['transmit_delay']
-    @transmit_delay.setter
-    def transmit_delay(self, x):
-        parameter = 'transmit_delay'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_ospf_interfaces_transmit_delay(x, parameter)
-        self.properties[parameter] = x
+    transmit_delay = TaskProperty('verify_nxos_ospf_interfaces_transmit_delay')
@@ -1,7 +1,7 @@
 # NxosOspfV2() - cisco/nxos/nxos_ospfv2.py
-our_version = 109
+our_version = 110
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************
 NxosOspfV2 - nxos_ospfv2.py
@@ -669,6 +669,9 @@ class NxosOspfV2(Task):
         self.config = dict()
         self.config['processes'] = list() # list of self.processes_dict
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_areas_authentication_set = set()
         self.properties_areas_authentication_set.add('authentication_message_digest')
         self.properties_areas_authentication_set.add('authentication_set')
@@ -936,7 +939,7 @@ class NxosOspfV2(Task):
         self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces = set()
         self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces.add('ethernet')
         self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces.add('loopback')
-        self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces.add('port-channel')
+        self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces.add('port_channel')
 
         self.nxos_ospfv2_valid_redistribute_protocol = set()
         self.nxos_ospfv2_valid_redistribute_protocol.add('bgp')
@@ -957,22 +960,17 @@ class NxosOspfV2(Task):
         self.nxos_ospfv2_valid_state.add('parsed')
         self.nxos_ospfv2_valid_state.add('rendered')
 
-        self.init_properties()
-
     def running_config_verification(self):
         if self.state != 'parsed':
-            self.task_log.error('exiting. if running_config is set, state must be set to parsed')
-            exit(1)
+            self.fail_msg('exiting. if running_config is set, state must be set to parsed')
         for p in self.properties_set:
             if self.properties[p] != None:
                 self.task_log.error('exiting. Cannot mix running_config with other configuration.')
-                self.task_log.error('Instantiate a separate NxosOspfV2() instance and configure it solely for running_config.')
-                exit(1)
+                self.fail_msg('Instantiate a separate NxosOspfV2() instance and configure it solely for running_config.')
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.running_config != None:
             self.running_config_verification()
 
@@ -1039,8 +1037,7 @@ class NxosOspfV2(Task):
             return False
         if self.filter_list_direction != None and self.filter_list_route_map != None:
             return True
-        self.task_log.error('exiting. filter_list_direction and filter_list_route_map must both be set, or both be unset (None)')
-        exit(1)
+        self.fail_msg('exiting. filter_list_direction and filter_list_route_map must both be set, or both be unset (None)')
     def populate_areas_filter_list(self):
         if self.verify_area_filter_list():
             d = dict()
@@ -1054,13 +1051,11 @@ class NxosOspfV2(Task):
         if self.nssa_translate_type7_always != None and self.nssa_translate_type7_never != None:
             self.task_log.error('exiting. The following are mutually-exclusive. Unset one or the other.')
             self.task_log.error('nssa_translate_type7_always ({})'.format(self.nssa_translate_type7_always))
-            self.task_log.error('nssa_translate_type7_never ({})'.format(self.nssa_translate_type7_never))
-            exit(1)
+            self.fail_msg('nssa_translate_type7_never ({})'.format(self.nssa_translate_type7_never))
         if self.nssa_translate_type7_never == True and self.nssa_translate_type7_supress_fa == True:
             self.task_log.error('exiting. The following are mutually-exclusive. Unset one or the other.')
             self.task_log.error('nssa_translate_type7_never ({})'.format(self.nssa_translate_type7_never))
-            self.task_log.error('nssa_translate_type7_supress_fa ({})'.format(self.nssa_translate_type7_supress_fa))
-            exit(1)
+            self.fail_msg('nssa_translate_type7_supress_fa ({})'.format(self.nssa_translate_type7_supress_fa))
 
     def populate_areas_nssa(self):
         nssa_dict = dict()
@@ -1137,20 +1132,17 @@ class NxosOspfV2(Task):
     def verify_max_lsa(self):
         if self.max_lsa_warning_only == True:
             if self.max_lsa_ignore_count != None:
-                self.task_log.error('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_ignore_count ({}) is set.'.format(
+                self.fail_msg('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_ignore_count ({}) is set.'.format(
                     self.max_lsa_warning_only,
                     self.max_lsa_ignore_count))
-                exit(1)
             if self.max_lsa_ignore_time != None:
-                self.task_log.error('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_ignore_time ({}) is set.'.format(
+                self.fail_msg('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_ignore_time ({}) is set.'.format(
                     self.max_lsa_warning_only,
                     self.max_lsa_ignore_time))
-                exit(1)
             if self.max_lsa_reset_time != None:
-                self.task_log.error('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_reset_time ({}) is set.'.format(
+                self.fail_msg('exiting.  max_lsa_warning_only ({}) cannot be True if max_lsa_reset_time ({}) is set.'.format(
                     self.max_lsa_warning_only,
                     self.max_lsa_reset_time))
-                exit(1)
     def populate_processes_max_lsa(self):
         self.verify_max_lsa()
         d = dict()
@@ -1276,8 +1268,7 @@ class NxosOspfV2(Task):
             self.task_log.error('Got the following:')
             self.task_log.error('lsa_hold_interval {}'.format(self.timers_throttle_lsa_hold_interval))
             self.task_log.error('lsa_max_interval {}'.format(self.timers_throttle_lsa_max_interval))
-            self.task_log.error('lsa_start_interval {}'.format(self.timers_throttle_lsa_start_interval))
-            exit(1)
+            self.fail_msg('lsa_start_interval {}'.format(self.timers_throttle_lsa_start_interval))
 
         d_throttle_spf = dict()
         for p in self.properties_processes_timers_throttle_spf_set:
@@ -1290,8 +1281,7 @@ class NxosOspfV2(Task):
             self.task_log.error('Got the following:')
             self.task_log.error('initial_spf_delay {}'.format(self.timers_throttle_spf_initial_spf_delay))
             self.task_log.error('max_wait_time {}'.format(self.timers_throttle_spf_max_wait_time))
-            self.task_log.error('min_hold_time {}'.format(self.timers_throttle_spf_min_hold_time))
-            exit(1)
+            self.fail_msg('min_hold_time {}'.format(self.timers_throttle_spf_min_hold_time))
 
         d_throttle = dict()
         if len(d_throttle_lsa) == 3:
@@ -1316,8 +1306,7 @@ class NxosOspfV2(Task):
 
     def verify_add_area(self):
         if self.area_id == None:
-            self.task_log.error('exiting. call instance.area_id before calling instance.add_area()')
-            exit(1)
+            self.fail_msg('exiting. call instance.area_id before calling instance.add_area()')
 
     def add_area(self):
         self.verify_add_area()
@@ -1341,8 +1330,7 @@ class NxosOspfV2(Task):
 
     def add_process(self):
         if self.process_id == None:
-            self.task_log.error('exiting. call instance.process_id before calling instance.add_process()')
-            exit(1)
+            self.fail_msg('exiting. call instance.process_id before calling instance.add_process()')
         self.populate_processes_auto_cost()
         self.populate_processes_default_information_originate()
         self.populate_processes_graceful_restart()
@@ -1372,11 +1360,9 @@ class NxosOspfV2(Task):
 
     def verify_add_redistribute(self):
         if self.properties['redistribute_protocol'] == None:
-            self.task_log.error('exiting. redistribute_protocol must be set before calling add_redistribute()')
-            exit(1)
+            self.fail_msg('exiting. redistribute_protocol must be set before calling add_redistribute()')
         if self.properties['redistribute_route_map'] == None:
-            self.task_log.error('exiting. redistribute_route_map must be set before calling add_redistribute()')
-            exit(1)
+            self.fail_msg('exiting. redistribute_route_map must be set before calling add_redistribute()')
     def add_redistribute(self):
         '''
         Create redistribute dict() and append to processes_dict['redistribute']
@@ -1392,8 +1378,7 @@ class NxosOspfV2(Task):
 
     def verify_add_summary_address(self):
         if self.properties['summary_address_prefix'] == None:
-            self.task_log.error('exiting. summary_address_prefix must be set before calling add_summary_address()')
-            exit(1)
+            self.fail_msg('exiting. summary_address_prefix must be set before calling add_summary_address()')
     def add_summary_address(self):
         '''
         Create summary_address dict() and append to processes_dict['summary_address']
@@ -1409,8 +1394,7 @@ class NxosOspfV2(Task):
 
     def add_vrf(self):
         if self.properties['vrf'] == None:
-            self.task_log.error('exiting. vrf must be set before calling add_vrf()')
-            exit(1)
+            self.fail_msg('exiting. vrf must be set before calling add_vrf()')
         self.processes_dict['vrf'] = self.vrf
         self.populate_processes_auto_cost()
         self.populate_processes_default_information_originate()
@@ -1446,7 +1430,7 @@ class NxosOspfV2(Task):
 
     def init_properties(self):
         self.vrfs = list() # cleared in add_process(), appended to in add_vrf()
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['state'] = None
         self.properties['task_name'] = None
         self.properties['register'] = None
@@ -1773,12 +1757,11 @@ class NxosOspfV2(Task):
         self.verify_integer_range(x, 1, 64, self.class_name, parameter)
 
     def nxos_ospfv2_verify_mpls_traffic_eng_router_id_interface(self, x, parameter='router_id'):
-        for interface in self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces:
-            if interface in x:
-                return
+        if self.is_interface_kind(x, self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces):
+            return
         source_class = self.class_name
         source_method = 'nxos_ospfv2_verify_mpls_traffic_eng_router_id_interface'
-        expectation = 'An interface type of either {}'.format(','.join(self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces))
+        expectation = 'An interface type of either {}'.format(','.join(sorted(self.nxos_ospfv2_valid_mpls_traffic_eng_router_id_interfaces)))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def nxos_ospfv2_verify_redistribute_protocol(self, x, parameter='redistribute_protocol'):
@@ -1808,8 +1791,7 @@ class NxosOspfV2(Task):
 
     def nxos_ospfv2_verify_summary_address_tag(self, x, parameter='summary_address_tag'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 0, 4294967295, self.class_name, parameter)
 
     #---------------------------------
@@ -1817,28 +1799,23 @@ class NxosOspfV2(Task):
     #---------------------------------
     def nxos_ospfv2_verify_max_lsa_ignore_count(self, x, parameter='max_lsa_ignore_count'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 4294967295, self.class_name, parameter)
     def nxos_ospfv2_verify_max_lsa_ignore_time(self, x, parameter='max_lsa_ignore_time'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 1440, self.class_name, parameter)
     def nxos_ospfv2_verify_max_lsa_max_non_self_generated_lsa(self, x, parameter='max_lsa_max_non_self_generated_lsa'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 4294967295, self.class_name, parameter)
     def nxos_ospfv2_verify_max_lsa_reset_time(self, x, parameter='max_lsa_reset_time'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 1440, self.class_name, parameter)
     def nxos_ospfv2_verify_max_lsa_threshold(self, x, parameter='max_lsa_threshold'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 100, self.class_name, parameter)
     #---------------------------------
     # max_lsa verification END
@@ -1849,8 +1826,7 @@ class NxosOspfV2(Task):
     #---------------------------------
     def nxos_ospfv2_verify_max_metric_router_lsa_external_lsa_max_metric_value(self, x, parameter='max_metric_router_lsa_external_lsa_max_metric_value'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 16777215, self.class_name, parameter) # Range from N9K-C93180YC-FX + 9.3(6) CCO
 
     def nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_for_bgp_asn(self, x, parameter='max_metric_router_lsa_on_startup_wait_for_bgp_asn'):
@@ -1858,14 +1834,12 @@ class NxosOspfV2(Task):
 
     def nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_period(self, x, parameter='max_metric_router_lsa_on_startup_wait_period'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 5, 86400, self.class_name, parameter) # Range from N9K-C93180YC-FX + 9.3(6) CCO
 
     def nxos_ospfv2_verify_max_metric_router_lsa_summary_lsa_max_metric_value(self, x, parameter='max_metric_router_lsa_summary_lsa_max_metric_value'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 16777215, self.class_name, parameter) # Range from N9K-C93180YC-FX + 9.3(6) CCO
     #---------------------------------
     # max_metric verification END
@@ -1894,50 +1868,42 @@ class NxosOspfV2(Task):
 
     def nxos_ospfv2_verify_timers_lsa_arrival(self, x, parameter='timers_lsa_arrival'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 10, 600000, self.class_name, parameter) #  10-600000 (milliseconds), default 1000
 
     def nxos_ospfv2_verify_timers_lsa_group_pacing(self, x, parameter='timers_lsa_group_pacing'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 1800, self.class_name, parameter) #  1-1800 (seconds)
 
     def nxos_ospfv2_verify_timers_throttle_lsa_hold_interval(self, x, parameter='timers_throttle_lsa_hold_interval'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 50, 30000, self.class_name, parameter) #  50-30000 (milliseconds), default 5000
 
     def nxos_ospfv2_verify_timers_throttle_lsa_max_interval(self, x, parameter='timers_throttle_lsa_max_interval'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 50, 30000, self.class_name, parameter) #  50-30000 (milliseconds), default 5000
 
     def nxos_ospfv2_verify_timers_throttle_lsa_start_interval(self, x, parameter='timers_throttle_lsa_start_interval'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 0, 5000, self.class_name, parameter) #  0-5000 (milliseconds), default 0
 
     def nxos_ospfv2_verify_timers_throttle_spf_initial_spf_delay(self, x, parameter='timers_throttle_spf_initial_spf_delay'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 600000, self.class_name, parameter) #  1-600000 (milliseconds), default 200
 
     def nxos_ospfv2_verify_timers_throttle_spf_max_wait_time(self, x, parameter='timers_throttle_spf_max_wait_time'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 600000, self.class_name, parameter) #  1-600000 (milliseconds), default 5000
 
     def nxos_ospfv2_verify_timers_throttle_spf_min_hold_time(self, x, parameter='timers_throttle_spf_min_hold_time'):
         if not self.is_digits(x):
-            self.task_log.error('exiting. Expected digits, got {}'.format(x))
-            exit(1)
+            self.fail_msg('exiting. Expected digits, got {}'.format(x))
         self.verify_integer_range(x, 1, 600000, self.class_name, parameter) #  1-600000 (milliseconds), default 1000
 
     #---------------------------------
@@ -1947,189 +1913,39 @@ class NxosOspfV2(Task):
     #-----------------------------------------------------------------------
     # areas_dict properties
     #-----------------------------------------------------------------------
-    @property
-    def area_id(self):
-        return self.properties['area_id']
-    @area_id.setter
-    def area_id(self, x):
-        parameter = 'area_id'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_area_id(x, parameter)
-        self.properties[parameter] = str(x)
+    area_id = TaskProperty('nxos_ospfv2_verify_area_id', to_str=True)
 
-    @property
-    def authentication_message_digest(self):
-        return self.properties['authentication_message_digest']
-    @authentication_message_digest.setter
-    def authentication_message_digest(self, x):
-        parameter = 'authentication_message_digest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    authentication_message_digest = TaskProperty('verify_boolean')
 
-    @property
-    def authentication_set(self):
-        return self.properties['authentication_set']
-    @authentication_set.setter
-    def authentication_set(self, x):
-        parameter = 'authentication_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    authentication_set = TaskProperty('verify_boolean')
 
-    @property
-    def default_cost(self):
-        return self.properties['default_cost']
-    @default_cost.setter
-    def default_cost(self, x):
-        parameter = 'default_cost'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_default_cost(x, parameter)
-        self.properties[parameter] = str(x)
+    default_cost = TaskProperty('nxos_ospfv2_verify_default_cost', to_str=True)
 
-    @property
-    def filter_list_direction(self):
-        return self.properties['filter_list_direction']
-    @filter_list_direction.setter
-    def filter_list_direction(self, x):
-        parameter = 'filter_list_direction'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_filter_list_direction(x, parameter)
-        self.properties[parameter] = x
+    filter_list_direction = TaskProperty('nxos_ospfv2_verify_filter_list_direction')
 
-    @property
-    def filter_list_route_map(self):
-        return self.properties['filter_list_route_map']
-    @filter_list_route_map.setter
-    def filter_list_route_map(self, x):
-        parameter = 'filter_list_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    filter_list_route_map = TaskProperty()
 
-    @property
-    def nssa_default_information_originate(self):
-        return self.properties['nssa_default_information_originate']
-    @nssa_default_information_originate.setter
-    def nssa_default_information_originate(self, x):
-        parameter = 'nssa_default_information_originate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_default_information_originate = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_no_redistribution(self):
-        return self.properties['nssa_no_redistribution']
-    @nssa_no_redistribution.setter
-    def nssa_no_redistribution(self, x):
-        parameter = 'nssa_no_redistribution'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_no_redistribution = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_no_summary(self):
-        return self.properties['nssa_no_summary']
-    @nssa_no_summary.setter
-    def nssa_no_summary(self, x):
-        parameter = 'nssa_no_summary'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_no_summary = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_set(self):
-        return self.properties['nssa_set']
-    @nssa_set.setter
-    def nssa_set(self, x):
-        parameter = 'nssa_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_set = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_translate_type7_always(self):
-        return self.properties['nssa_translate_type7_always']
-    @nssa_translate_type7_always.setter
-    def nssa_translate_type7_always(self, x):
-        parameter = 'nssa_translate_type7_always'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_translate_type7_always = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_translate_type7_never(self):
-        return self.properties['nssa_translate_type7_never']
-    @nssa_translate_type7_never.setter
-    def nssa_translate_type7_never(self, x):
-        parameter = 'nssa_translate_type7_never'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_translate_type7_never = TaskProperty('verify_boolean')
 
-    @property
-    def nssa_translate_type7_supress_fa(self):
-        return self.properties['nssa_translate_type7_supress_fa']
-    @nssa_translate_type7_supress_fa.setter
-    def nssa_translate_type7_supress_fa(self, x):
-        parameter = 'nssa_translate_type7_supress_fa'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    nssa_translate_type7_supress_fa = TaskProperty('verify_boolean')
 
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    register = TaskProperty()
 
-    @property
-    def running_config(self):
-        return self.properties['running_config']
-    @running_config.setter
-    def running_config(self, x):
-        parameter = 'running_config'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    running_config = TaskProperty()
 
-    @property
-    def stub_no_summary(self):
-        return self.properties['stub_no_summary']
-    @stub_no_summary.setter
-    def stub_no_summary(self, x):
-        parameter = 'stub_no_summary'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    stub_no_summary = TaskProperty('verify_boolean')
 
-    @property
-    def stub_set(self):
-        return self.properties['stub_set']
-    @stub_set.setter
-    def stub_set(self, x):
-        parameter = 'stub_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    stub_set = TaskProperty('verify_boolean')
 
     #-----------------------------------------------------------------------
     # processes_dict properties
@@ -2147,59 +1963,15 @@ class NxosOspfV2(Task):
         self.verify_integer_range(x, 1, 4000000, self.class_name, parameter)
         self.properties[parameter] = str(x)
 
-    @property
-    def auto_cost_unit(self):
-        return self.properties['auto_cost_unit']
-    @auto_cost_unit.setter
-    def auto_cost_unit(self, x):
-        parameter = 'auto_cost_unit'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_auto_cost_unit(x, parameter)
-        self.properties[parameter] = x
+    auto_cost_unit = TaskProperty('nxos_ospfv2_verify_auto_cost_unit')
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_boolean')
 
-    @property
-    def default_information_originate_always(self):
-        return self.properties['default_information_originate_always']
-    @default_information_originate_always.setter
-    def default_information_originate_always(self, x):
-        parameter = 'default_information_originate_always'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    default_information_originate_always = TaskProperty('verify_boolean')
 
-    @property
-    def default_information_originate_route_map(self):
-        return self.properties['default_information_originate_route_map']
-    @default_information_originate_route_map.setter
-    def default_information_originate_route_map(self, x):
-        parameter = 'default_information_originate_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    default_information_originate_route_map = TaskProperty()
 
-    @property
-    def default_information_originate_set(self):
-        return self.properties['default_information_originate_set']
-    @default_information_originate_set.setter
-    def default_information_originate_set(self, x):
-        parameter = 'default_information_originate_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    default_information_originate_set = TaskProperty('verify_boolean')
 
     @property
     def default_metric(self):
@@ -2223,270 +1995,54 @@ class NxosOspfV2(Task):
         self.verify_integer_range(x, 1, 255, self.class_name, parameter)
         self.properties[parameter] = str(x)
 
-    @property
-    def flush_routes(self):
-        return self.properties['flush_routes']
-    @flush_routes.setter
-    def flush_routes(self, x):
-        parameter = 'flush_routes'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    flush_routes = TaskProperty('verify_boolean')
 
-    @property
-    def graceful_restart_grace_period(self):
-        return self.properties['graceful_restart_grace_period']
-    @graceful_restart_grace_period.setter
-    def graceful_restart_grace_period(self, x):
-        parameter = 'graceful_restart_grace_period'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_graceful_restart_grace_period(x, parameter)
-        self.properties[parameter] = str(x)
+    graceful_restart_grace_period = TaskProperty('nxos_ospfv2_verify_graceful_restart_grace_period', to_str=True)
 
-    @property
-    def graceful_restart_helper_disable(self):
-        return self.properties['graceful_restart_helper_disable']
-    @graceful_restart_helper_disable.setter
-    def graceful_restart_helper_disable(self, x):
-        parameter = 'graceful_restart_helper_disable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart_helper_disable = TaskProperty('verify_boolean')
 
-    @property
-    def graceful_restart_set(self):
-        return self.properties['graceful_restart_set']
-    @graceful_restart_set.setter
-    def graceful_restart_set(self, x):
-        parameter = 'graceful_restart_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    graceful_restart_set = TaskProperty('verify_boolean')
 
-    @property
-    def isolate(self):
-        return self.properties['isolate']
-    @isolate.setter
-    def isolate(self, x):
-        parameter = 'isolate'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    isolate = TaskProperty('verify_boolean')
 
-    @property
-    def log_adjacency_changes_detail(self):
-        return self.properties['log_adjacency_changes_detail']
-    @log_adjacency_changes_detail.setter
-    def log_adjacency_changes_detail(self, x):
-        parameter = 'log_adjacency_changes_detail'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    log_adjacency_changes_detail = TaskProperty('verify_boolean')
 
-    @property
-    def log_adjacency_changes_log(self):
-        return self.properties['log_adjacency_changes_log']
-    @log_adjacency_changes_log.setter
-    def log_adjacency_changes_log(self, x):
-        parameter = 'log_adjacency_changes_log'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    log_adjacency_changes_log = TaskProperty('verify_boolean')
 
-    @property
-    def max_lsa_ignore_count(self):
-        return self.properties['max_lsa_ignore_count']
-    @max_lsa_ignore_count.setter
-    def max_lsa_ignore_count(self, x):
-        parameter = 'max_lsa_ignore_count'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_lsa_ignore_count(x, parameter)
-        self.properties[parameter] = str(x)
+    max_lsa_ignore_count = TaskProperty('nxos_ospfv2_verify_max_lsa_ignore_count', to_str=True)
 
-    @property
-    def max_lsa_ignore_time(self):
-        return self.properties['max_lsa_ignore_time']
-    @max_lsa_ignore_time.setter
-    def max_lsa_ignore_time(self, x):
-        parameter = 'max_lsa_ignore_time'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_lsa_ignore_time(x, parameter)
-        self.properties[parameter] = str(x)
+    max_lsa_ignore_time = TaskProperty('nxos_ospfv2_verify_max_lsa_ignore_time', to_str=True)
 
-    @property
-    def max_lsa_max_non_self_generated_lsa(self):
-        return self.properties['max_lsa_max_non_self_generated_lsa']
-    @max_lsa_max_non_self_generated_lsa.setter
-    def max_lsa_max_non_self_generated_lsa(self, x):
-        parameter = 'max_lsa_max_non_self_generated_lsa'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_lsa_max_non_self_generated_lsa(x, parameter)
-        self.properties[parameter] = str(x)
+    max_lsa_max_non_self_generated_lsa = TaskProperty('nxos_ospfv2_verify_max_lsa_max_non_self_generated_lsa', to_str=True)
 
-    @property
-    def max_lsa_reset_time(self):
-        return self.properties['max_lsa_reset_time']
-    @max_lsa_reset_time.setter
-    def max_lsa_reset_time(self, x):
-        parameter = 'max_lsa_reset_time'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_lsa_reset_time(x, parameter)
-        self.properties[parameter] = str(x)
+    max_lsa_reset_time = TaskProperty('nxos_ospfv2_verify_max_lsa_reset_time', to_str=True)
 
-    @property
-    def max_lsa_threshold(self):
-        return self.properties['max_lsa_threshold']
-    @max_lsa_threshold.setter
-    def max_lsa_threshold(self, x):
-        parameter = 'max_lsa_threshold'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_lsa_threshold(x, parameter)
-        self.properties[parameter] = str(x)
+    max_lsa_threshold = TaskProperty('nxos_ospfv2_verify_max_lsa_threshold', to_str=True)
 
-    @property
-    def max_lsa_warning_only(self):
-        return self.properties['max_lsa_warning_only']
-    @max_lsa_warning_only.setter
-    def max_lsa_warning_only(self, x):
-        parameter = 'max_lsa_warning_only'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_lsa_warning_only = TaskProperty('verify_boolean')
 
 
-    @property
-    def max_metric_router_lsa_include_stub(self):
-        return self.properties['max_metric_router_lsa_include_stub']
-    @max_metric_router_lsa_include_stub.setter
-    def max_metric_router_lsa_include_stub(self, x):
-        parameter = 'max_metric_router_lsa_include_stub'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_include_stub = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_set(self):
-        return self.properties['max_metric_router_lsa_set']
-    @max_metric_router_lsa_set.setter
-    def max_metric_router_lsa_set(self, x):
-        parameter = 'max_metric_router_lsa_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_set = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_external_lsa_max_metric_value(self):
-        return self.properties['max_metric_router_lsa_external_lsa_max_metric_value']
-    @max_metric_router_lsa_external_lsa_max_metric_value.setter
-    def max_metric_router_lsa_external_lsa_max_metric_value(self, x):
-        parameter = 'max_metric_router_lsa_external_lsa_max_metric_value'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_metric_router_lsa_external_lsa_max_metric_value(x, parameter)
-        self.properties[parameter] = str(x)
+    max_metric_router_lsa_external_lsa_max_metric_value = TaskProperty('nxos_ospfv2_verify_max_metric_router_lsa_external_lsa_max_metric_value', to_str=True)
 
-    @property
-    def max_metric_router_lsa_external_lsa_set(self):
-        return self.properties['max_metric_router_lsa_external_lsa_set']
-    @max_metric_router_lsa_external_lsa_set.setter
-    def max_metric_router_lsa_external_lsa_set(self, x):
-        parameter = 'max_metric_router_lsa_external_lsa_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_external_lsa_set = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_on_startup_set(self):
-        return self.properties['max_metric_router_lsa_on_startup_set']
-    @max_metric_router_lsa_on_startup_set.setter
-    def max_metric_router_lsa_on_startup_set(self, x):
-        parameter = 'max_metric_router_lsa_on_startup_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_on_startup_set = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_on_startup_wait_for_bgp_asn(self):
-        return self.properties['max_metric_router_lsa_on_startup_wait_for_bgp_asn']
-    @max_metric_router_lsa_on_startup_wait_for_bgp_asn.setter
-    def max_metric_router_lsa_on_startup_wait_for_bgp_asn(self, x):
-        parameter = 'max_metric_router_lsa_on_startup_wait_for_bgp_asn'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_for_bgp_asn(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_on_startup_wait_for_bgp_asn = TaskProperty('nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_for_bgp_asn')
 
-    @property
-    def max_metric_router_lsa_on_startup_wait_period(self):
-        return self.properties['max_metric_router_lsa_on_startup_wait_period']
-    @max_metric_router_lsa_on_startup_wait_period.setter
-    def max_metric_router_lsa_on_startup_wait_period(self, x):
-        parameter = 'max_metric_router_lsa_on_startup_wait_period'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_period(x, parameter)
-        self.properties[parameter] = str(x)
+    max_metric_router_lsa_on_startup_wait_period = TaskProperty('nxos_ospfv2_verify_max_metric_router_lsa_on_startup_wait_period', to_str=True)
 
-    @property
-    def max_metric_router_lsa_summary_lsa_set(self):
-        return self.properties['max_metric_router_lsa_summary_lsa_set']
-    @max_metric_router_lsa_summary_lsa_set.setter
-    def max_metric_router_lsa_summary_lsa_set(self, x):
-        parameter = 'max_metric_router_lsa_summary_lsa_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_summary_lsa_set = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_summary_lsa_set(self):
-        return self.properties['max_metric_router_lsa_summary_lsa_set']
-    @max_metric_router_lsa_summary_lsa_set.setter
-    def max_metric_router_lsa_summary_lsa_set(self, x):
-        parameter = 'max_metric_router_lsa_summary_lsa_set'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    max_metric_router_lsa_summary_lsa_set = TaskProperty('verify_boolean')
 
-    @property
-    def max_metric_router_lsa_summary_lsa_max_metric_value(self):
-        return self.properties['max_metric_router_lsa_summary_lsa_max_metric_value']
-    @max_metric_router_lsa_summary_lsa_max_metric_value.setter
-    def max_metric_router_lsa_summary_lsa_max_metric_value(self, x):
-        parameter = 'max_metric_router_lsa_summary_lsa_max_metric_value'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_max_metric_router_lsa_summary_lsa_max_metric_value(x, parameter)
-        self.properties[parameter] = str(x)
+    max_metric_router_lsa_summary_lsa_max_metric_value = TaskProperty('nxos_ospfv2_verify_max_metric_router_lsa_summary_lsa_max_metric_value', to_str=True)
 
-    @property
-    def maximum_paths(self):
-        return self.properties['maximum_paths']
-    @maximum_paths.setter
-    def maximum_paths(self, x):
-        parameter = 'maximum_paths'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_maximum_paths(x, parameter)
-        self.properties[parameter] = str(x)
+    maximum_paths = TaskProperty('nxos_ospfv2_verify_maximum_paths', to_str=True)
 
     @property
     def mpls_traffic_eng_areas(self):
@@ -2497,28 +2053,17 @@ class NxosOspfV2(Task):
         if self.set_none(x, parameter):
             return
         if not self.is_digits(x) and not self.is_list(x):
-            self.task_log.error('exiting. FF Expected digits or list() of digits for {}. Got {}'.format(parameter, v))
-            exit(1)
+            self.fail_msg('exiting. FF Expected digits or list() of digits for {}. Got {}'.format(parameter, v))
         if self.is_digits(x):
             self.properties[parameter].append(x)
             return
         if self.is_list(x):
             for v in x:
                 if not self.is_digits(v):
-                    self.task_log.error('exiting. FF Expected digits or list() of digits for {}. Got {}'.format(parameter, v))
-                    exit(1)
+                    self.fail_msg('exiting. FF Expected digits or list() of digits for {}. Got {}'.format(parameter, v))
             self.properties[parameter] += x
 
-    @property
-    def mpls_traffic_eng_multicast_intact(self):
-        return self.properties['mpls_traffic_eng_multicast_intact']
-    @mpls_traffic_eng_multicast_intact.setter
-    def mpls_traffic_eng_multicast_intact(self, x):
-        parameter = 'mpls_traffic_eng_multicast_intact'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    mpls_traffic_eng_multicast_intact = TaskProperty('verify_boolean')
 
     @property
     def mpls_traffic_eng_router_id(self):
@@ -2536,38 +2081,11 @@ class NxosOspfV2(Task):
         self.nxos_ospfv2_verify_mpls_traffic_eng_router_id_interface(x, parameter)
         self.properties[parameter] = x
 
-    @property
-    def name_lookup(self):
-        return self.properties['name_lookup']
-    @name_lookup.setter
-    def name_lookup(self, x):
-        parameter = 'name_lookup'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    name_lookup = TaskProperty('verify_boolean')
 
-    @property
-    def passive_interface_default(self):
-        return self.properties['passive_interface_default']
-    @passive_interface_default.setter
-    def passive_interface_default(self, x):
-        parameter = 'passive_interface_default'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    passive_interface_default = TaskProperty('verify_boolean')
 
-    @property
-    def process_id(self):
-        return self.properties['process_id']
-    @process_id.setter
-    def process_id(self, x):
-        parameter = 'process_id'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_process_id(x, parameter)
-        self.properties[parameter] = str(x)
+    process_id = TaskProperty('nxos_ospfv2_verify_process_id', to_str=True)
 
     @property
     def ranges_cost(self):
@@ -2580,16 +2098,7 @@ class NxosOspfV2(Task):
         # TODO: add_verification
         self.properties[parameter] = x
 
-    @property
-    def ranges_not_advertise(self):
-        return self.properties['ranges_not_advertise']
-    @ranges_not_advertise.setter
-    def ranges_not_advertise(self, x):
-        parameter = 'ranges_not_advertise'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    ranges_not_advertise = TaskProperty('verify_boolean')
 
     @property
     def ranges_prefix(self):
@@ -2602,229 +2111,44 @@ class NxosOspfV2(Task):
         # TODO: add_verification
         self.properties[parameter] = x
 
-    @property
-    def redistribute_id(self):
-        return self.properties['redistribute_id']
-    @redistribute_id.setter
-    def redistribute_id(self, x):
-        parameter = 'redistribute_id'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    redistribute_id = TaskProperty()
 
-    @property
-    def redistribute_protocol(self):
-        return self.properties['redistribute_protocol']
-    @redistribute_protocol.setter
-    def redistribute_protocol(self, x):
-        parameter = 'redistribute_protocol'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_redistribute_protocol(x, parameter)
-        self.properties[parameter] = x
+    redistribute_protocol = TaskProperty('nxos_ospfv2_verify_redistribute_protocol')
 
-    @property
-    def redistribute_route_map(self):
-        return self.properties['redistribute_route_map']
-    @redistribute_route_map.setter
-    def redistribute_route_map(self, x):
-        parameter = 'redistribute_route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    redistribute_route_map = TaskProperty()
 
-    @property
-    def rfc1583compatibility(self):
-        return self.properties['rfc1583compatibility']
-    @rfc1583compatibility.setter
-    def rfc1583compatibility(self, x):
-        parameter = 'rfc1583compatibility'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    rfc1583compatibility = TaskProperty('verify_boolean')
 
-    @property
-    def router_id(self):
-        return self.properties['router_id']
-    @router_id.setter
-    def router_id(self, x):
-        parameter = 'router_id'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_router_id(x, parameter)
-        self.properties[parameter] = x
+    router_id = TaskProperty('nxos_ospfv2_verify_router_id')
 
-    @property
-    def shutdown(self):
-        return self.properties['shutdown']
-    @shutdown.setter
-    def shutdown(self, x):
-        parameter = 'shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    shutdown = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('nxos_ospfv2_verify_state')
 
-    @property
-    def summary_address_not_advertise(self):
-        return self.properties['summary_address_not_advertise']
-    @summary_address_not_advertise.setter
-    def summary_address_not_advertise(self, x):
-        parameter = 'summary_address_not_advertise'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    summary_address_not_advertise = TaskProperty('verify_boolean')
 
-    @property
-    def summary_address_prefix(self):
-        return self.properties['summary_address_prefix']
-    @summary_address_prefix.setter
-    def summary_address_prefix(self, x):
-        parameter = 'summary_address_prefix'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_summary_address_prefix(x, parameter)
-        self.properties[parameter] = x
+    summary_address_prefix = TaskProperty('nxos_ospfv2_verify_summary_address_prefix')
 
-    @property
-    def summary_address_tag(self):
-        return self.properties['summary_address_tag']
-    @summary_address_tag.setter
-    def summary_address_tag(self, x):
-        parameter = 'summary_address_tag'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_summary_address_tag(x, parameter)
-        self.properties[parameter] = x
+    summary_address_tag = TaskProperty('nxos_ospfv2_verify_summary_address_tag')
 
-    @property
-    def table_map_filter(self):
-        return self.properties['table_map_filter']
-    @table_map_filter.setter
-    def table_map_filter(self, x):
-        parameter = 'table_map_filter'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    table_map_filter = TaskProperty('verify_boolean')
 
-    @property
-    def table_map_name(self):
-        return self.properties['table_map_name']
-    @table_map_name.setter
-    def table_map_name(self, x):
-        parameter = 'table_map_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    table_map_name = TaskProperty()
 
-    @property
-    def timers_lsa_arrival(self):
-        return self.properties['timers_lsa_arrival']
-    @timers_lsa_arrival.setter
-    def timers_lsa_arrival(self, x):
-        parameter = 'timers_lsa_arrival'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_lsa_arrival(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_lsa_arrival = TaskProperty('nxos_ospfv2_verify_timers_lsa_arrival', to_str=True)
 
-    @property
-    def timers_lsa_group_pacing(self):
-        return self.properties['timers_lsa_group_pacing']
-    @timers_lsa_group_pacing.setter
-    def timers_lsa_group_pacing(self, x):
-        parameter = 'timers_lsa_group_pacing'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_lsa_group_pacing(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_lsa_group_pacing = TaskProperty('nxos_ospfv2_verify_timers_lsa_group_pacing', to_str=True)
 
-    @property
-    def timers_throttle_lsa_hold_interval(self):
-        return self.properties['timers_throttle_lsa_hold_interval']
-    @timers_throttle_lsa_hold_interval.setter
-    def timers_throttle_lsa_hold_interval(self, x):
-        parameter = 'timers_throttle_lsa_hold_interval'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_lsa_hold_interval(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_lsa_hold_interval = TaskProperty('nxos_ospfv2_verify_timers_throttle_lsa_hold_interval', to_str=True)
 
-    @property
-    def timers_throttle_lsa_max_interval(self):
-        return self.properties['timers_throttle_lsa_max_interval']
-    @timers_throttle_lsa_max_interval.setter
-    def timers_throttle_lsa_max_interval(self, x):
-        parameter = 'timers_throttle_lsa_max_interval'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_lsa_max_interval(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_lsa_max_interval = TaskProperty('nxos_ospfv2_verify_timers_throttle_lsa_max_interval', to_str=True)
 
-    @property
-    def timers_throttle_lsa_start_interval(self):
-        return self.properties['timers_throttle_lsa_start_interval']
-    @timers_throttle_lsa_start_interval.setter
-    def timers_throttle_lsa_start_interval(self, x):
-        parameter = 'timers_throttle_lsa_start_interval'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_lsa_start_interval(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_lsa_start_interval = TaskProperty('nxos_ospfv2_verify_timers_throttle_lsa_start_interval', to_str=True)
 
-    @property
-    def timers_throttle_spf_initial_spf_delay(self):
-        return self.properties['timers_throttle_spf_initial_spf_delay']
-    @timers_throttle_spf_initial_spf_delay.setter
-    def timers_throttle_spf_initial_spf_delay(self, x):
-        parameter = 'timers_throttle_spf_initial_spf_delay'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_spf_initial_spf_delay(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_spf_initial_spf_delay = TaskProperty('nxos_ospfv2_verify_timers_throttle_spf_initial_spf_delay', to_str=True)
 
-    @property
-    def timers_throttle_spf_max_wait_time(self):
-        return self.properties['timers_throttle_spf_max_wait_time']
-    @timers_throttle_spf_max_wait_time.setter
-    def timers_throttle_spf_max_wait_time(self, x):
-        parameter = 'timers_throttle_spf_max_wait_time'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_spf_max_wait_time(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_spf_max_wait_time = TaskProperty('nxos_ospfv2_verify_timers_throttle_spf_max_wait_time', to_str=True)
 
-    @property
-    def timers_throttle_spf_min_hold_time(self):
-        return self.properties['timers_throttle_spf_min_hold_time']
-    @timers_throttle_spf_min_hold_time.setter
-    def timers_throttle_spf_min_hold_time(self, x):
-        parameter = 'timers_throttle_spf_min_hold_time'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_ospfv2_verify_timers_throttle_spf_min_hold_time(x, parameter)
-        self.properties[parameter] = str(x)
+    timers_throttle_spf_min_hold_time = TaskProperty('nxos_ospfv2_verify_timers_throttle_spf_min_hold_time', to_str=True)
 
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    vrf = TaskProperty()
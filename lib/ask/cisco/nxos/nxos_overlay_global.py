@@ -1,7 +1,7 @@
 # NxosOverlayGlobal() - cisco/nxos/nxos_overlay_global.py
 our_version = 103
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosOverlayGlobal()
@@ -67,6 +67,9 @@ class NxosOverlayGlobal(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('anycast_gateway_mac')
 
@@ -79,18 +82,13 @@ class NxosOverlayGlobal(Task):
         self.nxos_overlay_global_valid_state.add('absent')
         self.nxos_overlay_global_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.anycast_gateway_mac == None:
-            self.task_log.error('exiting. instance.anycast_gateway_mac must be set prior to calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.anycast_gateway_mac must be set prior to calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -128,13 +126,4 @@ class NxosOverlayGlobal(Task):
         expectation = 'keyword "default" or a mac address with any of the following formats: x.x.x, xxxx.xxxx.xxxx, xx:xx:xx:xx:xx:xx, xx-xx-xx-xx-xx-xx'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def anycast_gateway_mac(self):
-        return self.properties['anycast_gateway_mac']
-    @anycast_gateway_mac.setter
-    def anycast_gateway_mac(self, x):
-        parameter = 'anycast_gateway_mac'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_overlay_global_anycast_gateway_mac(x, parameter)
-        self.properties[parameter] = x
+    anycast_gateway_mac = TaskProperty('verify_nxos_overlay_global_anycast_gateway_mac')
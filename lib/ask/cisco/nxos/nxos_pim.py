@@ -1,7 +1,7 @@
 # NxosPim() - cisco/nxos/nxos_pim.py
 our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosPim()
@@ -82,6 +82,10 @@ class NxosPim(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
         self.ansible_task = dict()
+
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('bfd')
         self.properties_set.add('ssm_range')
@@ -91,12 +95,8 @@ class NxosPim(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def ssm_range_list_ok(self, x):
@@ -121,8 +121,7 @@ class NxosPim(Task):
 
     def final_verification(self):
         if self.ssm_range == None:
-            self.task_log.error('exiting. instance.ssm_range is mandatory. call instance.ssm_range before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.ssm_range is mandatory. call instance.ssm_range before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -140,24 +139,6 @@ class NxosPim(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = d.copy()
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_enable_disable(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def ssm_range(self):
-        return self.properties['ssm_range']
-    @ssm_range.setter
-    def ssm_range(self, x):
-        parameter = 'ssm_range'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ssm_range(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_enable_disable')
+
+    ssm_range = TaskProperty('verify_ssm_range')
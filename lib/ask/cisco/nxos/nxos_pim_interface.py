@@ -1,7 +1,7 @@
 # NxosPimInterface() - cisco/nxos/nxos_pim_interface.py
 our_version = 103
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosPimInterface()
@@ -201,6 +201,9 @@ class NxosPimInterface(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('bfd')
         self.properties_set.add('border')
@@ -251,30 +254,21 @@ class NxosPimInterface(Task):
         self.nxos_pim_interface_pim_hello_interval_min = 1
         self.nxos_pim_interface_pim_hello_interval_max = 18724286
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name']    = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.interface == None:
-            self.task_log.error('exiting. instance.interface must be set prior to calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.interface must be set prior to calling instance.commit()')
         if self.jp_policy_in != None and self.jp_type_in == None:
-            self.task_log.error('exiting. instance.jp_type_in must be set if instance.jp_policy_in is set')
-            exit(1)
+            self.fail_msg('exiting. instance.jp_type_in must be set if instance.jp_policy_in is set')
         if self.jp_policy_out != None and self.jp_type_out == None:
-            self.task_log.error('exiting. instance.jp_type_out must be set if instance.jp_policy_out is set')
-            exit(1)
+            self.fail_msg('exiting. instance.jp_type_out must be set if instance.jp_policy_out is set')
         if self.neighbor_policy != None and self.neighbor_type == None:
-            self.task_log.error('exiting. instance.neighbor_type must be set if instance.neighbor_policy is set')
-            exit(1)
+            self.fail_msg('exiting. instance.neighbor_type must be set if instance.neighbor_policy is set')
 
     def commit(self):
         self.update()
@@ -367,27 +361,9 @@ class NxosPimInterface(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def bfd(self):
-        return self.properties['bfd']
-    @bfd.setter
-    def bfd(self, x):
-        parameter = 'bfd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_bfd(x, parameter)
-        self.properties[parameter] = x
+    bfd = TaskProperty('verify_nxos_pim_interface_bfd')
 
-    @property
-    def border(self):
-        return self.properties['border']
-    @border.setter
-    def border(self, x):
-        parameter = 'border'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    border = TaskProperty('verify_boolean')
 
     @property
     def dr_prio(self):
@@ -400,15 +376,7 @@ class NxosPimInterface(Task):
         self.verify_nxos_pim_interface_dr_prio(x)
         self.properties[parameter] = str(x)
 
-    @property
-    def hello_auth_key(self):
-        return self.properties['hello_auth_key']
-    @hello_auth_key.setter
-    def hello_auth_key(self, x):
-        parameter = 'hello_auth_key'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    hello_auth_key = TaskProperty()
 
     @property
     def hello_interval(self):
@@ -421,109 +389,22 @@ class NxosPimInterface(Task):
         self.verify_nxos_pim_interface_hello_interval(x)
         self.properties[parameter] = str(x)
 
-    @property
-    def hello_interval_ms(self):
-        return self.properties['hello_interval_ms']
-    @hello_interval_ms.setter
-    def hello_interval_ms(self, x):
-        parameter = 'hello_interval_ms'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    hello_interval_ms = TaskProperty('verify_boolean')
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_interface(x, parameter)
-        self.properties[parameter] = x
+    interface = TaskProperty('verify_nxos_pim_interface_interface')
 
-    @property
-    def jp_policy_in(self):
-        return self.properties['jp_policy_in']
-    @jp_policy_in.setter
-    def jp_policy_in(self, x):
-        parameter = 'jp_policy_in'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    jp_policy_in = TaskProperty()
 
-    @property
-    def jp_policy_out(self):
-        return self.properties['jp_policy_out']
-    @jp_policy_out.setter
-    def jp_policy_out(self, x):
-        parameter = 'jp_policy_out'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    jp_policy_out = TaskProperty()
 
-    @property
-    def jp_type_in(self):
-        return self.properties['jp_type_in']
-    @jp_type_in.setter
-    def jp_type_in(self, x):
-        parameter = 'jp_type_in'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_jp_type_in(x, parameter)
-        self.properties[parameter] = x
+    jp_type_in = TaskProperty('verify_nxos_pim_interface_jp_type_in')
 
-    @property
-    def jp_type_out(self):
-        return self.properties['jp_type_out']
-    @jp_type_out.setter
-    def jp_type_out(self, x):
-        parameter = 'jp_type_out'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_jp_type_out(x, parameter)
-        self.properties[parameter] = x
+    jp_type_out = TaskProperty('verify_nxos_pim_interface_jp_type_out')
 
-    @property
-    def neighbor_policy(self):
-        return self.properties['neighbor_policy']
-    @neighbor_policy.setter
-    def neighbor_policy(self, x):
-        parameter = 'neighbor_policy'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    neighbor_policy = TaskProperty()
 
-    @property
-    def neighbor_type(self):
-        return self.properties['neighbor_type']
-    @neighbor_type.setter
-    def neighbor_type(self, x):
-        parameter = 'neighbor_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_neighbor_type(x, parameter)
-        self.properties[parameter] = x
+    neighbor_type = TaskProperty('verify_nxos_pim_interface_neighbor_type')
 
-    @property
-    def sparse(self):
-        return self.properties['sparse']
-    @sparse.setter
-    def sparse(self, x):
-        parameter = 'sparse'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    sparse = TaskProperty('verify_boolean')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_interface_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_pim_interface_state')
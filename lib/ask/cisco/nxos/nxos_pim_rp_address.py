@@ -1,7 +1,7 @@
 # NxosPimRpAddress() - cisco/nxos/nxos_pim_rp_address.py
 our_version = 103
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosPimRpAddress()
@@ -123,6 +123,9 @@ class NxosPimRpAddress(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('bidir')
         self.properties_set.add('group_list')
@@ -140,30 +143,21 @@ class NxosPimRpAddress(Task):
         self.nxos_pim_rp_address_valid_state.add('absent')
         self.nxos_pim_rp_address_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.rp_address == None:
-            self.task_log.error('exiting. instance.rp_address must be set prior to calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. instance.rp_address must be set prior to calling instance.commit()')
         if self.group_list != None and self.route_map != None:
-            self.task_log.error('exiting. instance.group_list and instance_route_map are mutually-exclusive')
-            exit(1)
+            self.fail_msg('exiting. instance.group_list and instance_route_map are mutually-exclusive')
         if self.group_list != None and self.prefix_list != None:
-            self.task_log.error('exiting. instance.group_list and instance_prefix_list are mutually-exclusive')
-            exit(1)
+            self.fail_msg('exiting. instance.group_list and instance_prefix_list are mutually-exclusive')
         if self.route_map != None and self.prefix_list != None:
-            self.task_log.error('exiting. instance.route_map and instance_prefix_list are mutually-exclusive')
-            exit(1)
+            self.fail_msg('exiting. instance.route_map and instance_prefix_list are mutually-exclusive')
 
 
     def commit(self):
@@ -202,47 +196,13 @@ class NxosPimRpAddress(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def bidir(self):
-        return self.properties['bidir']
-    @bidir.setter
-    def bidir(self, x):
-        parameter = 'bidir'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    bidir = TaskProperty('verify_boolean')
 
-    @property
-    def group_list(self):
-        return self.properties['group_list']
-    @group_list.setter
-    def group_list(self, x):
-        parameter = 'group_list'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_multicast_address_with_prefix(x, parameter)
-        self.properties[parameter] = x
+    group_list = TaskProperty('verify_ipv4_multicast_address_with_prefix')
 
-    @property
-    def prefix_list(self):
-        return self.properties['prefix_list']
-    @prefix_list.setter
-    def prefix_list(self, x):
-        parameter = 'prefix_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    prefix_list = TaskProperty()
 
-    @property
-    def route_map(self):
-        return self.properties['route_map']
-    @route_map.setter
-    def route_map(self, x):
-        parameter = 'route_map'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    route_map = TaskProperty()
 
     @property
     def rp_address(self):
@@ -255,13 +215,4 @@ class NxosPimRpAddress(Task):
         self.verify_nxos_pim_rp_address_rp_address(x)
         self.properties[parameter] = str(x)
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_pim_rp_address_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_pim_rp_address_state')
@@ -2,7 +2,7 @@
 our_version = 100
 from copy import deepcopy
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosPrefixLists()
@@ -190,24 +190,6 @@ class NxosPrefixLists(Task):
 
         self.config = list()
 
-        self.properties_afi = set()
-        self.properties_afi.add('afi')
-        self.properties_afi.add('state')
-
-        self.properties_prefix_list_entry = set()
-        self.properties_prefix_list_entry.add('action')
-        self.properties_prefix_list_entry.add('eq')
-        self.properties_prefix_list_entry.add('ge')
-        self.properties_prefix_list_entry.add('le')
-        self.properties_prefix_list_entry.add('mask')
-        self.properties_prefix_list_entry.add('prefix')
-        self.properties_prefix_list_entry.add('sequence')
-
-
-        self.properties_prefix_list = set()
-        self.properties_prefix_list.add('name')
-        self.properties_prefix_list.add('description')
-
         self.properties = set()
         self.properties.update(self.properties_afi)
         self.properties.update(self.properties_prefix_list_entry)
@@ -226,6 +208,37 @@ class NxosPrefixLists(Task):
         for p in self.properties:
             self.property_map[p] = p
 
+        self.mutex_prefix_list_entry = dict()
+        self.mutex_prefix_list_entry['eq'] = set()
+        self.mutex_prefix_list_entry['eq'].add('le')
+        self.mutex_prefix_list_entry['eq'].add('ge')
+        self.mutex_prefix_list_entry['ge'] = set()
+        self.mutex_prefix_list_entry['ge'].add('eq')
+        self.mutex_prefix_list_entry['ge'].add('le')
+        self.mutex_prefix_list_entry['le'] = set()
+        self.mutex_prefix_list_entry['le'].add('eq')
+        self.mutex_prefix_list_entry['le'].add('ge')
+
+        self.init_properties()
+
+    def init_schema(self):
+        self.properties_afi = set()
+        self.properties_afi.add('afi')
+        self.properties_afi.add('state')
+
+        self.properties_prefix_list_entry = set()
+        self.properties_prefix_list_entry.add('action')
+        self.properties_prefix_list_entry.add('eq')
+        self.properties_prefix_list_entry.add('ge')
+        self.properties_prefix_list_entry.add('le')
+        self.properties_prefix_list_entry.add('mask')
+        self.properties_prefix_list_entry.add('prefix')
+        self.properties_prefix_list_entry.add('sequence')
+
+        self.properties_prefix_list = set()
+        self.properties_prefix_list.add('name')
+        self.properties_prefix_list.add('description')
+
         self.nxos_prefix_lists_valid_action = set()
         self.nxos_prefix_lists_valid_action.add('deny')
         self.nxos_prefix_lists_valid_action.add('permit')
@@ -259,19 +272,6 @@ class NxosPrefixLists(Task):
         self.verify_cmp['ipv6']['le_min'] = 1
         self.verify_cmp['ipv6']['le_max'] = 128
 
-        self.mutex_prefix_list_entry = dict()
-        self.mutex_prefix_list_entry['eq'] = set()
-        self.mutex_prefix_list_entry['eq'].add('le')
-        self.mutex_prefix_list_entry['eq'].add('ge')
-        self.mutex_prefix_list_entry['ge'] = set()
-        self.mutex_prefix_list_entry['ge'].add('eq')
-        self.mutex_prefix_list_entry['ge'].add('le')
-        self.mutex_prefix_list_entry['le'] = set()
-        self.mutex_prefix_list_entry['le'].add('eq')
-        self.mutex_prefix_list_entry['le'].add('ge')
-
-        self.init_properties()
-
     def get_mapped_property(self, x):
         '''
         return either a mapped property, if one exists, or x
@@ -303,26 +303,22 @@ class NxosPrefixLists(Task):
             self.properties[p] = None
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.init_afi()
         self.properties['task_name'] = None
         self.properties['state'] = None
 
     def verify_prefix_list_entry(self):
         if self.action == None:
-            self.task_log.error('exiting. instance.action must be set before calling instance.add_prefix_list_entry()')
-            exit(1)
+            self.fail_msg('exiting. instance.action must be set before calling instance.add_prefix_list_entry()')
         if self.prefix == None:
-            self.task_log.error('exiting. instance.prefix must be set before calling instance.add_prefix_list_entry()')
-            exit(1)
+            self.fail_msg('exiting. instance.prefix must be set before calling instance.add_prefix_list_entry()')
         if self.sequence == None:
-            self.task_log.error('exiting. instance.sequence must be set before calling instance.add_prefix_list_entry()')
-            exit(1)
+            self.fail_msg('exiting. instance.sequence must be set before calling instance.add_prefix_list_entry()')
         for p in self.mutex_prefix_list_entry:
             for mp in self.mutex_prefix_list_entry[p]:
                 if self.properties[p] != None and self.properties[mp] != None:
-                    self.task_log.error('exiting. {} and {} are mutually-exclusive'.format(p, mp))
-                    exit(1)
+                    self.fail_msg('exiting. {} and {} are mutually-exclusive'.format(p, mp))
     def add_prefix_list_entry(self):
         self.verify_prefix_list_entry()
         d = dict()
@@ -331,18 +327,15 @@ class NxosPrefixLists(Task):
                 mapped_p = self.get_mapped_property(p)
                 d[mapped_p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. No prefix_list_entry properties are set')
-            exit(1)
+            self.fail_msg('exiting. No prefix_list_entry properties are set')
         self.prefix_list_entries.append(deepcopy(d))
         self.init_prefix_list_entry()
 
     def verify_prefix_list(self):
         if len(self.prefix_list_entries) == 0:
-            self.task_log.error('exiting. call instance.add_prefix_list_entry() at least once before calling instance.add_prefix_list()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_prefix_list_entry() at least once before calling instance.add_prefix_list()')
         if self.name == None:
-            self.task_log.error('exiting. instance.name must be set before calling instance.add_prefix_list()')
-            exit(1)
+            self.fail_msg('exiting. instance.name must be set before calling instance.add_prefix_list()')
     def add_prefix_list(self):
         self.verify_prefix_list()
         d = dict()
@@ -351,8 +344,7 @@ class NxosPrefixLists(Task):
                 mapped_p = self.get_mapped_property(p)
                 d[mapped_p] = self.properties[p]
         if len(d) == 0:
-            self.task_log.error('exiting. No prefix_list properties are set')
-            exit(1)
+            self.fail_msg('exiting. No prefix_list properties are set')
         d['entries'] = deepcopy(self.prefix_list_entries)
         self.prefix_lists.append(deepcopy(d))
         self.init_prefix_list()
@@ -382,11 +374,9 @@ class NxosPrefixLists(Task):
 
     def verify_add_afi(self):
         if self.afi == None:
-            self.task_log.error('exiting. instance.afi must be set prior to calling instance.add_afi()')
-            exit(1)
+            self.fail_msg('exiting. instance.afi must be set prior to calling instance.add_afi()')
         if len(self.prefix_lists) == 0:
-            self.task_log.error('exiting. Call add_prefix_list at least once before calling instance.add_afi()')
-            exit(1)
+            self.fail_msg('exiting. Call add_prefix_list at least once before calling instance.add_afi()')
         for prefix_list in self.prefix_lists:
             for prefix_list_entry in prefix_list['entries']:
                 if 'eq' in prefix_list_entry:
@@ -407,11 +397,9 @@ class NxosPrefixLists(Task):
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if len(self.config) == 0:
-            self.task_log.error('exiting. call instance.add_afi() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_afi() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -465,67 +453,17 @@ class NxosPrefixLists(Task):
         self.fail(source_class, source_method, x, parameter, expectation)
 
 
-    @property
-    def action(self):
-        return self.properties['action']
-    @action.setter
-    def action(self, x):
-        parameter = 'action'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_prefix_lists_action(x, parameter)
-        self.properties[parameter] = x
+    action = TaskProperty('verify_nxos_prefix_lists_action')
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_prefix_lists_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_prefix_lists_afi')
 
-    @property
-    def description(self):
-        return self.properties['description']
-    @description.setter
-    def description(self, x):
-        parameter = 'description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    description = TaskProperty()
 
-    @property
-    def eq(self):
-        return self.properties['eq']
-    @eq.setter
-    def eq(self, x):
-        parameter = 'eq'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    eq = TaskProperty()
 
-    @property
-    def ge(self):
-        return self.properties['ge']
-    @ge.setter
-    def ge(self, x):
-        parameter = 'ge'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    ge = TaskProperty()
 
-    @property
-    def le(self):
-        return self.properties['le']
-    @le.setter
-    def le(self, x):
-        parameter = 'le'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    le = TaskProperty()
 
     @property
     def mask(self):
@@ -538,44 +476,10 @@ class NxosPrefixLists(Task):
         # TODO add verification
         self.properties[parameter] = x
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    name = TaskProperty()
 
-    @property
-    def prefix(self):
-        return self.properties['prefix']
-    @prefix.setter
-    def prefix(self, x):
-        parameter = 'prefix'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_prefix_lists_prefix(x, parameter)
-        self.properties[parameter] = x
+    prefix = TaskProperty('verify_nxos_prefix_lists_prefix')
 
-    @property
-    def sequence(self):
-        return self.properties['sequence']
-    @sequence.setter
-    def sequence(self, x):
-        parameter = 'sequence'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    sequence = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_prefix_lists_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_prefix_lists_state')
@@ -1,7 +1,7 @@
 # NxosReboot() - cisco/nxos/nxos_reboot.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosReboot()
@@ -62,6 +62,9 @@ class NxosReboot(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('confirm')
 
@@ -70,18 +73,13 @@ class NxosReboot(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.confirm == None:
-            self.task_log.error('exiting. set instance.confirm prior to calling instance.commit()')
-            exit(11)
+            self.fail_msg('exiting. set instance.confirm prior to calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -100,13 +98,4 @@ class NxosReboot(Task):
         if self.task_name != None:
             self.ansible_task['name'] = self.task_name
 
-    @property
-    def confirm(self):
-        return self.properties['confirm']
-    @confirm.setter
-    def confirm(self, x):
-        parameter = 'confirm'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
+    confirm = TaskProperty('verify_boolean')
@@ -1,7 +1,7 @@
 # NxosSnmpCommunity() - cisco/nxos/nxos_snmp_community.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosSnmpCommunity()
@@ -99,6 +99,9 @@ class NxosSnmpCommunity(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('access')
         self.properties_set.add('acl')
@@ -119,24 +122,17 @@ class NxosSnmpCommunity(Task):
         self.nxos_snmp_community_valid_access.add('ro')
         self.nxos_snmp_community_valid_access.add('rw')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.access == None:
-            self.task_log.error('exiting. Set instance.access to ro or rw before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.access to ro or rw before calling instance.commit()')
         if self.community == None:
-            self.task_log.error('exiting. Set instance.community before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.community before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -174,54 +170,12 @@ class NxosSnmpCommunity(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def access(self):
-        return self.properties['access']
-    @access.setter
-    def access(self, x):
-        parameter = 'access'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_community_access(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def acl(self):
-        return self.properties['acl']
-    @acl.setter
-    def acl(self, x):
-        parameter = 'acl'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def community(self):
-        return self.properties['community']
-    @community.setter
-    def community(self, x):
-        parameter = 'community'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def group(self):
-        return self.properties['group']
-    @group.setter
-    def group(self, x):
-        parameter = 'group'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_community_state(x, parameter)
-        self.properties[parameter] = x
+    access = TaskProperty('verify_nxos_snmp_community_access')
+
+    acl = TaskProperty()
+
+    community = TaskProperty()
+
+    group = TaskProperty()
+
+    state = TaskProperty('verify_nxos_snmp_community_state')
@@ -1,7 +1,7 @@
 # NxosSnmpContact() - cisco/nxos/nxos_snmp_contact.py
 our_version = 109
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosSnmpContact()
@@ -69,6 +69,9 @@ class NxosSnmpContact(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('contact')
         self.properties_set.add('state')
@@ -82,21 +85,15 @@ class NxosSnmpContact(Task):
         self.nxos_snmp_contact_valid_state.add('absent')
         self.nxos_snmp_contact_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.contact == None:
-            self.task_log.error('exiting. Set instance.contact before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.contact before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
         if self.task_name == None:
             self.task_name = 'NxosSnmpContact {}'.format(self.contact)
 
@@ -127,23 +124,6 @@ class NxosSnmpContact(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def contact(self):
-        return self.properties['contact']
-    @contact.setter
-    def contact(self, x):
-        parameter = 'contact'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_contact_state(x, parameter)
-        self.properties[parameter] = x
+    contact = TaskProperty()
+
+    state = TaskProperty('verify_nxos_snmp_contact_state')
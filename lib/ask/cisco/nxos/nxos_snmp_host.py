@@ -1,7 +1,7 @@
 # NxosSnmpHost() - cisco/nxos/nxos_snmp_host.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosSnmpHost()
@@ -158,6 +158,9 @@ class NxosSnmpHost(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_snmp_host_valid_state = set()
         self.nxos_snmp_host_valid_state.add('present')
         self.nxos_snmp_host_valid_state.add('absent')
@@ -193,24 +196,17 @@ class NxosSnmpHost(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.community == None:
-            self.task_log.error('exiting. Set instance.community before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.community before calling instance.commit()')
         if self.snmp_host == None:
-            self.task_log.error('exiting. Set instance.snmp_host before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.snmp_host before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
         if self.task_name == None:
             self.task_name = 'NxosSnmpHost {}'.format(self.snmp_host)
 
@@ -302,119 +298,24 @@ class NxosSnmpHost(Task):
         expectation = ','.join(sorted(verify_set))
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def community(self):
-        return self.properties['community']
-    @community.setter
-    def community(self, x):
-        parameter = 'community'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def snmp_host(self):
-        return self.properties['snmp_host']
-    @snmp_host.setter
-    def snmp_host(self, x):
-        parameter = 'snmp_host'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_snmp_host(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def snmp_type(self):
-        return self.properties['snmp_type']
-    @snmp_type.setter
-    def snmp_type(self, x):
-        parameter = 'snmp_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_snmp_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def src_intf(self):
-        return self.properties['src_intf']
-    @src_intf.setter
-    def src_intf(self, x):
-        parameter = 'src_intf'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_src_intf(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def task_name(self):
-        return self.properties['task_name']
-    @task_name.setter
-    def task_name(self, x):
-        parameter = 'task_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def udp(self):
-        return self.properties['udp']
-    @udp.setter
-    def udp(self, x):
-        parameter = 'udp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_udp(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def v3(self):
-        return self.properties['v3']
-    @v3.setter
-    def v3(self, x):
-        parameter = 'v3'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_v3(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def version(self):
-        return self.properties['version']
-    @version.setter
-    def version(self, x):
-        parameter = 'version'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_host_version(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def vrf_filter(self):
-        return self.properties['vrf_filter']
-    @vrf_filter.setter
-    def vrf_filter(self, x):
-        parameter = 'vrf_filter'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    community = TaskProperty()
+
+    snmp_host = TaskProperty('verify_nxos_snmp_host_snmp_host')
+
+    snmp_type = TaskProperty('verify_nxos_snmp_host_snmp_type')
+
+    src_intf = TaskProperty('verify_nxos_snmp_host_src_intf')
+
+    state = TaskProperty('verify_nxos_snmp_host_state')
+
+    task_name = TaskProperty()
+
+    udp = TaskProperty('verify_nxos_snmp_host_udp')
+
+    v3 = TaskProperty('verify_nxos_snmp_host_v3')
+
+    version = TaskProperty('verify_nxos_snmp_host_version')
+
+    vrf = TaskProperty()
+
+    vrf_filter = TaskProperty()
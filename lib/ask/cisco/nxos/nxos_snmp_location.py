@@ -1,7 +1,7 @@
 # NxosSnmpLocation() - cisco/nxos/nxos_snmp_location.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosSnmpLocation()
@@ -70,6 +70,9 @@ class NxosSnmpLocation(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('location')
         self.properties_set.add('state')
@@ -83,21 +86,15 @@ class NxosSnmpLocation(Task):
         self.nxos_snmp_location_valid_state.add('present')
         self.nxos_snmp_location_valid_state.add('absent')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.location == None:
-            self.task_log.error('exiting. Set instance.location before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.location before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -126,23 +123,6 @@ class NxosSnmpLocation(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def location(self):
-        return self.properties['location']
-    @location.setter
-    def location(self, x):
-        parameter = 'location'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_snmp_location_state(x, parameter)
-        self.properties[parameter] = x
+    location = TaskProperty()
+
+    state = TaskProperty('verify_nxos_snmp_location_state')
@@ -1,7 +1,7 @@
 # NxosStaticRoutes() - cisco/nxos/nxos_static_routes.py
-our_version = 105
+our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosStaticRoutes()
@@ -185,6 +185,15 @@ class NxosStaticRoutes(Task):
         self.ipv4_routes = dict()
         self.ipv6_routes = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
+        # InterfaceName().kind accepted by verify_nxos_static_routes_interface()
+        self.nxos_static_routes_interface_kinds = set()
+        self.nxos_static_routes_interface_kinds.add('ethernet')
+        self.nxos_static_routes_interface_kinds.add('port_channel')
+        self.nxos_static_routes_interface_kinds.add('vlan')
+
         self.address_family_set = set()
         self.address_family_set.add('afi')
 
@@ -239,8 +248,6 @@ class NxosStaticRoutes(Task):
         self.nxos_static_routes_track_min = 1
         self.nxos_static_routes_track_max = 512
 
-        self.init_properties()
-
     def init_properties_address_family(self):
         for p in self.address_family_set:
             self.properties[p] = None
@@ -254,7 +261,7 @@ class NxosStaticRoutes(Task):
             self.properties[p] = None
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['vrf'] = None
         self.properties['state'] = None
         self.init_properties_address_family()
@@ -263,20 +270,16 @@ class NxosStaticRoutes(Task):
 
     def verify_next_hop(self):
         if self.afi == None:
-            self.task_log.error('exiting. instance.afi must be set prior to calling instance.add_next_hop()')
-            exit(1)
+            self.fail_msg('exiting. instance.afi must be set prior to calling instance.add_next_hop()')
         if self.dest == None:
-            self.task_log.error('exiting. instance.dest must be set prior to calling instance.add_next_hop()')
-            exit(1)
+            self.fail_msg('exiting. instance.dest must be set prior to calling instance.add_next_hop()')
         # TODO: Per RFC5549 ipv4 AFI can use ipv6 destination for next-hop and vice-versa
         # As of 9.3(6), NXOS does not support static routes with other AFI as next-hop
         # But, if it ever does, these checks will need to be removed. 
         if self.afi == 'ipv4' and not self.is_ipv4_address_with_prefix(self.dest):
-            self.task_log.error('exiting. instance.afi {} does not match dest {}'.format(self.afi, self.dest))
-            exit(1)
+            self.fail_msg('exiting. instance.afi {} does not match dest {}'.format(self.afi, self.dest))
         if self.afi == 'ipv6' and not self.is_ipv6_interface(self.dest):
-            self.task_log.error('exiting. instance.afi {} does not match dest {}'.format(self.afi, self.dest))
-            exit(1)
+            self.fail_msg('exiting. instance.afi {} does not match dest {}'.format(self.afi, self.dest))
 
     def add_next_hop_ipv4(self, nh):
         if self.dest not in self.ipv4_routes:
@@ -311,8 +314,7 @@ class NxosStaticRoutes(Task):
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -401,17 +403,11 @@ class NxosStaticRoutes(Task):
     def verify_nxos_static_routes_interface(self, x, parameter='interface'):
         if x == 'Null0':
             return
-        if self.is_ethernet_interface(x):
-            return
-        if self.is_ethernet_subinterface(x):
-            return
-        if self.is_port_channel_interface(x):
-            return
-        if self.is_vlan_interface(x):
+        if self.is_interface_kind(x, self.nxos_static_routes_interface_kinds):
             return
         source_class = self.class_name
         source_method = 'verify_nxos_pim_interface_interface'
-        expectation = ','.join(self.valid_ip_pim_interface)
+        expectation = ','.join(sorted(self.valid_ip_pim_interface))
         self.fail(source_class, source_method, x, parameter, expectation)
 
     def verify_nxos_static_routes_state(self, x, parameter='state'):
@@ -438,27 +434,9 @@ class NxosStaticRoutes(Task):
         range_max = self.nxos_static_routes_track_max
         self.verify_integer_range(x, range_min, range_max, source_class, source_method)
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_afi(x, parameter)
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_static_routes_afi')
 
-    @property
-    def dest(self):
-        return self.properties['dest']
-    @dest.setter
-    def dest(self, x):
-        parameter = 'dest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_dest(x, parameter)
-        self.properties[parameter] = x
+    dest = TaskProperty('verify_nxos_static_routes_dest')
 
     @property
     def admin_distance(self):
@@ -471,87 +449,18 @@ class NxosStaticRoutes(Task):
         self.verify_nxos_static_routes_admin_distance(x)
         self.properties[parameter] = x
 
-    @property
-    def dest_vrf(self):
-        return self.properties['dest_vrf']
-    @dest_vrf.setter
-    def dest_vrf(self, x):
-        parameter = 'dest_vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    dest_vrf = TaskProperty()
 
-    @property
-    def forward_router_address(self):
-        return self.properties['forward_router_address']
-    @forward_router_address.setter
-    def forward_router_address(self, x):
-        parameter = 'forward_router_address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_forward_router_address(x, parameter)
-        self.properties[parameter] = x
+    forward_router_address = TaskProperty('verify_nxos_static_routes_forward_router_address')
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_interface(x, parameter)
-        self.properties[parameter] = x
+    interface = TaskProperty('verify_nxos_static_routes_interface')
 
-    @property
-    def route_name(self):
-        return self.properties['route_name']
-    @route_name.setter
-    def route_name(self, x):
-        parameter = 'route_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    route_name = TaskProperty()
 
-    @property
-    def tag(self):
-        return self.properties['tag']
-    @tag.setter
-    def tag(self, x):
-        parameter = 'tag'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_tag(x, parameter)
-        self.properties[parameter] = x
+    tag = TaskProperty('verify_nxos_static_routes_tag')
 
-    @property
-    def track(self):
-        return self.properties['track']
-    @track.setter
-    def track(self, x):
-        parameter = 'track'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_track(x, parameter)
-        self.properties[parameter] = x
+    track = TaskProperty('verify_nxos_static_routes_track')
 
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    vrf = TaskProperty()
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_static_routes_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_static_routes_state')
@@ -1,7 +1,7 @@
 # NxosSystem() - cisco/nxos/nxos_system.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosSystem()
@@ -155,6 +155,9 @@ class NxosSystem(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.system_mtu_min = 1500
         self.system_mtu_max = 9216
 
@@ -175,19 +178,14 @@ class NxosSystem(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['state'] = None
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
         # Ensure at least one property is configured by the user or that state == absent
         for p in self.properties_set:
@@ -196,8 +194,7 @@ class NxosSystem(Task):
         if self.state == 'absent':
             return
         self.task_log.error('exiting. No properties have been set.') 
-        self.task_log.error('Set at least one property, or set state = "absent"')
-        exit(1)
+        self.fail_msg('Set at least one property, or set state = "absent"')
 
     def commit(self):
         self.update()
@@ -271,8 +268,7 @@ class NxosSystem(Task):
                 vrf = d['vrf']
             except:
                 self.task_log.error('exiting. Expected server and vrf keys in name_servers dict()')
-                self.task_log.error('Got {}'.format(d))
-                exit(1)
+                self.fail_msg('Got {}'.format(d))
     def verify_nxos_system_name_servers(self, x, parameter='name_servers'):
         if x == 'default':
             return
@@ -286,77 +282,16 @@ class NxosSystem(Task):
         expectation = 'list() of str(), list() of dict(), or keyword: default.'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def domain_lookup(self):
-        return self.properties['domain_lookup']
-    @domain_lookup.setter
-    def domain_lookup(self, x):
-        parameter = 'domain_lookup'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def domain_name(self):
-        return self.properties['domain_name']
-    @domain_name.setter
-    def domain_name(self, x):
-        parameter = 'domain_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def domain_search(self):
-        return self.properties['domain_search']
-    @domain_search.setter
-    def domain_search(self, x):
-        parameter = 'domain_search'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_system_domain_search(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def hostname(self):
-        return self.properties['hostname']
-    @hostname.setter
-    def hostname(self, x):
-        parameter = 'hostname'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def name_servers(self):
-        return self.properties['name_servers']
-    @name_servers.setter
-    def name_servers(self, x):
-        parameter = 'name_servers'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_system_name_servers(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_system_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_mtu(self):
-        return self.properties['system_mtu']
-    @system_mtu.setter
-    def system_mtu(self, x):
-        parameter = 'system_mtu'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_system_mtu(x, parameter)
-        self.properties[parameter] = str(x)
+    domain_lookup = TaskProperty('verify_boolean')
+
+    domain_name = TaskProperty()
+
+    domain_search = TaskProperty('verify_nxos_system_domain_search')
+
+    hostname = TaskProperty()
+
+    name_servers = TaskProperty('verify_nxos_system_name_servers')
+
+    state = TaskProperty('verify_nxos_system_state')
+
+    system_mtu = TaskProperty('verify_nxos_system_mtu', to_str=True)
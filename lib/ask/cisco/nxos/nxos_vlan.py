@@ -1,7 +1,7 @@
 # NxosVlan() - cisco/nxos/nxos_vlan.py
 our_version = 110
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 =========================
 NxosVlan() - nxos_vlan.py
@@ -98,16 +98,19 @@ class NxosVlan(Task):
         self.class_name = __class__.__name__
         self.aggregate_list = list() # updated in add_vlan()
         self.ansible_task = dict()
-
-        self._min_vlan_id = 2
-        self._max_vlan_id = 3967
-        self._min_vni = 1
-        self._max_vni = 16777214
         self._valid_admin_state = ['up', 'down']
         self._valid_associated_interfaces = ['Ethernet', 'port-channel', 'Vlan']
         self._valid_interfaces = ['Ethernet', 'port-channel', 'default']
         self._valid_mode = ['ce', 'fabricpath']
         self._valid_vlan_state = ['active', 'suspend']
+
+        self.init_properties()
+
+    def init_schema(self):
+        self._min_vlan_id = 2
+        self._max_vlan_id = 3967
+        self._min_vni = 1
+        self._max_vni = 16777214
         self.nxos_vlan_valid_state = set()
         self.nxos_vlan_valid_state.add('present')
         self.nxos_vlan_valid_state.add('absent')
@@ -131,18 +134,13 @@ class NxosVlan(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -237,27 +235,9 @@ class NxosVlan(Task):
     def verify_mapped_vni(self, x, parameter='mapped_vni'):
         self.verify_integer_range(x, self._min_vni, self._max_vni, self.class_name, 'verify_mapped_vni')
 
-    @property
-    def admin_state(self):
-        return self.properties['admin_state']
-    @admin_state.setter
-    def admin_state(self, x):
-        parameter = 'admin_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_admin_state(x, parameter)
-        self.properties[parameter] = x
+    admin_state = TaskProperty('verify_admin_state')
 
-    @property
-    def associated_interfaces(self):
-        return self.properties['associated_interfaces']
-    @associated_interfaces.setter
-    def associated_interfaces(self, x):
-        parameter = 'associated_interfaces'
-        if self.set_none(x, parameter):
-            return
-        self.verify_associated_interfaces(x, parameter)
-        self.properties[parameter] = x
+    associated_interfaces = TaskProperty('verify_associated_interfaces')
 
     @property
     def delay(self):
@@ -274,38 +254,11 @@ class NxosVlan(Task):
             self.fail(source_class, source_method, x, parameter, expectation)
         self.properties[parameter] = x
 
-    @property
-    def interfaces(self):
-        return self.properties['interfaces']
-    @interfaces.setter
-    def interfaces(self, x):
-        parameter = 'interfaces'
-        if self.set_none(x, parameter):
-            return
-        self.verify_interfaces(x, parameter)
-        self.properties[parameter] = x
+    interfaces = TaskProperty('verify_interfaces')
 
-    @property
-    def mapped_vni(self):
-        return self.properties['mapped_vni']
-    @mapped_vni.setter
-    def mapped_vni(self, x):
-        parameter = 'mapped_vni'
-        if self.set_none(x, parameter):
-            return
-        self.verify_mapped_vni(x, parameter)
-        self.properties[parameter] = x
+    mapped_vni = TaskProperty('verify_mapped_vni')
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_mode')
 
     @property
     def name(self):
@@ -317,27 +270,9 @@ class NxosVlan(Task):
             return
         self.properties[parameter] = self.spaces_to_underscore(x)
 
-    @property
-    def purge(self):
-        return self.properties['purge']
-    @purge.setter
-    def purge(self, x):
-        parameter = 'purge'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    purge = TaskProperty('verify_toggle')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vlan_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_vlan_state')
 
     @property
     def vlan_id(self):
@@ -351,25 +286,7 @@ class NxosVlan(Task):
         self.verify_vlan(x, expectation, parameter)
         self.properties[parameter] = x
 
-    @property
-    def vlan_range(self):
-        return self.properties['vlan_range']
-    @vlan_range.setter
-    def vlan_range(self, x):
-        parameter = 'vlan_range'
-        if self.set_none(x, parameter):
-            return
-        self.verify_vlan_list(x, parameter)
-        self.properties[parameter] = x
+    vlan_range = TaskProperty('verify_vlan_list')
 
-    @property
-    def vlan_state(self):
-        return self.properties['vlan_state']
-    @vlan_state.setter
-    def vlan_state(self, x):
-        parameter = 'vlan_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_vlan_state(x, parameter)
-        self.properties[parameter] = x
+    vlan_state = TaskProperty('verify_vlan_state')
 
@@ -1,7 +1,7 @@
 # NxosVlans() - cisco/nxos/nxos_vlans.py
 our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosVlans()
@@ -175,6 +175,9 @@ class NxosVlans(Task):
         self.class_name = __class__.__name__
         self.vlan_list = list() # appended to in add_vlan()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.valid_mode = set()
         self.valid_mode.add('ce')
         self.valid_mode.add('fabricpath')
@@ -211,20 +214,15 @@ class NxosVlans(Task):
         self.property_map = dict()
         self.property_map['vlan_state'] = 'state'
 
-        self.init_properties()
-
 
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['state'] = None
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -271,8 +269,7 @@ class NxosVlans(Task):
 
     def add_vlan_verification(self):
         if self.vlan_id == None:
-            self.task_log.error('exiting. call instance.vlan_id before calling instance.add_vlan()')
-            exit(1)
+            self.fail_msg('exiting. call instance.vlan_id before calling instance.add_vlan()')
     def add_vlan(self):
         self.add_vlan_verification()
         d = dict()
@@ -307,48 +304,14 @@ class NxosVlans(Task):
         self.verify_integer_range(x, self.vni_min, self.vni_max, parameter, parameter)
         self.properties[parameter] = x
 
-    @property
-    def mode(self):
-        return self.properties['mode']
-    @mode.setter
-    def mode(self, x):
-        parameter = 'mode'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vlans_mode(x, parameter)
-        self.properties[parameter] = x
+    mode = TaskProperty('verify_nxos_vlans_mode')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    name = TaskProperty()
 
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vlans_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_vlans_state')
 
-    @property
-    def task_name(self):
-        return self.properties['task_name']
-    @task_name.setter
-    def task_name(self, x):
-        parameter = 'task_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    task_name = TaskProperty()
 
     @property
     def vlan_id(self):
@@ -362,14 +325,5 @@ class NxosVlans(Task):
         self.verify_vlan(x, expectation, parameter)
         self.properties[parameter] = x
 
-    @property
-    def vlan_state(self):
-        return self.properties['vlan_state']
-    @vlan_state.setter
-    def vlan_state(self, x):
-        parameter = 'vlan_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vlans_vlan_state(x, parameter)
-        self.properties[parameter] = x
+    vlan_state = TaskProperty('verify_nxos_vlans_vlan_state')
 
@@ -1,7 +1,7 @@
 # NxosVpc() - cisco/nxos/nxos_vpc.py
 our_version = 110
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************************
 NxosVpc() - nxos_vpc.py
@@ -182,6 +182,9 @@ class NxosVpc(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.auto_recovery_reload_delay_min = 60
         self.auto_recovery_reload_delay_max = 3600
 
@@ -227,21 +230,15 @@ class NxosVpc(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.domain == None:
-            self.task_log.error('exiting. call instance.domain before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.domain before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -311,144 +308,28 @@ class NxosVpc(Task):
         expectation = ','.join(self.verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def auto_recovery(self):
-        return self.properties['auto_recovery']
-    @auto_recovery.setter
-    def auto_recovery(self, x):
-        parameter = 'auto_recovery'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def auto_recovery_reload_delay(self):
-        return self.properties['auto_recovery_reload_delay']
-    @auto_recovery_reload_delay.setter
-    def auto_recovery_reload_delay(self, x):
-        parameter = 'auto_recovery_reload_delay'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_auto_recovery_reload_delay(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def delay_restore(self):
-        return self.properties['delay_restore']
-    @delay_restore.setter
-    def delay_restore(self, x):
-        parameter = 'delay_restore'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_delay_restore(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def delay_restore_interface_vlan(self):
-        return self.properties['delay_restore_interface_vlan']
-    @delay_restore_interface_vlan.setter
-    def delay_restore_interface_vlan(self, x):
-        parameter = 'delay_restore_interface_vlan'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_delay_restore_interface_vlan(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def delay_restore_orphan_port(self):
-        return self.properties['delay_restore_orphan_port']
-    @delay_restore_orphan_port.setter
-    def delay_restore_orphan_port(self, x):
-        parameter = 'delay_restore_orphan_port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_delay_restore_orphan_port(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def domain(self):
-        return self.properties['domain']
-    @domain.setter
-    def domain(self, x):
-        parameter = 'domain'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_domain(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def peer_gw(self):
-        return self.properties['peer_gw']
-    @peer_gw.setter
-    def peer_gw(self, x):
-        parameter = 'peer_gw'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def pkl_dest(self):
-        return self.properties['pkl_dest']
-    @pkl_dest.setter
-    def pkl_dest(self, x):
-        parameter = 'pkl_dest'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_ipv6(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def pkl_src(self):
-        return self.properties['pkl_src']
-    @pkl_src.setter
-    def pkl_src(self, x):
-        parameter = 'pkl_src'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_ipv6(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def pkl_vrf(self):
-        return self.properties['pkl_vrf']
-    @pkl_vrf.setter
-    def pkl_vrf(self, x):
-        parameter = 'pkl_vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def role_priority(self):
-        return self.properties['role_priority']
-    @role_priority.setter
-    def role_priority(self, x):
-        parameter = 'role_priority'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_role_priority(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def system_priority(self):
-        return self.properties['system_priority']
-    @system_priority.setter
-    def system_priority(self, x):
-        parameter = 'system_priority'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_system_priority(x, parameter)
-        self.properties[parameter] = str(x)
+    auto_recovery = TaskProperty('verify_boolean')
+
+    auto_recovery_reload_delay = TaskProperty('verify_nxos_vpc_auto_recovery_reload_delay', to_str=True)
+
+    delay_restore = TaskProperty('verify_nxos_vpc_delay_restore', to_str=True)
+
+    delay_restore_interface_vlan = TaskProperty('verify_nxos_vpc_delay_restore_interface_vlan', to_str=True)
+
+    delay_restore_orphan_port = TaskProperty('verify_nxos_vpc_delay_restore_orphan_port', to_str=True)
+
+    domain = TaskProperty('verify_nxos_vpc_domain', to_str=True)
+
+    peer_gw = TaskProperty('verify_boolean')
+
+    pkl_dest = TaskProperty('verify_ipv4_ipv6')
+
+    pkl_src = TaskProperty('verify_ipv4_ipv6')
+
+    pkl_vrf = TaskProperty()
+
+    role_priority = TaskProperty('verify_nxos_vpc_role_priority', to_str=True)
+
+    state = TaskProperty('verify_nxos_vpc_state')
+
+    system_priority = TaskProperty('verify_nxos_vpc_system_priority', to_str=True)
@@ -1,7 +1,7 @@
 # NxosVpcInterface() - cisco/nxos/nxos_vpc_interface.py
 our_version = 109
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosVpcInterface()
@@ -95,14 +95,17 @@ class NxosVpcInterface(Task):
         self._version = our_version
         self.class_name = __class__.__name__
 
+        self.nxos_vpc_interface_valid_state = ['present', 'absent']
+
+        self.init_properties()
+
+    def init_schema(self):
         self.portchannel_min = 1
         self.portchannel_max = 4096
 
         self.vpc_min = 1
         self.vpc_max = 4096
 
-        self.nxos_vpc_interface_valid_state = ['present', 'absent']
-
         self.properties_set = set()
         self.properties_set.add('peer_link')
         self.properties_set.add('portchannel')
@@ -114,21 +117,15 @@ class NxosVpcInterface(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.portchannel == None:
-            self.task_log.error('exiting. call instance.portchannel before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.portchannel before calling instance.commit()')
         if self.peer_link != None and self.vpc != None:
-            self.task_log.error('exiting. instance.peer_link ({}) and instance.vpc ({}) are mutually exclusive. Unset one or the other.'.format(self.peer_link, self.vpc))
-            exit(1)
+            self.fail_msg('exiting. instance.peer_link ({}) and instance.vpc ({}) are mutually exclusive. Unset one or the other.'.format(self.peer_link, self.vpc))
 
     def commit(self):
         self.update()
@@ -168,46 +165,10 @@ class NxosVpcInterface(Task):
         range_max = self.vpc_max
         self.verify_integer_range(x, range_min, range_max, source_class, parameter)
 
-    @property
-    def peer_link(self):
-        return self.properties['peer_link']
-    @peer_link.setter
-    def peer_link(self, x):
-        parameter = 'peer_link'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def portchannel(self):
-        return self.properties['portchannel']
-    @portchannel.setter
-    def portchannel(self, x):
-        parameter = 'portchannel'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_interface_port_channel(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_interface_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vpc(self):
-        return self.properties['vpc']
-    @vpc.setter
-    def vpc(self, x):
-        parameter = 'vpc'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vpc_interface_vpc(x, parameter)
-        self.properties[parameter] = x
+    peer_link = TaskProperty('verify_boolean')
+
+    portchannel = TaskProperty('verify_nxos_vpc_interface_port_channel')
+
+    state = TaskProperty('verify_nxos_vpc_interface_state')
+
+    vpc = TaskProperty('verify_nxos_vpc_interface_vpc')
@@ -1,9 +1,9 @@
 # NxosVrf() - cisco/nxos/nxos_vrf.py
-our_version = 106
+our_version = 107
 from copy import deepcopy
 import ipaddress
 import re
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 NxosVrf()
@@ -211,10 +211,20 @@ class NxosVrf(Task):
         self.class_name = __class__.__name__
         self.aggregate_list = list() # updated in add_vrf()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_vrf_valid_state = set()
         self.nxos_vrf_valid_state.add('present')
         self.nxos_vrf_valid_state.add('absent')
 
+        # InterfaceName().kind accepted by verify_nxos_vrf_interfaces()
+        self.nxos_vrf_interface_kinds = set()
+        self.nxos_vrf_interface_kinds.add('ethernet')
+        self.nxos_vrf_interface_kinds.add('management')
+        self.nxos_vrf_interface_kinds.add('port_channel')
+        self.nxos_vrf_interface_kinds.add('vlan')
+
         self.properties_set = set()
         self.properties_set.add('associated_interfaces')
         self.properties_set.add('delay')
@@ -248,21 +258,15 @@ class NxosVrf(Task):
         self.property_map['state'] = 'state'
         self.property_map['vni'] = 'vni'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -311,15 +315,7 @@ class NxosVrf(Task):
         interfaces_ok = True
         if type(x) == type(list()):
             for interface in x:
-                if self.is_ethernet_interface(interface):
-                    continue
-                if self.is_ethernet_subinterface(interface):
-                    continue
-                if self.is_port_channel_interface(interface):
-                    continue
-                if self.is_vlan_interface(interface):
-                    continue
-                if self.is_management_interface(interface):
+                if self.is_interface_kind(interface, self.nxos_vrf_interface_kinds):
                     continue
                 interfaces_ok = False
             if interfaces_ok == True:
@@ -426,89 +422,18 @@ class NxosVrf(Task):
         expectation = 'digits, or keyword: default'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def associated_interfaces(self):
-        return self.properties['associated_interfaces']
-    @associated_interfaces.setter
-    def associated_interfaces(self, x):
-        parameter = 'associated_interfaces'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_interfaces(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def delay(self):
-        return self.properties['delay']
-    @delay.setter
-    def delay(self, x):
-        parameter = 'delay'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_delay(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def interfaces(self):
-        return self.properties['interfaces']
-    @interfaces.setter
-    def interfaces(self, x):
-        parameter = 'interfaces'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_interfaces(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def purge(self):
-        return self.properties['purge']
-    @purge.setter
-    def purge(self, x):
-        parameter = 'purge'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def rd(self):
-        return self.properties['rd']
-    @rd.setter
-    def rd(self, x):
-        parameter = 'rd'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_rd(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vni(self):
-        return self.properties['vni']
-    @vni.setter
-    def vni(self, x):
-        parameter = 'vni'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_vni(x, parameter)
-        self.properties[parameter] = x
+    associated_interfaces = TaskProperty('verify_nxos_vrf_interfaces')
+
+    delay = TaskProperty('verify_nxos_vrf_delay')
+
+    interfaces = TaskProperty('verify_nxos_vrf_interfaces')
+
+    name = TaskProperty()
+
+    purge = TaskProperty('verify_boolean')
+
+    rd = TaskProperty('verify_nxos_vrf_rd')
+
+    state = TaskProperty('verify_nxos_vrf_state')
+
+    vni = TaskProperty('verify_nxos_vrf_vni')
@@ -1,7 +1,7 @@
 # NxosVrfAf() - cisco/nxos/nxos_vrf_af.py
-our_version = 101
+our_version = 102
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 NxosVrfAf()
@@ -144,6 +144,9 @@ class NxosVrfAf(Task):
 
         self.route_targets = list() # updated in add_rt()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_vrf_af_valid_afi = set()
         self.nxos_vrf_af_valid_afi.add('ipv4')
         self.nxos_vrf_af_valid_afi.add('ipv6')
@@ -198,27 +201,19 @@ class NxosVrfAf(Task):
         self.property_map['state'] = 'state'
         self.property_map['vrf'] = 'vrf'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.afi == None:
-            self.task_log.error('exiting. call instance.afi before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.afi before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.vrf == None:
-            self.task_log.error('exiting. call instance.vrf before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.vrf before calling instance.commit()')
         if len(self.route_targets) == 0:
-            self.task_log.error('exiting. call instance.add_rt() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_rt() at least once before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -241,12 +236,10 @@ class NxosVrfAf(Task):
             self.ansible_task['name'] = self.task_name
 
     def init_rt(self):
-        for p in self.properties_rt:
-            self.properties[p] = None
+        self.reset(self.properties_rt)
     def verify_rt(self):
         if self.rt == None:
-            self.task_log.error('exiting. call instance.rt before calling instance.add_rt()')
-            exit(1)
+            self.fail_msg('exiting. call instance.rt before calling instance.add_rt()')
     def add_rt(self):
         self.verify_rt()
         d = dict()
@@ -293,77 +286,16 @@ class NxosVrfAf(Task):
         expectation = ','.join(sorted(verify_set))
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def afi(self):
-        return self.properties['afi']
-    @afi.setter
-    def afi(self, x):
-        parameter = 'afi'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_af_afi(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def rt_direction(self):
-        return self.properties['rt_direction']
-    @rt_direction.setter
-    def rt_direction(self, x):
-        parameter = 'rt_direction'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_af_rt_direction(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def route_target_both_auto_evpn(self):
-        return self.properties['route_target_both_auto_evpn']
-    @route_target_both_auto_evpn.setter
-    def route_target_both_auto_evpn(self, x):
-        parameter = 'route_target_both_auto_evpn'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def rt(self):
-        return self.properties['rt']
-    @rt.setter
-    def rt(self, x):
-        parameter = 'rt'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def rt_state(self):
-        return self.properties['rt_state']
-    @rt_state.setter
-    def rt_state(self, x):
-        parameter = 'rt_state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_af_rt_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_af_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    afi = TaskProperty('verify_nxos_vrf_af_afi')
+
+    rt_direction = TaskProperty('verify_nxos_vrf_af_rt_direction')
+
+    route_target_both_auto_evpn = TaskProperty('verify_boolean')
+
+    rt = TaskProperty()
+
+    rt_state = TaskProperty('verify_nxos_vrf_af_rt_state')
+
+    state = TaskProperty('verify_nxos_vrf_af_state')
+
+    vrf = TaskProperty()
@@ -1,7 +1,7 @@
 # NxosVrfInterface() - cisco/nxos/nxos_vrf_interface.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 NxosVrfInterface()
@@ -73,6 +73,9 @@ class NxosVrfInterface(Task):
         self.ansible_task = dict()
         self.ansible_task[self.ansible_module] = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.nxos_vrf_interface_valid_state = set()
         self.nxos_vrf_interface_valid_state.add('present')
         self.nxos_vrf_interface_valid_state.add('absent')
@@ -98,24 +101,17 @@ class NxosVrfInterface(Task):
         self.property_map['state'] = 'state'
         self.property_map['vrf'] = 'vrf'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.interface == None:
-            self.task_log.error('exiting. call instance.interface before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.interface before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.vrf == None:
-            self.task_log.error('exiting. call instance.vrf before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.vrf before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -143,34 +139,8 @@ class NxosVrfInterface(Task):
         expectation = ','.join(sorted(verify_set))
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ip_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vrf_interface_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vrf(self):
-        return self.properties['vrf']
-    @vrf.setter
-    def vrf(self, x):
-        parameter = 'vrf'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    interface = TaskProperty('verify_ip_interface')
+
+    state = TaskProperty('verify_nxos_vrf_interface_state')
+
+    vrf = TaskProperty()
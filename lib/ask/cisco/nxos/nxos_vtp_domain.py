@@ -1,7 +1,7 @@
 # NxosVtpDomain() - cisco/nxos/nxos_vtp_domain.py
 our_version = 100
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosVtpDomain()
@@ -86,6 +86,9 @@ class NxosVtpDomain(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('domain')
 
@@ -97,19 +100,14 @@ class NxosVtpDomain(Task):
         self.mandatory_properties = set()
         self.mandatory_properties.add('domain')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         for p in self.mandatory_properties:
             if self.properties[p] == None:
-                self.task_log.error('exiting. instance.{} must be set before calling instance.commit()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. instance.{} must be set before calling instance.commit()'.format(p))
 
     def commit(self):
         self.update()
@@ -128,12 +126,4 @@ class NxosVtpDomain(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def domain(self):
-        return self.properties['domain']
-    @domain.setter
-    def domain(self, x):
-        parameter = 'domain'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    domain = TaskProperty()
@@ -1,7 +1,7 @@
 # NxosVtpPassword() - cisco/nxos/nxos_vtp_password.py
 our_version = 100
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosVtpPassword()
@@ -96,6 +96,9 @@ class NxosVtpPassword(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('vtp_password')
         self.properties_set.add('state')
@@ -112,12 +115,8 @@ class NxosVtpPassword(Task):
         self.nxos_vtp_password_valid_state.add('absent')
         self.nxos_vtp_password_valid_state.add('present')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def nxos_vtp_password_verify_state(self, x, parameter='state'):
@@ -132,11 +131,9 @@ class NxosVtpPassword(Task):
     def final_verification(self):
         for p in self.mandatory_properties:
             if self.properties[p] == None:
-                self.task_log.error('exiting. instance.{} must be set before calling instance.commit()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. instance.{} must be set before calling instance.commit()'.format(p))
         if self.state == 'present' and self.vtp_password == None:
-            self.task_log.error('exiting. instance.vtp_password must be set if instance.state == present')
-            exit(1)
+            self.fail_msg('exiting. instance.vtp_password must be set if instance.state == present')
 
     def commit(self):
         self.update()
@@ -155,23 +152,6 @@ class NxosVtpPassword(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_vtp_password_verify_state(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def vtp_password(self):
-        return self.properties['vtp_password']
-    @vtp_password.setter
-    def vtp_password(self, x):
-        parameter = 'vtp_password'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    state = TaskProperty('nxos_vtp_password_verify_state')
+
+    vtp_password = TaskProperty()
@@ -1,7 +1,7 @@
 # NxosVtpVersion() - cisco/nxos/nxos_vtp_version.py
 our_version = 100
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************
 NxosVtpVersion()
@@ -88,6 +88,9 @@ class NxosVtpVersion(Task):
         self.class_name = __class__.__name__
         self.ansible_task = dict()
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('version')
 
@@ -103,12 +106,8 @@ class NxosVtpVersion(Task):
         self.valid_vtp_version.add(1)
         self.valid_vtp_version.add(2)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def nxos_vtp_version_verify_version(self, x, parameter='version'):
@@ -123,8 +122,7 @@ class NxosVtpVersion(Task):
     def final_verification(self):
         for p in self.mandatory_properties:
             if self.properties[p] == None:
-                self.task_log.error('exiting. instance.{} must be set before calling instance.commit()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. instance.{} must be set before calling instance.commit()'.format(p))
 
     def commit(self):
         self.update()
@@ -143,13 +141,4 @@ class NxosVtpVersion(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def version(self):
-        return self.properties['version']
-    @version.setter
-    def version(self, x):
-        parameter = 'version'
-        if self.set_none(x, parameter):
-            return
-        self.nxos_vtp_version_verify_version(x, parameter)
-        self.properties[parameter] = x
+    version = TaskProperty('nxos_vtp_version_verify_version')
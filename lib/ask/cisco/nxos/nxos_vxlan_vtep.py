@@ -1,7 +1,7 @@
 # NxosVxlanVtep() - python/lib3/nxos_vxlan_vtep.py
 our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 NxosVxlanVtep() - nxos_vxlan_vtep.py
@@ -171,6 +171,9 @@ class NxosVxlanVtep(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.source_interface_hold_down_time_min = 1
         self.source_interface_hold_down_time_max = 1500
 
@@ -208,21 +211,15 @@ class NxosVxlanVtep(Task):
         for p in self.properties_set:
             self.property_map[p] = p
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.interface == None:
-            self.task_log.error('exiting. Set instance.interface before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.interface before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. Set instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. Set instance.state before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -293,134 +290,27 @@ class NxosVxlanVtep(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def description(self):
-        return self.properties['description']
-    @description.setter
-    def description(self, x):
-        parameter = 'description'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def global_ingress_replication_bgp(self):
-        return self.properties['global_ingress_replication_bgp']
-    @global_ingress_replication_bgp.setter
-    def global_ingress_replication_bgp(self, x):
-        parameter = 'global_ingress_replication_bgp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def global_mcast_group_L2(self):
-        return self.properties['global_mcast_group_L2']
-    @global_mcast_group_L2.setter
-    def global_mcast_group_L2(self, x):
-        parameter = 'global_mcast_group_L2'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_global_mcast_group_L2(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def global_mcast_group_L3(self):
-        return self.properties['global_mcast_group_L3']
-    @global_mcast_group_L3.setter
-    def global_mcast_group_L3(self, x):
-        parameter = 'global_mcast_group_L3'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_global_mcast_group_L3(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def global_suppress_arp(self):
-        return self.properties['global_suppress_arp']
-    @global_suppress_arp.setter
-    def global_suppress_arp(self, x):
-        parameter = 'global_suppress_arp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def host_reachability(self):
-        return self.properties['host_reachability']
-    @host_reachability.setter
-    def host_reachability(self, x):
-        parameter = 'host_reachability'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def multisite_border_gateway_interface(self):
-        return self.properties['multisite_border_gateway_interface']
-    @multisite_border_gateway_interface.setter
-    def multisite_border_gateway_interface(self, x):
-        parameter = 'multisite_border_gateway_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_multisite_border_gateway_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def shutdown(self):
-        return self.properties['shutdown']
-    @shutdown.setter
-    def shutdown(self, x):
-        parameter = 'shutdown'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def source_interface(self):
-        return self.properties['source_interface']
-    @source_interface.setter
-    def source_interface(self, x):
-        parameter = 'source_interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_source_interface(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def source_interface_hold_down_time(self):
-        return self.properties['source_interface_hold_down_time']
-    @source_interface_hold_down_time.setter
-    def source_interface_hold_down_time(self, x):
-        parameter = 'source_interface_hold_down_time'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_source_interface_hold_down_time(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_state(x, parameter)
-        self.properties[parameter] = x
+    description = TaskProperty()
+
+    global_ingress_replication_bgp = TaskProperty('verify_toggle')
+
+    global_mcast_group_L2 = TaskProperty('verify_nxos_vxlan_vtep_global_mcast_group_L2')
+
+    global_mcast_group_L3 = TaskProperty('verify_nxos_vxlan_vtep_global_mcast_group_L3')
+
+    global_suppress_arp = TaskProperty('verify_toggle')
+
+    host_reachability = TaskProperty('verify_toggle')
+
+    interface = TaskProperty('verify_nxos_vxlan_vtep_interface')
+
+    multisite_border_gateway_interface = TaskProperty('verify_nxos_vxlan_vtep_multisite_border_gateway_interface')
+
+    shutdown = TaskProperty('verify_toggle')
+
+    source_interface = TaskProperty('verify_nxos_vxlan_vtep_source_interface')
+
+    source_interface_hold_down_time = TaskProperty('verify_nxos_vxlan_vtep_source_interface_hold_down_time', to_str=True)
+
+    state = TaskProperty('verify_nxos_vxlan_vtep_state')
 
@@ -1,7 +1,7 @@
 # NxosVxlanVtepVni() - cisco/nxos/nxos_vxlan_vtep_vni.py
 our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 NxosVxlanVtepVni() - nxos_vxlan_vtep_vni.py
@@ -130,6 +130,9 @@ class NxosVxlanVtepVni(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.valid_nxos_vxlan_vtep_vni_state = set()
         self.valid_nxos_vxlan_vtep_vni_state.add('present')
         self.valid_nxos_vxlan_vtep_vni_state.add('absent')
@@ -181,26 +184,20 @@ class NxosVxlanVtepVni(Task):
         self.property_map['suppress_arp'] = 'suppress_arp'
         self.property_map['suppress_arp_disable'] = 'suppress_arp_disable'
         self.property_map['vni'] = 'vni'
-        self.init_properties()
 
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['task_name'] = None
 
     def final_verification(self):
         '''
         '''
         if self.interface == None:
-            self.task_log.error('exiting. call instance.interface before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.interface before calling instance.commit()')
         if self.state == None:
-            self.task_log.error('exiting. call instance.state before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.state before calling instance.commit()')
         if self.vni == None:
-            self.task_log.error('exiting. call instance.vni before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.vni before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -266,104 +263,23 @@ class NxosVxlanVtepVni(Task):
         expectation = ','.join(verify_set)
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def assoc_vrf(self):
-        return self.properties['assoc_vrf']
-    @assoc_vrf.setter
-    def assoc_vrf(self, x):
-        parameter = 'assoc_vrf'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    assoc_vrf = TaskProperty('verify_toggle')
 
-    @property
-    def ingress_replication(self):
-        return self.properties['ingress_replication']
-    @ingress_replication.setter
-    def ingress_replication(self, x):
-        parameter = 'ingress_replication'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ingress_replication(x, parameter)
-        self.properties[parameter] = x
+    ingress_replication = TaskProperty('verify_ingress_replication')
 
-    @property
-    def interface(self):
-        return self.properties['interface']
-    @interface.setter
-    def interface(self, x):
-        parameter = 'interface'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_vni_interface(x, parameter)
-        self.properties[parameter] = x
+    interface = TaskProperty('verify_nxos_vxlan_vtep_vni_interface')
 
-    @property
-    def multicast_group(self):
-        return self.properties['multicast_group']
-    @multicast_group.setter
-    def multicast_group(self, x):
-        parameter = 'multicast_group'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ipv4_multicast_address(x, parameter)
-        self.properties[parameter] = x
+    multicast_group = TaskProperty('verify_ipv4_multicast_address')
 
-    @property
-    def multisite_ingress_replication(self):
-        return self.properties['multisite_ingress_replication']
-    @multisite_ingress_replication.setter
-    def multisite_ingress_replication(self, x):
-        parameter = 'multisite_ingress_replication'
-        if self.set_none(x, parameter):
-            return
-        self.verify_multisite_ingress_replication(x, parameter)
-        self.properties[parameter] = x
+    multisite_ingress_replication = TaskProperty('verify_multisite_ingress_replication')
 
-    @property
-    def peer_list(self):
-        return self.properties['peer_list']
-    @peer_list.setter
-    def peer_list(self, x):
-        parameter = 'peer_list'
-        if self.set_none(x, parameter):
-            return
-        self.verify_peer_list(x, parameter)
-        self.properties[parameter] = x
+    peer_list = TaskProperty('verify_peer_list')
 
-    @property
-    def state(self):
-        return self.properties['state']
-    @state.setter
-    def state(self, x):
-        parameter = 'state'
-        if self.set_none(x, parameter):
-            return
-        self.verify_nxos_vxlan_vtep_vni_state(x, parameter)
-        self.properties[parameter] = x
+    state = TaskProperty('verify_nxos_vxlan_vtep_vni_state')
 
-    @property
-    def suppress_arp(self):
-        return self.properties['suppress_arp']
-    @suppress_arp.setter
-    def suppress_arp(self, x):
-        parameter = 'suppress_arp'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    suppress_arp = TaskProperty('verify_toggle')
 
-    @property
-    def suppress_arp_disable(self):
-        return self.properties['suppress_arp_disable']
-    @suppress_arp_disable.setter
-    def suppress_arp_disable(self, x):
-        parameter = 'suppress_arp_disable'
-        if self.set_none(x, parameter):
-            return
-        self.verify_toggle(x, parameter)
-        self.properties[parameter] = x
+    suppress_arp_disable = TaskProperty('verify_toggle')
 
     @property
     def vni(self):
@@ -0,0 +1,251 @@
+# PlaybookCache() - common/cache.py
+our_version = 100
+import hashlib
+import json
+import os
+import tempfile
+from os import path
+'''
+***********************************
+PlaybookCache()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+100
+
+ScriptKit Synopsis
+------------------
+- PlaybookCache() lets Playbook() skip writing playbooks whose content
+  has not changed since the last run, and reports the hosts whose plays
+  did change
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_cache.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_cache.py>`_
+
+Description
+-----------
+PlaybookCache() keeps a manifest (a json file) with, for each playbook
+file written, a sha256 hash of its content, and of each host's plays.
+A play's hash is taken over its canonical form (json, with sorted keys),
+so it does not depend on how the play was built.
+
+When pb.cache is set, pb.write_playbook() compares the playbook's hash
+with the manifest.  If they match, and the file exists, the file is left
+untouched.  Otherwise it is written, replacing any existing file
+atomically (written to a temporary file in the same directory, then
+renamed over the old one).  See pb.overwrite in Playbook().
+
+The hosts whose plays are new, or changed, are in cache.changed_hosts,
+so that downstream automation can run only those::
+
+    from ask.common.cache import PlaybookCache
+    cache = PlaybookCache(log, '/tmp/fabric_manifest.json')
+    for host in hosts:
+        pb = Playbook(log)
+        pb.cache = cache
+        pb.file = '/tmp/playbooks/{}.yaml'.format(host)
+        # add tasks, pb.add_host(host), pb.append_playbook()
+        pb.write_playbook()
+    cache.save()
+    cache.write_limit_file('/tmp/changed_hosts')
+    # ansible-playbook --limit @/tmp/changed_hosts ...
+
+cache.save() must be called for the next run to see this run's hashes.
+ParallelPlaybook() calls it at the end of run().
+
+|
+
+========================    ============================================
+Method / Property           Description
+========================    ============================================
+changed_hosts               Sorted list() of hosts whose plays were new
+                            or changed, in any file recorded this run
+
+removed_hosts               Sorted list() of hosts that were in a
+                            recorded file's previous version, but not in
+                            its current version
+
+unchanged_hosts             Sorted list() of hosts whose plays were
+                            unchanged in every file recorded this run
+
+save()                      Write the manifest, atomically
+
+write_limit_file()          Write changed_hosts, one per line, to a file
+                            usable with ansible-playbook --limit @file
+========================    ============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+
+# bump if the manifest format, or the way hashes are computed, changes
+manifest_version = 1
+
+def write_atomic(filename, text):
+    '''
+    Write text to a temporary file in filename's directory, then rename
+    it to filename, so that readers of filename see either the old or the
+    new contents, never a partial file.
+    '''
+    fh = open_temporary(filename)
+    try:
+        fh.write(text)
+        fh.close()
+        os.replace(fh.name, filename)
+    except BaseException:
+        fh.close()
+        os.remove(fh.name)
+        raise
+
+def open_temporary(filename):
+    '''
+    Return a text file handle, open for writing, to a new temporary file
+    in filename's directory.  See write_atomic()
+    '''
+    directory, basename = path.split(path.abspath(filename))
+    return tempfile.NamedTemporaryFile('w', dir=directory, prefix='.{}.'.format(basename), suffix='.tmp', delete=False)
+
+class PlaybookCache(object):
+    def __init__(self, log, manifest=None):
+        '''
+        manifest: the json file in which hashes are kept between runs.
+        If None, hashes are kept only in memory.
+        '''
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+        self.manifest = manifest
+        # key: playbook filename, value: entry.  See new_entry()
+        self.entries = dict()
+        self.changed = set()
+        self.unchanged = set()
+        self.removed = set()
+        if manifest != None and path.exists(manifest):
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest, 'r') as fh:
+                d = json.load(fh)
+        except ValueError as error:
+            self.log.error('exiting. unable to read manifest {}: {}'.format(self.manifest, error))
+            exit(1)
+        if d.get('version') != manifest_version:
+            self.log.warning('ignoring manifest {} from version {}.  All playbooks will be written.'.format(self.manifest, d.get('version')))
+            return
+        self.entries = d['entries']
+
+    def save(self):
+        if self.manifest == None:
+            self.log.error('exiting. instance.save() called, but no manifest was given')
+            exit(1)
+        d = dict()
+        d['version'] = manifest_version
+        d['entries'] = self.entries
+        write_atomic(self.manifest, json.dumps(d, indent=4, sort_keys=True))
+
+    def copy(self):
+        '''
+        Return a PlaybookCache() holding a copy of this cache's entries,
+        and no manifest, for use in a worker process.  See ParallelPlaybook()
+        '''
+        cache = PlaybookCache(self.log)
+        cache.entries = dict(self.entries)
+        return cache
+
+    @staticmethod
+    def play_hash(play):
+        text = json.dumps(play, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def new_entry(settings):
+        '''
+        Return a new, empty, entry.  settings is a dict() of the Playbook()
+        settings that affect the written file e.g. output_format.
+        '''
+        entry = dict()
+        entry['hash'] = None
+        entry['hosts'] = dict()
+        entry['plays'] = [json.dumps(settings, sort_keys=True)]
+        return entry
+
+    def add_play(self, entry, play):
+        play_hash = self.play_hash(play)
+        entry['plays'].append(play_hash)
+        for host in play['hosts'].split(','):
+            if host not in entry['hosts']:
+                entry['hosts'][host] = list()
+            entry['hosts'][host].append(play_hash)
+
+    @staticmethod
+    def finish_entry(entry):
+        '''
+        Set entry's hash from its settings and play hashes
+        '''
+        plays = entry.pop('plays')
+        entry['hash'] = hashlib.sha256('\n'.join(plays).encode('utf-8')).hexdigest()
+        return entry
+
+    def entry(self, stream, settings):
+        '''
+        Return the finished entry for stream, a list() of plays
+        '''
+        entry = self.new_entry(settings)
+        for play in stream:
+            self.add_play(entry, play)
+        return self.finish_entry(entry)
+
+    def is_current(self, filename, entry):
+        '''
+        Return True if filename exists, and its recorded hash matches entry's
+        '''
+        previous = self.entries.get(filename)
+        if previous == None or previous['hash'] != entry['hash']:
+            return False
+        return path.exists(filename)
+
+    def record(self, filename, entry):
+        '''
+        Record entry as filename's current content, and update the changed,
+        unchanged, and removed hosts
+        '''
+        previous = self.entries.get(filename, {'hosts': dict()})
+        for host in entry['hosts']:
+            if previous['hosts'].get(host) == entry['hosts'][host]:
+                self.unchanged.add(host)
+            else:
+                self.changed.add(host)
+        for host in previous['hosts']:
+            if host not in entry['hosts']:
+                self.removed.add(host)
+        self.entries[filename] = entry
+
+    @property
+    def changed_hosts(self):
+        return sorted(self.changed)
+
+    @property
+    def removed_hosts(self):
+        # a host moved from one file to another is not removed
+        return sorted(self.removed - self.changed - self.unchanged)
+
+    @property
+    def unchanged_hosts(self):
+        # a host with plays in several files is unchanged only if
+        # unchanged in all of them
+        return sorted(self.unchanged - self.changed)
+
+    def write_limit_file(self, filename):
+        write_atomic(filename, ''.join('{}\n'.format(host) for host in self.changed_hosts))
@@ -0,0 +1,60 @@
+# order_play(), order_task() - common/canonical.py
+our_version = 101
+'''
+*************************
+canonical.py
+*************************
+
+Description
+-----------
+
+Canonical key order for plays and tasks, used by Playbook() when
+``pb.key_order = 'canonical'``.
+
+By default, Playbook() writes every mapping with its keys sorted, by
+passing sort_keys to yaml (or json).  That is stable, but puts a play's
+tasks before its vars, and a task's module before its name.  In
+canonical key order, plays and tasks are written in the order Ansible's
+documentation uses, and nothing relies on the emitter to sort:
+
+- play: name, hosts, gather_facts, other keys (sorted), environment,
+  vars, tasks
+- task: name, the module, other keys (sorted) e.g. register, vars
+- everything below: sorted keys.  snapshots.freeze() (common/snapshot.py)
+  already sorts these.
+
+The order does not depend on the order in which a task, or Playbook(),
+added the keys, so output is byte-for-byte identical from run to run,
+and content hashes (common/cache.py) are stable.
+
+'''
+from ask.common.snapshot import FrozenDict, snapshots, sorted_items
+
+# play keys written before, and after, all other play keys
+play_keys_first = ('name', 'hosts', 'gather_facts')
+play_keys_last = ('environment', 'vars', 'tasks')
+
+def order_keys(x, first, last):
+    '''
+    Return a FrozenDict() with the items of dict() x, keys in first
+    (in order), then other keys (sorted), then keys in last (in order).
+    The result is interned, as by snapshots.freeze(), so that equal
+    plays and tasks are one snapshot (see Playbook().merge_plays()).
+    '''
+    items = [(key, x[key]) for key in first if key in x]
+    items.extend((key, value) for key, value in sorted_items(x) if key not in first and key not in last)
+    items.extend((key, x[key]) for key in last if key in x)
+    key = (FrozenDict, tuple((k, snapshots.identity(v)) for k, v in items))
+    return snapshots.intern(key, FrozenDict, items)
+
+def order_play(play):
+    return order_keys(play, play_keys_first, play_keys_last)
+
+def order_task(task, ansible_module=None):
+    '''
+    ansible_module: the task's module key e.g. cisco.nxos.nxos_feature.
+    If None, or not in task, only name is moved first.
+    '''
+    if ansible_module == None or ansible_module == 'name':
+        return order_keys(task, ('name',), ())
+    return order_keys(task, ('name', ansible_module), ())
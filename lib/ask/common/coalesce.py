@@ -0,0 +1,179 @@
+# coalesce_tasks() - common/coalesce.py
+our_version = 101
+'''
+*************************
+coalesce.py
+*************************
+
+Description
+-----------
+
+Merges adjacent resource-module tasks of a play into one task, so that
+e.g. ten NxosVlans() tasks, each configuring one vlan, become one task
+configuring ten vlans, and ansible-playbook makes one round trip to the
+device rather than ten.  Playbook() does this in append_playbook() when
+``pb.coalesce_tasks = True``.
+
+Two adjacent tasks are merged when:
+
+- they are for the same module, and the module is in config_specs below
+- their state is the same, and is one of coalesce_states.  (With
+  overridden, the second task would undo the first.  gathered, parsed,
+  and rendered return data that a script may register.)
+- both have a non-empty config list (not e.g. a reference to a
+  variable, see Task().host_var), and nothing but config and state under
+  the module key (e.g. not running_config)
+- neither has task keys other than name and the module (e.g. register)
+- their config lists do not conflict
+
+Config items are matched on the key named in the module's spec (e.g. an
+interface's name, or a vlan's vlan_id).  An item whose key is not in the
+other task is appended.  Two items with the same key:
+
+- are the same item, if they are equal
+- with state merged, are merged into one item, if every field they both
+  set has the same value (lists named in the spec are merged in the same
+  way, item by item)
+- otherwise conflict, and the two tasks are not merged
+
+The merged task's name is that of the first task, followed by the number
+of other names, if the tasks had different names.
+
+'''
+
+coalesce_states = ('deleted', 'merged', 'replaced')
+
+# key: ansible module.  value: spec for its config list.  spec['key'] is
+# the field identifying a config item.  spec['lists'], if present, has
+# specs for lists within a config item.
+config_specs = dict()
+for module in ['acl_interfaces', 'bfd_interfaces', 'hsrp_interfaces', 'interfaces', 'l2_interfaces',
+               'l3_interfaces', 'lacp_interfaces', 'lag_interfaces', 'lldp_interfaces', 'ospf_interfaces']:
+    config_specs['cisco.nxos.nxos_{}'.format(module)] = {'key': 'name'}
+config_specs['cisco.nxos.nxos_static_routes'] = {
+    'key': 'vrf', # None for the default vrf
+    'lists': {
+        'address_families': {
+            'key': 'afi',
+            'lists': {
+                'routes': {'key': 'dest'}
+            }
+        }
+    }
+}
+config_specs['cisco.nxos.nxos_vlans'] = {'key': 'vlan_id'}
+
+def task_module(task):
+    '''
+    Return the module key of task, or None if there is not exactly one
+    key other than name
+    '''
+    modules = [key for key in task if key != 'name']
+    if len(modules) != 1:
+        return None
+    return modules[0]
+
+def merge_items(a, b, spec, state):
+    '''
+    Return config list a with the items of config list b merged in, or
+    None if they conflict
+    '''
+    items = list(a)
+    position = dict()
+    for index, item in enumerate(items):
+        position[item.get(spec['key'])] = index
+    for item in b:
+        key = item.get(spec['key'])
+        if key not in position:
+            position[key] = len(items)
+            items.append(item)
+            continue
+        merged = merge_item(items[position[key]], item, spec, state)
+        if merged is None:
+            return None
+        items[position[key]] = merged
+    return items
+
+def merge_item(a, b, spec, state):
+    '''
+    Return config items a and b, which have the same key, merged into
+    one item, or None if they conflict
+    '''
+    if a == b:
+        return a
+    if state != 'merged':
+        return None
+    lists = spec.get('lists', dict())
+    item = dict(a)
+    for field, value in b.items():
+        if field not in item:
+            item[field] = value
+        elif item[field] == value:
+            continue
+        elif field in lists and isinstance(item[field], list) and isinstance(value, list):
+            merged = merge_items(item[field], value, lists[field], state)
+            if merged is None:
+                return None
+            item[field] = merged
+        else:
+            return None
+    return item
+
+def merge_tasks(a, b):
+    '''
+    Return tasks a and b merged into one task (without a name), or None
+    if they can not be merged
+    '''
+    module = task_module(a)
+    if module not in config_specs or task_module(b) != module:
+        return None
+    args_a = a[module]
+    args_b = b[module]
+    if set(args_a) != {'config', 'state'} or set(args_b) != {'config', 'state'}:
+        return None
+    if args_a['state'] != args_b['state'] or args_a['state'] not in coalesce_states:
+        return None
+    if not isinstance(args_a['config'], list) or not isinstance(args_b['config'], list):
+        return None
+    if len(args_a['config']) == 0 or len(args_b['config']) == 0:
+        # e.g. state deleted, with no config, deletes everything
+        return None
+    config = merge_items(args_a['config'], args_b['config'], config_specs[module], args_a['state'])
+    if config is None:
+        return None
+    task = dict()
+    task[module] = {'config': config, 'state': args_a['state']}
+    return task
+
+def merged_name(names):
+    names = [name for name in dict.fromkeys(names) if name != None]
+    if len(names) == 0:
+        return None
+    if len(names) == 1:
+        return names[0]
+    return '{} (and {} more)'.format(names[0], len(names) - 1)
+
+def coalesce_tasks(tasks):
+    '''
+    Return tasks, a play's list() of tasks, with adjacent tasks merged.
+    Tasks that were not merged are returned as-is.  Merged tasks are new
+    dict()s.
+    '''
+    result = list()
+    names = list() # for each task in result, the names of the tasks merged into it
+    for task in tasks:
+        if len(result) != 0:
+            merged = merge_tasks(result[-1], task)
+            if merged is not None:
+                result[-1] = merged
+                names[-1].append(task.get('name'))
+                continue
+        result.append(task)
+        names.append([task.get('name')])
+    for index, task_names in enumerate(names):
+        if len(task_names) == 1:
+            continue
+        name = merged_name(task_names)
+        if name != None:
+            result[index]['name'] = name
+    return result
@@ -1,5 +1,5 @@
 # Common() - common/common.py
-our_version = 112
+our_version = 116
 '''
 ====================
 Common() - common.py
@@ -10,128 +10,364 @@ Description
 
 Common methods used by Ansible ScriptKit
 
+Validation errors
+-----------------
+
+By default, the first invalid value (or missing mandatory property) logs
+an error and exits.  To instead collect every error in a run, and report
+them all at the end, use ValidationCollector()::
+
+    from ask.common.common import ValidationCollector
+    collector = ValidationCollector()
+    with collector:
+        # build tasks and playbooks as usual
+        ...
+    # leaving the with block raises ValidationReport() if any errors
+    # were collected.  Its errors attribute is a list of ValidationError()
+
+Or, without the with statement::
+
+    collector = ValidationCollector()
+    collector.start()
+    ...
+    collector.stop()
+    for error in collector.errors:
+        print(error.source_class, error.parameter, error.value, error.expectation)
+    print(collector.report())
+
+Validator cache
+---------------
+
+The validators whose result depends only on the value being validated
+(e.g. is_ipv4_address(), is_bgp_asn(), verify_vlan_list(), verify_rd())
+are memoized in validator_cache.  Fabric specs repeat the same values
+(asns, prefixes, vlan lists) across many tasks, so most calls are hits.
+Only results are cached.  Failures are never cached, so a value that
+failed once is re-validated, and fails identically, every time::
+
+    from ask.common.common import validator_cache
+    validator_cache.configure(maxsize=1024, eviction='fifo')
+    # build tasks and playbooks as usual
+    print(validator_cache.stats())
+
 '''
 import re
+import sys
+from collections import OrderedDict, namedtuple
+from functools import wraps
 from os import path
 import ipaddress
 
+InterfaceName = namedtuple('InterfaceName', ['kind', 'name', 'module', 'port', 'subport', 'subinterface'])
+InterfaceName.__doc__ = '''
+Returned by Common().classify_interface()
+
+kind: one of ethernet, loopback, management, nve, port_channel, vlan
+name: the canonical (NX-OS show command) form of the interface name e.g.
+      ethernet1/1 -> Ethernet1/1, Port-channel10 -> port-channel10
+module, port, subport, subinterface: int(), or None if not present.
+      For interfaces other than ethernet, port is the interface number
+      e.g. Vlan10 -> port 10.
+'''
+
+class ValidationError(Exception):
+    '''
+    A single validation failure.  Raised by Common().fail() and
+    Common().fail_msg() when a ValidationCollector() is active.
+
+    parameter and value are None for failures that are not tied to
+    a single property value e.g. missing mandatory properties.
+    '''
+    def __init__(self, source_class, source_method, value, parameter, expectation):
+        self.source_class = source_class
+        self.source_method = source_method
+        self.value = value
+        self.parameter = parameter
+        self.expectation = expectation
+        super().__init__(str(self))
+
+    def __str__(self):
+        if self.parameter == None:
+            return '{}: {}'.format(self.source_class, self.expectation)
+        return '{}.{}: unexpected value [{}] for parameter [{}]. Expected one of [{}]'.format(
+            self.source_class, self.source_method, self.value, self.parameter, self.expectation)
+
+class ValidationReport(Exception):
+    '''
+    Raised by ValidationCollector() with all collected ValidationError()
+    '''
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('{} validation error(s)\n{}'.format(
+            len(errors),
+            '\n'.join([str(error) for error in errors])))
+
+class ValidationCollector(object):
+    '''
+    While active, validation failures in all ScriptKit tasks are
+    recorded in self.errors rather than causing an exit.
+
+    Usable as a context manager.  On exiting the with block, raise
+    ValidationReport() if any errors were collected, unless
+    raise_errors is False.
+    '''
+    def __init__(self, raise_errors=True):
+        self.raise_errors = raise_errors
+        self.errors = list()
+
+    def start(self):
+        Common.validation_collector = self
+
+    def stop(self):
+        if Common.validation_collector is self:
+            Common.validation_collector = None
+
+    def add(self, error):
+        self.errors.append(error)
+
+    def report(self):
+        '''
+        return a str() listing all collected errors, one per line
+        '''
+        return '\n'.join([str(error) for error in self.errors])
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        if exc_type == None and self.raise_errors and len(self.errors) != 0:
+            raise ValidationReport(self.errors)
+        return False
+
+def collect_validation_errors(method):
+    '''
+    Decorator for property setters and task methods e.g. commit().
+    If the method raises ValidationError (only possible while a
+    ValidationCollector() is active) record it in the active collector
+    and return None.
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except ValidationError as error:
+            self.validation_collector.add(error)
+    return wrapper
+
+class ValidatorCache(object):
+    '''
+    Per-validator memo cache for Common() validators of the form
+    method(self, x, ...) whose outcome depends only on x and on
+    Common() class attributes.
+
+    For is_*() validators, the returned bool is cached.  For verify_*()
+    validators, a normal return (i.e. x is valid) is cached.  A verify_*()
+    failure exits or raises ValidationError() before anything is cached,
+    so invalid values always take the uncached path.
+
+    maxsize: maximum entries per validator.  None is unbounded, 0
+             disables caching.
+    eviction: 'lru' evict the least-recently used entry, 'fifo' evict
+              the oldest entry, when maxsize is reached.
+    '''
+    valid_eviction = frozenset({'fifo', 'lru'})
+
+    def __init__(self, maxsize=4096, eviction='lru'):
+        self.caches = dict()
+        self.hits = dict()
+        self.misses = dict()
+        self.configure(maxsize, eviction)
+
+    def configure(self, maxsize=4096, eviction='lru'):
+        '''
+        Set maxsize and eviction for all validators, and clear all caches
+        '''
+        if eviction not in self.valid_eviction:
+            raise ValueError('ValidatorCache.configure: unexpected eviction [{}]. Expected one of [{}]'.format(
+                eviction, ','.join(sorted(self.valid_eviction))))
+        if maxsize != None and (type(maxsize) != int or maxsize < 0):
+            raise ValueError('ValidatorCache.configure: unexpected maxsize [{}]. Expected None or int() >= 0'.format(maxsize))
+        self.maxsize = maxsize
+        self.eviction = eviction
+        self.clear()
+
+    def clear(self):
+        '''
+        Empty all caches and zero all hit/miss counters
+        '''
+        for name in self.caches:
+            self.caches[name].clear()
+            self.hits[name] = 0
+            self.misses[name] = 0
+
+    def stats(self):
+        '''
+        return dict() keyed on validator name, with hits, misses, and
+        size (current number of entries) for each
+        '''
+        stats = dict()
+        for name in sorted(self.caches):
+            stats[name] = dict()
+            stats[name]['hits'] = self.hits[name]
+            stats[name]['misses'] = self.misses[name]
+            stats[name]['size'] = len(self.caches[name])
+        return stats
+
+    def cached(self, method):
+        '''
+        Decorator.  Memoize method(self, x, ...) on type(x) and x.
+        Lists are keyed on their contents.  Unhashable values are
+        passed through to method uncached.
+        '''
+        name = method.__name__
+        cache = OrderedDict()
+        self.caches[name] = cache
+        self.hits[name] = 0
+        self.misses[name] = 0
+        @wraps(method)
+        def wrapper(instance, x, *args, **kwargs):
+            if self.maxsize == 0:
+                return method(instance, x, *args, **kwargs)
+            if type(x) == list:
+                key = (list, tuple(x))
+            else:
+                key = (type(x), x)
+            try:
+                result = cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                return method(instance, x, *args, **kwargs)
+            else:
+                self.hits[name] += 1
+                if self.eviction == 'lru':
+                    cache.move_to_end(key)
+                return result
+            self.misses[name] += 1
+            result = method(instance, x, *args, **kwargs)
+            cache[key] = result
+            if self.maxsize != None and len(cache) > self.maxsize:
+                cache.popitem(last=False)
+            return result
+        return wrapper
+
+validator_cache = ValidatorCache()
+
 class Common(object):
     '''
+    The compiled regexes, valid_* sets, and vlan limits below are class
+    attributes.  They are built once, at import, and shared (read-only)
+    by every instance of Common() and its subclasses.  The sets are
+    frozenset() so that no instance can modify them for other instances.
+    Subclasses needing a different set of values (e.g. valid_state)
+    assign their own set() to the instance, which shadows the class
+    attribute.
     '''
+    platform_buffer_boost = (9372,)
+    re_digits = re.compile(r'^\d+$')
+    re_ipv4 = re.compile(r'^\s*\d+\.\d+\.\d+\.\d+\s*$')
+    re_ipv4_with_mask = re.compile(r'^\s*(\d+\.\d+\.\d+\.\d+)\/(\d+)\s*$')
+    # All interface names, in one regex.  See classify_interface()
+    re_interface = re.compile(r'^(?P<prefix>[Ee]thernet|[Ll]oopback|[Mm]gmt|[Nn]ve|[Pp]ort-channel|[Vv]lan)(?P<module>\d+)(?:\/(?P<port>\d+)(?:\/(?P<subport>\d+))?)?(?:\.(?P<subinterface>\d+))?$')
+
+    re_mac_format_a = re.compile(r'^[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}$')
+    re_mac_format_b = re.compile(r'^[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}$')
+    re_mac_format_c = re.compile(r'^[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}$')
+    re_mac_format_d = re.compile(r'^[0-9a-fA-F]\.[0-9a-fA-F]\.[0-9a-fA-F]$')
+
+    min_vlan = 1
+    max_vlan = 4094
+
+    valid_enable_disable = frozenset({'enable', 'disable'})
+    valid_enabled_disabled = frozenset({'enabled', 'disabled'})
+
+    valid_ip_interface = frozenset({
+        'Ethernet',
+        'port-channel',
+        'Vlan',
+        'Loopback',
+        'mgmt',
+        'Stc'})
+    valid_ip_interface_or_default = valid_ip_interface.union({'default'})
+
+    # used only for self.fail expectation messages
+    # Use self.is_*_interface() methods instead when verifying interface input
+    valid_ip_pim_interface = frozenset({
+        'Ethernet',
+        'port-channel',
+        'Vlan',
+        'Loopback'})
+
+    valid_interface = valid_ip_interface.union({'nve'})
+    valid_interface_or_default = valid_interface.union({'default'})
+
+    valid_lldp_interface = frozenset({'Ethernet'})
+
+    # key: lowercase re_interface prefix
+    # value: (InterfaceName().kind, canonical prefix)
+    interface_prefix = {
+        'ethernet': ('ethernet', 'Ethernet'),
+        'loopback': ('loopback', 'loopback'),
+        'mgmt': ('management', 'mgmt'),
+        'nve': ('nve', 'nve'),
+        'port-channel': ('port_channel', 'port-channel'),
+        'vlan': ('vlan', 'Vlan')
+    }
+    subinterface_kinds = frozenset({'ethernet', 'port_channel'})
+    ip_interface_kinds = frozenset({'ethernet', 'loopback', 'management', 'port_channel', 'vlan'})
+
+    valid_nxos_ip_interface = frozenset({
+        'ethernet',
+        'Ethernet',
+        'port-channel',
+        'vlan',
+        'Vlan',
+        'loopback',
+        'Loopback',
+        'mgmt0'})
+
+    valid_ospf_interface = frozenset({
+        'Ethernet',
+        'port-channel',
+        'Vlan',
+        'Loopback'})
+
+    valid_platforms = frozenset({
+        3064,
+        3132,
+        3164,
+        3172,
+        3232,
+        3264,
+        31108,
+        7700,
+        9236,
+        9332,
+        9336,
+        9372,
+        9504,
+        9508,
+        92160,
+        92304,
+        93180})
+
+    valid_state = frozenset({'present', 'absent', 'default', 'merged'})
+    valid_toggle = frozenset({'no', 'yes'})
+    valid_true_false = frozenset({'false', 'true'})
+
+    # see ValidationCollector()
+    validation_collector = None
+
+    # Subclasses define their own properties_set.  See Task().init_schema()
+    properties_set = frozenset()
+
     def __init__(self, ansible_module, task_log):
         self.class_name = __class__.__name__
         self.lib_version = our_version
         self.ansible_module = ansible_module
         self.task_log = task_log
-        self.properties_set = set()
-
-        self.platform_buffer_boost = [9372]
-        self.re_digits = re.compile(r'^\d+$')
-        self.re_ipv4 = re.compile(r'^\s*\d+\.\d+\.\d+\.\d+\s*$')
-        self.re_ipv4_with_mask = re.compile(r'^\s*(\d+\.\d+\.\d+\.\d+)\/(\d+)\s*$')
-        self.re_ethernet_module_port                      = re.compile(r'^[Ee]thernet\d+\/\d+$')
-        self.re_ethernet_module_port_subinterface         = re.compile(r'^[Ee]thernet\d+\/\d+\.\d+$')
-        self.re_ethernet_module_port_subport              = re.compile(r'^[Ee]thernet\d+\/\d+\/\d+$')
-        self.re_ethernet_module_port_subport_subinterface = re.compile(r'^[Ee]thernet\d+\/\d+\/\d+\.\d+$')
-        self.re_loopback_interface = re.compile(r'^[Ll]oopback\d+$')
-        self.re_management_interface = re.compile(r'^[Mm]gmt\d+$')
-        self.re_nve_interface = re.compile(r'^[Nn]ve\d+$')
-        self.re_vlan_interface = re.compile(r'^[Vv]lan\d+$')
-        self.re_port_channel_interface = re.compile(r'^[Pp]ort-channel\d+$')
-        self.re_port_channel_subinterface = re.compile(r'^[Pp]ort-channel\d+\.\d+$')
-
-        self.re_mac_format_a = re.compile(r'^[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}$')
-        self.re_mac_format_b = re.compile(r'^[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}\:[0-9a-fA-F]{2}$')
-        self.re_mac_format_c = re.compile(r'^[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}\-[0-9a-fA-F]{2}$')
-        self.re_mac_format_d = re.compile(r'^[0-9a-fA-F]\.[0-9a-fA-F]\.[0-9a-fA-F]$')
-
-        self.min_vlan = 1
-        self.max_vlan = 4094
-
-        self.valid_enable_disable = set()
-        self.valid_enable_disable.add('enable')
-        self.valid_enable_disable.add('disable')
-
-        self.valid_enabled_disabled = set()
-        self.valid_enabled_disabled.add('enabled')
-        self.valid_enabled_disabled.add('disabled')
-
-        self.valid_ip_interface = set()
-        self.valid_ip_interface.add('Ethernet')
-        self.valid_ip_interface.add('port-channel')
-        self.valid_ip_interface.add('Vlan')
-        self.valid_ip_interface.add('Loopback')
-        self.valid_ip_interface.add('mgmt')
-        self.valid_ip_interface.add('Stc')
-
-        self.valid_ip_interface_or_default = set.union(self.valid_ip_interface)
-        self.valid_ip_interface_or_default.add('default')
-
-        # used only for self.fail expectation messages
-        # Use self.is_*_interface() methods instead when verifying interface input
-        self.valid_ip_pim_interface = set()
-        self.valid_ip_pim_interface.add('Ethernet')
-        self.valid_ip_pim_interface.add('port-channel')
-        self.valid_ip_pim_interface.add('Vlan')
-        self.valid_ip_pim_interface.add('Loopback')
-
-        self.valid_interface = set.union(self.valid_ip_interface)
-        self.valid_interface.add('nve')
-
-        self.valid_interface_or_default = set.union(self.valid_interface)
-        self.valid_interface_or_default.add('default')
-
-        self.valid_lldp_interface = set()
-        self.valid_lldp_interface.add('Ethernet')
-
-        self.valid_nxos_ip_interface = set()
-        self.valid_nxos_ip_interface.add('ethernet')
-        self.valid_nxos_ip_interface.add('Ethernet')
-        self.valid_nxos_ip_interface.add('port-channel')
-        self.valid_nxos_ip_interface.add('vlan')
-        self.valid_nxos_ip_interface.add('Vlan')
-        self.valid_nxos_ip_interface.add('loopback')
-        self.valid_nxos_ip_interface.add('Loopback')
-        self.valid_nxos_ip_interface.add('mgmt0')
-
-        self.valid_ospf_interface = set()
-        self.valid_ospf_interface.add('Ethernet')
-        self.valid_ospf_interface.add('port-channel')
-        self.valid_ospf_interface.add('Vlan')
-        self.valid_ospf_interface.add('Loopback')
-
-        self.valid_platforms = set()
-        self.valid_platforms.add(3064)
-        self.valid_platforms.add(3132)
-        self.valid_platforms.add(3164)
-        self.valid_platforms.add(3172)
-        self.valid_platforms.add(3232)
-        self.valid_platforms.add(3264)
-        self.valid_platforms.add(31108)
-        self.valid_platforms.add(7700)
-        self.valid_platforms.add(9236)
-        self.valid_platforms.add(9332)
-        self.valid_platforms.add(9336)
-        self.valid_platforms.add(9372)
-        self.valid_platforms.add(9504)
-        self.valid_platforms.add(9508)
-        self.valid_platforms.add(92160)
-        self.valid_platforms.add(92304)
-        self.valid_platforms.add(93180)
-
-        self.valid_state = set()
-        self.valid_state.add('present')
-        self.valid_state.add('absent')
-        self.valid_state.add('default')
-        self.valid_state.add('merged')
-
-        self.valid_toggle = set()
-        self.valid_toggle.add('no')
-        self.valid_toggle.add('yes')
-
-        self.valid_true_false = set()
-        self.valid_true_false.add('false')
-        self.valid_true_false.add('true')
 
     def all_set(self, d):
         '''
@@ -203,11 +439,6 @@ class Common(object):
     def msg(self, source_class, source_method, value):
         print('{}.{}: {}'.format(source_class, source_method, value))
 
-    def fail(self, source_class, source_method, value, parameter, expectation):
-        print('{}.{}: exiting.  unexpected value [{}] for parameter [{}]. Expected one of [{}]'.format(
-            source_class, source_method, value, parameter, expectation))
-        exit(1)
-
     def spaces_to_underscore(self,x):
         return re.sub(' ', '_', x)
 
@@ -285,6 +516,7 @@ class Common(object):
             return True
         return False
 
+    @validator_cache.cached
     def is_ipv4_address(self,x):
         '''
         verify x is an ipv4 address
@@ -320,19 +552,82 @@ class Common(object):
             return False
         return True
 
-    def is_ethernet_interface(self, x):
-        if self.re_ethernet_module_port.search(x):
-            return True
-        if self.re_ethernet_module_port_subport.search(x):
+    @validator_cache.cached
+    def classify_interface(self, x):
+        '''
+        Classify interface name x in a single pass.
+
+        return InterfaceName() if x is an ethernet, ethernet subinterface,
+        loopback, management, nve, port-channel, port-channel subinterface,
+        or vlan (SVI) interface name.  Else return None.
+
+        Results are cached in validator_cache, so callers validating the
+        same names repeatedly share one InterfaceName() and one (interned)
+        canonical name per distinct input.
+        '''
+        if type(x) != str:
+            return None
+        m = self.re_interface.match(x)
+        if not m:
+            return None
+        kind,prefix = self.interface_prefix[m.group('prefix').lower()]
+        module = int(m.group('module'))
+        port = m.group('port')
+        subport = m.group('subport')
+        subinterface = m.group('subinterface')
+        if kind == 'ethernet':
+            if port == None:
+                return None
+            port = int(port)
+            name = '{}{}/{}'.format(prefix, module, port)
+            if subport != None:
+                subport = int(subport)
+                name += '/{}'.format(subport)
+        else:
+            if port != None:
+                return None
+            port = module
+            module = None
+            name = '{}{}'.format(prefix, port)
+        if subinterface != None:
+            if kind not in self.subinterface_kinds:
+                return None
+            subinterface = int(subinterface)
+            name += '.{}'.format(subinterface)
+        return InterfaceName(kind, sys.intern(name), module, port, subport, subinterface)
+
+    def canonical_interface(self, x):
+        '''
+        return the canonical form of interface name x e.g. ethernet1/1 -> Ethernet1/1
+        If x is not an interface name, return x unchanged.
+        '''
+        interface = self.classify_interface(x)
+        if interface == None:
+            return x
+        return interface.name
+
+    def is_interface_kind(self, x, kinds, subinterface=None):
+        '''
+        return True if x is an interface name whose InterfaceName().kind is in kinds
+
+        subinterface: None, subinterfaces are allowed
+                      True, x must be a subinterface
+                      False, x must not be a subinterface
+        '''
+        interface = self.classify_interface(x)
+        if interface == None:
+            return False
+        if interface.kind not in kinds:
+            return False
+        if subinterface == None:
             return True
-        return False
+        return (interface.subinterface != None) == subinterface
+
+    def is_ethernet_interface(self, x):
+        return self.is_interface_kind(x, ('ethernet',), subinterface=False)
 
     def is_ethernet_subinterface(self, x):
-        if self.re_ethernet_module_port_subinterface.search(x):
-            return True
-        if self.re_ethernet_module_port_subport_subinterface.search(x):
-            return True
-        return False
+        return self.is_interface_kind(x, ('ethernet',), subinterface=True)
 
     def is_ipv4_multicast_address(self,x):
         '''
@@ -360,6 +655,7 @@ class Common(object):
             return False
         return False
 
+    @validator_cache.cached
     def is_ipv4_address_with_prefix(self,x):
         '''
         verify x is an ipv4 address with prefix of the form address/Y
@@ -373,6 +669,7 @@ class Common(object):
             return False
         return True
 
+    @validator_cache.cached
     def is_ipv6_address_with_prefix(self,x):
         '''
         verify x is an ipv6 address with prefix of the form address/Y
@@ -386,6 +683,7 @@ class Common(object):
             return False
         return True
 
+    @validator_cache.cached
     def is_ipv6_address(self, _x):
         '''
         verify _x is an ipv6 address
@@ -397,6 +695,7 @@ class Common(object):
             return False
         return True
 
+    @validator_cache.cached
     def is_ipv4_network(self,x):
         try:
             _tmp = ipaddress.IPv4Network(x).subnets(new_prefix=32)
@@ -405,6 +704,7 @@ class Common(object):
             return False
         return True
 
+    @validator_cache.cached
     def is_ipv6_network(self,x):
         try:
             _tmp = ipaddress.IPv6Network(x).subnets(new_prefix=128)
@@ -446,26 +746,19 @@ class Common(object):
         return True
 
     def is_loopback_interface(self, x):
-        if self.re_loopback_interface.search(x):
-            return True
-        return False
+        return self.is_interface_kind(x, ('loopback',))
 
     def is_management_interface(self, x):
-        if self.re_management_interface.search(x):
-            return True
-        return False
+        return self.is_interface_kind(x, ('management',))
 
     def is_nve_interface(self, x):
-        if self.re_nve_interface.search(x):
-            return True
-        return False
+        return self.is_interface_kind(x, ('nve',))
 
     def is_port_channel_interface(self, x):
-        if self.re_port_channel_interface.search(x):
-            return True
-        if self.re_port_channel_subinterface.search(x):
-            return True
-        return False
+        '''
+        verify x is a port-channel interface or port-channel subinterface
+        '''
+        return self.is_interface_kind(x, ('port_channel',))
 
     def is_auto(self, x):
         if x == 'auto':
@@ -477,9 +770,10 @@ class Common(object):
             return True
         return False
 
+    @validator_cache.cached
     def is_valid_rd(self, x):
         try:
-            asn,nn = re.split(':', item)
+            asn,nn = re.split(':', x)
         except:
             return False
         if self.is_digits(asn) and self.is_digits(nn):
@@ -489,28 +783,28 @@ class Common(object):
         return False
 
     def is_vlan_interface(self, x):
-        if self.re_vlan_interface.search(x):
-            return True
-        return False
+        return self.is_interface_kind(x, ('vlan',))
 
+    @validator_cache.cached
     def verify_rd(self, x, parameter=''):
         source_class = self.class_name
         source_method = 'verify_rd'
         expectation = 'One of auto, default, x.x.x.x:x, x:x, where x is digits'
-        if self.is_auto:
+        if self.is_auto(x):
             return
-        if self.is_default:
+        if self.is_default(x):
             return
         if not self.is_valid_rd(x):
             self.fail(source_class, source_method, x, parameter, expectation)
 
+    @validator_cache.cached
     def verify_rt(self, x, parameter=''):
         source_class = self.class_name
         source_method = 'verify_rt'
         expectation = 'auto, default, or python list of x.x.x.x:x, x:x, where x is digits'
-        if self.is_auto:
+        if self.is_auto(x):
             return
-        if self.is_default:
+        if self.is_default(x):
             return
         if not self.is_list(x):
             self.fail(source_class, source_method, x, parameter, expectation)
@@ -534,6 +828,7 @@ class Common(object):
             return True
         return False
 
+    @validator_cache.cached
     def is_bgp_asn(self, x):
         if self.is_digits(x):
             if self.is_32_bit and int(x) >= 1:
@@ -659,8 +954,7 @@ class Common(object):
     def verify_file_exists(self, x, parameter=''):
         if path.exists(x):
             return
-        self.task_log.error('exiting. {} does not exist: {}'.format(parameter, x))
-        exit(1)
+        self.fail_msg('exiting. {} does not exist: {}'.format(parameter, x))
 
     def verify_interface_or_default(self, x, parameter=''):
         if self.is_default(x):
@@ -668,49 +962,23 @@ class Common(object):
         self.verify_interface(x, parameter)
 
     def verify_interface(self, x, parameter=''):
-        if self.is_ethernet_interface(x):
-            return
-        if self.is_ethernet_subinterface(x):
-            return
-        if self.is_port_channel_interface(x):
-            return
-        if self.is_management_interface(x):
-            return
-        if self.is_loopback_interface(x):
-            return
-        if self.is_nve_interface(x):
-            return
-        if self.is_vlan_interface(x):
+        if self.classify_interface(x) != None:
             return
         expectation = self.valid_interface
         self.fail(self.class_name, parameter, x, parameter, expectation)
 
     def verify_ip_interface(self, x, parameter=''):
-        if self.is_ethernet_interface(x):
-            return
-        if self.is_ethernet_subinterface(x):
-            return
-        if self.is_port_channel_interface(x):
-            return
-        if self.is_loopback_interface(x):
-            return
-        if self.is_management_interface(x):
-            return
-        if self.is_vlan_interface(x):
+        if self.is_interface_kind(x, self.ip_interface_kinds):
             return
         expectation = self.valid_ip_interface
         self.fail(self.class_name, parameter, x, parameter, expectation)
 
     def is_lldp_interface(self, x):
-        for value in self.valid_lldp_interface:
-            if value.lower() in x.lower():
-                return True
-        return False
+        return self.is_interface_kind(x, ('ethernet',))
 
     def verify_lldp_interface(self, x, parameter=''):
-        for value in self.valid_lldp_interface:
-            if value.lower() in x.lower():
-                return
+        if self.is_lldp_interface(x):
+            return
         expectation = self.valid_lldp_interface
         self.fail(self.class_name, parameter, x, parameter, expectation)
 
@@ -773,6 +1041,7 @@ class Common(object):
     def verify_vlan(self, x, expectation, parameter='verify_vlan'):
         self.verify_integer_range(x, self.min_vlan, self.max_vlan, self.class_name, 'verify_vlan')
 
+    @validator_cache.cached
     def verify_vlan_list(self, x, parameter='unspecified'):
         '''
         verify that x is a quoted comma-separated list of vlans and vlan ranges e.g.:
@@ -804,9 +1073,42 @@ class Common(object):
             _verify_min_max(item)
 
     def fail(self, source_class, source_method, value, parameter, expectation):
-        self.task_log.error('{}.{}: exiting.  unexpected value [{}] for parameter [{}]. Expected one of [{}]'.format(
-            source_class, source_method, value, parameter, expectation))
-        exit(1)
+        '''
+        Log the unexpected value and exit.
+
+        If a ValidationCollector() is active, raise ValidationError()
+        instead.  The collector records it at the nearest property
+        setter, commit(), update(), or add_*() boundary and the script
+        continues.
+        '''
+        if isinstance(expectation, (set, frozenset)):
+            expectation = ','.join(sorted([str(x) for x in expectation]))
+        if self.validation_collector == None:
+            self.task_log.error('{}.{}: exiting.  unexpected value [{}] for parameter [{}]. Expected one of [{}]'.format(
+                source_class, source_method, value, parameter, expectation))
+            exit(1)
+        raise ValidationError(source_class, source_method, value, parameter, expectation)
+
+    def fail_msg(self, message, details=None):
+        '''
+        Log message, and each line in list() details, then exit.  Used where
+        there is no single unexpected value to report e.g. mandatory properties
+        missing at commit() time.
+
+        If a ValidationCollector() is active, raise ValidationError()
+        instead.  See fail().
+        '''
+        if details == None:
+            details = list()
+        if self.validation_collector == None:
+            self.task_log.error(message)
+            for line in details:
+                self.task_log.error('   {}'.format(line))
+            exit(1)
+        expectation = re.sub(r'^exiting\.\s*', '', message)
+        if len(details) != 0:
+            expectation = '{} {}'.format(expectation, ', '.join(details))
+        raise ValidationError(self.class_name, None, None, None, expectation)
 
 
     def strip_netmask(self,ip):
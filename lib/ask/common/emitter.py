@@ -0,0 +1,312 @@
+# Emitter() - common/emitter.py
+our_version = 102
+import json
+import math
+import re
+from yaml.resolver import Resolver
+'''
+***********************************
+Emitter()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+102
+
+ScriptKit Synopsis
+------------------
+- Emitter() writes ScriptKit task trees (and playbooks built from them)
+  as YAML or JSON
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_emitter.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_emitter.py>`_
+
+Description
+-----------
+ScriptKit tasks only ever contain dict(), list(), str(), int(), float(),
+bool() and None.  Emitter() walks such trees directly, rather than going
+through PyYAML's representer, resolver, and serializer (which look up a
+representer for every node, and track every node in case it needs an
+anchor).
+
+The YAML written has the same layout as
+``yaml.dump(data, indent=4, default_flow_style=False, allow_unicode=True)``
+(block style, sorted keys) and loads to the same data.  It differs from
+yaml.dump() in that:
+
+- Long strings are not folded at 80 columns
+- Strings containing Jinja2 ``{{`` or ``{%`` are always quoted
+- Strings that need escapes are written JSON-style, double-quoted
+- An object that appears more than once is written in full each time,
+  rather than as an anchor and aliases
+
+Anything other than the types above causes Emitter() to exit with
+error.
+
+If emitter.sort_keys is False, mappings are written in their own key
+order (YAML and JSON).  Playbook() sets it for ``pb.key_order = 'canonical'``.
+
+Playbook() uses Emitter() when ``pb.yaml_backend = 'scriptkit'``, and
+for ``pb.output_format = 'json'``.
+
+|
+
+========================    ============================================
+Method                      Description
+========================    ============================================
+dump_json()                 Return data as JSON, indented by 4, with
+                            sorted keys (see sort_keys)::
+
+                                - Type: function()
+                                - Example:
+                                    emitter = Emitter(log)
+                                    text = emitter.dump_json(pb.stream)
+
+dump_json_item()            Return one item of a top-level list, as
+                            dump_json() would write it within that list.
+                            Used by Playbook() streaming mode::
+
+                                - Type: function()
+                                - Example:
+                                    text = emitter.dump_json_item(play)
+
+dump_yaml()                 Return data as YAML::
+
+                                - Type: function()
+                                - Keyword arguments:
+                                    explicit_start: write '---' first
+                                    explicit_end: write '...' last
+                                - Example:
+                                    emitter = Emitter(log)
+                                    text = emitter.dump_yaml(pb.stream, explicit_start=True)
+
+sort_keys                   If True, write mappings with sorted keys,
+                            else in their own order::
+
+                                - Type: bool()
+                                - Default: True
+
+write_yaml()                Write data, as YAML, to an open file.  If data
+                            is a list(), each item is written as soon as
+                            it is emitted::
+
+                                - Type: function()
+                                - Example:
+                                    with open('/tmp/playbook.yaml', 'w') as fh:
+                                        emitter.write_yaml(pb.stream, fh, explicit_start=True, explicit_end=True)
+
+========================    ============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+
+# characters that YAML can only write within double quotes.  YAML reads
+# \x85, \u2028 and \u2029 as line breaks.
+re_yaml_unprintable = re.compile('[^\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD\U00010000-\U0010FFFF]')
+# characters that json.dumps(ensure_ascii=False) leaves as-is, but that
+# YAML can only write as an escape, even within double quotes
+re_yaml_escape = re.compile('[^\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]')
+# strings that PyYAML's block context would need to quote
+re_yaml_indicator_start = re.compile(r'^([#,\[\]{}&*!|>\'"%@`]|[-?:]( |$))')
+re_yaml_indicator = re.compile(r': |:$| #')
+# Jinja2 expressions and statements, which Ansible templates
+re_jinja = re.compile(r'{{|{%')
+
+class Emitter(object):
+    def __init__(self, log):
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+        self.indent = 4
+        self.sort_keys = True
+        # str() -> its YAML scalar.  Task trees repeat the same keys and
+        # values many times.
+        self.scalar_cache = dict()
+
+    def quote_str(self, x):
+        '''
+        Return the YAML scalar for str() x, quoted if needed.
+        '''
+        if x in self.scalar_cache:
+            return self.scalar_cache[x]
+        if re_yaml_unprintable.search(x):
+            scalar = re_yaml_escape.sub(lambda m: '\\u{:04X}'.format(ord(m.group())), json.dumps(x, ensure_ascii=False))
+        elif self.is_plain(x):
+            scalar = x
+        else:
+            scalar = "'{}'".format(x.replace("'", "''"))
+        self.scalar_cache[x] = scalar
+        return scalar
+
+    def is_plain(self, x):
+        '''
+        Return True if str() x can be written unquoted, and would load
+        back as the same str().
+        '''
+        if x == '':
+            return False
+        if x[0] == ' ' or x[-1] == ' ':
+            return False
+        if re_yaml_indicator_start.search(x):
+            return False
+        if re_yaml_indicator.search(x):
+            return False
+        if re_jinja.search(x):
+            return False
+        # e.g. yes, no, null, 1.0, 0x1f, 2021-01-01, ~, =
+        for tag, regexp in Resolver.yaml_implicit_resolvers.get(x[0], []):
+            if regexp.match(x):
+                return False
+        return True
+
+    def scalar(self, x):
+        '''
+        Return the YAML scalar for x, which is not a non-empty dict()
+        or list()
+        '''
+        if isinstance(x, str):
+            return self.quote_str(x)
+        if x is None:
+            return 'null'
+        if x is True:
+            return 'true'
+        if x is False:
+            return 'false'
+        if isinstance(x, int):
+            return str(x)
+        if isinstance(x, float):
+            return self.float_scalar(x)
+        if isinstance(x, dict):
+            return '{}'
+        if isinstance(x, list):
+            return '[]'
+        self.log.error('exiting. Emitter() cannot write {}. Got {}'.format(type(x).__name__, x))
+        exit(1)
+
+    @staticmethod
+    def float_scalar(x):
+        '''
+        Return the YAML scalar for float() x, as PyYAML writes it
+        '''
+        if math.isnan(x):
+            return '.nan'
+        if math.isinf(x):
+            if x > 0:
+                return '.inf'
+            return '-.inf'
+        scalar = repr(x).lower()
+        if '.' not in scalar and 'e' in scalar:
+            scalar = scalar.replace('e', '.0e', 1)
+        return scalar
+
+    def emit_mapping(self, x, column, out):
+        '''
+        Append non-empty dict() x to out.  The first key continues the
+        current line, which is already at column.
+        '''
+        pad = ' ' * column
+        first = True
+        keys = x
+        if self.sort_keys:
+            keys = sorted(x)
+        for key in keys:
+            if first:
+                first = False
+            else:
+                out.append(pad)
+            out.append(self.scalar(key))
+            value = x[key]
+            if value and isinstance(value, dict):
+                out.append(':\n')
+                out.append(' ' * (column + self.indent))
+                self.emit_mapping(value, column + self.indent, out)
+            elif value and isinstance(value, list):
+                # sequences within mappings are not indented
+                out.append(':\n')
+                out.append(pad)
+                self.emit_sequence(value, column, out)
+            else:
+                out.append(': ')
+                out.append(self.scalar(value))
+                out.append('\n')
+
+    def emit_sequence(self, x, column, out):
+        '''
+        Append non-empty list() x to out.  The first item continues the
+        current line, which is already at column.
+        '''
+        pad = ' ' * column
+        first = True
+        for item in x:
+            if first:
+                first = False
+            else:
+                out.append(pad)
+            self.emit_item(item, column, out)
+
+    def emit_item(self, item, column, out):
+        '''
+        Append one sequence item to out
+        '''
+        if item and isinstance(item, dict):
+            out.append('-' + ' ' * (self.indent - 1))
+            self.emit_mapping(item, column + self.indent, out)
+        elif item and isinstance(item, list):
+            out.append('-' + ' ' * (self.indent - 1))
+            self.emit_sequence(item, column + self.indent, out)
+        else:
+            out.append('- ')
+            out.append(self.scalar(item))
+            out.append('\n')
+
+    def emit(self, x, out):
+        if x and isinstance(x, dict):
+            self.emit_mapping(x, 0, out)
+        elif x and isinstance(x, list):
+            self.emit_sequence(x, 0, out)
+        else:
+            out.append(self.scalar(x))
+            out.append('\n')
+
+    def dump_yaml(self, x, explicit_start=False, explicit_end=False):
+        out = list()
+        if explicit_start:
+            out.append('---\n')
+        self.emit(x, out)
+        if explicit_end:
+            out.append('...\n')
+        return ''.join(out)
+
+    def write_yaml(self, x, fh, explicit_start=False, explicit_end=False):
+        if explicit_start:
+            fh.write('---\n')
+        if x and isinstance(x, list):
+            for item in x:
+                out = list()
+                self.emit_item(item, 0, out)
+                fh.write(''.join(out))
+        else:
+            fh.write(self.dump_yaml(x))
+        if explicit_end:
+            fh.write('...\n')
+
+    def dump_json(self, x):
+        return json.dumps(x, indent=self.indent, sort_keys=self.sort_keys, ensure_ascii=False) + '\n'
+
+    def dump_json_item(self, x):
+        '''
+        json.dumps() the one-item list [x], and remove the enclosing
+        '[\\n' and '\\n]', leaving x indented as an item of a list.
+        '''
+        return json.dumps([x], indent=self.indent, sort_keys=self.sort_keys, ensure_ascii=False)[2:-2]
@@ -0,0 +1,293 @@
+# VarsWriter() - common/hoist.py
+our_version = 102
+from os import makedirs, path
+from ask.common.cache import write_atomic
+from ask.common.snapshot import FrozenDict, snapshots
+'''
+***********************************
+VarsWriter()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+102
+
+ScriptKit Synopsis
+------------------
+- VarsWriter() moves the vars shared by a Playbook()'s plays out of the
+  plays, into group_vars and host_vars files
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_hoist.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_hoist.py>`_
+
+Description
+-----------
+Every play carries the connection vars set by Playbook()
+(ansible_connection, ansible_user, ansible_password ...), so a playbook
+with a play per host repeats the same vars block thousands of times.
+Ansible also reads vars from group_vars/<group>.yml and
+host_vars/<host>.yml files in the playbook's directory.
+VarsWriter().write(pb), in one pass over pb.stream:
+
+- writes the vars that every play sets, to the same value, to
+  group_vars/<group>.yml
+- for each host, writes the remaining vars that every play of the host
+  sets, to the same value, to host_vars/<host>.yml
+- removes these vars from the plays.  A var is removed from a play with
+  several hosts only if it was moved to the host_vars of every one of
+  them.  A play whose vars are all moved has no vars key.
+
+Each host sees the same value of every var as before.  A var that some
+play does not set, or sets to a different value, stays in the plays, so
+no play gains a var that it did not have.
+
+Call write() after the last append_playbook(), and before
+pb.write_playbook() or ShardWriter().write(), with vw.directory set to
+the directory to which the playbook (or shards) will be written.  Not
+available in streaming mode.  Plays that differ only in per-host vars
+(e.g. built with Task().host_var) are identical once write() has moved
+those vars, so call pb.merge_plays() after write() to merge them into
+one play.
+
+A play's hosts may include groups of pb.inventory (see Playbook()),
+which are expanded to their hosts.
+
+Every host must be in vw.group in the inventory.  The default, all,
+contains every host.  Play vars override every inventory var, but once
+moved, a var is overridden by the same var in an inventory group_vars
+file for a more specific group, or in an inventory host_vars file.
+Choose vw.group accordingly, or remove such vars from the inventory.
+
+Files are written with pb's output_format (.yml or .json), yaml_backend,
+and overwrite.  If pb.overwrite is never, existing files are not
+overwritten.
+
+::
+
+    from ask.common.hoist import VarsWriter
+    # build pb, as usual
+    vw = VarsWriter(log)
+    vw.directory = '/tmp/fabric'
+    vw.write(pb)
+    pb.file = '/tmp/fabric/fabric.yaml'
+    pb.write_playbook()
+
+|
+
+============================    ==============================================
+Property / Method               Description
+============================    ==============================================
+directory                       The playbook's directory.  group_vars and
+                                host_vars are created in it, if needed.
+                                Must exist::
+
+                                    - Type: str()
+
+files                           After write(), a list() of the files
+                                written::
+
+                                    - Type: getter
+
+group                           The inventory group, containing every
+                                host of the playbook, for which the
+                                group_vars file is written::
+
+                                    - Type: str()
+                                    - Default: all
+
+group_vars                      After write(), a dict() of the vars
+                                written to the group_vars file::
+
+                                    - Type: getter
+
+host_vars                       If True, write host_vars files.  If
+                                False, only vars shared by every play
+                                are moved::
+
+                                    - Type: bool()
+                                    - Default: True
+
+write()                         Move vars from the plays of pb (a
+                                Playbook()) to group_vars and host_vars
+                                files.  See Description::
+
+                                    - Type: function()
+                                    - Example:
+                                        vw.write(pb)
+
+============================    ==============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+
+def play_vars(play):
+    '''
+    dict() keyed on var name, of (identity, value).  identity compares
+    equal for equal values.  See snapshots.identity()
+    '''
+    d = dict()
+    for key, value in play.get('vars', dict()).items():
+        value = snapshots.freeze(value)
+        d[key] = (snapshots.identity(value), value)
+    return d
+
+def common_vars(vars_list):
+    '''
+    Return the items of play_vars() dicts that are in every dict() of
+    vars_list, with the same value
+    '''
+    common = dict(vars_list[0])
+    for d in vars_list[1:]:
+        for key in list(common):
+            if key not in d or d[key][0] != common[key][0]:
+                del common[key]
+    return common
+
+class VarsWriter(object):
+    def __init__(self, log):
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+
+        self._directory = None
+        self._group = 'all'
+        self._host_vars = True
+        self._files = list()
+        self._group_vars = dict()
+
+    def verify_write(self, pb):
+        if self.directory == None:
+            self.log.error('exiting. call instance.directory before calling instance.write()')
+            exit(1)
+        if len(pb.stream) == 0:
+            # also the case in streaming mode, see pb.open_stream()
+            self.log.error('exiting. nothing to write.')
+            exit(1)
+
+    def hoist(self, pb):
+        '''
+        Return (group, hosts, removed).  group: the vars to write to
+        group_vars.  hosts: dict() keyed on host, of the vars to write to
+        its host_vars.  removed: for each play, the set() of var names
+        to remove from it.  Vars are play_vars() items.
+        '''
+        vars_list = [play_vars(play) for play in pb.stream]
+        hosts_list = [pb.play_hosts(play) for play in pb.stream]
+        group = common_vars(vars_list)
+        host_plays = dict() # host -> the play_vars() of each of its plays, less group
+        for d, hosts in zip(vars_list, hosts_list):
+            remaining = {key: value for key, value in d.items() if key not in group}
+            for host in hosts:
+                host_plays.setdefault(host, list()).append(remaining)
+        hosts = dict()
+        if self.host_vars:
+            for host, vars_of_plays in host_plays.items():
+                hoisted = common_vars(vars_of_plays)
+                if len(hoisted) != 0:
+                    hosts[host] = hoisted
+        removed = list()
+        for d, play_hosts in zip(vars_list, hosts_list):
+            names = set(group)
+            for key in d:
+                if key not in names and all(key in hosts.get(host, ()) for host in play_hosts):
+                    names.add(key)
+            removed.append(names)
+        return group, hosts, removed
+
+    def write(self, pb):
+        '''
+        Move vars from pb.stream to group_vars and host_vars files.  See
+        Description.
+        '''
+        self.verify_write(pb)
+        self._files = list()
+        group, hosts, removed = self.hoist(pb)
+        self._group_vars = {key: value for key, (identity, value) in group.items()}
+        if len(group) != 0:
+            self.write_vars(pb, 'group_vars', self.group, self._group_vars)
+        for host in sorted(hosts):
+            self.write_vars(pb, 'host_vars', host, {key: value for key, (identity, value) in hosts[host].items()})
+        stream = list()
+        for play, names in zip(pb.stream, removed):
+            if len(names) == 0:
+                stream.append(play)
+                continue
+            items = list()
+            for key, value in play.items():
+                if key != 'vars':
+                    items.append((key, value))
+                    continue
+                value = {k: v for k, v in value.items() if k not in names}
+                if len(value) == 0:
+                    continue
+                if isinstance(play, FrozenDict):
+                    value = snapshots.freeze(value)
+                items.append((key, value))
+            if isinstance(play, FrozenDict):
+                stream.append(FrozenDict(items))
+            else:
+                # deepcopy_tasks.  play is pb's own copy.
+                stream.append(dict(items))
+        pb.stream = stream
+        self.log.debug('moved {} vars to {}, and vars of {} hosts to host_vars'.format(len(group), self.group, len(hosts)))
+
+    def write_vars(self, pb, subdirectory, name, d):
+        directory = path.join(self.directory, subdirectory)
+        makedirs(directory, exist_ok=True)
+        if pb.output_format == 'json':
+            filename = path.join(directory, '{}.json'.format(name))
+            text = pb.emitter.dump_json(d)
+        else:
+            filename = path.join(directory, '{}.yml'.format(name))
+            text = pb.dump_yaml(d, indent=4, allow_unicode=True, explicit_start=True, default_flow_style=False)
+        if path.exists(filename) and pb.overwrite == 'never':
+            self.log.error('exiting. refusing to overwrite vars file {}. delete it first.'.format(filename))
+            exit(1)
+        write_atomic(filename, text)
+        self._files.append(filename)
+
+    @property
+    def directory(self):
+        return self._directory
+    @directory.setter
+    def directory(self, x):
+        if not path.isdir(x):
+            self.log.error('exiting. directory {} does not exist'.format(x))
+            exit(1)
+        self._directory = x
+
+    @property
+    def files(self):
+        return self._files
+
+    @property
+    def group(self):
+        return self._group
+    @group.setter
+    def group(self, x):
+        self._group = x
+
+    @property
+    def group_vars(self):
+        return self._group_vars
+
+    @property
+    def host_vars(self):
+        return self._host_vars
+    @host_vars.setter
+    def host_vars(self, x):
+        if x not in [True, False]:
+            self.log.error('exiting. host_vars must be True or False. Got {}'.format(x))
+            exit(1)
+        self._host_vars = x
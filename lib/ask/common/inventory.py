@@ -0,0 +1,493 @@
+# Inventory() - common/inventory.py
+our_version = 100
+import os
+import re
+import shlex
+from ast import literal_eval
+from os import path
+from ask.common.cache import open_temporary
+from ask.common.emitter import Emitter
+'''
+***********************************
+Inventory()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+100
+
+ScriptKit Synopsis
+------------------
+- Inventory() builds an Ansible inventory, with groups, child groups,
+  and group and host vars, and writes it as YAML or INI
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_inventory.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_inventory.py>`_
+
+Description
+-----------
+Build the inventory in the same script as the playbook, so that the
+two can not drift apart::
+
+    from ask.common.inventory import Inventory
+    inv = Inventory(log)
+    inv.add_group('leafs', 'fabric')     # leafs is a child of fabric
+    inv.add_group('spines', 'fabric')
+    inv.add_group_vars('fabric', 'ansible_network_os', 'nxos')
+    for number in range(1, 101):
+        host = 'leaf-{}'.format(number)
+        inv.add_host(host, 'leafs')
+        inv.add_host_vars(host, 'ansible_host', '10.0.0.{}'.format(number))
+    inv.file = '/tmp/inventory.yaml'
+    inv.write()
+
+    pb = Playbook(log)
+    pb.inventory = inv
+    pb.add_host('leafs')                 # a group, or a host
+    ...
+
+Every group is a descendant of all.  A group's hosts include those of
+its child groups.  Lookups (``'leaf-1' in inv``, has_host(),
+has_group(), host_vars()) are dict() lookups, and is_member() walks
+only the ancestors of the host's groups, so they cost the same for ten
+hosts or ten thousand.
+
+write() writes the inventory one group at a time, without building it
+in memory first.  Each group, in the order it was added, is written
+under all (YAML: all.children) with its hosts, vars, and the names of
+its child groups.  A host's vars are written once, with the first group
+that lists it.  Hosts in no group are written under all.
+
+With output_format ini, vars are written as Python literals (e.g.
+'admin', 90, True, ['a', 'b']), which Ansible's INI inventory reads back
+with the same type.
+
+With Playbook(), set ``pb.inventory = inv``.  pb.add_host() then exits
+with error for a name that is neither a host nor a group in inv, so a
+play's ``hosts:`` can name groups rather than long lists of hosts, and
+merge_plays(), VarsWriter(), and ShardWriter() expand those groups to
+their hosts.
+
+|
+
+========================    ============================================
+Method                      Description
+========================    ============================================
+add_group()                 Add a group, and optionally make it a child
+                            of parent, which is added if needed.  A group
+                            may have several parents::
+
+                                - Type: function()
+                                - Example:
+                                    inv.add_group('leafs')
+                                    inv.add_group('leafs', 'fabric')
+
+add_group_vars()            Add a var to a group.  Use group all for
+                            vars of every host::
+
+                                - Type: function()
+                                - Example:
+                                    inv.add_group_vars('all', 'ansible_user', 'admin')
+
+add_host()                  Add a host, optionally to group, which is
+                            added if needed.  A host may be in several
+                            groups::
+
+                                - Type: function()
+                                - Example:
+                                    inv.add_host('leaf-1', 'leafs')
+
+add_host_vars()             Add a var to a host::
+
+                                - Type: function()
+                                - Example:
+                                    inv.add_host_vars('leaf-1', 'ansible_host', '10.0.0.1')
+
+expand()                    Return a list() of the hosts named by x: the
+                            hosts of group x, or [x] if x is a host::
+
+                                - Type: function()
+                                - Example:
+                                    hosts = inv.expand('leafs')
+
+group_hosts()               Return a list() of the hosts of a group,
+                            including those of its child groups, in the
+                            order they were added::
+
+                                - Type: function()
+
+has_group()                 Return True if x is a group::
+
+                                - Type: function()
+
+has_host()                  Return True if x is a host::
+
+                                - Type: function()
+
+host_vars()                 Return the dict() of vars added to a host
+                            with add_host_vars()::
+
+                                - Type: function()
+
+is_member()                 Return True if host is in group, directly
+                            or through a child group::
+
+                                - Type: function()
+                                - Example:
+                                    if inv.is_member('leaf-1', 'fabric'):
+
+write()                     Write the inventory to file::
+
+                                - Type: function()
+
+========================    ============================================
+
+|
+
+============================    ==============================================
+Property                        Description
+============================    ==============================================
+file                            The file to which write() writes::
+
+                                    - Type: str()
+
+groups                          A list() of the groups, other than all,
+                                in the order they were added::
+
+                                    - Type: getter
+
+hosts                           A list() of the hosts, in the order they
+                                were added::
+
+                                    - Type: getter
+
+output_format                   The inventory format written by write()::
+
+                                    - Type: str()
+                                    - Valid values: ini, yaml
+                                    - Default: yaml
+
+overwrite                       What write() does if file exists.  See
+                                Playbook()::
+
+                                    - Type: str()
+                                    - Valid values: atomic, never
+                                    - Default: never
+
+============================    ==============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+# Ansible warns about group names that are not valid variable names
+re_group = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+# hosts are joined with ',' in a play's hosts key
+re_host = re.compile(r'^[^\s,\[\]=#;]+$')
+
+def ini_value(x):
+    '''
+    Return x as Ansible's INI inventory reads it back: a Python literal,
+    or, for a str() that Ansible would not read as a literal, x as-is.
+    '''
+    if isinstance(x, str) and re_host.match(x) and "'" not in x and '"' not in x:
+        try:
+            literal_eval(x)
+        except (ValueError, SyntaxError):
+            return x
+    return repr(x)
+
+class Inventory(object):
+    def __init__(self, log):
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+
+        self._file = None
+        self.valid_output_format = set()
+        self.valid_output_format.add('ini')
+        self.valid_output_format.add('yaml')
+        self._output_format = 'yaml'
+        self.valid_overwrite = set()
+        self.valid_overwrite.add('atomic')
+        self.valid_overwrite.add('never')
+        self._overwrite = 'never'
+        self.emitter = Emitter(log)
+
+        # host -> dict() of its vars
+        self._hosts = dict()
+        # host -> set() of the groups that list it directly
+        self._host_groups = dict()
+        # group -> dict() with keys hosts and children (dict()s used as
+        # ordered sets) and vars
+        self._groups = dict()
+        # group -> set() of its parent groups
+        self._parents = dict()
+        # host -> its position in self._hosts
+        self._position = dict()
+        # group -> group_hosts(group).  Cleared by add_group(), add_host()
+        self._expanded = dict()
+        self.new_group('all')
+
+    def new_group(self, group):
+        d = dict()
+        d['hosts'] = dict()
+        d['children'] = dict()
+        d['vars'] = dict()
+        self._groups[group] = d
+        self._parents[group] = set()
+
+    def add_group(self, group, parent=None):
+        self._expanded.clear()
+        if group not in self._groups:
+            self.verify_group(group)
+            self.new_group(group)
+        if parent == None or parent == 'all':
+            return
+        self.add_group(parent)
+        if group == 'all' or group == parent or self.is_ancestor(group, parent):
+            self.log.error('exiting. group {} can not be a child of {}, which is already its descendant'.format(group, parent))
+            exit(1)
+        self._groups[parent]['children'][group] = None
+        self._parents[group].add(parent)
+
+    def verify_group(self, group):
+        if not isinstance(group, str) or re_group.match(group) == None:
+            self.log.error('exiting. group must be letters, digits, and underscore, not starting with a digit. Got {}'.format(group))
+            exit(1)
+        if group in self._hosts:
+            self.log.error('exiting. {} is already a host, so can not be a group'.format(group))
+            exit(1)
+
+    def verify_host(self, host):
+        if not isinstance(host, str) or re_host.match(host) == None:
+            self.log.error('exiting. host must not contain whitespace or any of ,[]=#;. Got {}'.format(host))
+            exit(1)
+        if host in self._groups:
+            self.log.error('exiting. {} is already a group, so can not be a host'.format(host))
+            exit(1)
+
+    def is_ancestor(self, group, descendant):
+        '''
+        Return True if group is a parent, grandparent, etc, of descendant
+        '''
+        pending = list(self._parents[descendant])
+        seen = set()
+        while len(pending) != 0:
+            parent = pending.pop()
+            if parent == group:
+                return True
+            if parent not in seen:
+                seen.add(parent)
+                pending.extend(self._parents[parent])
+        return False
+
+    def add_host(self, host, group=None):
+        self._expanded.clear()
+        if host not in self._hosts:
+            self.verify_host(host)
+            self._position[host] = len(self._hosts)
+            self._hosts[host] = dict()
+            self._host_groups[host] = set()
+        if group == None or group == 'all':
+            return
+        self.add_group(group)
+        self._groups[group]['hosts'][host] = None
+        self._host_groups[host].add(group)
+
+    def add_host_vars(self, host, key, value):
+        if host not in self._hosts:
+            self.log.error('exiting. call instance.add_host({}) before calling instance.add_host_vars()'.format(host))
+            exit(1)
+        self._hosts[host][key] = value
+
+    def add_group_vars(self, group, key, value):
+        if group not in self._groups:
+            self.log.error('exiting. call instance.add_group({}) before calling instance.add_group_vars()'.format(group))
+            exit(1)
+        self._groups[group]['vars'][key] = value
+
+    def __contains__(self, x):
+        return x in self._hosts or x in self._groups
+
+    def has_host(self, x):
+        return x in self._hosts
+
+    def has_group(self, x):
+        return x in self._groups
+
+    def host_vars(self, host):
+        return self._hosts[host]
+
+    def is_member(self, host, group):
+        if host not in self._hosts or group not in self._groups:
+            return False
+        if group == 'all' or group in self._host_groups[host]:
+            return True
+        return any(self.is_ancestor(group, x) for x in self._host_groups[host])
+
+    def group_hosts(self, group):
+        if group in self._expanded:
+            return self._expanded[group]
+        if group == 'all':
+            self._expanded[group] = list(self._hosts)
+            return self._expanded[group]
+        hosts = dict()
+        pending = [group]
+        seen = set()
+        while len(pending) != 0:
+            x = pending.pop(0)
+            if x in seen:
+                continue
+            seen.add(x)
+            hosts.update(self._groups[x]['hosts'])
+            pending.extend(self._groups[x]['children'])
+        self._expanded[group] = sorted(hosts, key=self._position.get)
+        return self._expanded[group]
+
+    def expand(self, x):
+        if x in self._groups:
+            return self.group_hosts(x)
+        return [x]
+
+    def ungrouped_hosts(self):
+        return [host for host in self._hosts if len(self._host_groups[host]) == 0]
+
+    def write(self):
+        '''
+        Write the inventory to self.file.  See Description.
+        '''
+        if self.file == None:
+            self.log.error('exiting. call instance.file = <filename> before calling instance.write()')
+            exit(1)
+        if path.exists(self.file) and self.overwrite == 'never':
+            self.log.error('exiting. refusing to overwrite inventory file {}. delete it first.'.format(self.file))
+            exit(1)
+        if self.overwrite == 'atomic':
+            fh = open_temporary(self.file)
+        else:
+            fh = open(self.file, 'w')
+        with fh:
+            if self.output_format == 'ini':
+                self.write_ini(fh)
+            else:
+                self.write_yaml(fh)
+        if self.overwrite == 'atomic':
+            os.replace(fh.name, self.file)
+        self.log.debug('wrote {} hosts, {} groups to {}'.format(len(self._hosts), len(self._groups) - 1, self.file))
+
+    def write_ini(self, fh):
+        written = set() # hosts whose vars have been written
+        def host_line(host):
+            items = list()
+            if host not in written:
+                written.add(host)
+                for key, value in self._hosts[host].items():
+                    items.append(shlex.quote('{}={}'.format(key, ini_value(value))))
+            return ' '.join([host] + items) + '\n'
+        def vars_lines(group):
+            return ['{}={}\n'.format(key, ini_value(value)) for key, value in self._groups[group]['vars'].items()]
+        # ungrouped hosts, before the first section
+        for host in self.ungrouped_hosts():
+            fh.write(host_line(host))
+        if len(self._groups['all']['vars']) != 0:
+            fh.write('\n[all:vars]\n')
+            fh.writelines(vars_lines('all'))
+        for group, d in self._groups.items():
+            if group == 'all':
+                continue
+            if len(d['hosts']) != 0 or (len(d['vars']) == 0 and len(d['children']) == 0):
+                # a group with only vars or children needs no [group] section
+                fh.write('\n[{}]\n'.format(group))
+                fh.writelines(host_line(host) for host in d['hosts'])
+            if len(d['vars']) != 0:
+                fh.write('\n[{}:vars]\n'.format(group))
+                fh.writelines(vars_lines(group))
+            if len(d['children']) != 0:
+                fh.write('\n[{}:children]\n'.format(group))
+                fh.writelines('{}\n'.format(child) for child in d['children'])
+
+    def write_yaml(self, fh):
+        written = set() # hosts whose vars have been written
+        indent = ' ' * self.emitter.indent
+        def write_hosts(hosts, column):
+            fh.write('{}hosts:\n'.format(' ' * column))
+            for host in hosts:
+                host_vars = self._hosts[host]
+                fh.write('{}{}:'.format(' ' * (column + len(indent)), self.emitter.scalar(host)))
+                if host in written or len(host_vars) == 0:
+                    fh.write('\n')
+                    continue
+                written.add(host)
+                out = ['\n', ' ' * (column + 2 * len(indent))]
+                self.emitter.emit_mapping(host_vars, column + 2 * len(indent), out)
+                fh.write(''.join(out))
+        def write_vars(group, column):
+            group_vars = self._groups[group]['vars']
+            if len(group_vars) == 0:
+                return
+            out = ['{}vars:\n'.format(' ' * column), ' ' * (column + len(indent))]
+            self.emitter.emit_mapping(group_vars, column + len(indent), out)
+            fh.write(''.join(out))
+        fh.write('---\nall:\n')
+        ungrouped = self.ungrouped_hosts()
+        if len(ungrouped) != 0:
+            write_hosts(ungrouped, len(indent))
+        write_vars('all', len(indent))
+        if len(self._groups) > 1:
+            fh.write('{}children:\n'.format(indent))
+        for group, d in self._groups.items():
+            if group == 'all':
+                continue
+            fh.write('{}{}:\n'.format(indent * 2, group))
+            if len(d['hosts']) != 0:
+                write_hosts(d['hosts'], 3 * len(indent))
+            write_vars(group, 3 * len(indent))
+            if len(d['children']) != 0:
+                fh.write('{}children:\n'.format(indent * 3))
+                fh.writelines('{}{}:\n'.format(indent * 4, child) for child in d['children'])
+        fh.write('...\n')
+
+    @property
+    def file(self):
+        return self._file
+    @file.setter
+    def file(self, x):
+        self._file = x
+
+    @property
+    def groups(self):
+        return [group for group in self._groups if group != 'all']
+
+    @property
+    def hosts(self):
+        return list(self._hosts)
+
+    @property
+    def output_format(self):
+        return self._output_format
+    @output_format.setter
+    def output_format(self, x):
+        if x not in self.valid_output_format:
+            self.log.error('exiting. output_format must be one of {}. Got {}'.format(sorted(self.valid_output_format), x))
+            exit(1)
+        self._output_format = x
+
+    @property
+    def overwrite(self):
+        return self._overwrite
+    @overwrite.setter
+    def overwrite(self, x):
+        if x not in self.valid_overwrite:
+            self.log.error('exiting. overwrite must be one of {}. Got {}'.format(sorted(self.valid_overwrite), x))
+            exit(1)
+        self._overwrite = x
@@ -0,0 +1,426 @@
+# ParallelPlaybook() - common/parallel.py
+our_version = 104
+import logging
+import logging.handlers
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+from ask.common.playbook import Playbook
+'''
+***********************************
+ParallelPlaybook()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+104
+
+ScriptKit Synopsis
+------------------
+- ParallelPlaybook() builds one play per host, for many hosts, across a
+  pool of processes
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_parallel.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_parallel.py>`_
+
+Description
+-----------
+Playbook generation is usually independent per switch.  ParallelPlaybook()
+calls a builder function once per host, each call in one of a pool of
+worker processes (concurrent.futures.ProcessPoolExecutor), and either:
+
+- writes each host's playbook to its own file in ppb.directory, from the
+  worker, or
+- returns each host's plays to the parent, which writes them, in the
+  order of hosts, to the single playbook file ppb.file
+
+builder is called as builder(pb, host, log), where pb is a new Playbook()
+and log is the worker's logger.  builder creates tasks with log, and adds
+them to pb as usual.  If builder does not call pb.append_playbook() itself,
+ParallelPlaybook() adds host to, and appends, the last play.  builder must
+be a module-level function (it is pickled to the workers), and must not
+depend on state that only exists in the parent.
+
+Worker log records are sent back to the parent over a queue, and handled
+by the handlers of the parent's logger, so console output and the logfile
+look as they would for a sequential run::
+
+    from ask.common.log import Log
+    from ask.common.parallel import ParallelPlaybook
+    from ask.cisco.nxos.nxos_feature import NxosFeature
+
+    def build(pb, host, log):
+        pb.profile_nxos()
+        task = NxosFeature(log)
+        task.feature = 'bgp'
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+
+    log = Log('my_script', 'INFO', 'DEBUG')
+    ppb = ParallelPlaybook(log)
+    ppb.builder = build
+    ppb.hosts = ['leaf-{}'.format(x) for x in range(2000)]
+    ppb.file = '/tmp/fabric.yaml'
+    ppb.run()
+
+If ppb.cache is set to a PlaybookCache() (see common/cache.py), playbook
+files whose plays are unchanged since the last run are not rewritten,
+changed files are replaced atomically, and the cache's manifest is saved
+at the end of run().  ppb.cache.changed_hosts then lists the hosts to
+run the playbooks against.
+
+A builder that exits (e.g. on an invalid value) exits the parent with
+the same status, after its log records are handled.
+
+|
+
+============================    ==============================================
+Property                        Description
+============================    ==============================================
+builder                         Function called as builder(pb, host, log)
+                                once per host::
+
+                                    - Type: function()
+
+cache                           A PlaybookCache().  See above::
+
+                                    - Type: PlaybookCache()
+                                    - Default: None
+
+chunksize                       Number of hosts sent to a worker at a time::
+
+                                    - Type: int()
+                                    - Default: hosts / (4 * workers)
+
+directory                       Write each host's playbook to
+                                <directory>/<host>.yaml (or .json).
+                                Mutually-exclusive with file::
+
+                                    - Type: str()
+
+file                            Write every host's plays, in the order of
+                                hosts, to this file.  Mutually-exclusive
+                                with directory::
+
+                                    - Type: str()
+
+hosts                           The hosts, in order::
+
+                                    - Type: list()
+
+key_order                       See Playbook()::
+
+                                    - Default: sorted
+
+merge_plays                     If True, and file is set, merge plays that
+                                differ only in their hosts before writing
+                                file.  See merge_plays() in Playbook()::
+
+                                    - Type: bool()
+                                    - Default: False
+
+output_format                   See Playbook()::
+
+                                    - Default: yaml
+
+workers                         Number of worker processes.  If 0, run the
+                                builders sequentially in this process::
+
+                                    - Type: int()
+                                    - Default: os.cpu_count()
+
+yaml_aliases                    See Playbook()::
+
+                                    - Default: False
+
+yaml_backend                    See Playbook()::
+
+                                    - Default: auto
+
+============================    ==============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+
+# the logger, and cache, of a worker process.  See init_worker()
+worker_log = None
+worker_cache = None
+
+def init_worker(queue, log_name, log_level, cache):
+    '''
+    ProcessPoolExecutor() initializer.  Send the worker's log records to
+    the parent over queue.
+    '''
+    global worker_log
+    global worker_cache
+    worker_cache = cache
+    worker_log = logging.getLogger(log_name)
+    # a forked worker inherits the parent's handlers
+    worker_log.handlers.clear()
+    worker_log.addHandler(logging.handlers.QueueHandler(queue))
+    worker_log.setLevel(log_level)
+    worker_log.propagate = False
+
+def build_host(builder, host, settings, log, cache=None):
+    '''
+    Call builder for host.  If settings['directory'] is set, write host's
+    playbook there and return (host, filename, entry), else return
+    (host, plays, None).  entry is the file's cache entry, to be recorded
+    in the parent's cache, or None if cache is None.
+    '''
+    pb = Playbook(log)
+    pb.cache = cache
+    pb.yaml_backend = settings['yaml_backend']
+    pb.output_format = settings['output_format']
+    pb.key_order = settings['key_order']
+    pb.yaml_aliases = settings['yaml_aliases']
+    builder(pb, host, log)
+    if len(pb.playbook['tasks']) != 0:
+        if len(pb.hosts) == 0:
+            pb.add_host(host)
+        pb.append_playbook()
+    if settings['directory'] == None:
+        return host, pb.stream, None
+    pb.file = path.join(settings['directory'], '{}.{}'.format(host, settings['output_format']))
+    pb.write_playbook()
+    if cache == None:
+        return host, pb.file, None
+    return host, pb.file, cache.entries[pb.file]
+
+def build_host_in_worker(builder, host, settings):
+    return build_host(builder, host, settings, worker_log, worker_cache)
+
+class ParallelPlaybook(object):
+    def __init__(self, log):
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+
+        self._builder = None
+        self._cache = None
+        self._chunksize = None
+        self._directory = None
+        self._file = None
+        self._hosts = list()
+        self._key_order = 'sorted'
+        self._merge_plays = False
+        self._output_format = 'yaml'
+        self._workers = os.cpu_count()
+        self._yaml_aliases = False
+        self._yaml_backend = 'auto'
+
+    def settings(self):
+        '''
+        The parts of self needed by build_host(), as a picklable dict()
+        '''
+        d = dict()
+        d['directory'] = self.directory
+        d['key_order'] = self.key_order
+        d['output_format'] = self.output_format
+        d['yaml_aliases'] = self.yaml_aliases
+        d['yaml_backend'] = self.yaml_backend
+        return d
+
+    def verify_run(self):
+        if self.builder == None:
+            self.log.error('exiting. call instance.builder = <function> before calling instance.run()')
+            exit(1)
+        if len(self.hosts) == 0:
+            self.log.error('exiting. call instance.hosts = <list> before calling instance.run()')
+            exit(1)
+        if self.directory == None and self.file == None:
+            self.log.error('exiting. call instance.directory or instance.file before calling instance.run()')
+            exit(1)
+        if self.directory != None and self.file != None:
+            self.log.error('exiting. instance.directory and instance.file are mutually-exclusive')
+            exit(1)
+        if self.file != None and path.exists(self.file) and self.cache == None:
+            self.log.error('exiting. refusing to overwrite playbook file {}. delete it first.'.format(self.file))
+            exit(1)
+
+    def run(self):
+        '''
+        Build every host's plays, and write them.  See Description above.
+        '''
+        self.verify_run()
+        self.build()
+        if self.cache != None and self.cache.manifest != None:
+            self.cache.save()
+
+    def worker_cache(self):
+        '''
+        The cache given to build_host().  Entries are recorded in
+        self.cache by write().
+        '''
+        if self.cache == None or self.directory == None:
+            return None
+        return self.cache.copy()
+
+    def build(self):
+        if self.workers == 0:
+            cache = self.worker_cache()
+            results = (build_host(self.builder, host, self.settings(), self.log, cache) for host in self.hosts)
+            self.write(results)
+            return
+        queue = multiprocessing.Queue()
+        handlers = self.log.handlers
+        listener = logging.handlers.QueueListener(queue, *handlers, respect_handler_level=True)
+        log_level = min([handler.level for handler in handlers] + [logging.CRITICAL])
+        chunksize = self.chunksize
+        if chunksize == None:
+            chunksize = max(1, len(self.hosts) // (4 * self.workers))
+        listener.start()
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(queue, self.log.name, log_level, self.worker_cache())) as executor:
+                builders = [self.builder] * len(self.hosts)
+                settings = [self.settings()] * len(self.hosts)
+                self.write(executor.map(build_host_in_worker, builders, self.hosts, settings, chunksize=chunksize))
+        finally:
+            listener.stop()
+
+    def write(self, results):
+        '''
+        results yields (host, plays, None), or (host, filename, entry),
+        in the order of self.hosts.
+        '''
+        if self.directory != None:
+            for host, filename, entry in results:
+                self.log.debug('{} wrote {}'.format(host, filename))
+                if entry != None:
+                    self.cache.record(filename, entry)
+            return
+        pb = Playbook(self.log)
+        pb.cache = self.cache
+        pb.yaml_backend = self.yaml_backend
+        pb.output_format = self.output_format
+        pb.key_order = self.key_order
+        pb.yaml_aliases = self.yaml_aliases
+        pb.file = self.file
+        for host, plays, entry in results:
+            pb.stream.extend(plays)
+        if self.merge_plays:
+            pb.merge_plays()
+        pb.write_playbook()
+
+    @property
+    def builder(self):
+        return self._builder
+    @builder.setter
+    def builder(self, x):
+        if not callable(x):
+            self.log.error('exiting. builder must be a function. Got {}'.format(x))
+            exit(1)
+        self._builder = x
+
+    @property
+    def cache(self):
+        return self._cache
+    @cache.setter
+    def cache(self, x):
+        self._cache = x
+
+    @property
+    def chunksize(self):
+        return self._chunksize
+    @chunksize.setter
+    def chunksize(self, x):
+        if type(x) != int or x < 1:
+            self.log.error('exiting. chunksize must be an int() > 0. Got {}'.format(x))
+            exit(1)
+        self._chunksize = x
+
+    @property
+    def directory(self):
+        return self._directory
+    @directory.setter
+    def directory(self, x):
+        if not path.isdir(x):
+            self.log.error('exiting. directory {} does not exist'.format(x))
+            exit(1)
+        self._directory = x
+
+    @property
+    def file(self):
+        return self._file
+    @file.setter
+    def file(self, x):
+        self._file = x
+
+    @property
+    def hosts(self):
+        return self._hosts
+    @hosts.setter
+    def hosts(self, x):
+        if len(set(x)) != len(x):
+            self.log.error('exiting. hosts must be unique. Got {}'.format(x))
+            exit(1)
+        self._hosts = list(x)
+
+    @property
+    def key_order(self):
+        return self._key_order
+    @key_order.setter
+    def key_order(self, x):
+        pb = Playbook(self.log)
+        pb.key_order = x # exits if x is invalid
+        self._key_order = x
+
+    @property
+    def merge_plays(self):
+        return self._merge_plays
+    @merge_plays.setter
+    def merge_plays(self, x):
+        if x not in [True, False]:
+            self.log.error('exiting. merge_plays must be True or False. Got {}'.format(x))
+            exit(1)
+        self._merge_plays = x
+
+    @property
+    def output_format(self):
+        return self._output_format
+    @output_format.setter
+    def output_format(self, x):
+        pb = Playbook(self.log)
+        pb.output_format = x # exits if x is invalid
+        self._output_format = x
+
+    @property
+    def workers(self):
+        return self._workers
+    @workers.setter
+    def workers(self, x):
+        if type(x) != int or x < 0:
+            self.log.error('exiting. workers must be an int() >= 0. Got {}'.format(x))
+            exit(1)
+        self._workers = x
+
+    @property
+    def yaml_aliases(self):
+        return self._yaml_aliases
+    @yaml_aliases.setter
+    def yaml_aliases(self, x):
+        pb = Playbook(self.log)
+        pb.yaml_aliases = x # exits if x is invalid
+        self._yaml_aliases = x
+
+    @property
+    def yaml_backend(self):
+        return self._yaml_backend
+    @yaml_backend.setter
+    def yaml_backend(self, x):
+        pb = Playbook(self.log)
+        pb.yaml_backend = x # exits if x is invalid
+        self._yaml_backend = x
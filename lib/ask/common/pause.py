@@ -1,5 +1,5 @@
 our_version = 102
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************
 Pause()
@@ -73,14 +73,13 @@ class Pause(Task):
         self.init_properties()
 
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['seconds'] = None
         self.properties['task_name'] = None
 
     def final_verification(self):
         if self.seconds == None:
-            self.log.error('exiting. call instance.seconds before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.seconds before calling instance.commit()')
 
     def commit(self):
         self.update()
@@ -107,13 +106,4 @@ class Pause(Task):
         self.fail(source_class, source_method, x, parameter, expectation)
 
 
-    @property
-    def seconds(self):
-        return self.properties['seconds']
-    @seconds.setter
-    def seconds(self, x):
-        parameter = 'seconds'
-        if self.set_none(x, parameter):
-            return
-        self.verify_ansible_pause_seconds(x, parameter)
-        self.properties[parameter] = x
+    seconds = TaskProperty('verify_ansible_pause_seconds')
@@ -1,8 +1,19 @@
 # Playbook() - common/playbook.py
-our_version = 119
-from copy import deepcopy
+our_version = 134
+import os # close_stream()
 from os import path # write_playbook(), write_vars()
+import sys # open_stream()
 import yaml
+try:
+    from yaml import CDumper # libyaml, see yaml_backend
+except ImportError:
+    CDumper = None
+from ask.common.cache import open_temporary, write_atomic # cache, overwrite
+from ask.common.canonical import order_play, order_task # key_order
+from ask.common.coalesce import coalesce_tasks, task_module # coalesce_tasks
+from ask.common.emitter import Emitter # yaml_backend scriptkit, output_format json
+from ask.common.snapshot import FrozenDict, FrozenList, snapshots, thaw # add_task(), append_playbook()
+from ask.common.tuning import suggest_execution # suggest_execution()
 '''
 ***********************************
 Playbook()
@@ -14,7 +25,7 @@ Playbook()
 
 Version
 -------
-119
+134
 
 ScriptKit Synopsis
 ------------------
@@ -43,7 +54,10 @@ add_environment()           Add a key,value to the playbook environment.::
 
 add_host()                  Add an ansible host to the current playbook
                             hosts key.  This must match a host in the
-                            ansible inventory.::
+                            ansible inventory.  If pb.inventory is set,
+                            x may also be a group in pb.inventory, and
+                            pb.add_host() exits with error if x is
+                            neither::
 
                                 - Type: function()
                                 - Example:
@@ -73,6 +87,38 @@ add_task()                  Add a task to the current playbook.::
                                     pb.append_playbook()
                                     pb.write_playbook()
 
+                            If the task's host_var is set (see Task()
+                            in common/task.py), its config is written as
+                            a reference to the variable host_var e.g.
+                            '{{ l3_interfaces }}', and the config itself
+                            is added to the play's vars, as host_var.
+                            Plays for different hosts, built from the
+                            same tasks, then differ only in their vars.
+                            VarsWriter() (common/hoist.py) moves each
+                            host's values to its host_vars file, and
+                            merge_plays() then merges the plays into one
+                            play for all hosts::
+
+                                - Example:
+                                    pb = Playbook(log)
+                                    for host in hosts:
+                                        pb.profile_nxos()
+                                        task = NxosL3Interfaces(log)
+                                        # add_interface() for each of
+                                        # the host's interfaces
+                                        task.host_var = 'l3_interfaces'
+                                        task.state = 'merged'
+                                        task.commit()
+                                        pb.add_task(task)
+                                        pb.add_host(host)
+                                        pb.append_playbook()
+                                    vw = VarsWriter(log)
+                                    vw.directory = '/tmp/fabric'
+                                    vw.write(pb)
+                                    pb.merge_plays()
+                                    pb.file = '/tmp/fabric/fabric.yaml'
+                                    pb.write_playbook()
+
 add_vars()                  Add a key,value to the playbook's vars dict()::
 
                                 - Type: function()
@@ -110,6 +156,63 @@ append_playbook()           Append the current set of tasks as a playbook.
 
                                     pb.write_playbook()
 
+merge_plays()               Merge plays that differ only in their hosts
+                            into one play, whose hosts are those of all
+                            the merged plays, so that e.g. a baseline
+                            play added once per host is written once,
+                            and Ansible runs it on all hosts at once.
+                            A play is only merged into an earlier one if
+                            none of its hosts has a play in between, so
+                            each host's plays still run in the same
+                            order.  Call before write_playbook().  Not
+                            available in streaming mode.::
+
+                                - Type: function()
+                                - Example:
+                                    pb = Playbook(log)
+                                    for host in hosts:
+                                        task = NxosFeature(log)
+                                        task.feature = 'bgp'
+                                        task.state = 'enabled'
+                                        task.commit()
+                                        pb.add_task(task)
+                                        pb.add_host(host)
+                                        pb.append_playbook()
+                                    pb.merge_plays() # one play, all hosts
+                                    pb.write_playbook()
+
+open_stream()               Streaming mode, for playbooks with many plays
+                            e.g. one per host.  Open pb.file now.  Each
+                            append_playbook() then writes its play to the
+                            file immediately, and frees it, rather than
+                            keeping it in memory.  write_playbook() then
+                            finishes and closes the file.  The file
+                            contents are identical to those written
+                            without open_stream().::
+
+                                - Type: function()
+                                - Example:
+                                    pb = Playbook(log)
+                                    pb.file = '/tmp/myplaybook.yaml'
+                                    pb.open_stream()
+                                    for host in hosts:
+                                        task = NxosFeature(log)
+                                        task.feature = 'bgp'
+                                        task.state = 'enabled'
+                                        task.commit()
+                                        pb.add_task(task)
+                                        pb.add_host(host)
+                                        pb.append_playbook()
+                                    pb.write_playbook()
+
+play_hosts()                Return a list() of the hosts of a play in
+                            pb.stream, with any group in pb.inventory
+                            expanded to its hosts::
+
+                                - Type: function()
+                                - Example:
+                                    hosts = pb.play_hosts(pb.stream[0])
+
 profile_local()             Set various variables appropriately for
                             a playbook that runs on a local host.
                             Specifically, the following vars are set
@@ -165,7 +268,29 @@ profile_nxos()              Set various variables appropriately for a
                                     pb.ansible_command_timeout = 180
                                     pb.ansible_httpapi_validate_certs = True
 
-write_playbook()            Write the playbook file to disk or STDOUT::
+suggest_execution()         Suggest forks and serial for the current
+                            play, from its hosts (with groups of
+                            pb.inventory expanded) and the estimated
+                            cost of its tasks, and set pb.serial.  Call
+                            after adding the play's tasks and hosts,
+                            and before append_playbook().  Returns a
+                            dict() with keys forks, serial, play_seconds
+                            and estimated_seconds.  forks is not a play
+                            keyword: pass it to ansible-playbook
+                            --forks.  kwargs are passed to
+                            suggest_execution() in common/tuning.py,
+                            which describes the estimate::
+
+                                - Type: function()
+                                - Example:
+                                    pb.max_fail_percentage = 10
+                                    d = pb.suggest_execution(max_batch_percent=25)
+                                    pb.append_playbook()
+                                    print('ansible-playbook --forks {}'.format(d['forks']))
+
+write_playbook()            Write the playbook file to disk or STDOUT.
+                            To split the playbook across several files,
+                            see ShardWriter() in common/shard.py::
 
                                 - Type: function()
                                 - Example:
@@ -205,6 +330,46 @@ write_vars()            Write the current playbook vars section to disk or STDOU
 ============================    ==============================================
 Property                        Description
 ============================    ==============================================
+cache                           A PlaybookCache() (see common/cache.py).  If
+                                set, write_playbook() leaves the file
+                                untouched if its plays are unchanged since
+                                the run recorded in the cache's manifest,
+                                and otherwise overwrites it atomically.
+                                The cache records which hosts' plays
+                                changed::
+
+                                    - Type: PlaybookCache()
+                                    - Default: None
+                                    - Example:
+                                        cache = PlaybookCache(log, '/tmp/manifest.json')
+                                        pb.cache = cache
+                                        # ... pb.write_playbook()
+                                        cache.save()
+                                        print(cache.changed_hosts)
+
+coalesce_tasks                  If True, append_playbook() merges adjacent
+                                tasks of the play for the same resource
+                                module and state (e.g. several
+                                NxosVlans() tasks) into one task, unless
+                                their config lists conflict.  See
+                                common/coalesce.py::
+
+                                    - Type: bool()
+                                    - Default: False
+                                    - Example:
+                                        pb.coalesce_tasks = True
+
+deepcopy_tasks                  By default, add_task() and append_playbook()
+                                keep tasks, and plays, as immutable,
+                                shared snapshots (see common/snapshot.py),
+                                without copying them.  If True, deep-copy
+                                them instead, as mutable dict()s::
+
+                                    - Type: bool()
+                                    - Default: False
+                                    - Example:
+                                        pb.deepcopy_tasks = True
+
 file                            Filename to which playbook contents are written.
                                 If set to the string "STDOUT", write to standard
                                 output instead of to a file::
@@ -237,12 +402,142 @@ hosts                           A getter property that returns a python list()
                                         current_hosts = pb.hosts
                                         # current_hosts contains an empty list: []
 
+inventory                       An Inventory() (see common/inventory.py).
+                                If set, add_host() accepts only its hosts
+                                and groups, and merge_plays(),
+                                VarsWriter(), and ShardWriter() expand
+                                the groups in a play's hosts to their
+                                hosts (see play_hosts())::
+
+                                    - Type: Inventory()
+                                    - Default: None
+                                    - Example:
+                                        pb.inventory = inv
+                                        pb.add_host('leafs')
+
+key_order                       The order in which the keys of plays,
+                                tasks, and everything within them, are
+                                written::
+
+                                    - Type: str()
+                                    - Valid values:
+                                        - sorted: every mapping with
+                                          sorted keys
+                                        - canonical: plays and tasks
+                                          in the order Ansible's
+                                          documentation uses (play
+                                          name, hosts ... vars, tasks.
+                                          task name, then module).
+                                          Everything else sorted.
+                                          See common/canonical.py
+                                    - Default: sorted
+                                    - Example:
+                                        pb.key_order = 'canonical'
+
+max_fail_percentage             The current play's max_fail_percentage.
+                                Ansible stops the play if more than this
+                                percentage of the hosts of a batch (see
+                                serial) fail.  None to omit it::
+
+                                    - Type: int() or float()
+                                    - Valid values: 0 - 100
+                                    - Default: None
+                                    - Example:
+                                        pb.max_fail_percentage = 10
+
 name                            The playbook's name::
 
                                     - Type: str()
                                     - Example:
                                         pb.name = 'my playbook'
 
+overwrite                       What write_playbook(), write_vars(), and
+                                open_stream() do if pb.file exists::
+
+                                    - Type: str()
+                                    - Valid values:
+                                        - never: exit with error
+                                        - atomic: write to a temporary
+                                          file in the same directory,
+                                          then rename it to pb.file, so
+                                          that readers never see a
+                                          partially-written file
+                                    - Default: never, or atomic if
+                                      pb.cache is set
+                                    - Example:
+                                        pb.overwrite = 'atomic'
+
+output_format                   The format written by write_playbook() and
+                                write_vars().  Ansible reads playbooks in
+                                either format.::
+
+                                    - Type: str()
+                                    - Valid values: json, yaml
+                                    - Default: yaml
+                                    - Example:
+                                        pb.output_format = 'json'
+
+serial                          The current play's serial: the number,
+                                or percentage, of hosts in each batch,
+                                or a list() of these, for batches of
+                                increasing size.  None to omit it.  See
+                                also suggest_execution()::
+
+                                    - Type: int(), str(), or list()
+                                    - Examples:
+                                        pb.serial = 20
+                                        pb.serial = '25%'
+                                        pb.serial = [1, '10%', '100%']
+
+strategy                        The current play's strategy.  None to
+                                omit it (Ansible's default is linear)::
+
+                                    - Type: str()
+                                    - Valid values: debug, free,
+                                      host_pinned, linear
+                                    - Default: None
+                                    - Example:
+                                        pb.strategy = 'free'
+
+yaml_backend                    The YAML emitter used by write_playbook(),
+                                write_vars(), and streaming mode.  Both
+                                backends, other than scriptkit, produce
+                                identical output.::
+
+                                    - Type: str()
+                                    - Valid values:
+                                        - auto: libyaml (yaml.CDumper) if
+                                          it is installed, else python
+                                        - libyaml: libyaml only.  Exit with
+                                          error if it is not installed.
+                                        - python: the pure-python yaml.Dumper
+                                        - scriptkit: ScriptKit's Emitter().
+                                          Fastest.  Loads to the same data,
+                                          but does not fold long strings.
+                                          See common/emitter.py
+                                    - Default: auto
+                                    - Example:
+                                        pb.yaml_backend = 'python'
+
+yaml_aliases                    If True, write_playbook() writes each
+                                subtree (dict or list) that occurs more
+                                than once in the plays, e.g. the vars of
+                                every play, or an ACL applied to many
+                                hosts, once, as a YAML anchor, and every
+                                later occurrence as an alias to it.
+                                Subtrees are matched by content.
+                                Ansible loads the same data, from a
+                                smaller file.  Not available with
+                                yaml_backend scriptkit, or in streaming
+                                mode (anchors must be unique within the
+                                file).  Ignored with output_format
+                                json::
+
+                                    - Type: bool()
+                                    - Default: False
+                                    - Example:
+                                        pb.yaml_aliases = True
+
 ============================    ==============================================
 
 |
@@ -253,6 +548,71 @@ Authors
 - Allen Robel (@PacketCalc)
 
 '''
+def snapshot_dumper(dumper):
+    '''
+    Return a subclass of yaml Dumper class dumper that writes snapshots
+    (see common/snapshot.py) exactly as the dicts and lists they replace.
+    Snapshots are shared, so without ignore_aliases(), yaml would write
+    the second and later occurrences as aliases.
+    '''
+    class SnapshotDumper(dumper):
+        def ignore_aliases(self, data):
+            if data.__class__ is FrozenDict or data.__class__ is FrozenList:
+                return True
+            return super().ignore_aliases(data)
+    SnapshotDumper.add_representer(FrozenDict, dumper.represent_dict)
+    SnapshotDumper.add_representer(FrozenList, dumper.represent_list)
+    return SnapshotDumper
+
+def alias_dumper(dumper):
+    '''
+    Return a subclass of yaml Dumper class dumper that writes snapshots
+    as the dicts and lists they replace, and the second and later
+    occurrences of a non-empty snapshot as aliases.  See yaml_aliases.
+    '''
+    class AliasDumper(dumper):
+        def ignore_aliases(self, data):
+            if data.__class__ is FrozenDict or data.__class__ is FrozenList:
+                return len(data) == 0
+            return super().ignore_aliases(data)
+    AliasDumper.add_representer(FrozenDict, dumper.represent_dict)
+    AliasDumper.add_representer(FrozenList, dumper.represent_list)
+    return AliasDumper
+
+def share_subtrees(x, table):
+    '''
+    Return a snapshot of x in which subtrees with the same content, and
+    the same key order, are one object.  table (a dict()) holds the
+    subtrees seen so far.
+
+    Unlike snapshots.freeze(), keys keep their order (e.g. key_order
+    canonical), and table is private to one write, so the shared
+    subtrees are not interned in snapshots.
+    '''
+    if isinstance(x, dict):
+        items = [(key, share_subtrees(value, table)) for key, value in x.items()]
+        key = (FrozenDict, tuple((k, snapshots.identity(v)) for k, v in items))
+        cls = FrozenDict
+    elif isinstance(x, list):
+        items = [share_subtrees(item, table) for item in x]
+        key = (FrozenList, tuple(snapshots.identity(item) for item in items))
+        cls = FrozenList
+    else:
+        return x
+    try:
+        return table.setdefault(key, cls(items))
+    except TypeError:
+        # an unhashable scalar e.g. a set().  Not shared.
+        return cls(items)
+
+PythonDumper = snapshot_dumper(yaml.Dumper)
+PythonAliasDumper = alias_dumper(yaml.Dumper)
+LibyamlDumper = None
+LibyamlAliasDumper = None
+if CDumper != None:
+    LibyamlDumper = snapshot_dumper(CDumper)
+    LibyamlAliasDumper = alias_dumper(CDumper)
+
 class Playbook(object):
     def __init__(self, log):
         self.log = log
@@ -261,6 +621,43 @@ class Playbook(object):
 
         self._file = None
         self.stream = list() # a list of self.playbook - see self.append_playbook()
+        # the number of tasks in each play in self.stream.  See ShardWriter()
+        self.task_counts = list()
+        # see open_stream()
+        self._stream_fh = None
+        self._stream_stdout = False
+        self._stream_count = 0
+        self.valid_yaml_backend = set()
+        self.valid_yaml_backend.add('auto')
+        self.valid_yaml_backend.add('libyaml')
+        self.valid_yaml_backend.add('python')
+        self.valid_yaml_backend.add('scriptkit')
+        self._yaml_backend = 'auto'
+        self.valid_output_format = set()
+        self.valid_output_format.add('json')
+        self.valid_output_format.add('yaml')
+        self._output_format = 'yaml'
+        self.emitter = Emitter(log)
+        self._deepcopy_tasks = False
+        self._coalesce_tasks = False
+        self._yaml_aliases = False
+        self.valid_key_order = set()
+        self.valid_key_order.add('canonical')
+        self.valid_key_order.add('sorted')
+        self._key_order = 'sorted'
+        self.valid_overwrite = set()
+        self.valid_overwrite.add('atomic')
+        self.valid_overwrite.add('never')
+        self._overwrite = 'never'
+        self._cache = None
+        self._inventory = None
+        self.valid_strategy = set()
+        self.valid_strategy.add('debug')
+        self.valid_strategy.add('free')
+        self.valid_strategy.add('host_pinned')
+        self.valid_strategy.add('linear')
+        # see close_stream()
+        self._stream_entry = None
 
         self.init_playbook()
 
@@ -336,6 +733,96 @@ class Playbook(object):
     def file(self, x):
         self._file = x
 
+    @property
+    def yaml_backend(self):
+        return self._yaml_backend
+    @yaml_backend.setter
+    def yaml_backend(self, x):
+        if x not in self.valid_yaml_backend:
+            self.log.error('exiting. yaml_backend must be one of {}. Got {}'.format(sorted(self.valid_yaml_backend), x))
+            exit(1)
+        if x == 'libyaml' and CDumper == None:
+            self.log.error('exiting. yaml_backend libyaml requested, but PyYAML was built without libyaml')
+            exit(1)
+        self._yaml_backend = x
+
+    @property
+    def output_format(self):
+        return self._output_format
+    @output_format.setter
+    def output_format(self, x):
+        if x not in self.valid_output_format:
+            self.log.error('exiting. output_format must be one of {}. Got {}'.format(sorted(self.valid_output_format), x))
+            exit(1)
+        self._output_format = x
+
+    @property
+    def deepcopy_tasks(self):
+        return self._deepcopy_tasks
+    @deepcopy_tasks.setter
+    def deepcopy_tasks(self, x):
+        if x not in [True, False]:
+            self.log.error('exiting. deepcopy_tasks must be True or False. Got {}'.format(x))
+            exit(1)
+        self._deepcopy_tasks = x
+
+    @property
+    def coalesce_tasks(self):
+        return self._coalesce_tasks
+    @coalesce_tasks.setter
+    def coalesce_tasks(self, x):
+        if x not in [True, False]:
+            self.log.error('exiting. coalesce_tasks must be True or False. Got {}'.format(x))
+            exit(1)
+        self._coalesce_tasks = x
+
+    @property
+    def yaml_aliases(self):
+        return self._yaml_aliases
+    @yaml_aliases.setter
+    def yaml_aliases(self, x):
+        if x not in [True, False]:
+            self.log.error('exiting. yaml_aliases must be True or False. Got {}'.format(x))
+            exit(1)
+        self._yaml_aliases = x
+
+    @property
+    def key_order(self):
+        return self._key_order
+    @key_order.setter
+    def key_order(self, x):
+        if x not in self.valid_key_order:
+            self.log.error('exiting. key_order must be one of {}. Got {}'.format(sorted(self.valid_key_order), x))
+            exit(1)
+        self._key_order = x
+        self.emitter.sort_keys = x == 'sorted'
+
+    @property
+    def overwrite(self):
+        if self.cache != None:
+            return 'atomic'
+        return self._overwrite
+    @overwrite.setter
+    def overwrite(self, x):
+        if x not in self.valid_overwrite:
+            self.log.error('exiting. overwrite must be one of {}. Got {}'.format(sorted(self.valid_overwrite), x))
+            exit(1)
+        self._overwrite = x
+
+    @property
+    def cache(self):
+        return self._cache
+    @cache.setter
+    def cache(self, x):
+        self._cache = x
+
+    @property
+    def inventory(self):
+        return self._inventory
+    @inventory.setter
+    def inventory(self, x):
+        self._inventory = x
+
     @property
     def name(self):
         return self.playbook['name']
@@ -450,6 +937,60 @@ class Playbook(object):
     def no_proxy(self, x):
         self._environment['no_proxy'] = x
 
+    @property
+    def max_fail_percentage(self):
+        return self.playbook.get('max_fail_percentage')
+    @max_fail_percentage.setter
+    def max_fail_percentage(self, x):
+        if x == None:
+            self.playbook.pop('max_fail_percentage', None)
+            return
+        if type(x) not in [int, float] or x < 0 or x > 100:
+            self.log.error('exiting. max_fail_percentage must be an int() or float() between 0 and 100. Got {}'.format(x))
+            exit(1)
+        self.playbook['max_fail_percentage'] = x
+
+    def is_serial_item(self, x):
+        '''
+        Return True if x is a valid serial batch size: an int() > 0, or
+        a percentage str() e.g. '25%'
+        '''
+        if type(x) == int:
+            return x > 0
+        if isinstance(x, str) and x.endswith('%') and x[:-1].isdigit():
+            return 0 < int(x[:-1]) <= 100
+        return False
+
+    @property
+    def serial(self):
+        return self.playbook.get('serial')
+    @serial.setter
+    def serial(self, x):
+        if x == None:
+            self.playbook.pop('serial', None)
+            return
+        if isinstance(x, list):
+            valid = len(x) != 0 and all(self.is_serial_item(item) for item in x)
+        else:
+            valid = self.is_serial_item(x)
+        if not valid:
+            self.log.error('exiting. serial must be an int() > 0, a percentage e.g. 25%, or a non-empty list() of these. Got {}'.format(x))
+            exit(1)
+        self.playbook['serial'] = x
+
+    @property
+    def strategy(self):
+        return self.playbook.get('strategy')
+    @strategy.setter
+    def strategy(self, x):
+        if x == None:
+            self.playbook.pop('strategy', None)
+            return
+        if x not in self.valid_strategy:
+            self.log.error('exiting. strategy must be one of {}. Got {}'.format(sorted(self.valid_strategy), x))
+            exit(1)
+        self.playbook['strategy'] = x
+
     @property
     def gather_facts(self):
         return self.playbook['gather_facts']
@@ -462,15 +1003,116 @@ class Playbook(object):
         return self._hosts
 
     def add_host(self, x):
+        if self.inventory != None and x not in self.inventory:
+            self.log.error('exiting. {} is not a host or group in pb.inventory'.format(x))
+            exit(1)
         self._hosts.append(x)
 
+    def play_hosts(self, play):
+        '''
+        Return a list() of the hosts of play, a play in self.stream, with
+        any group in self.inventory expanded to its hosts
+        '''
+        names = play['hosts'].split(',')
+        if self.inventory == None:
+            return names
+        if len(names) == 1:
+            return self.inventory.expand(names[0])
+        hosts = dict()
+        for name in names:
+            hosts.update(dict.fromkeys(self.inventory.expand(name)))
+        return list(hosts)
+
     def add_task(self, x):
         '''
         x is an instance of a subclass of AskTask() e.g. NxosL3Interfaces()
         '''
         if x == None:
             return
-        self.playbook['tasks'].append(deepcopy(x.ansible_task))
+        if x.validation_collector != None and (getattr(x, 'commit_failed', False) or not hasattr(x, 'ansible_task')):
+            # x.commit() failed while a ValidationCollector() was active
+            # and the failure was recorded there.  Nothing to add, though
+            # x may still hold the ansible_task of an earlier commit().
+            return
+        ansible_module = getattr(x, 'ansible_module', None)
+        ansible_task = x.ansible_task
+        if getattr(x, 'host_var', None) != None:
+            ansible_task = self.template_task(ansible_task, ansible_module, x.host_var)
+        if getattr(x, 'throttle', None) != None:
+            ansible_task = dict(ansible_task)
+            ansible_task['throttle'] = x.throttle
+        self.playbook['tasks'].append(self.task_snapshot(ansible_task, ansible_module))
+
+    def suggest_execution(self, **kwargs):
+        '''
+        See suggest_execution() in the documentation above
+        '''
+        if len(self._hosts) == 0:
+            self.log.error('exiting. call instance.add_host() before calling pb.suggest_execution()')
+            exit(1)
+        if len(self.playbook['tasks']) == 0:
+            self.log.error('exiting. call instance.add_task() before calling pb.suggest_execution()')
+            exit(1)
+        hosts = self.play_hosts({'hosts': ','.join(self._hosts)})
+        d = suggest_execution(len(hosts), self.playbook['tasks'], **kwargs)
+        self.serial = d['serial']
+        self.log.debug('{} hosts, {} seconds per host: forks {}, serial {}, estimated {} seconds'.format(
+            len(hosts), d['play_seconds'], d['forks'], d['serial'], d['estimated_seconds']))
+        return d
+
+    def template_task(self, ansible_task, ansible_module, host_var):
+        '''
+        Return ansible_task with its config replaced by a reference to
+        the variable host_var, and add the config to the play's vars as
+        host_var.  See host_var in the add_task() documentation above.
+        '''
+        arguments = ansible_task.get(ansible_module)
+        if not isinstance(arguments, dict) or 'config' not in arguments:
+            self.log.error('exiting. host_var {} is set, but task {} has no config'.format(host_var, ansible_module))
+            exit(1)
+        config = arguments['config']
+        current = self.playbook['vars'].get(host_var)
+        if current != None and current != config:
+            self.log.error('exiting. host_var {} is already in this play, with a different value'.format(host_var))
+            exit(1)
+        self.playbook['vars'][host_var] = config
+        arguments = dict(arguments)
+        arguments['config'] = '{{{{ {} }}}}'.format(host_var)
+        task = dict(ansible_task)
+        task[ansible_module] = arguments
+        return task
+
+    def task_snapshot(self, ansible_task, ansible_module):
+        '''
+        Return ansible_task as add_task() keeps it: a snapshot, or, with
+        deepcopy_tasks, a mutable copy, in the order set by key_order
+        '''
+        if self.key_order == 'canonical':
+            task = order_task(snapshots.freeze(ansible_task), ansible_module)
+        elif self.deepcopy_tasks:
+            task = ansible_task
+        else:
+            # already a snapshot, if ansible_task is from a Task()
+            task = snapshots.freeze(ansible_task)
+        if self.deepcopy_tasks:
+            task = thaw(task)
+        return task
+
+    def coalesce_play_tasks(self):
+        '''
+        Called from append_playbook() if self.coalesce_tasks is True.
+        See common/coalesce.py
+        '''
+        tasks = self.playbook['tasks']
+        originals = set(id(task) for task in tasks)
+        coalesced = list()
+        for task in coalesce_tasks(tasks):
+            if id(task) not in originals:
+                task = self.task_snapshot(task, task_module(task))
+            coalesced.append(task)
+        if len(coalesced) != len(tasks):
+            self.log.debug('coalesced {} tasks into {}'.format(len(tasks), len(coalesced)))
+        self.playbook['tasks'] = coalesced
 
     @property
     def ansible_module(self):
@@ -511,36 +1153,125 @@ class Playbook(object):
             exit(1)
         d = dict()
         d['vars'] = self.playbook['vars']
+        if self.output_format == 'json':
+            text = self.emitter.dump_json(d)
         if self.file == 'STDOUT':
-            print('{}'.format(yaml.dump(d)))
+            if self.output_format == 'yaml':
+                text = self.dump_yaml(d)
+            print('{}'.format(text))
         else:
-            import os
-            if path.exists(self.file):
+            if path.exists(self.file) and self.overwrite == 'never':
                 self.log.error('exiting. refusing to overwrite vars file {}. delete it first.'.format(self.file))
                 exit(1)
-            with open(self.file, 'w') as fh:
-                yaml.dump(d, fh, indent=4, allow_unicode=True, explicit_end=False, explicit_start=False, default_flow_style=False) 
+            if self.output_format == 'yaml':
+                text = self.dump_yaml(d, indent=4, allow_unicode=True, explicit_end=False, explicit_start=False, default_flow_style=False)
+            self.write_file(text)
+
+    def dump_yaml(self, data, **kwargs):
+        '''
+        Return data as a YAML str(), using the emitter selected by
+        self.yaml_backend.  kwargs are passed to yaml.dump().
+
+        CDumper pairs the libyaml emitter with the same Representer
+        as yaml.Dumper, so the output does not depend on the backend.
+        (CSafeDumper would, for example, write a tuple as a list,
+        where yaml.Dumper writes !!python/tuple.)
+
+        The scriptkit backend uses Emitter(), which does not fold long
+        strings.  See common/emitter.py.
+
+        With key_order canonical, data is already in canonical order,
+        so is written as-is (sort_keys=False).
+
+        With yaml_aliases, repeated subtrees of data are shared first
+        (share_subtrees()), so that yaml's representer, which anchors
+        objects it meets more than once, anchors them.
+        '''
+        if self.key_order == 'canonical':
+            kwargs['sort_keys'] = False
+        if self.yaml_backend == 'scriptkit':
+            return self.emitter.dump_yaml(data, explicit_start=kwargs.get('explicit_start', False), explicit_end=kwargs.get('explicit_end', False))
+        libyaml = self.yaml_backend != 'python' and LibyamlDumper != None
+        if self.yaml_aliases:
+            data = share_subtrees(data, dict())
+            if libyaml:
+                return yaml.dump(data, Dumper=LibyamlAliasDumper, **kwargs)
+            return yaml.dump(data, Dumper=PythonAliasDumper, **kwargs)
+        if libyaml:
+            return yaml.dump(data, Dumper=LibyamlDumper, **kwargs)
+        return yaml.dump(data, Dumper=PythonDumper, **kwargs)
+
+    def verify_yaml_aliases(self):
+        if not self.yaml_aliases or self.output_format != 'yaml':
+            return
+        if self.yaml_backend == 'scriptkit':
+            self.log.error('exiting. yaml_aliases is not available with yaml_backend scriptkit')
+            exit(1)
 
     def write_playbook(self):
         '''
         write the playbook.yaml file
-        If the file already exists, exit with error.
+        If the file already exists, exit with error, unless self.overwrite
+        is atomic.  If self.cache is set, and the plays are unchanged,
+        do not write the file.
         '''
+        if self._stream_fh != None:
+            self.close_stream()
+            return
         if self.file == None:
             self.log.error('exiting. call pb.file = <filename> before calling pb.write_playbook()')
             exit(1)
         if len(self.stream) == 0:
             self.log.error('exiting. nothing to write.')
             exit(1)
+        self.verify_yaml_aliases()
         if self.file == 'STDOUT':
-            print('{}'.format(yaml.dump(self.stream)))
+            if self.output_format == 'json':
+                text = self.emitter.dump_json(self.stream)
+            else:
+                text = self.dump_yaml(self.stream)
+            print('{}'.format(text))
+            return
+        if path.exists(self.file) and self.overwrite == 'never':
+            self.log.error('exiting. refusing to overwrite playbook file {}. delete it first.'.format(self.file))
+            exit(1)
+        entry = None
+        if self.cache != None:
+            entry = self.cache.entry(self.stream, self.cache_settings())
+            if self.cache.is_current(self.file, entry):
+                self.log.debug('{} is unchanged. not writing it.'.format(self.file))
+                self.cache.record(self.file, entry)
+                return
+        if self.output_format == 'json':
+            text = self.emitter.dump_json(self.stream)
         else:
-            import os
-            if path.exists(self.file):
-                self.log.error('exiting. refusing to overwrite playbook file {}. delete it first.'.format(self.file))
-                exit(1)
-            with open(self.file, 'w') as fh:
-                yaml.dump(self.stream, fh, indent=4, allow_unicode=True, explicit_end=True, explicit_start=True, default_flow_style=False) 
+            text = self.dump_yaml(self.stream, indent=4, allow_unicode=True, explicit_end=True, explicit_start=True, default_flow_style=False)
+        self.write_file(text)
+        if entry != None:
+            self.cache.record(self.file, entry)
+
+    def write_file(self, text):
+        '''
+        Write text to self.file, replacing it atomically if self.overwrite
+        is atomic.  Callers check whether self.file may be overwritten.
+        '''
+        if self.overwrite == 'atomic':
+            write_atomic(self.file, text)
+            return
+        with open(self.file, 'w') as fh:
+            fh.write(text)
+
+    def cache_settings(self):
+        '''
+        The settings, other than the plays, that affect the written file.
+        Part of the hash recorded by self.cache.
+        '''
+        d = dict()
+        d['key_order'] = self.key_order
+        d['output_format'] = self.output_format
+        d['yaml_backend'] = self.yaml_backend
+        d['yaml_aliases'] = self.yaml_aliases
+        return d
 
     def append_playbook(self):
         if len(self._hosts) == 0:
@@ -549,6 +1280,8 @@ class Playbook(object):
         if len(self.playbook['tasks']) == 0:
             self.log.error('exiting. call instance.add_task() before calling pb.append_playbook()')
             exit(1)
+        if self.coalesce_tasks:
+            self.coalesce_play_tasks()
         new_vars = dict()
         for var in self.playbook['vars']:
             if self.playbook['vars'][var] != None:
@@ -556,6 +1289,171 @@ class Playbook(object):
         self.playbook['vars'] = new_vars
         self.playbook['hosts'] = ','.join(self._hosts)
         if len(self._environment) != 0:
-            self.playbook['environment'] = deepcopy(self._environment)
-        self.stream.append(deepcopy(self.playbook))
+            self.playbook['environment'] = self._environment
+        play = self.playbook
+        if self.key_order == 'canonical':
+            play = order_play(snapshots.freeze(play))
+        if self._stream_fh != None:
+            self.write_stream_play(play)
+        elif self.deepcopy_tasks:
+            self.stream.append(thaw(play))
+            self.task_counts.append(len(play['tasks']))
+        else:
+            # init_playbook(), below, starts a new self.playbook and
+            # self._environment, so the play can be kept by reference
+            self.stream.append(snapshots.freeze(play))
+            self.task_counts.append(len(play['tasks']))
         self.init_playbook()
+
+    def merge_plays(self):
+        '''
+        Merge plays that differ only in their hosts.  See merge_plays()
+        in the documentation above.
+
+        A play's fingerprint is the snapshot of the play without its
+        hosts.  snapshots.freeze() interns snapshots, so identical plays
+        have the same snapshot, and their tasks, already snapshots, are
+        not walked again.
+        '''
+        if self._stream_fh != None:
+            self.log.error('exiting. pb.merge_plays() is not available in streaming mode')
+            exit(1)
+        task_counts = self.task_counts
+        if len(task_counts) != len(self.stream):
+            task_counts = [len(play['tasks']) for play in self.stream]
+        plays = list()
+        play_names = list() # the hosts (or inventory groups) of each play in plays
+        counts = list()
+        fingerprints = list() # keeps each fingerprint's snapshot, and so its id(), alive
+        merge_into = dict() # fingerprint -> index in plays of the latest play with that fingerprint
+        last_play = dict() # host -> index in plays of the host's latest play.  See play_hosts()
+        for play, count in zip(self.stream, task_counts):
+            snapshot = snapshots.freeze({key: value for key, value in play.items() if key != 'hosts'})
+            fingerprints.append(snapshot)
+            fingerprint = snapshots.identity(snapshot)
+            names = play['hosts'].split(',')
+            hosts = self.play_hosts(play)
+            index = merge_into.get(fingerprint)
+            if index != None and all(last_play.get(host, -1) < index for host in hosts):
+                play_names[index].extend(names)
+            else:
+                index = len(plays)
+                plays.append(play)
+                play_names.append(list(names))
+                counts.append(count)
+                merge_into[fingerprint] = index
+            for host in hosts:
+                last_play[host] = index
+        self.log.debug('merged {} plays into {}'.format(len(self.stream), len(plays)))
+        self.stream = list()
+        for play, hosts in zip(plays, play_names):
+            hosts = ','.join(hosts)
+            if hosts == play['hosts']:
+                self.stream.append(play)
+            elif isinstance(play, FrozenDict):
+                self.stream.append(FrozenDict((key, hosts if key == 'hosts' else value) for key, value in play.items()))
+            else:
+                # deepcopy_tasks.  play is our own copy.
+                play['hosts'] = hosts
+                self.stream.append(play)
+        self.task_counts = counts
+
+    def open_stream(self):
+        '''
+        Open self.file for streaming.  See open_stream() in the
+        documentation above.
+        If the file already exists, exit with error.
+        '''
+        if self.file == None:
+            self.log.error('exiting. call pb.file = <filename> before calling pb.open_stream()')
+            exit(1)
+        if self._stream_fh != None:
+            self.log.error('exiting. stream already open. call pb.write_playbook() before calling pb.open_stream() again')
+            exit(1)
+        if len(self.stream) != 0:
+            self.log.error('exiting. call pb.open_stream() before calling pb.append_playbook()')
+            exit(1)
+        if self.yaml_aliases and self.output_format == 'yaml':
+            self.log.error('exiting. yaml_aliases is not available in streaming mode')
+            exit(1)
+        if self.file == 'STDOUT':
+            self._stream_fh = sys.stdout
+            self._stream_stdout = True
+        else:
+            if path.exists(self.file) and self.overwrite == 'never':
+                self.log.error('exiting. refusing to overwrite playbook file {}. delete it first.'.format(self.file))
+                exit(1)
+            if self.overwrite == 'atomic':
+                # renamed to self.file by close_stream()
+                self._stream_fh = open_temporary(self.file)
+            else:
+                self._stream_fh = open(self.file, 'w')
+            self._stream_stdout = False
+            if self.cache != None:
+                self._stream_entry = self.cache.new_entry(self.cache_settings())
+        self._stream_count = 0
+
+    def write_stream_play(self, play):
+        '''
+        Called from append_playbook() in streaming mode.
+
+        Write play as the next item of the top-level list of
+        plays.  Dumping each play as a one-item list, with the document
+        start marker on the first play only, produces the same text as
+        write_playbook() dumping the whole list.  Likewise for JSON.
+        '''
+        if self.output_format == 'json':
+            if self._stream_count == 0:
+                self._stream_fh.write('[\n')
+            else:
+                self._stream_fh.write(',\n')
+            self._stream_fh.write(self.emitter.dump_json_item(play))
+        elif self._stream_stdout:
+            self._stream_fh.write(self.dump_yaml([play]))
+        else:
+            self._stream_fh.write(self.dump_yaml([play], indent=4, allow_unicode=True, explicit_start=self._stream_count == 0, default_flow_style=False))
+        if self._stream_entry != None:
+            self.cache.add_play(self._stream_entry, play)
+        self._stream_count += 1
+
+    def close_stream(self):
+        '''
+        Called from write_playbook() in streaming mode.
+
+        Write the document end marker (or, for JSON, close the list),
+        and close the file.  If self.overwrite is atomic, rename the
+        temporary file to self.file, unless self.cache finds the plays
+        unchanged, in which case the temporary file is removed.
+        '''
+        if self._stream_count == 0:
+            self.log.error('exiting. nothing to write.')
+            exit(1)
+        if self.output_format == 'json':
+            self._stream_fh.write('\n]\n')
+        if self._stream_stdout:
+            self._stream_fh.write('\n')
+            self._stream_fh.flush()
+        else:
+            if self.output_format == 'yaml':
+                self._stream_fh.write('...\n')
+            self._stream_fh.close()
+            if self.overwrite == 'atomic':
+                self.replace_stream()
+        self._stream_fh = None
+        self._stream_entry = None
+
+    def replace_stream(self):
+        '''
+        Called from close_stream() when self.overwrite is atomic.
+        '''
+        entry = None
+        if self._stream_entry != None:
+            entry = self.cache.finish_entry(self._stream_entry)
+            if self.cache.is_current(self.file, entry):
+                self.log.debug('{} is unchanged. not writing it.'.format(self.file))
+                os.remove(self._stream_fh.name)
+                self.cache.record(self.file, entry)
+                return
+        os.replace(self._stream_fh.name, self.file)
+        if entry != None:
+            self.cache.record(self.file, entry)
@@ -0,0 +1,346 @@
+# ShardWriter() - common/shard.py
+our_version = 102
+from os import path
+from ask.common.cache import write_atomic
+from ask.common.playbook import Playbook
+'''
+***********************************
+ShardWriter()
+***********************************
+
+.. contents::
+   :local:
+   :depth: 1
+
+Version
+-------
+102
+
+ScriptKit Synopsis
+------------------
+- ShardWriter() splits a Playbook()'s plays across several playbook
+  files (shards), and writes a site.yml that imports them all
+
+ScriptKit Example
+-----------------
+- `unit_test/common/unit_test_shard.py <https://github.com/allenrobel/ask/blob/main/unit_test/common/unit_test_shard.py>`_
+
+Description
+-----------
+One playbook file holding the plays for a large fabric is slow for
+ansible-playbook to load, and can only be run as a single process.
+ShardWriter() writes the plays of pb.stream to sw.shards files in
+sw.directory, named <prefix>_001.yaml, <prefix>_002.yaml ... (or .json),
+balanced by the number of tasks in each play (pb.task_counts, recorded
+by append_playbook()).  It also writes sw.site, which imports every
+shard, in order, so that::
+
+    ansible-playbook site.yml           # runs every shard, in turn
+    ansible-playbook shard_003.yaml     # runs (or re-runs) one shard
+
+and shards can be run concurrently, each in its own ansible-playbook
+process.
+
+sw.shard_by selects how plays are assigned to shards:
+
+- hosts: plays that share a host (with any group of pb.inventory
+  expanded to its hosts) are kept in the same shard, in their original
+  order, and these groups of plays are spread across the
+  shards so that each shard has about the same number of tasks.  Each
+  host is in exactly one shard, so shards can safely be run
+  concurrently.
+- plays: the stream is cut into sw.shards consecutive runs, with about
+  the same number of plays in each
+- tasks: the stream is cut into sw.shards consecutive runs, with about
+  the same number of tasks in each
+
+With plays and tasks, running site.yml runs the plays in their original
+order, but a host may have plays in more than one shard, so shards
+should only be run concurrently if the plays of a host do not depend
+on each other's order.
+
+If there are fewer groups of plays than shards, fewer shards are
+written.  Shards are written by Playbook(), with pb's yaml_backend,
+output_format, key_order, yaml_aliases, overwrite, and cache, so a PlaybookCache()
+rewrites only the shards whose plays changed.
+
+::
+
+    from ask.common.shard import ShardWriter
+    # build pb, without open_stream(), as usual
+    sw = ShardWriter(log)
+    sw.directory = '/tmp/fabric'
+    sw.shards = 8
+    sw.write(pb)
+    print(sw.shard_hosts)
+
+|
+
+============================    ==============================================
+Property / Method               Description
+============================    ==============================================
+directory                       Directory to which shards and site are
+                                written.  Must exist::
+
+                                    - Type: str()
+
+prefix                          Shard filename prefix::
+
+                                    - Type: str()
+                                    - Default: shard
+
+shard_by                        See Description::
+
+                                    - Type: str()
+                                    - Valid values: hosts, plays, tasks
+                                    - Default: hosts
+
+shard_files                     After write(), a list() of the shard
+                                filenames, in order::
+
+                                    - Type: getter
+
+shard_hosts                     After write(), a dict() keyed on shard
+                                filename, of the sorted list() of hosts
+                                in that shard::
+
+                                    - Type: getter
+
+shards                          The number of shards::
+
+                                    - Type: int()
+                                    - Default: 2
+
+site                            The filename, in directory, of the
+                                playbook importing every shard.  If None,
+                                it is not written::
+
+                                    - Type: str()
+                                    - Default: site.yml
+
+write()                         Write the plays in pb.stream (pb is a
+                                Playbook()) to shards::
+
+                                    - Type: function()
+                                    - Example:
+                                        sw.write(pb)
+
+============================    ==============================================
+
+|
+
+Authors
+~~~~~~~
+
+- Allen Robel (@PacketCalc)
+
+'''
+
+def group_plays(hosts_list):
+    '''
+    hosts_list: the list() of hosts of each play in a stream.  Return a
+    list() of lists of indexes into the stream.  Plays sharing a host,
+    directly or through other plays, are in the same list.  Lists are in
+    the order of their first play, and indexes within a list in stream
+    order.
+    '''
+    # union-find over plays, joined through their hosts
+    parent = list(range(len(hosts_list)))
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    first_play = dict()
+    for index, hosts in enumerate(hosts_list):
+        for host in hosts:
+            if host not in first_play:
+                first_play[host] = index
+                continue
+            a = find(first_play[host])
+            b = find(index)
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+    groups = dict()
+    for index in range(len(hosts_list)):
+        root = find(index)
+        if root not in groups:
+            groups[root] = list()
+        groups[root].append(index)
+    return [groups[root] for root in sorted(groups)]
+
+def balance_groups(groups, weights, shards):
+    '''
+    Assign groups (see group_plays()) to shards, heaviest group first,
+    each to the shard with the least weight so far.  Return a list() per
+    shard of play indexes, in stream order.
+    '''
+    loads = [0] * shards
+    assigned = [list() for _ in range(shards)]
+    group_weights = [sum(weights[index] for index in group) for group in groups]
+    # sorted() is stable, so equal groups keep their order
+    for position in sorted(range(len(groups)), key=lambda x: -group_weights[x]):
+        shard = loads.index(min(loads))
+        loads[shard] += group_weights[position]
+        assigned[shard].extend(groups[position])
+    return [sorted(indexes) for indexes in assigned]
+
+def split_consecutive(weights, shards):
+    '''
+    Cut range(len(weights)) into shards consecutive runs of about equal
+    total weight.  Each item goes to the shard containing the midpoint
+    of its weight.  Return a list() per shard of indexes.
+    '''
+    total = sum(weights)
+    assigned = [list() for _ in range(shards)]
+    cumulative = 0
+    for index, weight in enumerate(weights):
+        shard = int(shards * (cumulative + weight / 2) / total)
+        assigned[min(shard, shards - 1)].append(index)
+        cumulative += weight
+    return assigned
+
+class ShardWriter(object):
+    def __init__(self, log):
+        self.log = log
+        self.lib_version = our_version
+        self._classname = __class__.__name__
+
+        self._directory = None
+        self._prefix = 'shard'
+        self.valid_shard_by = set()
+        self.valid_shard_by.add('hosts')
+        self.valid_shard_by.add('plays')
+        self.valid_shard_by.add('tasks')
+        self._shard_by = 'hosts'
+        self._shards = 2
+        self._site = 'site.yml'
+        self._shard_files = list()
+        self._shard_hosts = dict()
+
+    def verify_write(self, pb):
+        if self.directory == None:
+            self.log.error('exiting. call instance.directory before calling instance.write()')
+            exit(1)
+        if len(pb.stream) == 0:
+            # also the case in streaming mode, see pb.open_stream()
+            self.log.error('exiting. nothing to write.')
+            exit(1)
+
+    @staticmethod
+    def task_counts(pb):
+        '''
+        pb.task_counts, or, if plays were added to pb.stream other than
+        by append_playbook(), the number of tasks in each play
+        '''
+        if len(pb.task_counts) == len(pb.stream):
+            return pb.task_counts
+        return [len(play['tasks']) for play in pb.stream]
+
+    def assign(self, pb):
+        '''
+        Return a list() per shard of indexes into pb.stream
+        '''
+        if self.shard_by == 'plays':
+            return split_consecutive([1] * len(pb.stream), self.shards)
+        if self.shard_by == 'tasks':
+            return split_consecutive(self.task_counts(pb), self.shards)
+        return balance_groups(group_plays([pb.play_hosts(play) for play in pb.stream]), self.task_counts(pb), self.shards)
+
+    def shard_playbook(self, pb, filename):
+        '''
+        Return a Playbook() that writes filename as pb would
+        '''
+        shard = Playbook(self.log)
+        shard.yaml_backend = pb.yaml_backend
+        shard.output_format = pb.output_format
+        shard.key_order = pb.key_order
+        shard.yaml_aliases = pb.yaml_aliases
+        shard.overwrite = pb.overwrite
+        shard.cache = pb.cache
+        shard.file = filename
+        return shard
+
+    def write(self, pb):
+        '''
+        Write pb.stream to shards, and self.site.  See Description.
+        '''
+        self.verify_write(pb)
+        self._shard_files = list()
+        self._shard_hosts = dict()
+        assigned = [indexes for indexes in self.assign(pb) if len(indexes) != 0]
+        width = max(3, len(str(len(assigned))))
+        for number, indexes in enumerate(assigned, start=1):
+            filename = path.join(self.directory, '{}_{:0{}d}.{}'.format(self.prefix, number, width, pb.output_format))
+            shard = self.shard_playbook(pb, filename)
+            hosts = set()
+            for index in indexes:
+                shard.stream.append(pb.stream[index])
+                hosts.update(pb.play_hosts(pb.stream[index]))
+            shard.write_playbook()
+            self._shard_files.append(filename)
+            self._shard_hosts[filename] = sorted(hosts)
+            self.log.debug('{}: {} plays, {} hosts'.format(filename, len(indexes), len(hosts)))
+        if self.site != None:
+            self.write_site(pb)
+
+    def write_site(self, pb):
+        filename = path.join(self.directory, self.site)
+        if path.exists(filename) and pb.overwrite == 'never':
+            self.log.error('exiting. refusing to overwrite playbook file {}. delete it first.'.format(filename))
+            exit(1)
+        imports = [{'import_playbook': path.basename(x)} for x in self.shard_files]
+        text = pb.dump_yaml(imports, indent=4, allow_unicode=True, explicit_end=True, explicit_start=True, default_flow_style=False)
+        write_atomic(filename, text)
+
+    @property
+    def directory(self):
+        return self._directory
+    @directory.setter
+    def directory(self, x):
+        if not path.isdir(x):
+            self.log.error('exiting. directory {} does not exist'.format(x))
+            exit(1)
+        self._directory = x
+
+    @property
+    def prefix(self):
+        return self._prefix
+    @prefix.setter
+    def prefix(self, x):
+        self._prefix = x
+
+    @property
+    def shard_by(self):
+        return self._shard_by
+    @shard_by.setter
+    def shard_by(self, x):
+        if x not in self.valid_shard_by:
+            self.log.error('exiting. shard_by must be one of {}. Got {}'.format(sorted(self.valid_shard_by), x))
+            exit(1)
+        self._shard_by = x
+
+    @property
+    def shard_files(self):
+        return self._shard_files
+
+    @property
+    def shard_hosts(self):
+        return self._shard_hosts
+
+    @property
+    def shards(self):
+        return self._shards
+    @shards.setter
+    def shards(self, x):
+        if type(x) != int or x < 1:
+            self.log.error('exiting. shards must be an int() > 0. Got {}'.format(x))
+            exit(1)
+        self._shards = x
+
+    @property
+    def site(self):
+        return self._site
+    @site.setter
+    def site(self, x):
+        self._site = x
@@ -0,0 +1,215 @@
+# Snapshots() - common/snapshot.py
+our_version = 103
+'''
+*************************
+Snapshots() - snapshot.py
+*************************
+
+Description
+-----------
+
+Immutable, structurally-shared snapshots of task trees.
+
+When a task's commit() (or update()) returns, Task() replaces
+task.ansible_task with a snapshot: the same tree, with every dict()
+replaced by a FrozenDict() and every list() by a FrozenList().  Playbook()
+stores snapshots by reference, rather than deep-copying each task into
+the playbook, and each play into the stream.
+
+FrozenDict() and FrozenList() are dict() and list() subclasses, so they
+compare equal to, and are written (yaml, json, Emitter()) exactly like,
+the dicts and lists they replace.  Any attempt to modify one raises
+TypeError.  copy.deepcopy() of a snapshot returns an ordinary, mutable,
+dict() or list() tree.
+
+Structural sharing
+------------------
+
+snapshots.freeze() interns every subtree it creates.  Identical subtrees,
+whether within one task, across tasks, or across plays (e.g. the vars of
+every play, or the same ACL applied to many hosts), are held once::
+
+    from ask.common.snapshot import snapshots
+    # build tasks and playbooks as usual
+    print(snapshots.stats())
+    snapshots.clear()   # forget interned subtrees e.g. between playbooks
+
+Subtrees already held by a playbook, or a task, are unaffected by clear().
+
+The table holds subtrees by weak reference.  A subtree leaves the table
+when nothing else (a task, play, or playbook) refers to it, so in
+streaming mode (see Playbook().open_stream()) the plays already written,
+and their subtrees, are freed, and memory does not grow with the number
+of plays.
+
+Key order
+---------
+
+snapshots.freeze() puts the keys of every FrozenDict() it creates in
+sorted order, whatever order the task added them in (many tasks build
+their dicts by iterating a set(), whose order varies from run to run).
+A snapshot can therefore be written with yaml's sort_keys=False, or
+hashed, with the same result on every run.  Identical dicts built in different orders also share one
+snapshot.  See also common/canonical.py.
+
+'''
+from copy import deepcopy
+from operator import itemgetter
+from weakref import KeyedRef
+
+def read_only(self, *args, **kwargs):
+    raise TypeError('{} is read-only.  copy.deepcopy() it for a mutable copy'.format(self.__class__.__name__))
+
+class FrozenDict(dict):
+    '''
+    Read-only dict().  See snapshots.freeze()
+    '''
+    __slots__ = ('__weakref__',)
+    __setitem__ = __delitem__ = __ior__ = read_only
+    clear = pop = popitem = setdefault = update = read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (unpickle_snapshot, (FrozenDict, list(self.items())))
+
+class FrozenList(list):
+    '''
+    Read-only list().  See snapshots.freeze()
+    '''
+    __slots__ = ('__weakref__',)
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return (unpickle_snapshot, (FrozenList, list(self)))
+
+def sorted_items(x):
+    '''
+    Return the items of dict() x, sorted by key.  If the keys are not
+    comparable (e.g. a mix of int() and str()), return them unsorted, as
+    yaml's sort_keys does.
+    '''
+    try:
+        return sorted(x.items(), key=itemgetter(0))
+    except TypeError:
+        return list(x.items())
+
+class Snapshots(object):
+    '''
+    Interning table for snapshots.  See Structural sharing, above.
+
+    The table key for a subtree is built from the ids of its (already
+    interned) children, and the type and value of its scalars, so
+    interning costs one pass over the tree.  The table maps each key to a
+    weak reference to its subtree, and drops the key when the subtree is
+    freed.  A live subtree holds its children, so an id in a live key can
+    not be reused, and a dead key is treated as absent.
+    '''
+    def __init__(self):
+        self.table = dict()
+        self.hits = 0
+        self.misses = 0
+        table = self.table
+        def forget(reference):
+            # called when reference's subtree is freed.  Drop its key,
+            # unless the key has been interned again since.
+            if table.get(reference.key) is reference:
+                del table[reference.key]
+        self.forget = forget
+
+    def clear(self):
+        self.table.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        '''
+        return dict() with keys hits, misses, size
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.table)}
+
+    def freeze(self, x):
+        '''
+        Return an interned snapshot of x, with sorted keys.  Snapshots
+        are returned as-is.
+        '''
+        if x.__class__ is FrozenDict or x.__class__ is FrozenList:
+            return x
+        if isinstance(x, dict):
+            items = [(key, self.freeze(value)) for key, value in sorted_items(x)]
+            key = (FrozenDict, tuple((k, self.identity(v)) for k, v in items))
+            return self.intern(key, FrozenDict, items)
+        if isinstance(x, list):
+            items = [self.freeze(item) for item in x]
+            key = (FrozenList, tuple(self.identity(item) for item in items))
+            return self.intern(key, FrozenList, items)
+        return x
+
+    @staticmethod
+    def identity(x):
+        if x.__class__ is FrozenDict or x.__class__ is FrozenList:
+            return id(x)
+        return (x.__class__, x)
+
+    def intern(self, key, cls, items):
+        try:
+            reference = self.table.get(key)
+        except TypeError:
+            # an unhashable scalar e.g. a set().  Not interned.
+            return cls(items)
+        if reference is not None:
+            snapshot = reference()
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+        self.misses += 1
+        snapshot = cls(items)
+        self.table[key] = KeyedRef(snapshot, self.forget, key)
+        return snapshot
+
+def unpickle_snapshot(cls, items):
+    '''
+    Return the snapshot of class cls with items, interned as by
+    snapshots.freeze(), but with keys in their pickled order.  pickle
+    rebuilds items (and so interns the subtrees) first.  Snapshots
+    returned by worker processes (see ParallelPlaybook()) are thereby
+    shared with equal snapshots of the parent, as Playbook().merge_plays()
+    requires.
+    '''
+    if cls is FrozenDict:
+        key = (FrozenDict, tuple((k, snapshots.identity(v)) for k, v in items))
+    else:
+        key = (FrozenList, tuple(snapshots.identity(item) for item in items))
+    return snapshots.intern(key, cls, items)
+
+def thaw(x, depth=-1):
+    '''
+    Return a mutable copy of the top depth levels (by default, all
+    levels) of x, a snapshot or any dict() / list() tree.  Deeper levels
+    are not copied.  Unlike copy.deepcopy(), subtrees shared within x are
+    copied separately, so the copy shares nothing.
+
+    Task() thaws a task's ansible_task (depth 3) before commit() or
+    update() runs again, for tasks that add to the ansible_task of their
+    previous commit() e.g. self.ansible_task[self.ansible_module]['config'].append()
+    '''
+    if depth == 0:
+        return x
+    if isinstance(x, dict):
+        return {key: thaw(value, depth - 1) for key, value in x.items()}
+    if isinstance(x, list):
+        return [thaw(item, depth - 1) for item in x]
+    return x
+
+snapshots = Snapshots()
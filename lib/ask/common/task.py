@@ -1,5 +1,5 @@
 # Task() - common/task.py
-our_version = 104
+our_version = 118
 '''
 **********
 Task()
@@ -13,29 +13,645 @@ Task() is the base class for Ansible Playbook Task classes
 Example usage
 -------------
 
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 class NxosBgpGlobal(Task):
     ...
+    # property stored in self.properties['asn'] and verified by
+    # self.verify_bgp_asn(x, 'asn') whenever it is set to non-None
+    asn = TaskProperty('verify_bgp_asn')
+
+Deferred validation
+-------------------
+
+By default, TaskProperty() values are verified as they are set.  With
+deferred validation, setting a TaskProperty() only records the value.
+All recorded values are verified, grouped by verify method, when the
+task's commit(), update(), or add_*() method is next called::
+
+    from ask.common.task import DeferredValidation
+    with DeferredValidation():
+        task = NxosInterfaces(log)
+        for port in range(1, 49):
+            task.name = 'Ethernet1/{}'.format(port)
+            task.mode = 'layer3'
+            task.mtu = 9216
+            task.add_interface()    # name and mode are verified here
+        task.state = 'merged'
+        task.commit()
+
+Or, for a single task, set task.deferred_validation = True.
+
+Within a DeferredValidation() block, each distinct value is verified
+only once per task class and verify method.  Bulk loops repeat the same
+values (booleans, modes, states, vlans, etc) across many tasks, so most
+deferred values skip the verify call entirely.  This assumes verify
+methods depend only on the value, which is true for TaskProperty()
+verify methods.
+
+Hand-written property setters (those not using TaskProperty()) always
+verify on assignment.  A value that fails deferred verification exits
+(or, with a ValidationCollector() active, is recorded and the property
+is set to None) at commit() time rather than at assignment time.
+
+Trusted sources
+---------------
+
+When values come from an already-validated source of truth, tasks
+created within a TrustedSource() block skip TaskProperty() value
+verification entirely.  Structural checks in commit() and add_*() e.g.
+mandatory properties, mutually-exclusive properties, and
+final_verification(), still run::
+
+    from ask.common.task import TrustedSource
+    with TrustedSource(sample=0.01) as trusted:
+        for spec in specs:
+            task = NxosL3Interfaces(log)
+            ...
+    print(trusted.created, trusted.sampled)
+
+sample is the fraction (0.0 - 1.0) of tasks that are nonetheless fully
+verified, chosen at random at task creation.  Pass seed to make the
+choice repeatable.  Or, for a single task, set task.trusted = True.
+
+Reusing a task
+--------------
+
+Every property assignment is recorded in task.dirty until the property
+is reset.  task.reset() sets only the dirty properties back to None, so
+a single task instance can be reused in a loop without re-initializing
+every property::
+
+    task = NxosFeature(log)
+    for feature in features:
+        task.reset()
+        task.feature = feature
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+
+task.reset(names) resets only the dirty properties in names.  add_*()
+methods use this to reset the properties they consume.  task.clear_dirty()
+forgets the dirty properties without resetting them.
+
+reset() resets properties only.  Lists accumulated by add_*() e.g.
+NxosInterfaces().interface_list are not cleared.
+
+Per-host data
+-------------
+
+Set task.host_var to a variable name to write the task's config as a
+reference to that variable, rather than as literal data::
+
+    task = NxosL3Interfaces(log)
+    ... # add_interface() for each of the host's interfaces
+    task.host_var = 'l3_interfaces'
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+
+Playbook().add_task() writes the task's config as
+``'{{ l3_interfaces }}'`` and moves the config itself to the play's vars.
+Plays built this way for different hosts then differ only in their
+vars.  VarsWriter() (common/hoist.py) moves each host's values to its
+host_vars file, after which pb.merge_plays() merges the plays into one.
+See Playbook().
+
+Throttle
+--------
+
+Set task.throttle to limit the number of hosts that run the task at
+once, whatever the play's forks, e.g. for a task that loads a shared
+server.  Playbook().add_task() adds it to the task as Ansible's throttle
+keyword::
+
+    task.throttle = 4
+
+Snapshots
+---------
+
+When commit() or update() returns, task.ansible_task is frozen into an
+immutable snapshot, which Playbook().add_task() stores by reference.
+See common/snapshot.py.  Modifying task.ansible_task directly, after
+commit(), raises TypeError.  Set the task's properties and call commit()
+again instead.
+
 '''
-from ask.common.common import Common
+import re
+from functools import wraps
+from random import Random
+from types import MappingProxyType
+from ask.common.common import Common, ValidationError, collect_validation_errors
+from ask.common.snapshot import FrozenDict, snapshots, thaw
+
+class TaskProperty(object):
+    '''
+    Declarative replacement for the hand-written @property getter/setter
+    pair that most Task subclass properties share::
+
+        @property
+        def mode(self):
+            return self.properties['mode']
+        @mode.setter
+        def mode(self, x):
+            parameter = 'mode'
+            if self.set_none(x, parameter):
+                return
+            self.verify_nxos_interfaces_mode(x, parameter)
+            self.properties[parameter] = x
+
+    becomes::
+
+        mode = TaskProperty('verify_nxos_interfaces_mode')
+
+    verify is the name of the instance method called as verify(x, name)
+    before x is stored.  It is looked up on the instance, so subclasses
+    can override it.  If to_str is True, str(x) is stored.  Setting the
+    property to None stores None without calling verify.
+
+    Values live in self.properties, keyed on the property name, as before,
+    so update(), add_*(), etc are unchanged.  See PropertyValues()
+    '''
+    __slots__ = ('name', 'verify', 'to_str')
+
+    def __init__(self, verify=None, to_str=False):
+        self.name = None
+        self.verify = verify
+        self.to_str = to_str
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        properties = instance.properties
+        try:
+            # properties[self.name], without the call
+            value = properties.stored[properties.index[self.name]]
+        except (KeyError, IndexError):
+            return properties[self.name]
+        if value is unset:
+            raise KeyError(self.name)
+        return value
+
+    def __set__(self, instance, x):
+        instance.dirty.add(self.name)
+        if x is None:
+            instance.properties[self.name] = None
+            return
+        if self.verify is not None and not instance.trusted:
+            if instance.deferred_validation:
+                stored = x
+                if self.to_str:
+                    stored = str(x)
+                instance.properties[self.name] = stored
+                if instance.verified_values != None:
+                    try:
+                        if (instance.__class__, self.verify, x.__class__, x) in instance.verified_values:
+                            return
+                    except TypeError:
+                        pass
+                instance.pending_validation[self.name] = (self.verify, x, stored)
+                return
+            try:
+                getattr(instance, self.verify)(x, self.name)
+            except ValidationError as error:
+                # only raised while a ValidationCollector() is active
+                instance.validation_collector.add(error)
+                return
+        if self.to_str:
+            x = str(x)
+        properties = instance.properties
+        try:
+            # properties[self.name] = x, without the call
+            properties.stored[properties.index[self.name]] = x
+        except (KeyError, IndexError):
+            properties[self.name] = x
+
+# marks a position in PropertyValues().stored whose key is not set
+unset = object()
+
+class PropertyValues(object):
+    '''
+    A task's property values, i.e. self.properties.  Reads and writes
+    like a dict() keyed on property name (properties[name],
+    properties[name] = x, name in properties, get(), keys(), items(),
+    iteration), so update(), add_*(), etc are unchanged.
+
+    Each task class keeps one index, a dict() of property name to
+    position, shared by all of its instances (see Task().new_properties()).
+    An instance holds only stored, a list() of values in index order, so
+    it takes about a third of the memory of a dict() with the same keys.
+    A name the index does not have yet is added to it when first set.
+    '''
+    __slots__ = ('index', 'stored')
+
+    def __init__(self, index, stored):
+        self.index = index
+        self.stored = stored
+
+    def __getitem__(self, name):
+        try:
+            value = self.stored[self.index[name]]
+        except (KeyError, IndexError):
+            # IndexError: name was added to index after self was created
+            raise KeyError(name) from None
+        if value is unset:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        try:
+            self.stored[self.index[name]] = value
+            return
+        except KeyError:
+            position = self.index[name] = len(self.index)
+        except IndexError:
+            position = self.index[name]
+        stored = self.stored
+        stored.extend([unset] * (position + 1 - len(stored)))
+        stored[position] = value
+
+    def __contains__(self, name):
+        position = self.index.get(name)
+        return position is not None and position < len(self.stored) and self.stored[position] is not unset
+
+    def __iter__(self):
+        stored = self.stored
+        for name, position in list(self.index.items()):
+            if position < len(stored) and stored[position] is not unset:
+                yield name
+
+    def __len__(self):
+        return len(self.stored) - self.stored.count(unset)
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, PropertyValues)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def reset(self, names):
+        '''
+        Set each of names that is a key to None.  Return a list() of the
+        others.  See Task().reset()
+        '''
+        index = self.index
+        stored = self.stored
+        others = list()
+        for name in names:
+            position = index.get(name)
+            if position is None or position >= len(stored) or stored[position] is unset:
+                others.append(name)
+            else:
+                stored[position] = None
+        return others
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self.stored[self.index[name]] for name in self]
+
+    def items(self):
+        return [(name, self.stored[self.index[name]]) for name in self]
+
+class DeferredValidation(object):
+    '''
+    Context manager.  While active, TaskProperty() values of all tasks
+    are verified at commit(), update() and add_*() time rather than as
+    they are set.  See Deferred validation, above.
+    '''
+    def __enter__(self):
+        self.previous = (Task.deferred_validation, Task.verified_values)
+        Task.deferred_validation = True
+        Task.verified_values = set()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        Task.deferred_validation, Task.verified_values = self.previous
+        return False
+
+class TrustedSource(object):
+    '''
+    Context manager.  Tasks created while active skip TaskProperty()
+    value verification, except for a random fraction, sample, of tasks
+    which are fully verified.  See Trusted sources, above.
+
+    created: number of tasks created while active
+    sampled: number of those that were fully verified
+    '''
+    def __init__(self, sample=0.0, seed=None):
+        if type(sample) not in (int, float) or sample < 0 or sample > 1:
+            raise ValueError('TrustedSource: unexpected sample [{}]. Expected 0.0 <= float() <= 1.0'.format(sample))
+        self.sample = sample
+        self.random = Random(seed)
+        self.created = 0
+        self.sampled = 0
+
+    def is_trusted(self):
+        '''
+        Called by Task() for each task created while active.
+        return False for the sampled fraction of tasks, else True
+        '''
+        self.created += 1
+        if self.sample != 0 and self.random.random() < self.sample:
+            self.sampled += 1
+            return False
+        return True
+
+    def __enter__(self):
+        self.previous = Task.trusted_source
+        Task.trusted_source = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        Task.trusted_source = self.previous
+        return False
+
+def task_property_setter(name, fset):
+    '''
+    Wrap a hand-written property setter so that it records name in
+    self.dirty and, while a ValidationCollector() is active, records
+    a validation failure rather than raising it.
+    '''
+    @wraps(fset)
+    def wrapper(self, x):
+        self.dirty.add(name)
+        try:
+            return fset(self, x)
+        except ValidationError as error:
+            self.validation_collector.add(error)
+    return wrapper
+
+def validate_pending_first(method):
+    '''
+    Decorator for commit(), update() and add_*().  Verify values recorded
+    while in deferred validation mode before calling method.
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if len(self.pending_validation) != 0:
+            self.validate_pending()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+def track_commit_failure(method):
+    '''
+    Decorator for commit() and update().  Set self.commit_failed if the
+    outermost commit() or update() call, or any commit() or update() it
+    calls, raises ValidationError (i.e. the failure was recorded by a
+    ValidationCollector()).  Playbook().add_task() skips such a task,
+    rather than adding the ansible_task of an earlier, successful,
+    commit().
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.commit_depth == 0:
+            self.commit_failed = False
+        try:
+            return method(self, *args, **kwargs)
+        except ValidationError:
+            self.commit_failed = True
+            raise
+    return wrapper
+
+def snapshot_ansible_task(method):
+    '''
+    Decorator for commit() and update().  When the outermost commit() or
+    update() call returns, freeze self.ansible_task into a snapshot.
+    Before it runs, thaw a previous snapshot, for tasks that add to their
+    previous ansible_task.
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.commit_depth == 0 and self.__dict__.get('ansible_task').__class__ is FrozenDict:
+            self.ansible_task = thaw(self.ansible_task, 3)
+        self.commit_depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            self.commit_depth -= 1
+        if self.commit_depth == 0 and isinstance(self.__dict__.get('ansible_task'), dict):
+            self.ansible_task = snapshots.freeze(self.ansible_task)
+        return result
+    return wrapper
+
+# a variable name usable in a Jinja reference.  See Task().host_var
+re_host_var = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
 class Task(Common):
+    task_properties_set = frozenset({'host_var', 'register', 'state', 'task_name', 'throttle'})
+    deferred_validation = False
+    # set() of (class, verify method name, type, value) that passed
+    # deferred verification.  Active only within DeferredValidation()
+    verified_values = None
+    # if True, TaskProperty() values are not verified.  See TrustedSource()
+    trusted = False
+    trusted_source = None
+
+    def __init_subclass__(cls, **kwargs):
+        '''
+        Wrap each subclass's commit(), update() and add_*() methods with
+        collect_validation_errors(), and its property setters with
+        task_property_setter(), so that, while a ValidationCollector() is
+        active, a validation failure is recorded and the script continues
+        with the next statement.  See ValidationCollector() in common.py
+        task_property_setter() also records assignments in self.dirty.
+
+        commit(), update() and add_*() additionally verify any values
+        recorded in deferred validation mode.  See validate_pending()
+        commit() and update() leave self.ansible_task as a snapshot.  See
+        snapshot_ansible_task()
+        commit() and update() record a validation failure in
+        self.commit_failed.  See track_commit_failure()
+        '''
+        super().__init_subclass__(**kwargs)
+        for name, value in list(cls.__dict__.items()):
+            if isinstance(value, property) and value.fset != None:
+                setattr(cls, name, value.setter(task_property_setter(name, value.fset)))
+            elif callable(value) and name in ('commit', 'update'):
+                setattr(cls, name, collect_validation_errors(track_commit_failure(validate_pending_first(snapshot_ansible_task(value)))))
+            elif callable(value) and name.startswith('add_'):
+                setattr(cls, name, collect_validation_errors(validate_pending_first(value)))
+
     def __init__(self, ansible_module, task_log):
         super().__init__(ansible_module, task_log)
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
-        self.task_properties_set = set()
-        self.task_properties_set.add('register')
-        self.task_properties_set.add('state')
-        self.task_properties_set.add('task_name')
+        # key: property name, value: (verify method name, value, stored value)
+        # See validate_pending()
+        self.pending_validation = dict()
+
+        # properties assigned since last reset.  See reset()
+        self.dirty = set()
+
+        # nesting depth of commit() and update() calls.  See snapshot_ansible_task()
+        self.commit_depth = 0
+
+        # True if the last commit() or update() failed validation.  See
+        # track_commit_failure()
+        self.commit_failed = False
+
+        if self.trusted_source != None:
+            self.trusted = self.trusted_source.is_trusted()
+
         self.init_task_properties()
+        self.load_schema()
 
     def init_task_properties(self):
         self.task_properties = dict()
         for p in self.task_properties_set:
             self.task_properties[p] = None
 
+    def init_schema(self):
+        '''
+        Subclasses override init_schema() to build the parts of the class
+        that do not vary between instances e.g. properties_set,
+        scriptkit_properties, property_map, nxos_*_valid_* sets, and
+        *_min/*_max range limits.
+
+        init_schema() is called only once per class.  See load_schema().
+        '''
+        pass
+
+    def load_schema(self):
+        '''
+        On first instantiation of a class, call init_schema() and move
+        every attribute it created from the instance to the class, frozen
+        (set() -> frozenset(), dict() -> read-only MappingProxyType()).
+
+        Later instances of the class find the schema already present
+        on the class and skip init_schema(), so they hold only their
+        own values e.g. self.properties.
+
+        Also create the class's property_index.  See new_properties()
+        '''
+        cls = self.__class__
+        if '_schema_loaded' in cls.__dict__:
+            return
+        before = set(self.__dict__)
+        self.init_schema()
+        for key in set(self.__dict__) - before:
+            setattr(cls, key, self.freeze(self.__dict__.pop(key)))
+        cls.property_index = dict()
+        # key: names passed to new_properties().  value: PropertyValues().stored
+        cls.property_templates = dict()
+        cls._schema_loaded = True
+
+    def new_properties(self, names=frozenset()):
+        '''
+        Return an empty self.properties, with each property in names (a
+        frozenset(), usually self.properties_set) set to None.  Subclasses
+        call this from init_properties()::
+
+            self.properties = self.new_properties(self.properties_set)
+
+        See PropertyValues()
+        '''
+        index = self.property_index
+        if not isinstance(names, frozenset):
+            names = frozenset(names)
+        template = self.property_templates.get(names)
+        if template is None:
+            template = [unset] * len(index)
+            for name in names:
+                position = index.get(name)
+                if position is None:
+                    position = index[name] = len(index)
+                    template.append(unset)
+                template[position] = None
+            self.property_templates[names] = template
+        if len(template) < len(index):
+            # names set later e.g. by init_properties(), have been indexed
+            template.extend([unset] * (len(index) - len(template)))
+        return PropertyValues(index, template.copy())
+
+    def freeze(self, x):
+        '''
+        Return an immutable copy of x, recursing into dict() values
+        '''
+        if isinstance(x, (set, frozenset)):
+            return frozenset(x)
+        if isinstance(x, dict):
+            return MappingProxyType({k: self.freeze(v) for k, v in x.items()})
+        return x
+
+    def validate_pending(self):
+        '''
+        Verify the TaskProperty() values set while in deferred validation
+        mode.  Values are grouped by verify method, so that each method is
+        looked up once and then run over all of its values.
+
+        A value that was since overwritten via an eagerly verified path is
+        skipped.  Values already in verified_values are never recorded as
+        pending (see TaskProperty().__set__()).  A value that
+        fails verification exits or, with a ValidationCollector() active,
+        is recorded and its property set to None.
+        '''
+        pending = self.pending_validation
+        self.pending_validation = dict()
+        batches = dict()
+        for name in pending:
+            verify, x, stored = pending[name]
+            if self.properties[name] is not stored:
+                continue
+            if verify not in batches:
+                batches[verify] = list()
+            batches[verify].append((name, x))
+        verified = self.verified_values
+        for verify in batches:
+            method = getattr(self, verify)
+            for name, x in batches[verify]:
+                try:
+                    method(x, name)
+                except ValidationError as error:
+                    # only raised while a ValidationCollector() is active
+                    self.validation_collector.add(error)
+                    self.properties[name] = None
+                    continue
+                if verified != None:
+                    try:
+                        verified.add((self.__class__, verify, x.__class__, x))
+                    except TypeError:
+                        pass
+
+    def reset(self, names=None):
+        '''
+        Set each property assigned since it was last reset (i.e. each
+        property in self.dirty) to None, and remove it from self.dirty.
+
+        names: if not None, reset only the dirty properties in names
+        '''
+        if names == None:
+            names = self.dirty
+        else:
+            names = self.dirty.intersection(names)
+        # also resets keys of self.properties that shadow task properties
+        # e.g. properties['task_name'] set by init_properties() or set_none()
+        self.properties.reset(names)
+        for name in self.task_properties_set.intersection(names):
+            self.task_properties[name] = None
+        if names is self.dirty:
+            self.dirty.clear()
+        else:
+            self.dirty.difference_update(names)
+
+    def clear_dirty(self):
+        '''
+        Forget which properties have been assigned, without resetting them
+        '''
+        self.dirty.clear()
+
     def append_to_task_name(self, item):
         '''
         If self.task_name hasn't been set yet::
@@ -55,8 +671,7 @@ class Task(Common):
         try:
             count = len(self.scriptkit_properties)
         except:
-            self.task_log.error('exiting. Ansible module {} missing scriptkit_properties set()'.format(self.ansible_module))
-            exit(1)
+            self.fail_msg('exiting. Ansible module {} missing scriptkit_properties set()'.format(self.ansible_module))
         if item not in self.scriptkit_properties:
             self.task_name += ", {}".format(item)
             return
@@ -65,12 +680,34 @@ class Task(Common):
         if self.properties[item] != None:
             self.task_name += ", {}: {}".format(item, self.properties[item])
 
+    # Common().vrf is defined outside Task(), so is not wrapped by
+    # __init_subclass__()
+    vrf = Common.vrf.setter(task_property_setter('vrf', Common.vrf.fset))
+
+    @property
+    def host_var(self):
+        return self.task_properties['host_var']
+    @host_var.setter
+    @collect_validation_errors
+    def host_var(self, x):
+        parameter = 'host_var'
+        self.dirty.add(parameter)
+        if x == None:
+            # set_none() resets self.properties, not self.task_properties
+            self.task_properties[parameter] = None
+            return
+        if not isinstance(x, str) or re_host_var.match(x) == None:
+            self.fail(self.class_name, parameter, x, parameter, 'a variable name: letters, digits, and underscore, not starting with a digit')
+        self.task_properties[parameter] = x
+
     @property
     def register(self):
         return self.task_properties['register']
     @register.setter
+    @collect_validation_errors
     def register(self, x):
         parameter = 'register'
+        self.dirty.add(parameter)
         if self.set_none(x, parameter):
             return
         self.task_properties[parameter] = x
@@ -79,8 +716,10 @@ class Task(Common):
     def state(self):
         return self.task_properties['state']
     @state.setter
+    @collect_validation_errors
     def state(self, x):
         parameter = 'state'
+        self.dirty.add(parameter)
         if self.set_none(x, parameter):
             return
         self.verify_state(x, parameter)
@@ -90,8 +729,26 @@ class Task(Common):
     def task_name(self):
         return self.task_properties['task_name']
     @task_name.setter
+    @collect_validation_errors
     def task_name(self, x):
         parameter = 'task_name'
+        self.dirty.add(parameter)
         if self.set_none(x, parameter):
             return
         self.task_properties[parameter] = x
+
+    @property
+    def throttle(self):
+        return self.task_properties['throttle']
+    @throttle.setter
+    @collect_validation_errors
+    def throttle(self, x):
+        parameter = 'throttle'
+        self.dirty.add(parameter)
+        if x == None:
+            # set_none() resets self.properties, not self.task_properties
+            self.task_properties[parameter] = None
+            return
+        if type(x) != int or x < 1:
+            self.fail(self.class_name, parameter, x, parameter, 'an int() > 0')
+        self.task_properties[parameter] = x
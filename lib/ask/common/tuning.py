@@ -0,0 +1,109 @@
+# suggest_execution() - common/tuning.py
+our_version = 100
+import math
+import os
+'''
+*************************
+tuning.py
+*************************
+
+Description
+-----------
+
+Suggests forks and serial for a play, from the number of hosts it runs
+on and the estimated cost of its tasks.  Used by
+Playbook().suggest_execution().
+
+A task's cost is the estimated seconds it keeps a fork busy for one
+host: module_costs[module] (or default_task_cost), plus
+config_item_cost for each item of a resource module's config list.  A
+pause task costs its seconds (or minutes).  A play's cost per host is
+the sum of its tasks' costs.
+
+forks (ansible-playbook --forks, or forks in ansible.cfg) is how many
+hosts Ansible runs at once.  Network modules mostly wait on the device,
+so forks is forks_per_cpu per controller CPU, at most max_forks, and at
+most the number of hosts.
+
+serial is the number of hosts in each batch.  Ansible runs the play to
+completion on one batch before starting the next, so max_fail_percentage
+can stop a bad change after one batch.  serial is the largest multiple
+of forks (so no fork idles within a batch) such that:
+
+- a batch takes at most batch_seconds: ceil(serial / forks) rounds of
+  the play's cost per host
+- a batch has at most max_batch_percent of the hosts
+
+but at least forks.  If every host fits in one batch, serial is None
+(no batches).
+
+Costs in module_costs are rough defaults.  Pass costs to override them,
+or measure a run and adjust.
+
+'''
+
+default_task_cost = 5.0
+config_item_cost = 0.5
+
+# key: ansible module.  value: estimated seconds per task, per host
+module_costs = dict()
+module_costs['cisco.nxos.nxos_command'] = 3.0
+module_costs['cisco.nxos.nxos_config'] = 10.0
+module_costs['cisco.nxos.nxos_reboot'] = 600.0
+module_costs['local_action'] = 1.0
+
+def task_cost(task, costs=None):
+    '''
+    Return the estimated seconds task (an ansible_task dict()) costs
+    per host.  costs: dict() overriding module_costs.
+    '''
+    modules = [key for key in task if key in ('pause', 'ansible.builtin.pause')]
+    if len(modules) != 0:
+        arguments = task[modules[0]] or dict()
+        return float(arguments.get('seconds', 0)) + 60.0 * float(arguments.get('minutes', 0))
+    cost = None
+    module = None
+    for key in task:
+        if costs != None and key in costs:
+            module = key
+            cost = costs[key]
+        elif key in module_costs:
+            module = key
+            cost = module_costs[key]
+        elif isinstance(task[key], dict) and 'config' in task[key]:
+            module = key
+        if module != None:
+            break
+    if cost == None:
+        cost = default_task_cost
+    if module != None and isinstance(task[module], dict) and isinstance(task[module].get('config'), list):
+        cost += config_item_cost * len(task[module]['config'])
+    return cost
+
+def suggest_execution(host_count, tasks, costs=None, batch_seconds=600, max_batch_percent=100, forks_per_cpu=8, max_forks=100, cpu_count=None):
+    '''
+    Return a dict() with keys forks, serial, play_seconds (the play's
+    cost per host) and estimated_seconds (the estimated run time of the
+    play, with these forks and serial).  See Description.
+    '''
+    if cpu_count == None:
+        cpu_count = os.cpu_count() or 1
+    play_seconds = sum(task_cost(task, costs) for task in tasks)
+    forks = max(1, min(host_count, max_forks, forks_per_cpu * cpu_count))
+    rounds = max(1, int(batch_seconds // play_seconds)) if play_seconds > 0 else host_count
+    serial = forks * rounds
+    serial = min(serial, int(host_count * max_batch_percent / 100))
+    serial = max(forks, serial - serial % forks)
+    if serial >= host_count:
+        serial = None
+    batch = host_count if serial == None else serial
+    batches = math.ceil(host_count / batch)
+    # the last batch may be smaller
+    estimated = (batches - 1) * math.ceil(batch / forks) * play_seconds
+    estimated += math.ceil((host_count - (batches - 1) * batch) / forks) * play_seconds
+    d = dict()
+    d['forks'] = forks
+    d['serial'] = serial
+    d['play_seconds'] = play_seconds
+    d['estimated_seconds'] = estimated
+    return d
@@ -1,7 +1,7 @@
 # StcBgpDevice() - spirent/stc_bgp_device.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 StcBgpDevice() - spirent/stc_bgp_device.py
@@ -110,6 +110,9 @@ class StcBgpDevice(Task):
         self.ansible_task[self.ansible_module]['objects'] = list()
         self.ansible_task[self.ansible_module]['action'] = None
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('asn')
         self.properties_set.add('dut_asn')
@@ -154,12 +157,8 @@ class StcBgpDevice(Task):
         self.stc_bgp_device_valid_ip_version.add('IPV4')
         self.stc_bgp_device_valid_ip_version.add('IPV6')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def verify_stc_bgp_device_action(self, x, parameter='action'):
         verify_set = self.stc_bgp_device_valid_action
@@ -178,12 +177,10 @@ class StcBgpDevice(Task):
     def final_verification(self):
         for p in self.bgp_router_config_set:
             if self.properties[p] == None:
-                self.task_log.error('exiting. call instance.{} before calling instance.update()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. call instance.{} before calling instance.update()'.format(p))
         for p in self.stc_set:
             if self.properties[p] == None:
-                self.task_log.error('exiting. call instance.{} before calling instance.update()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. call instance.{} before calling instance.update()'.format(p))
 
     def commit(self):
         self.update()
@@ -198,8 +195,7 @@ class StcBgpDevice(Task):
         d['BgpRouterConfig'] = dict()
         for p in self.bgp_router_config_set:
             if p not in self.property_map:
-                self.task_log.error('exiting. Please contact info@scriptkit.org about this error.')
-                exit(1)
+                self.fail_msg('exiting. Please contact info@scriptkit.org about this error.')
             mapped_p = self.property_map[p]
             d['BgpRouterConfig'][mapped_p] = self.properties[p]
 
@@ -214,61 +210,19 @@ class StcBgpDevice(Task):
     # bgp_router_config properties
     #-----------------------------------------------------------------
 
-    @property
-    def asn(self):
-        return self.properties['asn']
-    @asn.setter
-    def asn(self, x):
-        parameter = 'asn'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    asn = TaskProperty()
 
-    @property
-    def dut_asn(self):
-        return self.properties['dut_asn']
-    @dut_asn.setter
-    def dut_asn(self, x):
-        parameter = 'dut_asn'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    dut_asn = TaskProperty()
 
-    @property
-    def ip_version(self):
-        return self.properties['ip_version']
-    @ip_version.setter
-    def ip_version(self, x):
-        parameter = 'ip_version'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_bgp_device_ip_version(x, parameter)
-        self.properties[parameter] = x
+    ip_version = TaskProperty('verify_stc_bgp_device_ip_version')
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    name = TaskProperty()
 
     #-----------------------------------------------------------------
     # top_level properties
     #-----------------------------------------------------------------
 
-    @property
-    def action(self):
-        return self.properties['action']
-    @action.setter
-    def action(self, x):
-        parameter = 'action'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_bgp_device_action(x, parameter)
-        self.properties[parameter] = x
+    action = TaskProperty('verify_stc_bgp_device_action')
 
     @property
     def count(self):
@@ -283,12 +237,4 @@ class StcBgpDevice(Task):
             self.fail(self.class_name, parameter, x, parameter, expectation)
         self.properties[parameter] = x
 
-    @property
-    def under(self):
-        return self.properties['under']
-    @under.setter
-    def under(self, x):
-        parameter = 'under'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    under = TaskProperty()
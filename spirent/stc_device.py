@@ -1,7 +1,7 @@
 # StcDevice() - spirent/stc_device.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *****************************************************************************
 StcDeviceMac() - spirent/stc_device.py
@@ -123,6 +123,9 @@ class StcDevice(Task):
         self.task_properties_set = set()
         self.task_properties_set.add('task_name')
 
+        self.init_properties()
+
+    def init_schema(self):
         self.stc_command_properties_set = set()
         self.stc_command_properties_set.add('command')
 
@@ -150,8 +153,6 @@ class StcDevice(Task):
         self.property_map['device_name']    = 'name'
         self.property_map['parent_list']    = 'ParentList'
 
-        self.init_properties()
-
     def init_properties(self):
         self.ansible_task = dict()
         self.ansible_task['name'] = None
@@ -159,7 +160,7 @@ class StcDevice(Task):
         # self.ansible_task[self.ansible_module]['command'] = 'DeviceCreate'
         # self.ansible_task[self.ansible_module]['properties'] = dict()
 
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['port_name'] = None
         for p in self.stc_command_properties_set:
             self.properties[p] = None
@@ -183,11 +184,9 @@ class StcDevice(Task):
     def final_verification(self):
         self.set_defaults()
         if self.device_name == None:
-            self.task_log.error('exiting. call instance.device_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.device_name before calling instance.update()')
         if self.port_name == None:
-            self.task_log.error('exiting. call instance.port_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.port_name before calling instance.update()')
 
     def commit(self):
         self.update()
@@ -214,75 +213,19 @@ class StcDevice(Task):
     def get_port_ref(self):
         return "ref:/port[@Name='{}']".format(self.port_name)
 
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def create_count(self):
-        return self.properties['create_count']
-    @create_count.setter
-    def create_count(self, x):
-        parameter = 'create_count'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def device_count(self):
-        return self.properties['device_count']
-    @device_count.setter
-    def device_count(self, x):
-        parameter = 'device_count'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def if_count(self):
-        return self.properties['if_count']
-    @if_count.setter
-    def if_count(self, x):
-        parameter = 'if_count'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def device_name(self):
-        return self.properties['device_name']
-    @device_name.setter
-    def device_name(self, x):
-        parameter = 'device_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def parent_list(self):
-        return self.properties['parent_list']
-    @parent_list.setter
-    def parent_list(self, x):
-        parameter = 'parent_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def port_name(self):
-        return self.properties['port_name']
-    @port_name.setter
-    def port_name(self, x):
-        parameter = 'port_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    command = TaskProperty()
+
+    create_count = TaskProperty()
+
+    device_count = TaskProperty()
+
+    if_count = TaskProperty()
+
+    device_name = TaskProperty()
+
+    parent_list = TaskProperty()
+
+    port_name = TaskProperty()
 
 class StcDeviceMac(StcDevice):
     def __init__(self, task_log):
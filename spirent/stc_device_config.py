@@ -1,7 +1,7 @@
 # StcDeviceConfig() - spirent/stc_device_config.py
-our_version = 107
+our_version = 108
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *****************************************************************************
 StcDeviceConfigIPv4() - spirent/stc_device_config.py
@@ -108,6 +108,9 @@ class StcDeviceConfig(Task):
 
         self.action = 'config'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.stc_command_properties_set = set()
         self.stc_command_properties_set.add('count')
         self.stc_command_properties_set.add('device')
@@ -131,10 +134,8 @@ class StcDeviceConfig(Task):
         self.property_map['gateway']    = 'Gateway'
         self.property_map['prefixlen']  = 'PrefixLength'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         for p in self.stc_device_properties_set:
             self.properties[p] = None
         for p in self.stc_command_properties_set:
@@ -142,17 +143,13 @@ class StcDeviceConfig(Task):
 
     def final_verification(self):
         if self.device_name == None:
-            self.task_log.error('exiting. call instance.device_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.device_name before calling instance.update()')
         if self.address == None:
-            self.task_log.error('exiting. call instance.address before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.address before calling instance.update()')
         if self.gateway == None:
-            self.task_log.error('exiting. call instance.gateway before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.gateway before calling instance.update()')
         if self.prefixlen == None:
-            self.task_log.error('exiting. call instance.prefixlen before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.prefixlen before calling instance.update()')
 
     def commit(self):
         self.update()
@@ -186,16 +183,7 @@ class StcDeviceConfig(Task):
         expectation = 'int()'
         self.fail(self.class_name, source_method, x, parameter, expectation)
 
-    @property
-    def count(self):
-        return self.properties['count']
-    @count.setter
-    def count(self, x):
-        parameter = 'count'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_device_config_count(x, parameter)
-        self.properties[parameter] = x
+    count = TaskProperty('verify_stc_device_config_count')
 
     @property
     def device_name(self):
@@ -224,42 +212,18 @@ class StcDeviceConfig(Task):
         d['objects'] = "ref:/EmulatedDevice[@Name='611_ipv6]/Ipv6If[address!="fe80::*"]"
         '''
         parameter = 'device'
+        # stored as device, so that reset() resets it.  The wrapper added
+        # by Task().__init_subclass__() records device_name
+        self.dirty.add(parameter)
         if self.set_none(x, parameter):
             return
         self.properties[parameter] = x
 
-    @property
-    def address(self):
-        return self.properties['address']
-    @address.setter
-    def address(self, x):
-        parameter = 'address'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_device_config_address(x, parameter)
-        self.properties[parameter] = x
+    address = TaskProperty('verify_stc_device_config_address')
 
-    @property
-    def gateway(self):
-        return self.properties['gateway']
-    @gateway.setter
-    def gateway(self, x):
-        parameter = 'gateway'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_device_config_gateway(x, parameter)
-        self.properties[parameter] = x
+    gateway = TaskProperty('verify_stc_device_config_gateway')
 
-    @property
-    def prefixlen(self):
-        return self.properties['prefixlen']
-    @prefixlen.setter
-    def prefixlen(self, x):
-        parameter = 'prefixlen'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_device_config_prefixlen(x, parameter)
-        self.properties[parameter] = x
+    prefixlen = TaskProperty('verify_stc_device_config_prefixlen')
 
 class StcDeviceConfigIpv4(StcDeviceConfig):
     def __init__(self, log):
@@ -268,8 +232,7 @@ class StcDeviceConfigIpv4(StcDeviceConfig):
 
     def get_device_ref(self):
         if self.device_name == None:
-            self.task_log.error('exiting. call instance.device_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.device_name before calling instance.update()')
         return "ref:/Emulateddevice[@Name='" + self.device_name + "']"
 
     def verify_stc_device_config_address(self, x, parameter='address'):
@@ -297,8 +260,7 @@ class StcDeviceConfigIpv6(StcDeviceConfig):
 
     def get_device_ref(self):
         if self.device_name == None:
-            self.task_log.error('exiting. call instance.device_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.device_name before calling instance.update()')
         return 'ref:/Emulateddevice[@Name="{}"]/Ipv6If[name!="{}_linklocal"]'.format(self.device_name, self.device_name)
 
     def verify_stc_device_config_address(self, x, parameter='address'):
@@ -1,7 +1,7 @@
 # StcDeviceConfigIpv6LinkLocal() - spirent/stc_device_config_ipv6_link_local.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *****************************************************************************
 StcDeviceConfigIpv6LinkLocal() - spirent/stc_device_config_ipv6_link_local.py
@@ -84,6 +84,12 @@ class StcDeviceConfigIpv6LinkLocal(Task):
         self.class_name = __class__.__name__
 
         self.action = 'config'
+
+        self.objects = list() # appended to in add_object()
+
+        self.init_properties()
+
+    def init_schema(self):
         self.count = 1
         # If there are any use cases where a user would have to 
         # set link_local_prefixlen, we can change this to a user
@@ -91,8 +97,6 @@ class StcDeviceConfigIpv6LinkLocal(Task):
         # user doesn't have to think about it.
         self.link_local_prefixlen = 128
 
-        self.objects = list() # appended to in add_object()
-
         self.properties_set = set()
         self.properties_set.add('link_local_address')
         self.properties_set.add('link_local_gateway')
@@ -109,12 +113,8 @@ class StcDeviceConfigIpv6LinkLocal(Task):
         self.property_map['link_local_address'] = 'Address'
         self.property_map['link_local_gateway'] = 'Gateway'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
         self.properties['device_name'] = None
 
     def add_object(self):
@@ -133,8 +133,7 @@ class StcDeviceConfigIpv6LinkLocal(Task):
 
     def final_verification(self):
         if self.device_name == None:
-            self.task_log.error('exiting. call instance.device_name before calling instance.update()')
-            exit(1)
+            self.fail_msg('exiting. call instance.device_name before calling instance.update()')
         if self.link_local_address == None:
             self.link_local_address = 'fe80::1'
         if self.link_local_gateway == None:
@@ -164,15 +163,7 @@ class StcDeviceConfigIpv6LinkLocal(Task):
     def get_device_ref(self):
         return '/Emulateddevice[@Name="{}"]'.format(self.device_name)
 
-    @property
-    def device_name(self):
-        return self.properties['device_name']
-    @device_name.setter
-    def device_name(self, x):
-        parameter = 'device_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    device_name = TaskProperty()
 
     @property
     def link_local_address(self):
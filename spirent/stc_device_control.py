@@ -1,7 +1,7 @@
 # StcDeviceControl() - spirent/stc_device_control.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDeviceControl() - spirent/stc_device_control.py
@@ -72,6 +72,9 @@ class StcDeviceControl(Task):
 
         self.action = 'perform'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.stc_device_control_valid_command = set()
         self.stc_device_control_valid_command.add('start')
         self.stc_device_control_valid_command.add('stop')
@@ -95,10 +98,8 @@ class StcDeviceControl(Task):
         self.property_map = dict()
         self.property_map['device_list'] = 'DeviceList'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['command'] = None
         self.properties['device_list'] = None
 
@@ -107,8 +108,7 @@ class StcDeviceControl(Task):
             self.device_list = 'ref:/project'
         if self.command == None:
             self.task_log.error('exiting. Call instance.command before calling instance.update()')
-            self.task_log.error('Valid values for command: {}'.format(','.join(self.stc_device_control_valid_command)))
-            exit(1)
+            self.fail_msg('Valid values for command: {}'.format(','.join(self.stc_device_control_valid_command)))
 
     def commit(self):
         self.update()
@@ -134,23 +134,6 @@ class StcDeviceControl(Task):
             expectation = '{}'.format(', '.join(self.stc_device_control_valid_command))
             self.fail(self.class_name, parameter, x, parameter, expectation)
 
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_device_control_command(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def device_list(self):
-        return self.properties['device_list']
-    @device_list.setter
-    def device_list(self, x):
-        parameter = 'device_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    command = TaskProperty('verify_stc_device_control_command')
+
+    device_list = TaskProperty()
@@ -1,7 +1,7 @@
 # StcDrvClear() - spirent/stc_drv_clear.py
-our_version = 106
+our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDrvClear() - spirent/stc_drv_clear.py
@@ -62,6 +62,9 @@ class StcDrvClear(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.stc_properties_set = set()
         self.stc_properties_set.add('port_list')
 
@@ -76,16 +79,14 @@ class StcDrvClear(Task):
         self.property_map = dict()
         self.property_map['port_list'] = 'PortList'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         for p in self.stc_properties_set:
             self.properties[p] = None
 
     def final_verification(self):
         if self.properties['port_list'] == None:
-            self.properties['port_list'] = 'ref:/port'
+            self.port_list = 'ref:/port'
 
     def commit(self):
         self.update()
@@ -108,12 +109,4 @@ class StcDrvClear(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def port_list(self):
-        return self.properties['port_list']
-    @port_list.setter
-    def port_list(self, x):
-        parameter = 'port_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    port_list = TaskProperty()
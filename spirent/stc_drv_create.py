@@ -2,7 +2,7 @@
 # StcDrvCreate() - spirent/stc_drv_create.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDrvCreate() - spirent/stc_drv_create.py
@@ -169,6 +169,10 @@ class StcDrvCreate(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+        self.init_presentation_result_query()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('drv_name')
         self.properties_set.add('reset_existing')
@@ -227,13 +231,8 @@ class StcDrvCreate(Task):
         self.valid_select_properties.add('StreamBlock.AvgLatency')
         self.valid_select_properties.add('StreamBlock.IsExpected')
 
-        self.init_properties()
-        self.init_presentation_result_query()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def init_presentation_result_query(self):
         self.select_properties_set = set()
@@ -292,8 +291,7 @@ class StcDrvCreate(Task):
             if self.sort_by not in self.select_properties_set:
                 self.task_log.error('exiting. instance.sort_by not found in instance.select_properties. Add it before calling instance.commit()')
                 self.task_log.error('instance.sort_by: {}'.format(self.sort_by))
-                self.task_log.error('instance.select_properties: {}'.format(self.select_properties))
-                exit(1)
+                self.fail_msg('instance.select_properties: {}'.format(self.select_properties))
 
     def add_config(self):
         d = dict()
@@ -354,15 +352,7 @@ class StcDrvCreate(Task):
         parameter = 'drv_name'
         self.properties[parameter] = x
 
-    @property
-    def reset_existing(self):
-        return self.properties['reset_existing']
-    @reset_existing.setter
-    def reset_existing(self, x):
-        parameter = 'reset_existing'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    reset_existing = TaskProperty()
 
     #-----------------------------------------------------------
     # presentation_result_query properties
@@ -1,7 +1,7 @@
 # StcDrvDelete() - spirent/stc_drv_delete.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDrvDelete() - spirent/stc_drv_delete.py
@@ -70,6 +70,9 @@ class StcDrvDelete(Task):
 
         self.action = 'delete'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('drv_name')
         self.properties_set.add('reset_existing')
@@ -86,12 +89,8 @@ class StcDrvDelete(Task):
         self.property_map['drv_name'] = 'drv_name'
         self.property_map['reset_existing'] = 'reset_existing'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.drv_name == None:
@@ -121,22 +120,6 @@ class StcDrvDelete(Task):
             self.drv_name = "Dropped Frames DRV"
         return 'ref:/project/DynamicResultView[name="{}"]'.format(self.drv_name)
 
-    @property
-    def drv_name(self):
-        return self.properties['drv_name']
-    @drv_name.setter
-    def drv_name(self, x):
-        parameter = 'drv_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def reset_existing(self):
-        return self.properties['reset_existing']
-    @reset_existing.setter
-    def reset_existing(self, x):
-        parameter = 'reset_existing'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    drv_name = TaskProperty()
+
+    reset_existing = TaskProperty()
@@ -1,7 +1,7 @@
 # StcDrvFetch() - spirent/stc_drv_fetch.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDrvFetch() - spirent/stc_drv_fetch.py
@@ -78,6 +78,9 @@ class StcDrvFetch(Task):
 
         self.action = 'drv.fetch'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('drv_name')
         self.properties_set.add('register')
@@ -96,12 +99,8 @@ class StcDrvFetch(Task):
         self.property_map['register'] = 'register'
         self.property_map['reset_existing'] = 'reset_existing'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def get_drv_ref(self):
         if self.drv_name == None:
@@ -111,8 +110,7 @@ class StcDrvFetch(Task):
     def final_verification(self):
         if self.register == None:
             self.task_log.error('exiting. call instance.register before calling instance.update()')
-            self.task_log.error('example: instance.register = "rxResults"')
-            exit(1)
+            self.fail_msg('example: instance.register = "rxResults"')
         if self.drv_name == None:
             self.drv_name = "Dropped Frames DRV"
         if self.reset_existing == None:
@@ -144,33 +142,8 @@ class StcDrvFetch(Task):
         expectation = 'bool(): True or False'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def drv_name(self):
-        return self.properties['drv_name']
-    @drv_name.setter
-    def drv_name(self, x):
-        parameter = 'drv_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def reset_existing(self):
-        return self.properties['reset_existing']
-    @reset_existing.setter
-    def reset_existing(self, x):
-        parameter = 'reset_existing'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_drv_fetch_reset_existing(x, parameter)
-        self.properties[parameter] = x
+    drv_name = TaskProperty()
+
+    register = TaskProperty()
+
+    reset_existing = TaskProperty('verify_stc_drv_fetch_reset_existing')
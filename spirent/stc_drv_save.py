@@ -1,7 +1,7 @@
 # StcDrvSave() - spirent/stc_drv_save.py
 our_version = 105
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 **************************************************
 StcDrvSave() - spirent/stc_drv_save.py
@@ -67,6 +67,9 @@ class StcDrvSave(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('filename')
         self.properties_set.add('register')
@@ -76,18 +79,13 @@ class StcDrvSave(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         for p in self.properties_set:
             if self.properties[p] == None:
-                self.log.error('exiting. call instance.{} before calling update()'.format(p))
-                exit(1)
+                self.fail_msg('exiting. call instance.{} before calling update()'.format(p))
 
     def commit(self):
         self.update()
@@ -107,22 +105,6 @@ class StcDrvSave(Task):
         local_action = 'copy content={' + '{ ' + self.register + ' }' + '}' + ' dest="' + self.filename + '"'
         self.ansible_task[self.ansible_module] = local_action
 
-    @property
-    def register(self):
-        return self.properties['register']
-    @register.setter
-    def register(self, x):
-        parameter = 'register'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def filename(self):
-        return self.properties['filename']
-    @filename.setter
-    def filename(self, x):
-        parameter = 'filename'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    register = TaskProperty()
+
+    filename = TaskProperty()
@@ -1,7 +1,7 @@
 # StcDrvUnsubscribe() - spirent/stc_drv_unsubscribe.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *****************************************************
 StcDrvUnsubscribe() - spirent/stc_drv_unsubscribe.py
@@ -71,6 +71,9 @@ class StcDrvUnsubscribe(Task):
 
         self.action = 'drv.unsubscribe'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('drv_name')
         self.properties_set.add('reset_existing')
@@ -80,12 +83,8 @@ class StcDrvUnsubscribe(Task):
         self.scriptkit_properties = set()
         self.scriptkit_properties.update(self.properties_set)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.drv_name == None:
@@ -124,16 +123,7 @@ class StcDrvUnsubscribe(Task):
         expectation = 'bool(): True or False'
         self.fail(source_class, source_method, x, parameter, expectation)
 
-    @property
-    def reset_existing(self):
-        return self.properties['reset_existing']
-    @reset_existing.setter
-    def reset_existing(self, x):
-        parameter = 'reset_existing'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_drv_unsubscribe_reset_existing(x, parameter)
-        self.properties[parameter] = x
+    reset_existing = TaskProperty('verify_stc_drv_unsubscribe_reset_existing')
 
     @property
     def drv_name(self):
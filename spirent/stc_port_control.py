@@ -1,7 +1,7 @@
 # StcPortControl() - spirent/stc_port_control.py
 our_version = 106
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ***********************************************
 StcPortControl() - spirent/stc_port_control.py
@@ -142,7 +142,12 @@ class StcPortControl(Task):
         self.action = 'perform'
 
         self.port_list = list() # Updated in self.add_port*()
+                
+        self.properties = self.new_properties()
+
+        self.init_properties()
 
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('auto_connect')
         self.properties_set.add('command')
@@ -172,12 +177,8 @@ class StcPortControl(Task):
         self.stc_port_control_valid_command = set()
         self.stc_port_control_valid_command.add('attach')
         self.stc_port_control_valid_command.add('detach')
-                
-        self.properties = dict()
         self.port_properties = dict()
 
-        self.init_properties()
-
     def init_properties(self):
         for p in self.properties_set:
             self.properties[p] = None
@@ -188,14 +189,11 @@ class StcPortControl(Task):
     def final_verification(self):
         if self.command == None:
             self.task_log.error('exiting. Call instance.command before calling instance.commit()')
-            self.task_log.error('instance.command valid values: '.format(','.join(self.stc_port_control_valid_command)))
-            exit(1)
+            self.fail_msg('instance.command valid values: '.format(','.join(self.stc_port_control_valid_command)))
         if self.command == 'detach' and self.revoke_owner == True:
-            self.task_log.error('exiting. instance.revoke_owner must be False if instance.command is attach')
-            exit(1)
+            self.fail_msg('exiting. instance.revoke_owner must be False if instance.command is attach')
         if self.command == 'detach' and self.auto_connect == True:
-            self.task_log.error('exiting. instance.auto_connect must be False if instance.command is attach')
-            exit(1)
+            self.fail_msg('exiting. instance.auto_connect must be False if instance.command is attach')
         if self.auto_connect == None and self.command != 'detach':
             self.auto_connect = True
         if self.revoke_owner == None and self.command != 'detach':
@@ -277,14 +275,11 @@ class StcPortControl(Task):
 
     def port_verification(self):
         if self.chassis == None:
-            self.task_log.error('exiting. call instance.chassis before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.chassis before calling instance.add_port()')
         if self.module == None:
-            self.task_log.error('exiting. call instance.module before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.module before calling instance.add_port()')
         if self.port == None:
-            self.task_log.error('exiting. call instance.port before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.port before calling instance.add_port()')
 
     def add_port_by_location(self):
         '''
@@ -330,68 +325,14 @@ class StcPortControl(Task):
         expectation = 'bool() True or False'
         self.fail(self.class_name, source_method, x, parameter, expectation)
 
-    @property
-    def auto_connect(self):
-        return self.properties['auto_connect']
-    @auto_connect.setter
-    def auto_connect(self, x):
-        parameter = 'auto_connect'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_port_control_auto_connect(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_port_control_command(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def chassis(self):
-        return self.properties['chassis']
-    @chassis.setter
-    def chassis(self, x):
-        parameter = 'chassis'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def module(self):
-        return self.properties['module']
-    @module.setter
-    def module(self, x):
-        parameter = 'module'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def port(self):
-        return self.properties['port']
-    @port.setter
-    def port(self, x):
-        parameter = 'port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def revoke_owner(self):
-        return self.properties['revoke_owner']
-    @revoke_owner.setter
-    def revoke_owner(self, x):
-        parameter = 'revoke_owner'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_port_control_revoke_owner(x, parameter)
-        self.properties[parameter] = x
+    auto_connect = TaskProperty('verify_stc_port_control_auto_connect')
+
+    command = TaskProperty('verify_stc_port_control_command')
+
+    chassis = TaskProperty('verify_digits', to_str=True)
+
+    module = TaskProperty('verify_digits', to_str=True)
+
+    port = TaskProperty('verify_digits', to_str=True)
+
+    revoke_owner = TaskProperty('verify_stc_port_control_revoke_owner')
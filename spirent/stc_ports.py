@@ -1,7 +1,7 @@
 # StcPorts() - spirent/stc_ports.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *******************************************
 StcPorts() - spirent/stc_ports.py
@@ -119,9 +119,12 @@ class StcPorts(Task):
 
         self.port_list = list() # list() of dict(). Updated in self.add_port()
 
-        self.properties = dict()
+        self.properties = self.new_properties()
         self.properties['action'] = None
 
+        self.init_properties()
+
+    def init_schema(self):
         # Don't include action in properties_set
         # since init_properties() gets called each 
         # time add_port() is called and we want action
@@ -152,19 +155,15 @@ class StcPorts(Task):
         self.stc_ports_valid_action.add('create')
         self.stc_ports_valid_action.add('delete')
 
-        self.init_properties()
-
     def init_properties(self):
         for p in self.properties_set:
             self.properties[p] = None
 
     def final_verification(self):
         if len(self.port_list) == 0:
-            self.task_log.error('exiting. call instance.add_port() at least once before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.add_port() at least once before calling instance.commit()')
         if self.action == None:
-            self.task_log.error('exiting. call instance.action before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.action before calling instance.commit()')
 
 
     def commit(self):
@@ -191,14 +190,11 @@ class StcPorts(Task):
 
     def port_verification(self):
         if self.chassis == None:
-            self.task_log.error('exiting. call instance.chassis before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.chassis before calling instance.add_port()')
         if self.module == None:
-            self.task_log.error('exiting. call instance.module before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.module before calling instance.add_port()')
         if self.port == None:
-            self.task_log.error('exiting. call instance.port before calling instance.add_port()')
-            exit(1)
+            self.fail_msg('exiting. call instance.port before calling instance.add_port()')
         if self.name == None:
             self.name = 'Stc{}/{}/{}'.format(self.chassis, self.module, self.port)
     def add_port(self):
@@ -220,57 +216,13 @@ class StcPorts(Task):
             expectation = '{}'.format(', '.join(verify_set))
             self.fail(self.class_name, source_method, x, parameter, expectation)
 
-    @property
-    def action(self):
-        return self.properties['action']
-    @action.setter
-    def action(self, x):
-        parameter = 'action'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_ports_action(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def chassis(self):
-        return self.properties['chassis']
-    @chassis.setter
-    def chassis(self, x):
-        parameter = 'chassis'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def module(self):
-        return self.properties['module']
-    @module.setter
-    def module(self, x):
-        parameter = 'module'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def port(self):
-        return self.properties['port']
-    @port.setter
-    def port(self, x):
-        parameter = 'port'
-        if self.set_none(x, parameter):
-            return
-        self.verify_digits(x, parameter)
-        self.properties[parameter] = str(x)
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    action = TaskProperty('verify_stc_ports_action')
+
+    chassis = TaskProperty('verify_digits', to_str=True)
+
+    module = TaskProperty('verify_digits', to_str=True)
+
+    port = TaskProperty('verify_digits', to_str=True)
+
+    name = TaskProperty()
 
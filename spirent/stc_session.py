@@ -1,7 +1,7 @@
 # StcSession() - spirent/stc_session.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 ******************************
 StcSession() - stc_session.py
@@ -137,6 +137,9 @@ class StcSession(Task):
 
         self.action = 'session'
 
+        self.init_properties()
+
+    def init_schema(self):
         self.stc_properties_set = set()
         self.stc_properties_set.add('command')
         self.stc_properties_set.add('chassis')
@@ -162,23 +165,18 @@ class StcSession(Task):
         self.property_map['reset_existing'] = 'reset_existing'
         self.property_map['user'] = 'user'
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
+        self.properties = self.new_properties()
         for p in self.stc_properties_set:
             self.properties[p] = None
 
     def final_verification(self):
         if self.command == 'delete':
-            self.task_log.error('exiting. delete is not currently supported for instance.command')
-            exit(1)
+            self.fail_msg('exiting. delete is not currently supported for instance.command')
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
         if self.user == None:
-            self.task_log.error('exiting. call instance.user before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.user before calling instance.commit()')
         if self.command == None:
             self.command = 'create'
         if self.chassis == None:
@@ -207,64 +205,14 @@ class StcSession(Task):
         if self.task_name != None:
             self.ansible_task['name'] = self.task_name
 
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def chassis(self):
-        return self.properties['chassis']
-    @chassis.setter
-    def chassis(self, x):
-        parameter = 'chassis'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def kill_existing(self):
-        return self.properties['kill_existing']
-    @kill_existing.setter
-    def kill_existing(self, x):
-        parameter = 'kill_existing'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def reset_existing(self):
-        return self.properties['reset_existing']
-    @reset_existing.setter
-    def reset_existing(self, x):
-        parameter = 'reset_existing'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def user(self):
-        return self.properties['user']
-    @user.setter
-    def user(self, x):
-        parameter = 'user'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    command = TaskProperty()
+
+    chassis = TaskProperty()
+
+    kill_existing = TaskProperty('verify_boolean')
+
+    name = TaskProperty()
+
+    reset_existing = TaskProperty('verify_boolean')
+
+    user = TaskProperty()
@@ -1,7 +1,7 @@
 # StcStreamblock() - spirent/stc_streamblock.py
 our_version = 107
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *****************************************************************************
 StcStreamblock() - spirent/stc_streamblock.py
@@ -374,6 +374,9 @@ class StcStreamblock(Task):
         self.lib_version = our_version
         self.class_name = __class__.__name__
 
+        self.init_properties()
+
+    def init_schema(self):
         self.properties_set = set()
         self.properties_set.add('action')
         self.properties_set.add('count')
@@ -484,50 +487,35 @@ class StcStreamblock(Task):
         for p in self.binding_target_protocols:
             self.stc_streamblock_valid_tx_protocol.add(p)
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def final_verification(self):
         if self.action == 'delete':
             if self.name == None:
-                self.task_log.error('exiting. call instance.name before calling instance.commit()')
-                exit(1)
+                self.fail_msg('exiting. call instance.name before calling instance.commit()')
             return
 
         if self.tx_name == None:
-            self.task_log.error('exiting. call instance.tx_name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.tx_name before calling instance.commit()')
         if self.tx_type == None:
-            self.task_log.error('exiting. call instance.tx_type before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.tx_type before calling instance.commit()')
         if self.tx_protocol == None:
-            self.task_log.error('exiting. call instance.tx_protocol before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.tx_protocol before calling instance.commit()')
         if self.rx_name == None:
-            self.task_log.error('exiting. call instance.rx_name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.rx_name before calling instance.commit()')
         if self.rx_type == None:
-            self.task_log.error('exiting. call instance.rx_type before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.rx_type before calling instance.commit()')
         if self.rx_protocol == None:
-            self.task_log.error('exiting. call instance.rx_protocol before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.rx_protocol before calling instance.commit()')
         if self.name == None:
-            self.task_log.error('exiting. call instance.name before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.name before calling instance.commit()')
         if self.load == None:
-            self.task_log.error('exiting. call instance.load before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.load before calling instance.commit()')
         if self.load_unit == None:
-            self.task_log.error('exiting. call instance.load_unit before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.load_unit before calling instance.commit()')
         if self.traffic_pattern == None:
-            self.task_log.error('exiting. call instance.traffic_pattern before calling instance.commit()')
-            exit(1)
+            self.fail_msg('exiting. call instance.traffic_pattern before calling instance.commit()')
 
         if self.action == None:
             self.action = 'create'
@@ -697,73 +685,21 @@ class StcStreamblock(Task):
     # top_level properties
     #-----------------------------------------------------------------
 
-    @property
-    def action(self):
-        return self.properties['action']
-    @action.setter
-    def action(self, x):
-        parameter = 'action'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_action(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def count(self):
-        return self.properties['count']
-    @count.setter
-    def count(self, x):
-        parameter = 'count'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_count(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def port_name(self):
-        return self.properties['port_name']
-    @port_name.setter
-    def port_name(self, x):
-        parameter = 'port_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    action = TaskProperty('verify_stc_streamblock_action')
+
+    count = TaskProperty('verify_stc_streamblock_count')
+
+    port_name = TaskProperty()
 
     #-----------------------------------------------------------------
     # streamblock properties
     #-----------------------------------------------------------------
 
-    @property
-    def name(self):
-        return self.properties['name']
-    @name.setter
-    def name(self, x):
-        parameter = 'name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def stream_only_generation(self):
-        return self.properties['stream_only_generation']
-    @stream_only_generation.setter
-    def stream_only_generation(self, x):
-        parameter = 'stream_only_generation'
-        if self.set_none(x, parameter):
-            return
-        self.verify_boolean(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def traffic_pattern(self):
-        return self.properties['traffic_pattern']
-    @traffic_pattern.setter
-    def traffic_pattern(self, x):
-        parameter = 'traffic_pattern'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_traffic_pattern(x, parameter)
-        self.properties[parameter] = x
+    name = TaskProperty()
+
+    stream_only_generation = TaskProperty('verify_boolean')
+
+    traffic_pattern = TaskProperty('verify_stc_streamblock_traffic_pattern')
 
     #-----------------------------------------------------------------
     # streamblock_config properties
@@ -772,122 +708,29 @@ class StcStreamblock(Task):
     #    build_srcbinding_targets()
     #-----------------------------------------------------------------
 
-    @property
-    def rx_name(self):
-        return self.properties['rx_name']
-    @rx_name.setter
-    def rx_name(self, x):
-        parameter = 'rx_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def tx_name(self):
-        return self.properties['tx_name']
-    @tx_name.setter
-    def tx_name(self, x):
-        parameter = 'tx_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def rx_selector(self):
-        return self.properties['rx_selector']
-    @rx_selector.setter
-    def rx_selector(self, x):
-        parameter = 'rx_selector'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def tx_selector(self):
-        return self.properties['tx_selector']
-    @tx_selector.setter
-    def tx_selector(self, x):
-        parameter = 'tx_selector'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def rx_type(self):
-        return self.properties['rx_type']
-    @rx_type.setter
-    def rx_type(self, x):
-        parameter = 'rx_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_rx_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def tx_type(self):
-        return self.properties['tx_type']
-    @tx_type.setter
-    def tx_type(self, x):
-        parameter = 'tx_type'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_tx_type(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def rx_protocol(self):
-        return self.properties['rx_protocol']
-    @rx_protocol.setter
-    def rx_protocol(self, x):
-        parameter = 'rx_protocol'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_rx_protocol(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def tx_protocol(self):
-        return self.properties['tx_protocol']
-    @tx_protocol.setter
-    def tx_protocol(self, x):
-        parameter = 'tx_protocol'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_tx_protocol(x, parameter)
-        self.properties[parameter] = x
+    rx_name = TaskProperty()
+
+    tx_name = TaskProperty()
+
+    rx_selector = TaskProperty()
+
+    tx_selector = TaskProperty()
+
+    rx_type = TaskProperty('verify_stc_streamblock_rx_type')
+
+    tx_type = TaskProperty('verify_stc_streamblock_tx_type')
+
+    rx_protocol = TaskProperty('verify_stc_streamblock_rx_protocol')
+
+    tx_protocol = TaskProperty('verify_stc_streamblock_tx_protocol')
 
 
     #-----------------------------------------------------------------
     # Load properties
     #-----------------------------------------------------------------
 
-    @property
-    def load(self):
-        return self.properties['load']
-    @load.setter
-    def load(self, x):
-        parameter = 'load'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
-
-    @property
-    def load_unit(self):
-        return self.properties['load_unit']
-    @load_unit.setter
-    def load_unit(self, x):
-        parameter = 'load_unit'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_streamblock_load_unit(x, parameter)
-        self.properties[parameter] = x
-
-    @property
-    def task_name(self):
-        return self.properties['task_name']
-    @task_name.setter
-    def task_name(self, x):
-        parameter = 'task_name'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    load = TaskProperty()
+
+    load_unit = TaskProperty('verify_stc_streamblock_load_unit')
+
+    task_name = TaskProperty()
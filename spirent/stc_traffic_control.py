@@ -1,7 +1,7 @@
 # StcTrafficControl() - spirent/stc_traffic_control.py
 our_version = 103
 from copy import deepcopy
-from ask.common.task import Task
+from ask.common.task import Task, TaskProperty
 '''
 *********************
 StcTrafficControl()
@@ -81,6 +81,9 @@ class StcTrafficControl(Task):
 
         self.action = 'perform'
 
+        self.init_properties()
+
+    def init_schema(self):
         # Used in init_properties() to initialize all user-accessible properties
         self.properties_set = set()
         self.properties_set.add('command')
@@ -105,12 +108,8 @@ class StcTrafficControl(Task):
         self.stc_traffic_control_valid_command.add('start')
         self.stc_traffic_control_valid_command.add('stop')
 
-        self.init_properties()
-
     def init_properties(self):
-        self.properties = dict()
-        for p in self.properties_set:
-            self.properties[p] = None
+        self.properties = self.new_properties(self.properties_set)
 
     def verify_stc_traffic_control_command(self, x, parameter='command'):
         verify_set = self.stc_traffic_control_valid_command
@@ -126,8 +125,7 @@ class StcTrafficControl(Task):
             self.generator_list = 'ref:/project'
         if self.command == None:
             self.task_log.error('exiting. Call instance.command before calling instance.commit()')
-            self.task_log.error('Valid values for instance.command: {}'.format(','.join(self.stc_traffic_control_valid_command)))
-            exit(1)
+            self.fail_msg('Valid values for instance.command: {}'.format(','.join(self.stc_traffic_control_valid_command)))
 
     def commit(self):
         self.update()
@@ -155,23 +153,6 @@ class StcTrafficControl(Task):
             self.ansible_task['name'] = self.task_name
         self.ansible_task[self.ansible_module] = deepcopy(d)
 
-    @property
-    def command(self):
-        return self.properties['command']
-    @command.setter
-    def command(self, x):
-        parameter = 'command'
-        if self.set_none(x, parameter):
-            return
-        self.verify_stc_traffic_control_command(x, parameter)
-        self.properties['command'] = x
-
-    @property
-    def generator_list(self):
-        return self.properties['generator_list']
-    @generator_list.setter
-    def generator_list(self, x):
-        parameter = 'generator_list'
-        if self.set_none(x, parameter):
-            return
-        self.properties[parameter] = x
+    command = TaskProperty('verify_stc_traffic_control_command')
+
+    generator_list = TaskProperty()
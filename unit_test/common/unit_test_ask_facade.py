@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_ask_facade.py
+our_version = 101
+'''
+Verifies that the ask package facade (ask/__init__.py) lists every
+ScriptKit class, that each listed class resolves, and that importing
+ask does not import any ScriptKit module.
+'''
+import importlib
+import inspect
+import pkgutil
+import sys
+
+import ask
+from ask.common.log import Log
+
+log = Log('unit_test_ask_facade', 'INFO', 'DEBUG')
+
+loaded = [name for name in sys.modules if name.startswith('ask.') and name not in ('ask.common', 'ask.common.log')]
+if len(loaded) != 0:
+    log.error('FAIL: import ask imported {}'.format(loaded))
+    exit(1)
+
+for package_name in ['ask.ansible', 'ask.cisco.nxos', 'ask.spirent']:
+    package = importlib.import_module(package_name)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module_name = '{}.{}'.format(package_name, module_info.name)
+        module = importlib.import_module(module_name)
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module_name:
+                continue
+            if name not in ask.class_module:
+                log.error('FAIL: {} (in {}) missing from ask.class_module'.format(name, module_name))
+                exit(1)
+
+for name in ask.class_module:
+    value = getattr(ask, name)
+    if value.__name__ != name:
+        log.error('FAIL: ask.{} resolved to {}'.format(name, value))
+        exit(1)
+    if value.__module__ != ask.class_module[name]:
+        log.error('FAIL: ask.{} resolved to {}'.format(name, value.__module__))
+        exit(1)
+
+try:
+    ask.NoSuchClass
+    log.error('FAIL: ask.NoSuchClass did not raise AttributeError')
+    exit(1)
+except AttributeError:
+    pass
+
+log.info('PASS')
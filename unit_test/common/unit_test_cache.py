@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_cache.py
+our_version = 101
+'''
+Verifies that, with a PlaybookCache(), Playbook() and ParallelPlaybook()
+rewrite only the playbooks whose plays changed since the previous run,
+that the changed, unchanged, and removed hosts are reported, and that
+overwrite atomic replaces an existing file.
+'''
+import shutil
+from os import listdir, makedirs, path, stat
+from ask.common.log import Log
+from ask.common.cache import PlaybookCache
+from ask.common.parallel import ParallelPlaybook
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+
+log = Log('unit_test_cache', 'INFO', 'DEBUG')
+
+directory = '/tmp/unit_test_cache'
+manifest = path.join(directory, 'manifest.json')
+shutil.rmtree(directory, ignore_errors=True)
+makedirs(directory)
+
+# feature enabled on each host.  Changed between runs below.
+features = dict()
+for host in ['leaf-1', 'leaf-2', 'leaf-3']:
+    features[host] = 'bgp'
+
+def add_play(pb, host):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = features[host]
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    pb.add_host(host)
+    pb.append_playbook()
+
+def write_per_host(stream=False):
+    '''
+    write one playbook per host in features.  return the cache
+    '''
+    cache = PlaybookCache(log, manifest)
+    for host in features:
+        pb = Playbook(log)
+        pb.cache = cache
+        pb.file = path.join(directory, '{}.yaml'.format(host))
+        if stream:
+            pb.open_stream()
+        add_play(pb, host)
+        pb.write_playbook()
+    cache.save()
+    return cache
+
+def mtimes():
+    return {x: stat(path.join(directory, x)).st_mtime_ns for x in listdir(directory) if x.endswith('.yaml')}
+
+cache = write_per_host()
+if cache.changed_hosts != ['leaf-1', 'leaf-2', 'leaf-3']:
+    log.error('FAIL: first run: expected all hosts changed. Got {}'.format(cache.changed_hosts))
+    exit(1)
+before = mtimes()
+if len(before) != 3:
+    log.error('FAIL: first run: expected 3 playbooks. Got {}'.format(sorted(before)))
+    exit(1)
+
+cache = write_per_host()
+if cache.changed_hosts != []:
+    log.error('FAIL: unchanged run: expected no hosts changed. Got {}'.format(cache.changed_hosts))
+    exit(1)
+if cache.unchanged_hosts != ['leaf-1', 'leaf-2', 'leaf-3']:
+    log.error('FAIL: unchanged run: got unchanged hosts {}'.format(cache.unchanged_hosts))
+    exit(1)
+if mtimes() != before:
+    log.error('FAIL: unchanged run: playbooks were rewritten')
+    exit(1)
+
+features['leaf-2'] = 'ospf'
+cache = write_per_host(stream=True)
+if cache.changed_hosts != ['leaf-2']:
+    log.error('FAIL: one host changed: got {}'.format(cache.changed_hosts))
+    exit(1)
+after = mtimes()
+if after['leaf-1.yaml'] != before['leaf-1.yaml']:
+    log.error('FAIL: one host changed: leaf-1.yaml was rewritten')
+    exit(1)
+if after['leaf-2.yaml'] == before['leaf-2.yaml']:
+    log.error('FAIL: one host changed: leaf-2.yaml was not rewritten')
+    exit(1)
+with open(path.join(directory, 'leaf-2.yaml'), 'r') as fh:
+    if 'feature: ospf' not in fh.read():
+        log.error('FAIL: one host changed: leaf-2.yaml does not have the new play')
+        exit(1)
+if [x for x in listdir(directory) if x.endswith('.tmp')] != []:
+    log.error('FAIL: temporary files left behind')
+    exit(1)
+
+limit_file = path.join(directory, 'changed_hosts')
+cache.write_limit_file(limit_file)
+with open(limit_file, 'r') as fh:
+    if fh.read() != 'leaf-2\n':
+        log.error('FAIL: unexpected limit file contents')
+        exit(1)
+
+# merged playbook: a host dropped from the playbook is removed
+def write_merged():
+    cache = PlaybookCache(log, manifest)
+    pb = Playbook(log)
+    pb.cache = cache
+    pb.file = path.join(directory, 'fabric.yaml')
+    for host in features:
+        add_play(pb, host)
+    pb.write_playbook()
+    cache.save()
+    return cache
+
+write_merged()
+del features['leaf-3']
+cache = write_merged()
+if cache.changed_hosts != []:
+    log.error('FAIL: host dropped: got changed hosts {}'.format(cache.changed_hosts))
+    exit(1)
+if cache.removed_hosts != ['leaf-3']:
+    log.error('FAIL: host dropped: got removed hosts {}'.format(cache.removed_hosts))
+    exit(1)
+
+# overwrite atomic, without a cache
+filename = path.join(directory, 'atomic.yaml')
+with open(filename, 'w') as fh:
+    fh.write('old contents\n')
+pb = Playbook(log)
+pb.overwrite = 'atomic'
+pb.file = filename
+add_play(pb, 'leaf-1')
+pb.write_playbook()
+with open(filename, 'r') as fh:
+    if 'feature: bgp' not in fh.read():
+        log.error('FAIL: overwrite atomic: file was not replaced')
+        exit(1)
+
+# ParallelPlaybook(): workers record their entries in the parent's cache
+def build(pb, host, log):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = features[host]
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+
+def run_parallel(workers):
+    ppb = ParallelPlaybook(log)
+    ppb.builder = build
+    ppb.hosts = sorted(features)
+    ppb.workers = workers
+    ppb.directory = path.join(directory, 'parallel')
+    ppb.cache = PlaybookCache(log, path.join(directory, 'parallel_manifest.json'))
+    ppb.run()
+    return ppb.cache
+
+makedirs(path.join(directory, 'parallel'))
+cache = run_parallel(2)
+if cache.changed_hosts != ['leaf-1', 'leaf-2']:
+    log.error('FAIL: parallel first run: got {}'.format(cache.changed_hosts))
+    exit(1)
+features['leaf-1'] = 'ospf'
+cache = run_parallel(2)
+if cache.changed_hosts != ['leaf-1']:
+    log.error('FAIL: parallel second run: got {}'.format(cache.changed_hosts))
+    exit(1)
+cache = run_parallel(0)
+if cache.changed_hosts != []:
+    log.error('FAIL: sequential third run: got {}'.format(cache.changed_hosts))
+    exit(1)
+
+shutil.rmtree(directory, ignore_errors=True)
+log.info('PASS')
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_canonical.py
+our_version = 101
+'''
+Verifies that, with pb.key_order = 'canonical', plays and tasks are
+written in canonical key order by every yaml_backend and output_format,
+that the output does not depend on the order in which keys were added,
+and that it loads to the same data as the default (sorted) key order.
+'''
+import json
+import yaml
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.snapshot import snapshots
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_canonical', 'INFO', 'DEBUG')
+
+class DictTask(object):
+    '''
+    A task whose ansible_task is a plain dict(), with keys in the
+    order given
+    '''
+    def __init__(self, keys):
+        self.validation_collector = None
+        self.ansible_module = 'cisco.nxos.nxos_interfaces'
+        config = dict()
+        for key in keys:
+            config[key] = 'value_{}'.format(key)
+        self.ansible_task = dict()
+        self.ansible_task[self.ansible_module] = {'config': [config], 'state': 'merged'}
+        self.ansible_task['name'] = 'dict task'
+
+def build(key_order, yaml_backend, output_format, keys):
+    pb = Playbook(log)
+    pb.key_order = key_order
+    pb.yaml_backend = yaml_backend
+    pb.output_format = output_format
+    pb.file = 'STDOUT'
+    pb.profile_nxos()
+    pb.add_environment('no_proxy', '*')
+    task = NxosFeature(log)
+    task.task_name = 'enable bgp'
+    task.feature = 'bgp'
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    task = NxosInterfaces(log)
+    task.name = 'Ethernet1/1'
+    task.mtu = 9216
+    task.description = 'uplink'
+    task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+    pb.add_task(DictTask(keys))
+    pb.add_host('leaf-1')
+    pb.append_playbook()
+    if output_format == 'json':
+        return pb.emitter.dump_json(pb.stream)
+    return pb.dump_yaml(pb.stream, indent=4, allow_unicode=True, explicit_start=True, default_flow_style=False)
+
+keys = ['mtu', 'description', 'name', 'enabled']
+for output_format, yaml_backends in [('yaml', ['python', 'libyaml', 'scriptkit']), ('json', ['auto'])]:
+    for yaml_backend in yaml_backends:
+        case = '{} {}'.format(output_format, yaml_backend)
+        text = build('canonical', yaml_backend, output_format, keys)
+        if build('canonical', yaml_backend, output_format, list(reversed(keys))) != text:
+            log.error('FAIL: {}: output depends on key insertion order'.format(case))
+            exit(1)
+        if output_format == 'json':
+            data = json.loads(text)
+            if data != json.loads(build('sorted', yaml_backend, output_format, keys)):
+                log.error('FAIL: {}: canonical and sorted data differ'.format(case))
+                exit(1)
+        else:
+            data = yaml.safe_load(text)
+            if data != yaml.safe_load(build('sorted', yaml_backend, output_format, keys)):
+                log.error('FAIL: {}: canonical and sorted data differ'.format(case))
+                exit(1)
+        play = data[0]
+        if list(play) != ['name', 'hosts', 'gather_facts', 'environment', 'vars', 'tasks']:
+            log.error('FAIL: {}: unexpected play key order {}'.format(case, list(play)))
+            exit(1)
+        if list(play['vars']) != sorted(play['vars']):
+            log.error('FAIL: {}: vars keys are not sorted'.format(case))
+            exit(1)
+        for task in play['tasks']:
+            if 'name' in task:
+                if list(task)[0] != 'name':
+                    log.error('FAIL: {}: task name is not first. Got {}'.format(case, list(task)))
+                    exit(1)
+        config = play['tasks'][2]['cisco.nxos.nxos_interfaces']['config'][0]
+        if list(config) != sorted(keys):
+            log.error('FAIL: {}: config keys are not sorted. Got {}'.format(case, list(config)))
+            exit(1)
+
+# the same dict built in different key orders is one snapshot
+a = snapshots.freeze({'b': 1, 'a': [{'y': 2, 'x': 3}]})
+b = snapshots.freeze({'a': [{'x': 3, 'y': 2}], 'b': 1})
+if a is not b:
+    log.error('FAIL: dicts differing only in key order are not shared')
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_classify_interface.py
+our_version = 101
+'''
+Verifies Common().classify_interface() type, module/port/subport,
+subinterface, and canonical name, and that the is_*_interface()
+methods built on it accept and reject the expected names.
+'''
+from ask.common.log import Log
+from ask.common.common import Common, InterfaceName
+
+log = Log('unit_test_classify_interface', 'INFO', 'DEBUG')
+common = Common('unit_test', log)
+
+expected = dict()
+expected['ethernet1/1'] = InterfaceName('ethernet', 'Ethernet1/1', 1, 1, None, None)
+expected['Ethernet1/2/3'] = InterfaceName('ethernet', 'Ethernet1/2/3', 1, 2, 3, None)
+expected['Ethernet1/49.100'] = InterfaceName('ethernet', 'Ethernet1/49.100', 1, 49, None, 100)
+expected['Port-channel10'] = InterfaceName('port_channel', 'port-channel10', None, 10, None, None)
+expected['port-channel10.20'] = InterfaceName('port_channel', 'port-channel10.20', None, 10, None, 20)
+expected['Loopback0'] = InterfaceName('loopback', 'loopback0', None, 0, None, None)
+expected['mgmt0'] = InterfaceName('management', 'mgmt0', None, 0, None, None)
+expected['nve1'] = InterfaceName('nve', 'nve1', None, 1, None, None)
+expected['vlan10'] = InterfaceName('vlan', 'Vlan10', None, 10, None, None)
+for name in ['Ethernet1', 'Vlan10.1', 'Loopback0/1', 'Ethernet1/1/1/1', 'ETHERNET1/1', 'Tunnel1', '', 10, None]:
+    expected[name] = None
+
+for name in expected:
+    result = common.classify_interface(name)
+    if result != expected[name]:
+        log.error('FAIL: classify_interface({!r}) returned {}, expected {}'.format(name, result, expected[name]))
+        exit(1)
+    # second call is served from validator_cache
+    if common.classify_interface(name) is not result:
+        log.error('FAIL: classify_interface({!r}) not cached'.format(name))
+        exit(1)
+
+if common.canonical_interface('ethernet1/1') is not common.canonical_interface('Ethernet1/1'):
+    log.error('FAIL: canonical names not shared')
+    exit(1)
+if common.canonical_interface('Tunnel1') != 'Tunnel1':
+    log.error('FAIL: unclassified name not returned unchanged')
+    exit(1)
+if not common.is_ethernet_interface('Ethernet1/1'):
+    log.error('FAIL: is_ethernet_interface')
+    exit(1)
+if common.is_ethernet_interface('Ethernet1/1.10'):
+    log.error('FAIL: is_ethernet_interface subinterface')
+    exit(1)
+if not common.is_ethernet_subinterface('Ethernet1/1/1.10'):
+    log.error('FAIL: is_ethernet_subinterface')
+    exit(1)
+if not common.is_port_channel_interface('port-channel1.10'):
+    log.error('FAIL: is_port_channel_interface subinterface')
+    exit(1)
+if not common.is_lldp_interface('Ethernet1/1'):
+    log.error('FAIL: is_lldp_interface')
+    exit(1)
+if common.is_lldp_interface('Vlan10'):
+    log.error('FAIL: is_lldp_interface Vlan10')
+    exit(1)
+if not common.is_interface_kind('Vlan10', common.ip_interface_kinds):
+    log.error('FAIL: ip_interface_kinds Vlan10')
+    exit(1)
+if common.is_interface_kind('nve1', common.ip_interface_kinds):
+    log.error('FAIL: ip_interface_kinds nve1')
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_coalesce.py
+our_version = 101
+'''
+Verifies that pb.coalesce_tasks merges adjacent, compatible resource
+module tasks, and refuses to merge tasks whose config lists conflict,
+whose state differs or is overridden, that are not adjacent, or that
+register their result.
+'''
+import yaml
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.cisco.nxos.nxos_l3_interfaces import NxosL3Interfaces
+from ask.cisco.nxos.nxos_static_routes import NxosStaticRoutes
+from ask.cisco.nxos.nxos_vlans import NxosVlans
+
+log = Log('unit_test_coalesce', 'INFO', 'DEBUG')
+
+def vlan_task(vlan_id, name=None, state='merged'):
+    task = NxosVlans(log)
+    task.vlan_id = vlan_id
+    if name != None:
+        task.name = name
+    task.add_vlan()
+    task.task_name = 'vlan {}'.format(vlan_id)
+    task.state = state
+    task.commit()
+    return task
+
+def interface_task(name, state='merged', **properties):
+    task = NxosInterfaces(log)
+    task.name = name
+    for key in properties:
+        setattr(task, key, properties[key])
+    task.add_interface()
+    task.state = state
+    task.commit()
+    return task
+
+def route_task(dest, next_hop):
+    task = NxosStaticRoutes(log)
+    task.afi = 'ipv4'
+    task.dest = dest
+    task.forward_router_address = next_hop
+    task.add_next_hop()
+    task.state = 'merged'
+    task.commit()
+    return task
+
+def feature_task(feature):
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    return task
+
+def play_tasks(tasks, **settings):
+    '''
+    return the tasks of one play, as written, with coalesce_tasks True
+    '''
+    pb = Playbook(log)
+    for key in settings:
+        setattr(pb, key, settings[key])
+    pb.coalesce_tasks = True
+    pb.profile_nxos()
+    for task in tasks:
+        pb.add_task(task)
+    pb.add_host('leaf-1')
+    pb.append_playbook()
+    if pb.task_counts != [len(pb.stream[0]['tasks'])]:
+        log.error('FAIL: task_counts does not match the coalesced play')
+        exit(1)
+    return yaml.safe_load(pb.dump_yaml(pb.stream))[0]['tasks']
+
+def configs(tasks, module):
+    return [task[module]['config'] for task in tasks]
+
+vlans = 'cisco.nxos.nxos_vlans'
+interfaces = 'cisco.nxos.nxos_interfaces'
+
+for settings in [dict(), {'deepcopy_tasks': True}, {'key_order': 'canonical'}]:
+    case = 'settings {}'.format(settings)
+
+    # ten vlans, one task each, become one task
+    tasks = play_tasks([vlan_task(x) for x in range(10, 20)], **settings)
+    if len(tasks) != 1:
+        log.error('FAIL: {}: expected 1 vlans task. Got {}'.format(case, len(tasks)))
+        exit(1)
+    if [x['vlan_id'] for x in tasks[0][vlans]['config']] != list(range(10, 20)):
+        log.error('FAIL: {}: vlans missing or out of order'.format(case))
+        exit(1)
+    if tasks[0]['name'] != 'vlan 10 (and 9 more)':
+        log.error('FAIL: {}: unexpected name {}'.format(case, tasks[0]['name']))
+        exit(1)
+
+    # the same vlan twice: identical is merged, different values conflict
+    tasks = play_tasks([vlan_task(10, 'web'), vlan_task(10, 'web')], **settings)
+    if configs(tasks, vlans) != [[{'vlan_id': 10, 'name': 'web'}]]:
+        log.error('FAIL: {}: identical vlans not merged. Got {}'.format(case, tasks))
+        exit(1)
+    tasks = play_tasks([vlan_task(10, 'web'), vlan_task(10, 'db')], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: conflicting vlans were merged'.format(case))
+        exit(1)
+
+    # state merged: an interface's fields are merged, if they do not conflict
+    tasks = play_tasks([interface_task('Ethernet1/1', description='uplink'), interface_task('Ethernet1/1', mtu=9216), interface_task('Ethernet1/2', mtu=9216)], **settings)
+    if configs(tasks, interfaces) != [[{'name': 'Ethernet1/1', 'description': 'uplink', 'mtu': '9216'}, {'name': 'Ethernet1/2', 'mtu': '9216'}]]:
+        log.error('FAIL: {}: unexpected merged interfaces {}'.format(case, tasks))
+        exit(1)
+    tasks = play_tasks([interface_task('Ethernet1/1', mtu=1500), interface_task('Ethernet1/1', mtu=9216)], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: conflicting interfaces were merged'.format(case))
+        exit(1)
+
+    # state replaced: only identical items are merged
+    tasks = play_tasks([interface_task('Ethernet1/1', 'replaced', description='uplink'), interface_task('Ethernet1/1', 'replaced', mtu=9216)], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: replaced interfaces with different fields were merged'.format(case))
+        exit(1)
+
+    # different or overridden state, and non-adjacent tasks, are not merged
+    tasks = play_tasks([interface_task('Ethernet1/1', 'merged', mtu=9216), interface_task('Ethernet1/2', 'replaced', mtu=9216)], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: tasks with different states were merged'.format(case))
+        exit(1)
+    tasks = play_tasks([interface_task('Ethernet1/1', 'overridden', mtu=9216), interface_task('Ethernet1/2', 'overridden', mtu=9216)], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: overridden tasks were merged'.format(case))
+        exit(1)
+    tasks = play_tasks([vlan_task(10), feature_task('bgp'), vlan_task(11)], **settings)
+    if len(tasks) != 3:
+        log.error('FAIL: {}: non-adjacent tasks were merged'.format(case))
+        exit(1)
+
+    # static routes are merged per vrf, afi, and dest
+    tasks = play_tasks([route_task('10.1.0.0/16', '192.168.1.1'), route_task('10.2.0.0/16', '192.168.1.1')], **settings)
+    if len(tasks) != 1:
+        log.error('FAIL: {}: static routes were not merged'.format(case))
+        exit(1)
+    routes = tasks[0]['cisco.nxos.nxos_static_routes']['config'][0]['address_families'][0]['routes']
+    if [x['dest'] for x in routes] != ['10.1.0.0/16', '10.2.0.0/16']:
+        log.error('FAIL: {}: unexpected routes {}'.format(case, routes))
+        exit(1)
+    tasks = play_tasks([route_task('10.1.0.0/16', '192.168.1.1'), route_task('10.1.0.0/16', '192.168.1.2')], **settings)
+    if len(tasks) != 2:
+        log.error('FAIL: {}: conflicting static routes were merged'.format(case))
+        exit(1)
+
+# a task that registers its result is not merged
+l3_tasks = list()
+for name in ['Ethernet1/1', 'Ethernet1/2']:
+    task = NxosL3Interfaces(log)
+    task.name = name
+    task.ipv4_address = '10.0.0.1/30'
+    task.add_interface()
+    task.register = 'result'
+    task.state = 'merged'
+    task.commit()
+    l3_tasks.append(task)
+if len(play_tasks(l3_tasks)) != 2:
+    log.error('FAIL: tasks with register were merged')
+    exit(1)
+
+log.info('PASS')
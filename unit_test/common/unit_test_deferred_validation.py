@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_deferred_validation.py
+our_version = 101
+'''
+Verifies that, with DeferredValidation() active, invalid TaskProperty()
+values are accepted on assignment and reported at add_*() / commit()
+time, and that valid values produce the same task as eager validation.
+'''
+from ask.common.log import Log
+from ask.common.common import ValidationCollector
+from ask.common.task import DeferredValidation
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_deferred_validation', 'INFO', 'DEBUG')
+
+def build_task():
+    task = NxosInterfaces(log)
+    for port in range(1, 5):
+        task.name = 'Ethernet1/{}'.format(port)
+        task.mode = 'layer3'
+        task.speed = 10000
+        task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    return task
+
+eager = build_task()
+with DeferredValidation():
+    deferred = build_task()
+if eager.ansible_task != deferred.ansible_task:
+    log.error('FAIL: eager and deferred tasks differ')
+    exit(1)
+
+with DeferredValidation():
+    build_task()
+    task = NxosInterfaces(log)
+    task.mode = 'layer3'
+    if len(task.pending_validation) != 0:
+        log.error('FAIL: already verified value is pending')
+        exit(1)
+    task.mode = 'layer2'
+    if len(task.pending_validation) != 1:
+        log.error('FAIL: new value is not pending')
+        exit(1)
+
+collector = ValidationCollector(raise_errors=False)
+with collector:
+    with DeferredValidation():
+        task = NxosInterfaces(log)
+        task.name = 'Ethernet1/1'
+        task.mode = 'layer4'
+        if len(collector.errors) != 0:
+            log.error('FAIL: error reported before add_interface()')
+            exit(1)
+        if len(task.pending_validation) != 2:
+            log.error('FAIL: expected 2 pending values, got {}'.format(task.pending_validation))
+            exit(1)
+        task.add_interface()
+if len(collector.errors) != 1:
+    log.error('FAIL: expected 1 error, got {}'.format(collector.report()))
+    exit(1)
+if collector.errors[0].parameter != 'mode':
+    log.error('FAIL: unexpected error {}'.format(collector.errors[0]))
+    exit(1)
+if len(task.pending_validation) != 0:
+    log.error('FAIL: pending values not cleared')
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_emitter.py
+our_version = 102
+'''
+Verifies that Emitter() YAML loads to the same data as yaml.dump()
+output, that it has the same layout for data with no long strings, that
+Ansible-sensitive strings are quoted, and that JSON playbooks (streamed
+or not) load to the same plays as YAML playbooks, and that strings with
+YAML line breaks or non-printable characters load back unchanged.
+'''
+import json
+import yaml
+from os import path, remove
+from ask.common.log import Log
+from ask.common.emitter import Emitter
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.cisco.nxos.nxos_vrf import NxosVrf
+
+log = Log('unit_test_emitter', 'INFO', 'DEBUG')
+emitter = Emitter(log)
+
+def pyyaml(data, explicit=False):
+    return yaml.dump(data, indent=4, allow_unicode=True, explicit_start=explicit, explicit_end=explicit, default_flow_style=False)
+
+strings = ['plain', 'yes', 'No', 'on', 'OFF', 'true', 'null', '~', '', ' lead', 'trail ',
+    '1', '1.0', '0x1f', '0o17', '1_000', '.inf', '-.inf', '.NaN', '2021-01-01', '10:20',
+    '=', '<<', '-', '-x', '- x', '?', '? x', ':x', 'x:', 'a: b', 'a:b', 'a #c', 'a#c',
+    '#c', '*x', '&x', '!x', '%x', '@x', '`x', '|x', '>x', "'x", '"x', "it's", '[x', 'x]',
+    '{x', 'x,y', '{{ foo }}', 'foo {{ bar }}', '{% if x %}', 'Ünïcödé → leaf', 'a\tb',
+    'x\ny', 'a\x01b', '﻿bom', 'Ethernet1/1', '10.1.1.1/24', '2001::1/64', '65000:1']
+data = dict()
+data['strings'] = strings
+data['mapping'] = {s: s for s in strings}
+data['scalars'] = [None, True, False, 0, -1, 2**40, 1.5, 1e20, -2.5e-7, float('inf'), {}, []]
+data['nested'] = [[1, [2, 3], {}], {'a': [{'b': [], 'c': {'d': None}}]}, 'end']
+
+for value in [data, [data, data], 'yes', [], {}]:
+    text = emitter.dump_yaml(value, explicit_start=True, explicit_end=True)
+    if yaml.safe_load(text) != yaml.safe_load(pyyaml(value, True)):
+        log.error('FAIL: Emitter() data differs for {}'.format(value))
+        exit(1)
+
+for s in ['yes', 'on', '{{ foo }}', 'foo {{ bar }}', '{% if x %}', '1.0', '']:
+    if not isinstance(yaml.safe_load(emitter.dump_yaml({'x': s}))['x'], str):
+        log.error('FAIL: not quoted: {}'.format(s))
+        exit(1)
+    if emitter.dump_yaml({'x': s}) == 'x: {}\n'.format(s):
+        log.error('FAIL: not quoted: {}'.format(s))
+        exit(1)
+
+# YAML reads \x85, \u2028 and \u2029 as line breaks, and can only write
+# \x7f-\x9f, \ufffe and \uffff as escapes
+for c in ['\x85', '\u2028', '\u2029', '\x7f', '\x80', '\x9f', '\ufffe', '\uffff']:
+    for s in [c, 'a{}b'.format(c), '{}a'.format(c), 'a {} b'.format(c), 'x: {}'.format(c)]:
+        for value in [s, [s], {s: s}]:
+            text = emitter.dump_yaml(value)
+            if yaml.safe_load(text) != value:
+                log.error('FAIL: Emitter() does not round-trip {}. Got {}'.format(ascii(value), ascii(text)))
+                exit(1)
+
+def add_plays(pb):
+    for host in range(3):
+        task = NxosInterfaces(log)
+        task.name = 'Ethernet1/{}'.format(host + 1)
+        task.description = 'to leaf-{}'.format(host)
+        task.mtu = 9216
+        task.add_interface()
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        task = NxosVrf(log)
+        task.name = 'vrf_{}'.format(host)
+        task.vni = 10000 + host
+        task.state = 'present'
+        task.commit()
+        pb.add_task(task)
+        pb.add_host('leaf-{}'.format(host))
+        pb.append_playbook()
+
+def write(yaml_backend, output_format, streaming):
+    filename = '/tmp/unit_test_emitter_{}_{}_{}'.format(yaml_backend, output_format, streaming)
+    if path.exists(filename):
+        remove(filename)
+    pb = Playbook(log)
+    pb.yaml_backend = yaml_backend
+    pb.output_format = output_format
+    pb.profile_nxos()
+    pb.file = filename
+    if streaming:
+        pb.open_stream()
+    add_plays(pb)
+    pb.write_playbook()
+    with open(filename, 'r') as fh:
+        return fh.read()
+
+# playbooks with no long strings are byte-identical to yaml.dump()
+expected = write('python', 'yaml', False)
+if write('scriptkit', 'yaml', False) != expected:
+    log.error('FAIL: scriptkit playbook differs from python playbook')
+    exit(1)
+if write('scriptkit', 'yaml', True) != expected:
+    log.error('FAIL: scriptkit streamed playbook differs from python playbook')
+    exit(1)
+
+plays = yaml.safe_load(expected)
+json_playbook = write('python', 'json', False)
+if json.loads(json_playbook) != plays:
+    log.error('FAIL: json playbook differs from yaml playbook')
+    exit(1)
+if write('python', 'json', True) != json_playbook:
+    log.error('FAIL: json streamed playbook differs from json playbook')
+    exit(1)
+log.info('PASS')
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_hoist.py
+our_version = 101
+'''
+Verifies that VarsWriter() moves vars shared by every play to group_vars,
+vars shared by every play of a host to host_vars, and that every host
+still sees the same vars in every play, with and without
+pb.deepcopy_tasks.
+'''
+import shutil
+import yaml
+from os import makedirs, path
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.hoist import VarsWriter
+from ask.cisco.nxos.nxos_feature import NxosFeature
+
+log = Log('unit_test_hoist', 'INFO', 'DEBUG')
+
+directory = '/tmp/unit_test_hoist'
+
+def add_play(pb, hosts, feature, **extra_vars):
+    pb.profile_nxos()
+    for key in extra_vars:
+        pb.add_vars(key, extra_vars[key])
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    for host in hosts:
+        pb.add_host(host)
+    pb.append_playbook()
+
+def build(deepcopy_tasks):
+    pb = Playbook(log)
+    pb.deepcopy_tasks = deepcopy_tasks
+    for host in range(1, 5):
+        name = 'leaf-{}'.format(host)
+        add_play(pb, [name], 'bgp', ansible_host='10.0.0.{}'.format(host))
+        add_play(pb, [name], 'ospf', ansible_host='10.0.0.{}'.format(host), loopback={'ip': '1.1.1.{}'.format(host)})
+    # leaf-1 and leaf-2 share a play.  Their ansible_host differs, so it
+    # stays in the play.
+    add_play(pb, ['leaf-1', 'leaf-2'], 'lacp', ansible_host='10.0.0.1')
+    # spine-1 has a different ansible_user in one play only
+    add_play(pb, ['spine-1'], 'bgp')
+    add_play(pb, ['spine-1'], 'ospf', ansible_user='operator')
+    return pb
+
+def read(filename):
+    with open(filename, 'r') as fh:
+        return yaml.safe_load(fh)
+
+def effective_vars(stream, group_vars, host_vars):
+    '''
+    list() of the vars each host sees in each play, in play order, with
+    Ansible's precedence: play vars, then host_vars, then group_vars
+    '''
+    result = list()
+    for play in stream:
+        for host in play['hosts'].split(','):
+            d = dict(group_vars)
+            d.update(host_vars.get(host, dict()))
+            d.update(play.get('vars', dict()))
+            result.append((host, d))
+    return result
+
+for deepcopy_tasks in [False, True]:
+    case = 'deepcopy_tasks {}'.format(deepcopy_tasks)
+    shutil.rmtree(directory, ignore_errors=True)
+    makedirs(directory)
+    pb = build(deepcopy_tasks)
+    before = effective_vars(yaml.safe_load(pb.dump_yaml(pb.stream)), dict(), dict())
+    vw = VarsWriter(log)
+    vw.directory = directory
+    vw.write(pb)
+    stream = yaml.safe_load(pb.dump_yaml(pb.stream))
+    group_vars = read(path.join(directory, 'group_vars', 'all.yml'))
+    if group_vars != vw.group_vars:
+        log.error('FAIL: {}: group_vars file differs from vw.group_vars'.format(case))
+        exit(1)
+    if not ('ansible_connection' in group_vars and 'ansible_user' not in group_vars):
+        log.error('FAIL: {}: unexpected group_vars {}'.format(case, group_vars))
+        exit(1)
+    if 'ansible_host' in group_vars:
+        log.error('FAIL: {}: ansible_host differs per host, but is in group_vars'.format(case))
+        exit(1)
+    host_vars = dict()
+    for filename in vw.files[1:]:
+        host_vars[path.basename(filename)[:-len('.yml')]] = read(filename)
+    if sorted(host_vars) != ['leaf-1', 'leaf-2', 'leaf-3', 'leaf-4']:
+        log.error('FAIL: {}: unexpected host_vars files {}'.format(case, sorted(host_vars)))
+        exit(1)
+    if host_vars['leaf-3'] != {'ansible_host': '10.0.0.3', 'ansible_user': 'admin'}:
+        log.error('FAIL: {}: unexpected leaf-3 host_vars {}'.format(case, host_vars['leaf-3']))
+        exit(1)
+    if effective_vars(stream, group_vars, host_vars) != before:
+        log.error('FAIL: {}: a host sees different vars after hoisting'.format(case))
+        exit(1)
+    if 'vars' in stream[0]:
+        log.error('FAIL: {}: empty vars not removed from play'.format(case))
+        exit(1)
+    if stream[8]['vars'] != {'ansible_host': '10.0.0.1'}:
+        log.error('FAIL: {}: unexpected shared play vars {}'.format(case, stream[8].get('vars')))
+        exit(1)
+    if len(pb.dump_yaml(pb.stream)) >= len(pb.dump_yaml(build(deepcopy_tasks).stream)) / 2:
+        log.error('FAIL: {}: playbook did not shrink'.format(case))
+        exit(1)
+
+# host_vars False: only group_vars are written
+shutil.rmtree(directory, ignore_errors=True)
+makedirs(directory)
+pb = build(False)
+vw = VarsWriter(log)
+vw.directory = directory
+vw.group = 'fabric'
+vw.host_vars = False
+vw.write(pb)
+if [path.relpath(x, directory) for x in vw.files] != ['group_vars/fabric.yml']:
+    log.error('FAIL: host_vars False: unexpected files {}'.format(vw.files))
+    exit(1)
+if not all(play['vars'].get('ansible_host') != None for play in pb.stream if play['hosts'] != 'spine-1'):
+    log.error('FAIL: host_vars False: ansible_host removed from plays')
+    exit(1)
+
+shutil.rmtree(directory, ignore_errors=True)
+log.info('PASS')
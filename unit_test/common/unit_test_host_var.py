@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_host_var.py
+our_version = 102
+'''
+Verifies that Task().host_var writes a task's config as a variable
+reference, and that, after VarsWriter().write() and pb.merge_plays(),
+one play for all hosts, plus each host's host_vars file, renders to the
+same tasks as the literal per-host plays, and that host_var = None
+clears it.
+'''
+import shutil
+import yaml
+from os import makedirs, path
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.hoist import VarsWriter
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_l3_interfaces import NxosL3Interfaces
+
+log = Log('unit_test_host_var', 'INFO', 'DEBUG')
+
+directory = '/tmp/unit_test_host_var'
+hosts = ['leaf-{}'.format(x) for x in range(1, 21)]
+
+def build(host_var, **settings):
+    pb = Playbook(log)
+    for key in settings:
+        setattr(pb, key, settings[key])
+    for number, host in enumerate(hosts, start=1):
+        pb.profile_nxos()
+        task = NxosFeature(log)
+        task.feature = 'interface-vlan'
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+        task = NxosL3Interfaces(log)
+        for port in range(1, 5):
+            task.name = 'Ethernet1/{}'.format(port)
+            task.ipv4_address = '10.{}.{}.1/30'.format(number, port)
+            task.add_ipv4()
+            task.add_interface()
+        task.host_var = host_var
+        task.task_name = 'l3 interfaces'
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        pb.add_host(host)
+        pb.append_playbook()
+    return pb
+
+def loaded(pb):
+    return yaml.safe_load(pb.dump_yaml(pb.stream))
+
+def render(x, host_vars):
+    '''
+    substitute references of the form {{ name }} with host_vars[name]
+    '''
+    if isinstance(x, dict):
+        return {key: render(value, host_vars) for key, value in x.items()}
+    if isinstance(x, list):
+        return [render(item, host_vars) for item in x]
+    if isinstance(x, str) and x.startswith('{{ ') and x.endswith(' }}'):
+        return host_vars[x[3:-3]]
+    return x
+
+module = 'cisco.nxos.nxos_l3_interfaces'
+for settings in [dict(), {'deepcopy_tasks': True}, {'key_order': 'canonical', 'coalesce_tasks': True}, {'yaml_backend': 'scriptkit'}]:
+    case = 'settings {}'.format(settings)
+    shutil.rmtree(directory, ignore_errors=True)
+    makedirs(directory)
+    literal = loaded(build(None, **settings))
+    pb = build('l3_interfaces', **settings)
+    vw = VarsWriter(log)
+    vw.directory = directory
+    vw.write(pb)
+    pb.merge_plays()
+    stream = loaded(pb)
+    if len(stream) != 1:
+        log.error('FAIL: {}: expected one play. Got {}'.format(case, len(stream)))
+        exit(1)
+    if stream[0]['hosts'] != ','.join(hosts):
+        log.error('FAIL: {}: unexpected hosts {}'.format(case, stream[0]['hosts']))
+        exit(1)
+    if stream[0]['tasks'][1][module]['config'] != '{{ l3_interfaces }}':
+        log.error('FAIL: {}: config is not a reference {}'.format(case, stream[0]['tasks'][1]))
+        exit(1)
+    group_vars = vw.group_vars
+    for host, play in zip(hosts, literal):
+        with open(path.join(directory, 'host_vars', '{}.yml'.format(host)), 'r') as fh:
+            host_vars = yaml.safe_load(fh)
+        if list(host_vars) != ['l3_interfaces']:
+            log.error('FAIL: {}: unexpected {} host_vars {}'.format(case, host, list(host_vars)))
+            exit(1)
+        if render(stream[0]['tasks'], host_vars) != play['tasks']:
+            log.error('FAIL: {}: {} tasks differ from the literal play'.format(case, host))
+            exit(1)
+        if dict(group_vars, **host_vars, **stream[0].get('vars', dict())) != dict(play['vars'], l3_interfaces=host_vars['l3_interfaces']):
+            log.error('FAIL: {}: {} vars differ'.format(case, host))
+            exit(1)
+    if len(pb.dump_yaml(pb.stream)) * 10 >= len(pb.dump_yaml(literal)):
+        log.error('FAIL: {}: templated playbook is not much smaller'.format(case))
+        exit(1)
+
+# two tasks in one play may share a host_var only if their configs are equal
+pb = Playbook(log)
+for repeat in range(2):
+    task = NxosL3Interfaces(log)
+    task.name = 'Ethernet1/1'
+    task.ipv4_address = '10.0.0.1/30'
+    task.add_ipv4()
+    task.add_interface()
+    task.host_var = 'uplink'
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+if pb.playbook['vars']['uplink'] != [{'name': 'Ethernet1/1', 'ipv4': [{'address': '10.0.0.1/30'}]}]:
+    log.error('FAIL: unexpected play vars {}'.format(pb.playbook['vars'].get('uplink')))
+    exit(1)
+
+# host_var = None clears a previous host_var
+pb = Playbook(log)
+task = NxosL3Interfaces(log)
+task.name = 'Ethernet1/1'
+task.ipv4_address = '10.0.0.1/30'
+task.add_ipv4()
+task.add_interface()
+task.host_var = 'uplink'
+task.host_var = None
+if task.host_var != None:
+    log.error('FAIL: host_var = None did not clear host_var. Got {}'.format(task.host_var))
+    exit(1)
+if 'host_var' in task.properties:
+    log.error('FAIL: host_var = None added host_var to task.properties')
+    exit(1)
+task.state = 'merged'
+task.commit()
+pb.add_task(task)
+if not isinstance(pb.playbook['tasks'][0][module]['config'], list):
+    log.error('FAIL: config is not literal after host_var = None')
+    exit(1)
+if 'uplink' in pb.playbook.get('vars', dict()):
+    log.error('FAIL: host_var = None still added play vars')
+    exit(1)
+
+shutil.rmtree(directory, ignore_errors=True)
+log.info('PASS')
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_inventory.py
+our_version = 101
+'''
+Verifies Inventory() membership, and that its YAML and INI files, read
+back as Ansible reads them, give every host the same groups and vars.
+Verifies that Playbook() accepts only inventory hosts and groups, and
+that merge_plays() and ShardWriter() expand groups to their hosts.
+'''
+import shlex
+import shutil
+import yaml
+from ast import literal_eval
+from os import makedirs, path
+from ask.common.log import Log
+from ask.common.inventory import Inventory
+from ask.common.playbook import Playbook
+from ask.common.shard import ShardWriter
+from ask.cisco.nxos.nxos_feature import NxosFeature
+
+log = Log('unit_test_inventory', 'INFO', 'DEBUG')
+
+directory = '/tmp/unit_test_inventory'
+
+inv = Inventory(log)
+inv.add_group('leafs', 'fabric')
+inv.add_group('spines', 'fabric')
+inv.add_group('border', 'leafs')
+inv.add_group_vars('all', 'ansible_user', 'admin')
+inv.add_group_vars('fabric', 'ansible_network_os', 'nxos')
+inv.add_group_vars('fabric', 'ansible_command_timeout', 90)
+inv.add_group_vars('leafs', 'ntp_servers', ['10.1.1.1', '10.1.1.2'])
+for number in range(1, 9):
+    host = 'leaf-{}'.format(number)
+    inv.add_host(host, 'leafs')
+    inv.add_host_vars(host, 'ansible_host', '10.0.0.{}'.format(number))
+inv.add_host('leaf-8', 'border')
+inv.add_host_vars('leaf-8', 'description', "border leaf # 'eight'")
+inv.add_host_vars('leaf-8', 'vpc', True)
+for number in range(1, 3):
+    inv.add_host('spine-{}'.format(number), 'spines')
+inv.add_host('stc-1', 'lab')
+inv.add_host_vars('stc-1', 'port', '8080')
+inv.add_host('jumphost')
+
+if not ('leaf-1' in inv and 'fabric' in inv and 'leaf-99' not in inv):
+    log.error('FAIL: unexpected membership')
+    exit(1)
+if not (inv.has_host('stc-1') and not inv.has_host('lab') and inv.has_group('lab')):
+    log.error('FAIL: unexpected has_host/has_group')
+    exit(1)
+if not (inv.is_member('leaf-8', 'fabric') and inv.is_member('leaf-1', 'fabric') and not inv.is_member('stc-1', 'fabric')):
+    log.error('FAIL: unexpected is_member')
+    exit(1)
+if not (inv.is_member('jumphost', 'all') and not inv.is_member('jumphost', 'lab')):
+    log.error('FAIL: unexpected is_member for ungrouped host')
+    exit(1)
+if inv.group_hosts('fabric') != ['leaf-{}'.format(x) for x in range(1, 9)] + ['spine-1', 'spine-2']:
+    log.error('FAIL: unexpected fabric hosts {}'.format(inv.group_hosts('fabric')))
+    exit(1)
+if not (inv.expand('border') == ['leaf-8'] and inv.expand('leaf-3') == ['leaf-3']):
+    log.error('FAIL: unexpected expand')
+    exit(1)
+if inv.groups != ['leafs', 'fabric', 'spines', 'border', 'lab']:
+    log.error('FAIL: unexpected groups {}'.format(inv.groups))
+    exit(1)
+
+def resolve(group_parents, group_vars, host_groups, host_vars):
+    '''
+    dict() keyed on host, of (its groups, including ancestors, and its
+    vars, with host vars over child group vars over parent group vars)
+    '''
+    def ancestors(group):
+        result = [group]
+        for parent in group_parents.get(group, []):
+            for x in ancestors(parent):
+                if x not in result:
+                    result.append(x)
+        return result
+    def depth(group):
+        return max([depth(x) + 1 for x in group_parents.get(group, [])] + [0])
+    result = dict()
+    for host in host_vars:
+        groups = set(['all'])
+        for group in host_groups.get(host, []):
+            groups.update(ancestors(group))
+        d = dict()
+        for group in sorted(groups, key=lambda x: (x != 'all', depth(x), x)):
+            d.update(group_vars.get(group, dict()))
+        d.update(host_vars[host])
+        result[host] = (groups, d)
+    return result
+
+def read_yaml(filename):
+    with open(filename, 'r') as fh:
+        data = yaml.safe_load(fh)
+    group_parents, group_vars, host_groups, host_vars = dict(), dict(), dict(), dict()
+    def parse_group(group, d):
+        d = d or dict()
+        group_vars.setdefault(group, dict()).update(d.get('vars') or dict())
+        for host, v in (d.get('hosts') or dict()).items():
+            host_vars.setdefault(host, dict()).update(v or dict())
+            if group != 'all':
+                host_groups.setdefault(host, []).append(group)
+        for child, child_d in (d.get('children') or dict()).items():
+            if group != 'all':
+                group_parents.setdefault(child, []).append(group)
+            parse_group(child, child_d)
+    parse_group('all', data['all'])
+    return resolve(group_parents, group_vars, host_groups, host_vars)
+
+def read_ini(filename):
+    '''
+    As Ansible's ini inventory plugin: host lines are split as by shlex,
+    and values are read as Python literals where possible
+    '''
+    def value(x):
+        try:
+            return literal_eval(x)
+        except (ValueError, SyntaxError):
+            return x
+    group_parents, group_vars, host_groups, host_vars = dict(), dict(), dict(), dict()
+    group, state = 'ungrouped', 'hosts'
+    with open(filename, 'r') as fh:
+        for line in fh:
+            line = line.strip()
+            if line == '':
+                continue
+            if line.startswith('['):
+                group, _, state = line[1:-1].partition(':')
+                state = state or 'hosts'
+                continue
+            if state == 'vars':
+                key, x = [e.strip() for e in line.split('=', 1)]
+                group_vars.setdefault(group, dict())[key] = value(x)
+            elif state == 'children':
+                group_parents.setdefault(line, []).append(group)
+            else:
+                tokens = shlex.split(line, comments=True)
+                host_vars.setdefault(tokens[0], dict())
+                for token in tokens[1:]:
+                    key, x = token.split('=', 1)
+                    host_vars[tokens[0]][key] = value(x)
+                if group != 'ungrouped':
+                    host_groups.setdefault(tokens[0], []).append(group)
+    return resolve(group_parents, group_vars, host_groups, host_vars)
+
+shutil.rmtree(directory, ignore_errors=True)
+makedirs(directory)
+results = dict()
+for output_format in ['yaml', 'ini']:
+    inv.output_format = output_format
+    inv.file = path.join(directory, 'inventory.{}'.format(output_format))
+    inv.write()
+    if output_format == 'yaml':
+        results[output_format] = read_yaml(inv.file)
+    else:
+        results[output_format] = read_ini(inv.file)
+if results['yaml'] != results['ini']:
+    log.error('FAIL: yaml and ini inventories differ')
+    exit(1)
+hosts = results['yaml']
+if sorted(hosts) != sorted(inv.hosts):
+    log.error('FAIL: unexpected hosts {}'.format(sorted(hosts)))
+    exit(1)
+if hosts['leaf-8'][0] != {'all', 'fabric', 'leafs', 'border'}:
+    log.error('FAIL: unexpected leaf-8 groups {}'.format(hosts['leaf-8'][0]))
+    exit(1)
+if hosts['leaf-8'][1] != {'ansible_user': 'admin', 'ansible_network_os': 'nxos', 'ansible_command_timeout': 90, 'ntp_servers': ['10.1.1.1', '10.1.1.2'],
+                             'ansible_host': '10.0.0.8', 'description': "border leaf # 'eight'", 'vpc': True}:
+    log.error('FAIL: unexpected leaf-8 vars {}'.format(hosts['leaf-8'][1]))
+    exit(1)
+if hosts['stc-1'][1] != {'ansible_user': 'admin', 'port': '8080'}:
+    log.error('FAIL: unexpected stc-1 vars {}'.format(hosts['stc-1'][1]))
+    exit(1)
+if hosts['jumphost'] != ({'all'}, {'ansible_user': 'admin'}):
+    log.error('FAIL: unexpected jumphost {}'.format(hosts['jumphost']))
+    exit(1)
+
+# Playbook() with an inventory
+def add_play(pb, name, feature):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    pb.add_host(name)
+    pb.append_playbook()
+
+pb = Playbook(log)
+pb.inventory = inv
+add_play(pb, 'fabric', 'bgp')
+add_play(pb, 'leaf-1', 'ospf')
+add_play(pb, 'stc-1', 'bgp')  # merged into the fabric play
+add_play(pb, 'leaf-2', 'bgp') # not merged: leaf-2 is in fabric
+if pb.play_hosts(pb.stream[0]) != inv.group_hosts('fabric'):
+    log.error('FAIL: unexpected play_hosts {}'.format(pb.play_hosts(pb.stream[0])))
+    exit(1)
+pb.merge_plays()
+if [play['hosts'] for play in pb.stream] != ['fabric,stc-1', 'leaf-1', 'leaf-2']:
+    log.error('FAIL: unexpected merge {}'.format([play['hosts'] for play in pb.stream]))
+    exit(1)
+
+sw = ShardWriter(log)
+sw.directory = directory
+sw.shards = 2
+sw.write(pb)
+if len(sw.shard_files) != 1:
+    log.error('FAIL: plays sharing hosts through a group were split across shards {}'.format(sw.shard_hosts))
+    exit(1)
+
+shutil.rmtree(directory, ignore_errors=True)
+log.info('PASS')
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_merge_plays.py
+our_version = 102
+'''
+Verifies that pb.merge_plays() merges plays that differ only in their
+hosts, and that each host's plays still run in the same order, with
+and without pb.deepcopy_tasks, and with key_order canonical.
+'''
+import yaml
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_merge_plays', 'INFO', 'DEBUG')
+
+def feature_play(pb, host, feature):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    pb.add_host(host)
+    pb.append_playbook()
+
+def interface_play(pb, host):
+    pb.profile_nxos()
+    task = NxosInterfaces(log)
+    task.name = 'Ethernet1/1'
+    task.description = 'uplink from {}'.format(host)
+    task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+    pb.add_host(host)
+    pb.append_playbook()
+
+def host_plays(stream):
+    '''
+    dict() keyed on host, of the list() of tasks run on that host, in order
+    '''
+    d = dict()
+    for play in stream:
+        for host in play['hosts'].split(','):
+            d.setdefault(host, list()).append(play['tasks'])
+    return d
+
+def loaded(pb):
+    return yaml.safe_load(pb.dump_yaml(pb.stream))
+
+hosts = ['leaf-{}'.format(x) for x in range(1, 51)]
+
+def new_playbook(settings):
+    pb = Playbook(log)
+    for key in settings:
+        setattr(pb, key, settings[key])
+    return pb
+
+for settings in [{'deepcopy_tasks': False}, {'deepcopy_tasks': True}, {'key_order': 'canonical'}]:
+    case = 'settings {}'.format(settings)
+
+    # a baseline play per host, then a host-specific play per host
+    pb = new_playbook(settings)
+    for host in hosts:
+        feature_play(pb, host, 'bgp')
+        interface_play(pb, host)
+    before = host_plays(loaded(pb))
+    pb.merge_plays()
+    stream = loaded(pb)
+    if len(stream) != 1 + len(hosts):
+        log.error('FAIL: {}: expected {} plays. Got {}'.format(case, 1 + len(hosts), len(stream)))
+        exit(1)
+    if stream[0]['hosts'] != ','.join(hosts):
+        log.error('FAIL: {}: baseline play hosts are {}'.format(case, stream[0]['hosts']))
+        exit(1)
+    if host_plays(stream) != before:
+        log.error('FAIL: {}: host play order changed'.format(case))
+        exit(1)
+    if pb.task_counts != [len(play['tasks']) for play in pb.stream]:
+        log.error('FAIL: {}: task_counts does not match the merged stream'.format(case))
+        exit(1)
+
+    # leaf-1 runs bgp then ospf, leaf-2 runs ospf then bgp.  leaf-2's bgp
+    # play can not be merged into leaf-1's, which runs before ospf.
+    pb = new_playbook(settings)
+    feature_play(pb, 'leaf-1', 'bgp')
+    feature_play(pb, 'leaf-1', 'ospf')
+    feature_play(pb, 'leaf-2', 'ospf')
+    feature_play(pb, 'leaf-2', 'bgp')
+    before = host_plays(loaded(pb))
+    pb.merge_plays()
+    stream = loaded(pb)
+    if [play['hosts'] for play in stream] != ['leaf-1', 'leaf-1,leaf-2', 'leaf-2']:
+        log.error('FAIL: {}: unexpected merge {}'.format(case, [play['hosts'] for play in stream]))
+        exit(1)
+    if host_plays(stream) != before:
+        log.error('FAIL: {}: host play order changed'.format(case))
+        exit(1)
+
+    # the same play twice for one host is not merged
+    pb = new_playbook(settings)
+    feature_play(pb, 'leaf-1', 'bgp')
+    feature_play(pb, 'leaf-1', 'bgp')
+    pb.merge_plays()
+    if len(pb.stream) != 2:
+        log.error('FAIL: {}: repeated play for one host was merged'.format(case))
+        exit(1)
+
+log.info('PASS')
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_parallel.py
+our_version = 102
+'''
+Verifies that ParallelPlaybook() with worker processes writes the same
+merged playbook (with and without merge_plays), and the same per-host
+playbooks, as a sequential (workers = 0) run, and that worker log
+records reach the parent's logfile.
+'''
+import shutil
+from os import listdir, makedirs, path, remove
+from ask.common.log import Log
+from ask.common.parallel import ParallelPlaybook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_parallel', 'INFO', 'DEBUG')
+
+def build(pb, host, log):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = 'bgp'
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    task = NxosInterfaces(log)
+    for port in range(1, 5):
+        task.name = 'Ethernet1/{}'.format(port)
+        task.description = '{} port {}'.format(host, port)
+        task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+    log.debug('unit_test_parallel built {}'.format(host))
+
+def build_shared(pb, host, log):
+    pb.profile_nxos()
+    task = NxosFeature(log)
+    task.feature = 'bgp'
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+
+hosts = ['leaf-{}'.format(x) for x in range(20)]
+
+def merged(workers, builder=build, merge_plays=False):
+    filename = '/tmp/unit_test_parallel_{}.yaml'.format(workers)
+    if path.exists(filename):
+        remove(filename)
+    ppb = ParallelPlaybook(log)
+    ppb.builder = builder
+    ppb.hosts = hosts
+    ppb.workers = workers
+    ppb.chunksize = 3
+    ppb.merge_plays = merge_plays
+    ppb.file = filename
+    ppb.run()
+    with open(filename, 'r') as fh:
+        return fh.read()
+
+def per_host(workers):
+    directory = '/tmp/unit_test_parallel_{}'.format(workers)
+    shutil.rmtree(directory, ignore_errors=True)
+    makedirs(directory)
+    ppb = ParallelPlaybook(log)
+    ppb.builder = build
+    ppb.hosts = hosts
+    ppb.workers = workers
+    ppb.directory = directory
+    ppb.run()
+    contents = dict()
+    for filename in sorted(listdir(directory)):
+        with open(path.join(directory, filename), 'r') as fh:
+            contents[filename] = fh.read()
+    return contents
+
+expected = merged(0)
+if expected.index('leaf-0\n') >= expected.index('leaf-19\n'):
+    log.error('FAIL: plays are not in host order')
+    exit(1)
+if merged(2) != expected:
+    log.error('FAIL: parallel merged playbook differs from sequential')
+    exit(1)
+expected = merged(0, build_shared, merge_plays=True)
+if expected.count('hosts:') != 1:
+    log.error('FAIL: expected 1 merged play, got {}'.format(expected.count('hosts:')))
+    exit(1)
+if merged(2, build_shared, merge_plays=True) != expected:
+    log.error('FAIL: parallel merge_plays differs from sequential')
+    exit(1)
+expected = per_host(0)
+if len(expected) != len(hosts):
+    log.error('FAIL: expected {} files, got {}'.format(len(hosts), len(expected)))
+    exit(1)
+if per_host(2) != expected:
+    log.error('FAIL: parallel per-host playbooks differ from sequential')
+    exit(1)
+
+with open('/tmp/unit_test_parallel.log', 'r') as fh:
+    logfile = fh.read()
+if 'unit_test_parallel built leaf-19' not in logfile:
+    log.error('FAIL: worker log records missing from logfile')
+    exit(1)
+log.info('PASS')
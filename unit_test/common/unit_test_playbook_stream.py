@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_playbook_stream.py
+our_version = 100
+'''
+Verifies that a playbook written in streaming mode (pb.open_stream())
+is identical to the same playbook written by write_playbook() alone.
+'''
+from os import path, remove
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_playbook_stream', 'INFO', 'DEBUG')
+
+def add_plays(pb):
+    for host in ['leaf-101', 'leaf-102', 'spine-201']:
+        task = NxosFeature(log)
+        task.feature = 'bgp'
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+        task = NxosInterfaces(log)
+        task.name = 'Ethernet1/1'
+        task.description = 'to {}'.format(host)
+        task.add_interface()
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        pb.add_host(host)
+        pb.add_environment('no_proxy', '*')
+        pb.append_playbook()
+
+def write(filename, streaming):
+    if path.exists(filename):
+        remove(filename)
+    pb = Playbook(log)
+    pb.profile_nxos()
+    pb.file = filename
+    if streaming:
+        pb.open_stream()
+    add_plays(pb)
+    pb.write_playbook()
+    with open(filename, 'r') as fh:
+        return fh.read()
+
+expected = write('/tmp/playbook_stream_expected.yaml', False)
+streamed = write('/tmp/playbook_stream.yaml', True)
+if streamed != expected:
+    log.error('FAIL: streamed playbook differs from write_playbook() playbook')
+    exit(1)
+log.info('PASS')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_playbook_yaml_backend.py
+our_version = 100
+'''
+Verifies that write_playbook() and write_vars() produce byte-identical
+files with pb.yaml_backend = 'libyaml' and pb.yaml_backend = 'python'.
+Skipped (PASS) if PyYAML was built without libyaml.
+'''
+from os import path, remove
+from ask.common.log import Log
+from ask.common.playbook import Playbook, CDumper
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.cisco.nxos.nxos_vrf import NxosVrf
+
+log = Log('unit_test_playbook_yaml_backend', 'INFO', 'DEBUG')
+
+if CDumper == None:
+    log.info('PASS (skipped. PyYAML was built without libyaml)')
+    exit(0)
+
+# values that exercise quoting, wrapping, and unicode in the emitter
+descriptions = list()
+descriptions.append('plain')
+descriptions.append('yes')
+descriptions.append('1.0')
+descriptions.append('key: value # not a comment')
+descriptions.append("it's \"quoted\"")
+descriptions.append('Ünïcödé → leaf')
+descriptions.append('a long description ' * 10)
+descriptions.append('')
+
+def add_plays(pb):
+    for host, description in enumerate(descriptions):
+        task = NxosInterfaces(log)
+        task.name = 'Ethernet1/{}'.format(host + 1)
+        task.description = description
+        task.mtu = 9216
+        task.enabled = True
+        task.add_interface()
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        task = NxosVrf(log)
+        task.name = 'vrf_{}'.format(host)
+        task.vni = 10000 + host
+        task.state = 'present'
+        task.commit()
+        pb.add_task(task)
+        pb.add_host('leaf-{}'.format(host))
+        pb.add_environment('no_proxy', '*')
+        pb.append_playbook()
+
+def write(backend, what):
+    filename = '/tmp/unit_test_playbook_yaml_backend_{}_{}.yaml'.format(what, backend)
+    if path.exists(filename):
+        remove(filename)
+    pb = Playbook(log)
+    pb.yaml_backend = backend
+    pb.profile_nxos()
+    pb.file = filename
+    if what == 'vars':
+        pb.add_vars('note', descriptions[-2])
+        pb.add_vars('unicode', descriptions[5])
+        pb.write_vars()
+    else:
+        if what == 'stream':
+            pb.open_stream()
+        add_plays(pb)
+        pb.write_playbook()
+    with open(filename, 'rb') as fh:
+        return fh.read()
+
+for what in ['playbook', 'stream', 'vars']:
+    expected = write('python', what)
+    result = write('libyaml', what)
+    if result != expected:
+        log.error('FAIL: {} libyaml output differs from python output'.format(what))
+        exit(1)
+
+# python-specific types are represented identically, too
+pb = Playbook(log)
+data = {'tuple': (1, 2)}
+pb.yaml_backend = 'python'
+expected = pb.dump_yaml(data)
+pb.yaml_backend = 'libyaml'
+if pb.dump_yaml(data) != expected:
+    log.error('FAIL: libyaml tuple differs from python output')
+    exit(1)
+log.info('PASS')
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_property_values.py
+our_version = 100
+'''
+Verifies that task.properties (PropertyValues()) reads and writes like
+the dict() it replaces, including names that are not in the class's
+properties_set, and that instances of a class share one index.
+'''
+from ask.common.log import Log
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_property_values', 'INFO', 'DEBUG')
+
+task = NxosInterfaces(log)
+expected = dict.fromkeys(task.properties_set)
+if dict(task.properties.items()) != expected or task.properties != expected:
+    log.error('FAIL: unexpected initial properties {}'.format(task.properties))
+    exit(1)
+
+task.mtu = 9216
+task.properties['foo'] = 'bar'      # a name not in properties_set
+expected['mtu'] = '9216'    # to_str
+expected['foo'] = 'bar'
+if task.properties != expected or len(task.properties) != len(expected) or set(task.properties) != set(expected):
+    log.error('FAIL: unexpected properties {}'.format(task.properties))
+    exit(1)
+if 'foo' not in task.properties or task.properties.get('foo') != 'bar' or task.properties.get('baz', 1) != 1:
+    log.error('FAIL: unexpected contains/get for {}'.format(task.properties))
+    exit(1)
+
+# foo is now in the shared index, but is not set in a new instance
+other = NxosInterfaces(log)
+if other.properties.index is not task.properties.index:
+    log.error('FAIL: instances do not share an index')
+    exit(1)
+if 'foo' in other.properties or other.properties.get('foo') != None:
+    log.error('FAIL: foo is set in a new instance {}'.format(other.properties))
+    exit(1)
+try:
+    other.properties['foo']
+    log.error('FAIL: other.properties[foo] did not raise KeyError')
+    exit(1)
+except KeyError:
+    pass
+other.properties['foo'] = 'baz'
+if other.properties['foo'] != 'baz' or task.properties['foo'] != 'bar':
+    log.error('FAIL: instances share values')
+    exit(1)
+
+# reset() sets dirty properties back to None
+task.reset()
+if task.mtu != None:
+    log.error('FAIL: reset() did not reset mtu. Got {}'.format(task.mtu))
+    exit(1)
+log.info('PASS')
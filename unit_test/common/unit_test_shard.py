@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_shard.py
+our_version = 101
+'''
+Verifies that ShardWriter() writes every play exactly once, keeps each
+host in one shard (shard_by hosts) or the original play order (shard_by
+plays, tasks), balances shards, and writes a site.yml importing every
+shard.
+'''
+import shutil
+import yaml
+from os import makedirs, path
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.shard import ShardWriter
+from ask.cisco.nxos.nxos_feature import NxosFeature
+
+log = Log('unit_test_shard', 'INFO', 'DEBUG')
+
+directory = '/tmp/unit_test_shard'
+
+def add_play(pb, hosts, tasks):
+    pb.profile_nxos()
+    for index in range(tasks):
+        task = NxosFeature(log)
+        task.task_name = '{} task {}'.format(','.join(hosts), index)
+        task.feature = 'bgp'
+        task.state = 'enabled'
+        task.commit()
+        pb.add_task(task)
+    for host in hosts:
+        pb.add_host(host)
+    pb.append_playbook()
+
+def build():
+    pb = Playbook(log)
+    # leaf-0 .. leaf-11: two plays each, with 1 to 4 tasks
+    for host in range(12):
+        add_play(pb, ['leaf-{}'.format(host)], host % 4 + 1)
+    for host in range(12):
+        add_play(pb, ['leaf-{}'.format(host)], 1)
+    # spine-1 and spine-2 share a play, so must share a shard
+    add_play(pb, ['spine-1'], 2)
+    add_play(pb, ['spine-1', 'spine-2'], 2)
+    add_play(pb, ['spine-2'], 2)
+    return pb
+
+def write(shard_by, shards):
+    shutil.rmtree(directory, ignore_errors=True)
+    makedirs(directory)
+    pb = build()
+    if pb.task_counts != [len(play['tasks']) for play in pb.stream]:
+        log.error('FAIL: pb.task_counts does not match pb.stream')
+        exit(1)
+    sw = ShardWriter(log)
+    sw.directory = directory
+    sw.shard_by = shard_by
+    sw.shards = shards
+    sw.write(pb)
+    shards = list()
+    for filename in sw.shard_files:
+        with open(filename, 'r') as fh:
+            shards.append(yaml.safe_load(fh))
+    with open(path.join(directory, 'site.yml'), 'r') as fh:
+        site = yaml.safe_load(fh)
+    if site != [{'import_playbook': path.basename(x)} for x in sw.shard_files]:
+        log.error('FAIL: {}: unexpected site.yml {}'.format(shard_by, site))
+        exit(1)
+    return pb, sw, shards
+
+def task_names(plays):
+    return [task['name'] for play in plays for task in play['tasks']]
+
+def all_task_names(pb):
+    return [task['name'] for play in pb.stream for task in play['tasks']]
+
+# hosts
+pb, sw, shards = write('hosts', 4)
+if len(shards) != 4:
+    log.error('FAIL: hosts: expected 4 shards. Got {}'.format(len(shards)))
+    exit(1)
+if sorted(task_names(sum(shards, []))) != sorted(all_task_names(pb)):
+    log.error('FAIL: hosts: plays missing or duplicated')
+    exit(1)
+seen = dict()
+for number, plays in enumerate(shards):
+    for play in plays:
+        for host in play['hosts'].split(','):
+            if seen.get(host, number) != number:
+                log.error('FAIL: hosts: {} is in more than one shard'.format(host))
+                exit(1)
+            seen[host] = number
+    names = task_names(plays)
+    if names != [x for x in all_task_names(pb) if x in names]:
+        log.error('FAIL: hosts: shard {} plays are out of order'.format(number + 1))
+        exit(1)
+if sw.shard_hosts[sw.shard_files[0]] != sorted(set(host for play in shards[0] for host in play['hosts'].split(','))):
+    log.error('FAIL: hosts: unexpected shard_hosts')
+    exit(1)
+loads = [len(task_names(plays)) for plays in shards]
+if max(loads) - min(loads) > 6:
+    log.error('FAIL: hosts: shards are unbalanced. Got {}'.format(loads))
+    exit(1)
+
+# plays and tasks: consecutive, in order
+for shard_by in ['plays', 'tasks']:
+    pb, sw, shards = write(shard_by, 3)
+    if task_names(sum(shards, [])) != all_task_names(pb):
+        log.error('FAIL: {}: plays are not in their original order'.format(shard_by))
+        exit(1)
+    if shard_by == 'plays':
+        sizes = [len(plays) for plays in shards]
+    else:
+        sizes = [len(task_names(plays)) for plays in shards]
+    if max(sizes) - min(sizes) > 4:
+        log.error('FAIL: {}: shards are unbalanced. Got {}'.format(shard_by, sizes))
+        exit(1)
+
+# fewer groups than shards
+shutil.rmtree(directory, ignore_errors=True)
+makedirs(directory)
+pb = Playbook(log)
+add_play(pb, ['leaf-1'], 1)
+add_play(pb, ['leaf-1'], 1)
+sw = ShardWriter(log)
+sw.directory = directory
+sw.shards = 4
+sw.write(pb)
+if [path.basename(x) for x in sw.shard_files] != ['shard_001.yaml']:
+    log.error('FAIL: expected one shard. Got {}'.format(sw.shard_files))
+    exit(1)
+
+shutil.rmtree(directory, ignore_errors=True)
+log.info('PASS')
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_snapshot.py
+our_version = 102
+'''
+Verifies that commit() leaves task.ansible_task as a read-only snapshot,
+that Playbook() keeps snapshots by reference and shares identical
+subtrees, that a task can be committed again, and that playbooks written
+with and without pb.deepcopy_tasks are identical, and that snapshots
+no longer referenced leave the intern table.
+'''
+import pickle
+from copy import deepcopy
+from os import path, remove
+from ask.common.log import Log
+from ask.common.playbook import Playbook
+from ask.common.snapshot import FrozenDict, snapshots
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_snapshot', 'INFO', 'DEBUG')
+
+def feature_task(feature):
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    return task
+
+def interfaces_task(ports):
+    task = NxosInterfaces(log)
+    for port in ports:
+        task.name = 'Ethernet1/{}'.format(port)
+        task.mtu = 9216
+        task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    return task
+
+task = feature_task('bgp')
+if not isinstance(task.ansible_task, FrozenDict):
+    log.error('FAIL: ansible_task is {}'.format(type(task.ansible_task)))
+    exit(1)
+for mutate in [lambda x: x.update({'a': 1}), lambda x: x.__setitem__('a', 1), lambda x: x.pop('name')]:
+    try:
+        mutate(task.ansible_task)
+        log.error('FAIL: snapshot was modified')
+        exit(1)
+    except TypeError:
+        pass
+copied = deepcopy(task.ansible_task)
+if not (type(copied) == dict and copied == task.ansible_task):
+    log.error('FAIL: deepcopy() is not a mutable equal dict')
+    exit(1)
+if pickle.loads(pickle.dumps(task.ansible_task)) != task.ansible_task:
+    log.error('FAIL: pickle round trip differs')
+    exit(1)
+
+# identical tasks, and subtrees, are held once
+if feature_task('bgp').ansible_task is not task.ansible_task:
+    log.error('FAIL: identical tasks are not shared')
+    exit(1)
+first = interfaces_task([1, 2])
+second = interfaces_task([2, 3])
+config_first = first.ansible_task['cisco.nxos.nxos_interfaces']['config']
+config_second = second.ansible_task['cisco.nxos.nxos_interfaces']['config']
+if config_first[1] is not config_second[0]:
+    log.error('FAIL: identical subtrees are not shared')
+    exit(1)
+
+# tasks that add to their previous ansible_task can commit() again
+task = NxosInterfaces(log)
+task.name = 'Ethernet1/1'
+task.add_interface()
+task.state = 'merged'
+task.commit()
+task.commit()
+if not isinstance(task.ansible_task, FrozenDict):
+    log.error('FAIL: ansible_task not frozen after second commit()')
+    exit(1)
+
+def write(deepcopy_tasks):
+    filename = '/tmp/unit_test_snapshot_{}.yaml'.format(deepcopy_tasks)
+    if path.exists(filename):
+        remove(filename)
+    pb = Playbook(log)
+    pb.profile_nxos()
+    pb.deepcopy_tasks = deepcopy_tasks
+    pb.file = filename
+    for host in ['leaf-1', 'leaf-2']:
+        pb.add_task(feature_task('bgp'))
+        pb.add_task(interfaces_task([1, 2]))
+        pb.add_host(host)
+        pb.add_environment('no_proxy', '*')
+        pb.append_playbook()
+    pb.write_playbook()
+    with open(filename, 'r') as fh:
+        return pb, fh.read()
+
+snapshots.clear()
+pb, expected = write(False)
+if pb.stream[0]['tasks'][1] is not pb.stream[1]['tasks'][1]:
+    log.error('FAIL: task not stored by reference')
+    exit(1)
+if pb.stream[0]['environment'] is not pb.stream[1]['environment']:
+    log.error('FAIL: identical environments not shared')
+    exit(1)
+if snapshots.stats()['hits'] <= 0:
+    log.error('FAIL: no snapshot hits {}'.format(snapshots.stats()))
+    exit(1)
+pb, copied = write(True)
+if type(pb.stream[0]['tasks'][0]) != dict:
+    log.error('FAIL: deepcopy_tasks task is {}'.format(type(pb.stream[0]['tasks'][0])))
+    exit(1)
+if pb.stream[0]['tasks'][1] is pb.stream[1]['tasks'][1]:
+    log.error('FAIL: deepcopy_tasks task is shared')
+    exit(1)
+if copied != expected:
+    log.error('FAIL: deepcopy_tasks playbook differs')
+    exit(1)
+if '&id' in expected:
+    log.error('FAIL: playbook contains yaml anchors')
+    exit(1)
+
+# the intern table holds snapshots by weak reference
+snapshots.clear()
+pb = Playbook(log)
+pb.add_task(interfaces_task([1, 2, 3]))
+pb.add_host('leaf-1')
+pb.append_playbook()
+size = snapshots.stats()['size']
+if size <= 0:
+    log.error('FAIL: nothing interned {}'.format(snapshots.stats()))
+    exit(1)
+if snapshots.freeze(deepcopy(pb.stream[0])) is not pb.stream[0]:
+    log.error('FAIL: equal play not interned')
+    exit(1)
+del pb
+if snapshots.stats()['size'] >= size:
+    log.error('FAIL: freed snapshots still in the intern table {}'.format(snapshots.stats()))
+    exit(1)
+log.info('PASS')
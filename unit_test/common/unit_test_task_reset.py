@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_task_reset.py
+our_version = 103
+'''
+Verifies Task().dirty tracking, and that a task reused via reset()
+generates the same tasks as new task instances, including task_name and
+properties stored under another name.
+'''
+from ask.common.log import Log
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.spirent.stc_device_config import StcDeviceConfigIpv4
+
+log = Log('unit_test_task_reset', 'INFO', 'DEBUG')
+
+features = ['bgp', 'ospf', 'pim']
+
+expected = list()
+for feature in features:
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.commit()
+    expected.append(task.ansible_task)
+
+task = NxosFeature(log)
+for index, feature in enumerate(features):
+    task.reset()
+    if not (task.feature == None and task.state == None):
+        log.error('FAIL: reset() did not reset feature and state')
+        exit(1)
+    task.feature = feature
+    task.state = 'enabled'
+    if task.dirty != {'feature', 'state'}:
+        log.error('FAIL: unexpected dirty {}'.format(task.dirty))
+        exit(1)
+    task.commit()
+    if task.ansible_task != expected[index]:
+        log.error('FAIL: reused task differs for {}'.format(feature))
+        exit(1)
+
+task = NxosInterfaces(log)
+task.name = 'Ethernet1/1'
+task.mode = 'layer3'
+task.state = 'merged'
+task.add_interface()
+if task.dirty != {'state'}:
+    log.error('FAIL: add_interface() left dirty {}'.format(task.dirty))
+    exit(1)
+if not (task.name == None and task.mode == None):
+    log.error('FAIL: add_interface() did not reset name and mode')
+    exit(1)
+if task.state != 'merged':
+    log.error('FAIL: add_interface() reset state')
+    exit(1)
+
+# task_name is a task property, and also a key of task.properties
+task = NxosFeature(log)
+task.task_name = 'enable bgp'
+task.feature = 'bgp'
+task.state = 'enabled'
+task.commit()
+task.reset()
+if task.task_name != None:
+    log.error('FAIL: reset() did not reset task_name, got {}'.format(task.task_name))
+    exit(1)
+task.feature = 'ospf'
+task.state = 'enabled'
+task.commit()
+if 'name' in task.ansible_task:
+    log.error('FAIL: reused task kept name {}'.format(task.ansible_task['name']))
+    exit(1)
+
+# device_name is stored as properties['device']
+task = StcDeviceConfigIpv4(log)
+task.device_name = '711_ipv4'
+task.reset()
+if task.device_name != None:
+    log.error('FAIL: reset() did not reset device_name, got {}'.format(task.device_name))
+    exit(1)
+
+task = NxosInterfaces(log)
+task.description = 'foo'
+task.clear_dirty()
+task.reset()
+if task.description != 'foo':
+    log.error('FAIL: reset() after clear_dirty() reset description')
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_trusted_source.py
+our_version = 101
+'''
+Verifies that tasks created within TrustedSource() skip TaskProperty()
+value verification but keep structural checks, and that sample=1.0
+fully verifies every task.
+'''
+from ask.common.log import Log
+from ask.common.common import ValidationCollector
+from ask.common.task import TrustedSource
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+
+log = Log('unit_test_trusted_source', 'INFO', 'DEBUG')
+
+def build_task(mode):
+    task = NxosInterfaces(log)
+    task.name = 'Ethernet1/1'
+    task.mode = mode
+    task.add_interface()
+    task.state = 'merged'
+    task.commit()
+    return task
+
+collector = ValidationCollector(raise_errors=False)
+with collector:
+    with TrustedSource() as trusted:
+        task = build_task('layer4')   # not verified
+        task = NxosInterfaces(log)
+        task.add_interface()          # structural check: name not set
+if not (trusted.created == 2 and trusted.sampled == 0):
+    log.error('FAIL: created {} sampled {}'.format(trusted.created, trusted.sampled))
+    exit(1)
+if len(collector.errors) != 1:
+    log.error('FAIL: expected 1 error, got {}'.format(collector.report()))
+    exit(1)
+if collector.errors[0].parameter != None:
+    log.error('FAIL: unexpected error {}'.format(collector.errors[0]))
+    exit(1)
+
+collector = ValidationCollector(raise_errors=False)
+with collector:
+    with TrustedSource(sample=1.0) as trusted:
+        build_task('layer4')
+if trusted.sampled != 1:
+    log.error('FAIL: task was not sampled')
+    exit(1)
+if not (len(collector.errors) == 1 and collector.errors[0].parameter == 'mode'):
+    log.error('FAIL: sampled task not verified {}'.format(collector.report()))
+    exit(1)
+
+with TrustedSource(sample=0.25, seed=1) as trusted:
+    for _ in range(400):
+        NxosInterfaces(log)
+if not (50 <= trusted.sampled <= 150):
+    log.error('FAIL: unexpected sample count {}'.format(trusted.sampled))
+    exit(1)
+
+log.info('PASS')
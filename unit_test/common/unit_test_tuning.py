@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_tuning.py
+our_version = 102
+'''
+Verifies that pb.strategy, pb.serial, pb.max_fail_percentage, and
+task.throttle are written to the play and task, that task.throttle =
+None clears throttle, and that
+pb.suggest_execution() suggests forks and serial from the play's hosts
+and task costs.
+'''
+import yaml
+from ask.common.log import Log
+from ask.common.inventory import Inventory
+from ask.common.playbook import Playbook
+from ask.common.tuning import task_cost
+from ask.ansible.pause import Pause
+from ask.cisco.nxos.nxos_feature import NxosFeature
+from ask.cisco.nxos.nxos_vlans import NxosVlans
+
+log = Log('unit_test_tuning', 'INFO', 'DEBUG')
+
+def feature_task(feature, throttle=None):
+    task = NxosFeature(log)
+    task.feature = feature
+    task.state = 'enabled'
+    task.throttle = throttle
+    task.commit()
+    return task
+
+def loaded(pb):
+    return yaml.safe_load(pb.dump_yaml(pb.stream))
+
+# play and task keywords
+for key_order in ['sorted', 'canonical']:
+    pb = Playbook(log)
+    pb.key_order = key_order
+    pb.coalesce_tasks = True
+    pb.strategy = 'free'
+    pb.serial = [1, '10%', '100%']
+    pb.max_fail_percentage = 10
+    pb.add_task(feature_task('bgp', throttle=2))
+    pb.add_task(feature_task('ospf'))
+    pb.add_host('leaf-1')
+    pb.append_playbook()
+    pb.add_task(feature_task('bgp'))
+    pb.add_host('leaf-1')
+    pb.strategy = 'linear'
+    pb.strategy = None
+    pb.append_playbook()
+    stream = loaded(pb)
+    if not (stream[0]['strategy'] == 'free' and stream[0]['serial'] == [1, '10%', '100%'] and stream[0]['max_fail_percentage'] == 10):
+        log.error('FAIL: {}: unexpected play {}'.format(key_order, stream[0]))
+        exit(1)
+    if not (stream[0]['tasks'][0]['throttle'] == 2 and 'throttle' not in stream[0]['tasks'][1]):
+        log.error('FAIL: {}: unexpected tasks {}'.format(key_order, stream[0]['tasks']))
+        exit(1)
+    if any(key in stream[1] for key in ['strategy', 'serial', 'max_fail_percentage']):
+        log.error('FAIL: {}: settings carried over to the next play {}'.format(key_order, stream[1]))
+        exit(1)
+
+# throttle = None clears a previous throttle
+pb = Playbook(log)
+task = NxosFeature(log)
+task.feature = 'bgp'
+task.state = 'enabled'
+task.throttle = 4
+task.throttle = None
+if task.throttle != None:
+    log.error('FAIL: throttle = None did not clear throttle. Got {}'.format(task.throttle))
+    exit(1)
+if 'throttle' in task.properties:
+    log.error('FAIL: throttle = None added throttle to task.properties')
+    exit(1)
+task.commit()
+pb.add_task(task)
+pb.add_host('leaf-1')
+pb.append_playbook()
+if 'throttle' in loaded(pb)[0]['tasks'][0]:
+    log.error('FAIL: throttle = None still wrote throttle {}'.format(loaded(pb)[0]['tasks'][0]))
+    exit(1)
+
+# task costs
+pause = Pause(log)
+pause.seconds = 30
+pause.update()
+if task_cost(pause.ansible_task) != 30:
+    log.error('FAIL: unexpected pause cost {}'.format(task_cost(pause.ansible_task)))
+    exit(1)
+vlans = NxosVlans(log)
+for vlan_id in range(10, 20):
+    vlans.vlan_id = vlan_id
+    vlans.add_vlan()
+vlans.state = 'merged'
+vlans.commit()
+if task_cost(vlans.ansible_task) != 10.0:
+    log.error('FAIL: unexpected vlans cost {}'.format(task_cost(vlans.ansible_task)))
+    exit(1)
+if task_cost(vlans.ansible_task, {'cisco.nxos.nxos_vlans': 2.0}) != 7.0:
+    log.error('FAIL: costs did not override the default')
+    exit(1)
+
+# 1000 hosts, 10 tasks of 5 seconds each, 4 CPUs: 32 forks, batches of
+# at most 600 seconds (12 rounds of 32) and 25% of hosts (250), rounded
+# down to a multiple of forks
+inv = Inventory(log)
+for number in range(1000):
+    inv.add_host('leaf-{}'.format(number), 'leafs')
+pb = Playbook(log)
+pb.inventory = inv
+for number in range(10):
+    pb.add_task(feature_task('feature_{}'.format(number)))
+pb.add_host('leafs')
+d = pb.suggest_execution(max_batch_percent=25, cpu_count=4)
+if d != {'forks': 32, 'serial': 224, 'play_seconds': 50.0, 'estimated_seconds': 1600.0}:
+    log.error('FAIL: unexpected suggestion {}'.format(d))
+    exit(1)
+if pb.serial != 224:
+    log.error('FAIL: serial not set on the play')
+    exit(1)
+pb.append_playbook()
+if loaded(pb)[0]['serial'] != 224:
+    log.error('FAIL: serial not written')
+    exit(1)
+
+# few hosts: one batch, serial omitted
+pb = Playbook(log)
+pb.serial = 5
+pb.add_task(feature_task('bgp'))
+for number in range(10):
+    pb.add_host('leaf-{}'.format(number))
+d = pb.suggest_execution(cpu_count=4)
+if not (d['forks'] == 10 and d['serial'] == None and pb.serial == None):
+    log.error('FAIL: unexpected suggestion {}'.format(d))
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_validation_collector.py
+our_version = 101
+'''
+Verifies that, while a ValidationCollector() is active, validation
+failures are collected rather than causing an exit, and that
+ValidationReport() is raised at the end of the with block.  Also that a
+reused task whose commit() fails is not added with the ansible_task of
+its earlier commit().
+'''
+from ask.common.log import Log
+from ask.common.common import ValidationCollector, ValidationReport
+from ask.common.playbook import Playbook
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.cisco.nxos.nxos_feature import NxosFeature
+
+log = Log('unit_test_validation_collector', 'INFO', 'DEBUG')
+
+def add_tasks(pb):
+    task = NxosInterfaces(log)
+    task.name = 'Ethernet1/1'
+    task.mtu = 'foo'            # error 1: not digits
+    task.mode = 'layer4'        # error 2: invalid mode
+    task.add_interface()
+    task.name = 'Foo1/1'        # error 3: invalid interface name
+    task.add_interface()        # error 4: name not set
+    task.state = 'merged'
+    task.commit()
+    pb.add_task(task)
+
+    task = NxosFeature(log)
+    task.feature = 'bgp'
+    task.commit()               # error 5: state not set
+    pb.add_task(task)
+
+pb = Playbook(log)
+pb.add_host('dc-101')
+
+expected_errors = 5
+try:
+    with ValidationCollector() as collector:
+        add_tasks(pb)
+    log.error('FAIL: ValidationReport was not raised')
+    exit(1)
+except ValidationReport as report:
+    for error in report.errors:
+        log.info('collected: {}'.format(error))
+    if len(report.errors) != expected_errors:
+        log.error('FAIL: expected {} errors, got {}'.format(expected_errors, len(report.errors)))
+        exit(1)
+    if report.errors[1].parameter != 'mode' or report.errors[1].value != 'layer4':
+        log.error('FAIL: unexpected error contents {}'.format(report.errors[1]))
+        exit(1)
+
+collector = ValidationCollector(raise_errors=False)
+with collector:
+    task = NxosFeature(log)
+    task.state = 'enabled'
+    task.feature = 'bgp'
+    task.commit()
+if len(collector.errors) != 0:
+    log.error('FAIL: unexpected errors: {}'.format(collector.report()))
+    exit(1)
+# a reused task whose second commit() fails
+pb = Playbook(log)
+pb.add_host('dc-101')
+collector = ValidationCollector(raise_errors=False)
+with collector:
+    task = NxosFeature(log)
+    task.feature = 'bgp'
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+    task.feature = 'ospf'
+    task.state = None
+    task.commit()               # error: state not set
+    pb.add_task(task)
+if len(collector.errors) != 1:
+    log.error('FAIL: expected 1 error, got {}'.format(len(collector.errors)))
+    exit(1)
+if len(pb.playbook['tasks']) != 1:
+    log.error('FAIL: task with failed commit() was added. tasks {}'.format(pb.playbook['tasks']))
+    exit(1)
+with collector:
+    task.state = 'enabled'
+    task.commit()
+    pb.add_task(task)
+if len(pb.playbook['tasks']) != 2 or pb.playbook['tasks'][1]['cisco.nxos.nxos_feature']['feature'] != 'ospf':
+    log.error('FAIL: task was not added after a successful commit(). tasks {}'.format(pb.playbook['tasks']))
+    exit(1)
+log.info('PASS')
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_validator_cache.py
+our_version = 101
+'''
+Verifies that validator_cache counts hits and misses, evicts at maxsize,
+and that an invalid value fails identically whether or not an earlier
+call for the same value has been made (failures are never cached).
+'''
+from ask.common.log import Log
+from ask.common.common import ValidationCollector, validator_cache
+from ask.cisco.nxos.nxos_evpn_vni import NxosEvpnVni
+
+log = Log('unit_test_validator_cache', 'INFO', 'DEBUG')
+
+def set_rt(value):
+    task = NxosEvpnVni(log)
+    task.route_target_import = value
+
+validator_cache.configure(maxsize=2, eviction='lru')
+
+for _ in range(3):
+    set_rt(['1.2.3.4:304', '56220:1'])
+stats = validator_cache.stats()
+if stats['verify_rt']['misses'] != 1:
+    log.error('FAIL: verify_rt misses {}'.format(stats['verify_rt']))
+    exit(1)
+if stats['verify_rt']['hits'] != 2:
+    log.error('FAIL: verify_rt hits {}'.format(stats['verify_rt']))
+    exit(1)
+
+set_rt(['65122:13'])
+set_rt(['1.2.3.4:304', '56220:1'])  # hit, and now most-recently used
+set_rt(['65122:14'])                # evicts ['65122:13']
+stats = validator_cache.stats()
+if stats['verify_rt']['size'] != 2:
+    log.error('FAIL: verify_rt size {}'.format(stats['verify_rt']))
+    exit(1)
+set_rt(['65122:13'])
+if validator_cache.stats()['verify_rt']['misses'] != 4:
+    log.error('FAIL: expected eviction {}'.format(validator_cache.stats()['verify_rt']))
+    exit(1)
+
+errors = list()
+for _ in range(2):
+    collector = ValidationCollector(raise_errors=False)
+    with collector:
+        set_rt(['65122:13', 'foo'])
+    errors.append([str(error) for error in collector.errors])
+if len(errors[0]) != 1:
+    log.error('FAIL: expected 1 error, got {}'.format(errors[0]))
+    exit(1)
+if errors[0] != errors[1]:
+    log.error('FAIL: failures differ {} {}'.format(errors[0], errors[1]))
+    exit(1)
+
+validator_cache.configure(maxsize=0)
+set_rt(['1.2.3.4:304', '56220:1'])
+if validator_cache.stats()['verify_rt'] != {'hits': 0, 'misses': 0, 'size': 0}:
+    log.error('FAIL: cache not disabled')
+    exit(1)
+
+log.info('PASS')
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# unit_test/common/unit_test_yaml_aliases.py
+our_version = 101
+'''
+Verifies that pb.yaml_aliases writes repeated subtrees once, as anchors,
+with every backend and key_order, that the file loads to the same data
+as without yaml_aliases, and that it is smaller, and the same with
+every backend.
+'''
+import yaml
+from ask.common.log import Log
+from ask.common.playbook import Playbook, CDumper
+from ask.cisco.nxos.nxos_interfaces import NxosInterfaces
+from ask.cisco.nxos.nxos_vlans import NxosVlans
+
+log = Log('unit_test_yaml_aliases', 'INFO', 'DEBUG')
+
+def add_plays(pb):
+    # the same vars, and the same vlans task, in every play.  The
+    # interfaces task differs per host, but shares its uplink interface.
+    for host in range(20):
+        pb.profile_nxos()
+        task = NxosVlans(log)
+        for vlan_id in range(10, 20):
+            task.vlan_id = vlan_id
+            task.name = 'vlan_{}'.format(vlan_id)
+            task.add_vlan()
+        task.task_name = 'baseline vlans'
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        task = NxosInterfaces(log)
+        task.name = 'Ethernet1/1'
+        task.description = 'uplink'
+        task.mtu = 9216
+        task.add_interface()
+        task.name = 'Ethernet1/{}'.format(host + 2)
+        task.description = 'host port {}'.format(host)
+        task.add_interface()
+        task.state = 'merged'
+        task.commit()
+        pb.add_task(task)
+        pb.add_host('leaf-{}'.format(host))
+        pb.append_playbook()
+
+def write(yaml_backend, key_order, yaml_aliases):
+    filename = '/tmp/unit_test_yaml_aliases.yaml'
+    pb = Playbook(log)
+    pb.yaml_backend = yaml_backend
+    pb.key_order = key_order
+    pb.yaml_aliases = yaml_aliases
+    pb.overwrite = 'atomic'
+    pb.file = filename
+    add_plays(pb)
+    pb.write_playbook()
+    with open(filename, 'r') as fh:
+        return fh.read()
+
+backends = ['python']
+if CDumper != None:
+    backends.append('libyaml')
+
+for key_order in ['sorted', 'canonical']:
+    plain = write('python', key_order, False)
+    if '&id' in plain:
+        log.error('FAIL: {}: anchors written without yaml_aliases'.format(key_order))
+        exit(1)
+    for yaml_backend in backends:
+        case = '{} {}'.format(yaml_backend, key_order)
+        text = write(yaml_backend, key_order, True)
+        if yaml.safe_load(text) != yaml.safe_load(plain):
+            log.error('FAIL: {}: aliased playbook loads to different data'.format(case))
+            exit(1)
+        if len(text) >= len(plain) / 2:
+            log.error('FAIL: {}: expected less than half the size. Got {} of {}'.format(case, len(text), len(plain)))
+            exit(1)
+        # vars and the vlans task once per file, the uplink once per file
+        if text.count('ansible_command_timeout') != 1:
+            log.error('FAIL: {}: vars written more than once'.format(case))
+            exit(1)
+        if text.count('vlan_19') != 1:
+            log.error('FAIL: {}: vlans written more than once'.format(case))
+            exit(1)
+        if text.count('uplink') != 1:
+            log.error('FAIL: {}: uplink written more than once'.format(case))
+            exit(1)
+        if text.count('host port') != 20:
+            log.error('FAIL: {}: per-host interfaces missing'.format(case))
+            exit(1)
+        loaded = yaml.safe_load(text)
+        if key_order == 'canonical':
+            if list(loaded[1].keys())[-2:] != ['vars', 'tasks']:
+                log.error('FAIL: {}: aliased play not in canonical order {}'.format(case, list(loaded[1].keys())))
+                exit(1)
+    if write('python', key_order, True) != text:
+        log.error('FAIL: {}: output differs between backends, or runs'.format(key_order))
+        exit(1)
+
+log.info('PASS')